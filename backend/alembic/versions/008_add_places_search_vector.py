@@ -0,0 +1,81 @@
+"""Add stored search_vector and trigram indexes to places.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_EXPRESSION = """
+    setweight(to_tsvector('korean', coalesce({row}name, '')), 'A')
+    || setweight(to_tsvector('korean', coalesce(array_to_string({row}tags, ' '), '')), 'B')
+    || setweight(to_tsvector('korean', coalesce({row}description, '')), 'C')
+    || setweight(to_tsvector('korean', coalesce({row}address, '')), 'D')
+"""
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # The search code targets a 'korean' configuration; fall back to a copy of
+    # 'simple' when no Korean parser is installed so the trigger never fails.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_ts_config WHERE cfgname = 'korean'
+            ) THEN
+                CREATE TEXT SEARCH CONFIGURATION korean (COPY = simple);
+            END IF;
+        END $$
+    """)
+
+    op.execute("ALTER TABLE places ADD COLUMN IF NOT EXISTS search_vector tsvector")
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION places_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_EXPRESSION.format(row="NEW.")};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_places_search_vector
+        BEFORE INSERT OR UPDATE OF name, tags, description, address ON places
+        FOR EACH ROW EXECUTE FUNCTION places_search_vector_update()
+    """)
+
+    # Backfill existing rows
+    op.execute(
+        f"UPDATE places SET search_vector = {SEARCH_VECTOR_EXPRESSION.format(row='')}"
+    )
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_places_search_vector
+        ON places USING GIN(search_vector)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_places_name_trgm
+        ON places USING GIN(name gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_places_address_trgm
+        ON places USING GIN(address gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_places_address_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_places_name_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_places_search_vector")
+    op.execute("DROP TRIGGER IF EXISTS trg_places_search_vector ON places")
+    op.execute("DROP FUNCTION IF EXISTS places_search_vector_update()")
+    op.execute("ALTER TABLE places DROP COLUMN IF EXISTS search_vector")
+    # The 'korean' configuration and pg_trgm are left in place (may be shared)
@@ -0,0 +1,44 @@
+"""Add the onboarding popular-place sample pool.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rebuilt by app.workers.onboarding_pool_worker
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS onboarding_sample_pool (
+            place_id UUID PRIMARY KEY,
+            region_key VARCHAR(32) NOT NULL,
+            category VARCHAR(50) NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            address VARCHAR(500),
+            coordinates GEOGRAPHY(POINT, 4326) NOT NULL,
+            popularity INTEGER NOT NULL,
+            recommendation_score DOUBLE PRECISION,
+            region_rank INTEGER NOT NULL,
+            refreshed_at TIMESTAMP NOT NULL
+        )
+    """)
+    # KNN (<->) ordering for onboarding samples
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_onboarding_sample_pool_coordinates
+        ON onboarding_sample_pool USING GIST(coordinates)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_onboarding_sample_pool_category
+        ON onboarding_sample_pool (category)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS onboarding_sample_pool")
@@ -10,6 +10,11 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
+from app.services.experiments.sequential_statistics import (
+    SufficientStatistics,
+    msprt_test,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -534,6 +539,42 @@ class ABTestAnalyzer:
             logger.error(f"Error calculating statistical significance: {e}")
             return {}
 
+    def calculate_sequential_significance(
+        self,
+        control_stats: Dict[str, Any],
+        treatment_stats: Dict[str, Any],
+        alpha: float = 0.05,
+        minimum_effect: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run an always-valid mSPRT on streaming sufficient statistics.
+
+        Each side is a SufficientStatistics dict (n, sum_y, sum_y2 and the
+        optional covariate sums used for CUPED), so the result can be
+        refreshed after every event without rereading raw data.
+        """
+        try:
+            control = SufficientStatistics.from_dict(control_stats)
+            treatment = SufficientStatistics.from_dict(treatment_stats)
+            test = msprt_test(control, treatment, alpha=alpha, tau=minimum_effect)
+
+            effect_size = test["effect_size"]
+            return {
+                "p_value": test["p_value"],
+                "significant": test["decided"],
+                "confidence_level": 1 - alpha,
+                "effect_size": effect_size,
+                "relative_lift": (
+                    effect_size / control.mean if control.mean > 0 else 0
+                ),
+                "confidence_interval": test["confidence_interval"],
+                "variance_reduction": test["variance_reduction"],
+                "test_type": test["test_type"],
+            }
+
+        except Exception as e:
+            logger.error(f"Error calculating sequential significance: {e}")
+            return {}
+
     def _calculate_power(
         self, control_sample: int, treatment_sample: int, effect_size: float
     ) -> float:
@@ -23,6 +23,7 @@ from app.schemas.archive import (
     ArchiveListResponse,
     ArchiveRequest,
 )
+from app.services.places.extraction_queue import extraction_queue
 from app.services.places.place_extractor import PlaceExtractorService
 from app.services.link_analyzer_client import (
     ContentExtractionError,
@@ -96,22 +97,14 @@ async def archive_url(
         db.commit()
         db.refresh(existing)
         if existing.content_type == "place":
-            background_tasks.add_task(
-                _place_extractor.extract_and_create,
-                user_id=user_id,
-                **_to_extraction_snapshot(existing),
-            )
+            await _enqueue_extraction(background_tasks, user_id, existing)
         return existing
 
     db.add(content)
     db.commit()
     db.refresh(content)
     if content.content_type == "place":
-        background_tasks.add_task(
-            _place_extractor.extract_and_create,
-            user_id=user_id,
-            **_to_extraction_snapshot(content),
-        )
+        await _enqueue_extraction(background_tasks, user_id, content)
     return content
 
 
@@ -207,22 +200,14 @@ async def archive_instagram(
         db.commit()
         db.refresh(existing)
         if existing.content_type == "place":
-            background_tasks.add_task(
-                _place_extractor.extract_and_create,
-                user_id=user_id,
-                **_to_extraction_snapshot(existing),
-            )
+            await _enqueue_extraction(background_tasks, user_id, existing)
         return existing
 
     db.add(content)
     db.commit()
     db.refresh(content)
     if content.content_type == "place":
-        background_tasks.add_task(
-            _place_extractor.extract_and_create,
-            user_id=user_id,
-            **_to_extraction_snapshot(content),
-        )
+        await _enqueue_extraction(background_tasks, user_id, content)
     return content
 
 
@@ -266,6 +251,21 @@ def list_archives(
     )
 
 
+# ------------------------------------------------------------------
+# GET /archive/extraction-queue/metrics — Place 추출 큐 지표
+# ------------------------------------------------------------------
+
+@router.get("/extraction-queue/metrics")
+async def get_extraction_queue_metrics(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> Any:
+    try:
+        return await extraction_queue.get_metrics()
+    except Exception as exc:
+        logger.error("extraction queue metrics unavailable: %s", exc)
+        raise HTTPException(status_code=503, detail="추출 큐를 사용할 수 없습니다.")
+
+
 # ------------------------------------------------------------------
 # GET /archive/{id} — 상세 조회
 # ------------------------------------------------------------------
@@ -301,6 +301,20 @@ def delete_archive(
 # Helpers
 # ------------------------------------------------------------------
 
+async def _enqueue_extraction(
+    background_tasks: BackgroundTasks, user_id: UUID, content: ArchivedContent
+) -> None:
+    """Place 추출 작업을 워커 큐에 넣는다. 큐(Redis)를 쓸 수 없으면 인프로세스로 대체한다."""
+    snapshot = _to_extraction_snapshot(content)
+    try:
+        await extraction_queue.enqueue(user_id, snapshot)
+    except Exception as exc:
+        logger.warning("extraction queue unavailable, running in-process: %s", exc)
+        background_tasks.add_task(
+            _place_extractor.extract_and_create, user_id=user_id, **snapshot
+        )
+
+
 def _to_extraction_snapshot(content: ArchivedContent) -> dict:
     """ORM 객체에서 PlaceExtractorService에 필요한 필드를 세션-독립 dict로 복사한다."""
     import copy
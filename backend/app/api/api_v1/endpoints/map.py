@@ -19,6 +19,7 @@ from app.schemas.map import (
     PlaceSearchResult,
 )
 from app.schemas.place import PlaceResponse
+from app.services.maps.geocode_cache import geocode_cache
 from app.services.maps.kakao_map_service import KakaoMapService, KakaoMapServiceError
 
 router = APIRouter()
@@ -145,6 +146,16 @@ async def search_places(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/geocode-cache/stats")
+async def get_geocode_cache_stats():
+    """
+    Hit-rate metrics for the shared geocode/keyword search cache.
+
+    Counters are per process; hit_rate counts local, Redis and coalesced hits.
+    """
+    return geocode_cache.get_stats()
+
+
 @router.get("/places", response_model=List[PlaceResponse])
 async def get_places_in_bounds(
     *,
@@ -128,7 +128,7 @@ async def send_push_notification(
     """Send push notification to specified users."""
     try:
         # TODO: Add admin authorization check
-        response = fcm_service.send_push_notification(request)
+        response = await fcm_service.send_push_notification_async(request)
         return response
 
     except Exception as e:
@@ -180,7 +180,7 @@ async def send_templated_notification(
                 detail="Scheduled notifications not yet implemented",
             )
         else:
-            response = fcm_service.send_push_notification(push_request)
+            response = await fcm_service.send_push_notification_async(push_request)
             return response
 
     except ValueError as e:
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_db
 from app.crud.place import place as place_crud
 from app.middleware.auth_middleware import get_current_user
+from app.models.place import PlaceStatus
 from app.models.user_data import AuthenticatedUser
 from app.schemas.place import (
     PlaceCreate,
@@ -20,6 +21,7 @@ from app.schemas.place import (
     PlaceUpdate,
 )
 from app.services.places.duplicate_detector import DuplicateDetector
+from app.services.ranking.activity_counters import activity_counters
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -103,6 +105,10 @@ async def create_place(
             db, obj_in=place_in, user_id=UUID(TEMP_USER_ID)
         )
 
+        await activity_counters.record_tag_usage(
+            added=place.tags or [], created_at=place.created_at
+        )
+
         logger.info(f"Created place: {place.id} - {place.name}")
         return PlaceResponse.from_orm(place)
 
@@ -222,9 +228,17 @@ async def update_place(
         if not place:
             raise HTTPException(status_code=404, detail="Place not found")
 
+        previous_tags = set(place.tags or [])
         updated_place = place_crud.update_with_coordinates(
             db, db_obj=place, obj_in=place_update
         )
+        current_tags = set(updated_place.tags or [])
+        if updated_place.status == PlaceStatus.ACTIVE:
+            await activity_counters.record_tag_usage(
+                added=current_tags - previous_tags,
+                removed=previous_tags - current_tags,
+                created_at=updated_place.created_at,
+            )
 
         logger.info(f"Updated place: {place_id}")
         return PlaceResponse.from_orm(updated_place)
@@ -244,6 +258,12 @@ async def delete_place(
 ) -> dict:
     """Soft delete place (set status to inactive)."""
     try:
+        place = place_crud.get_by_user(
+            db, user_id=UUID(TEMP_USER_ID), place_id=place_id
+        )
+        removed_tags = list(place.tags or []) if place else []
+        was_active = place is not None and place.status == PlaceStatus.ACTIVE
+
         success = place_crud.soft_delete(
             db, place_id=place_id, user_id=UUID(TEMP_USER_ID)
         )
@@ -251,6 +271,11 @@ async def delete_place(
         if not success:
             raise HTTPException(status_code=404, detail="Place not found")
 
+        if was_active:
+            await activity_counters.record_tag_usage(
+                removed=removed_tags, created_at=place.created_at
+            )
+
         logger.info(f"Deleted place: {place_id}")
         return {"message": "Place deleted successfully", "place_id": str(place_id)}
 
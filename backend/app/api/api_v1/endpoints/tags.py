@@ -147,7 +147,9 @@ async def get_trending_tags(
     """
     try:
         tag_service = TagService(db)
-        trending = tag_service.get_trending_tags(days=days, limit=limit)
+        trending = await tag_service.get_streaming_trending_tags(
+            days=days, limit=limit
+        )
 
         return trending
 
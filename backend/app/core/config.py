@@ -146,6 +146,48 @@ class Settings(BaseSettings):
         default=None, description="link-analyzer service API key"
     )
 
+    # Place Extraction Queue
+    EXTRACTION_WORKER_CONCURRENCY: int = Field(
+        default=4, description="Concurrent extraction jobs per worker process"
+    )
+    EXTRACTION_MAX_ATTEMPTS: int = Field(
+        default=5, description="Attempts before an extraction job is dead-lettered"
+    )
+    EXTRACTION_LEASE_SECONDS: float = Field(
+        default=60.0,
+        description="In-flight job lease; jobs not renewed within it are requeued",
+    )
+    KAKAO_API_CONCURRENCY: int = Field(
+        default=4, description="Maximum in-flight Kakao API calls per worker process"
+    )
+
+    # Geocode / Keyword Search Cache
+    GEOCODE_CACHE_TTL_SECONDS: int = Field(
+        default=30 * 24 * 3600, description="TTL for cached geocode/search hits"
+    )
+    GEOCODE_NEGATIVE_CACHE_TTL_SECONDS: int = Field(
+        default=3600, description="TTL for cached 'not found' geocode/search results"
+    )
+    GEOCODE_LOCAL_CACHE_SIZE: int = Field(
+        default=4096, description="Per-process LRU entries in front of Redis"
+    )
+
+    # Viewport Tile Cache
+    VIEWPORT_TILE_CACHE_TTL_SECONDS: int = Field(
+        default=600, description="TTL for cached map viewport tiles"
+    )
+
+    # Onboarding Sample Pool
+    ONBOARDING_POOL_REFRESH_SECONDS: int = Field(
+        default=3600, description="Seconds between onboarding sample pool rebuilds"
+    )
+    ONBOARDING_SAMPLE_RADIUS_KM: float = Field(
+        default=20.0, description="Maximum distance of onboarding sample places"
+    )
+    ONBOARDING_SAMPLE_TIMEOUT_MS: int = Field(
+        default=200, description="Statement timeout for the onboarding sample query"
+    )
+
     # Push Notification Configuration
     NOTIFICATION_BATCH_SIZE: int = Field(
         default=500, description="Maximum number of notifications to send in one batch"
@@ -153,6 +195,9 @@ class Settings(BaseSettings):
     NOTIFICATION_RETRY_ATTEMPTS: int = Field(
         default=3, description="Number of retry attempts for failed notifications"
     )
+    NOTIFICATION_ROLLUP_INTERVAL_SECONDS: int = Field(
+        default=60, description="Seconds between notification rollup refreshes"
+    )
     DEFAULT_NOTIFICATION_TTL: int = Field(
         default=3600,
         description="Default notification time-to-live in seconds (1 hour)",
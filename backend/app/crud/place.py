@@ -10,6 +10,8 @@ from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.place import Place, PlaceCategory, PlaceStatus
 from app.schemas.place import PlaceCreate, PlaceListRequest, PlaceUpdate
+from app.services.maps.viewport_tile_cache import viewport_tile_cache
+from app.services.search.suggestion_index import suggestion_indexes
 
 
 class CRUDPlace(CRUDBase[Place, PlaceCreate, PlaceUpdate]):
@@ -35,6 +37,10 @@ class CRUDPlace(CRUDBase[Place, PlaceCreate, PlaceUpdate]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        suggestion_indexes.index_place(db_obj)
+        viewport_tile_cache.invalidate_place(
+            user_id, [(db_obj.latitude, db_obj.longitude)]
+        )
         return db_obj
 
     def get_by_user(
@@ -292,6 +298,7 @@ class CRUDPlace(CRUDBase[Place, PlaceCreate, PlaceUpdate]):
     ) -> Place:
         """Update place including coordinates if provided."""
         obj_data = obj_in.dict(exclude_unset=True)
+        previous_coordinates = (db_obj.latitude, db_obj.longitude)
 
         # Extract coordinates
         latitude = obj_data.pop("latitude", None)
@@ -308,6 +315,11 @@ class CRUDPlace(CRUDBase[Place, PlaceCreate, PlaceUpdate]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        suggestion_indexes.index_place(db_obj)
+        viewport_tile_cache.invalidate_place(
+            db_obj.user_id,
+            [previous_coordinates, (db_obj.latitude, db_obj.longitude)],
+        )
         return db_obj
 
     def soft_delete(self, db: Session, *, place_id: UUID, user_id: UUID) -> bool:
@@ -316,6 +328,10 @@ class CRUDPlace(CRUDBase[Place, PlaceCreate, PlaceUpdate]):
         if db_obj:
             db_obj.status = PlaceStatus.INACTIVE
             db.commit()
+            suggestion_indexes.remove_place(place_id, user_id)
+            viewport_tile_cache.invalidate_place(
+                user_id, [(db_obj.latitude, db_obj.longitude)]
+            )
             return True
         return False
 
@@ -4,6 +4,8 @@ Hotly App FastAPI application.
 Main application entry point following backend_reference patterns.
 """
 
+import asyncio
+import logging
 from pathlib import Path
 from typing import Dict
 
@@ -23,6 +25,38 @@ from app.middleware.security_middleware import (
 )
 
 configure_logging()
+logger = logging.getLogger(__name__)
+
+
+async def startup_services() -> None:
+    """Initialize services on startup."""
+    try:
+        # Initialize Elasticsearch connection
+        from app.db.elasticsearch import init_elasticsearch
+
+        await init_elasticsearch()
+    except Exception as e:
+        logger.warning(f"Failed to initialize Elasticsearch: {e}")
+
+    try:
+        # Build the autocomplete prefix index off the event loop
+        from app.db.session import SessionLocal
+        from app.services.search.suggestion_index import suggestion_indexes
+
+        await asyncio.to_thread(suggestion_indexes.warm, SessionLocal)
+    except Exception as e:
+        logger.warning(f"Failed to build suggestion index: {e}")
+
+
+async def shutdown_services() -> None:
+    """Clean up resources on shutdown."""
+    try:
+        # Close Elasticsearch connection
+        from app.db.elasticsearch import close_elasticsearch
+
+        await close_elasticsearch()
+    except Exception as e:
+        logger.warning(f"Failed to close Elasticsearch connection: {e}")
 
 
 def create_app() -> FastAPI:
@@ -76,33 +110,8 @@ def create_app() -> FastAPI:
         """Root endpoint."""
         return {"message": "Hotly App API", "version": "0.1.0"}
 
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize services on startup."""
-        try:
-            # Initialize Elasticsearch connection
-            from app.db.elasticsearch import init_elasticsearch
-
-            await init_elasticsearch()
-        except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to initialize Elasticsearch: {e}")
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        """Clean up resources on shutdown."""
-        try:
-            # Close Elasticsearch connection
-            from app.db.elasticsearch import close_elasticsearch
-
-            await close_elasticsearch()
-        except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to close Elasticsearch connection: {e}")
+    app.add_event_handler("startup", startup_services)
+    app.add_event_handler("shutdown", shutdown_services)
 
     # Include health check routes
     app.include_router(health_router)
@@ -11,6 +11,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -135,6 +136,66 @@ class NotificationInteraction(Base):
         return f"<NotificationInteraction(id={self.id}, type={self.interaction_type})>"
 
 
+class NotificationHourlyRollup(Base):
+    """
+    Hourly notification metrics per type and platform.
+
+    Rebuilt incrementally from notification_logs/notification_interactions by
+    NotificationRollupService; interactions count toward the hour the
+    notification was sent in. Daily figures are sums of these rows.
+    """
+
+    __tablename__ = "notification_hourly_rollups"
+
+    bucket_start = Column(DateTime, primary_key=True)  # sent_at truncated to hour
+    notification_type = Column(String(50), primary_key=True)
+    platform = Column(String(20), primary_key=True)
+
+    sent = Column(Integer, default=0, nullable=False)
+    delivered = Column(Integer, default=0, nullable=False)
+    opened = Column(Integer, default=0, nullable=False)
+    clicked = Column(Integer, default=0, nullable=False)
+    dismissed = Column(Integer, default=0, nullable=False)
+    delivery_time_sum = Column(Float, default=0.0, nullable=False)
+    delivery_time_count = Column(Integer, default=0, nullable=False)
+
+    refreshed_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<NotificationHourlyRollup(bucket={self.bucket_start}, "
+            f"type={self.notification_type}, sent={self.sent})>"
+        )
+
+
+class UserNotificationHourlyRollup(Base):
+    """Hourly per-user delivered/engagement counts for pattern analysis."""
+
+    __tablename__ = "user_notification_hourly_rollups"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    notification_type = Column(String(50), primary_key=True)
+
+    received = Column(Integer, default=0, nullable=False)  # successful sends
+    opened = Column(Integer, default=0, nullable=False)
+    clicked = Column(Integer, default=0, nullable=False)
+    dismissed = Column(Integer, default=0, nullable=False)
+    response_time_sum = Column(Float, default=0.0, nullable=False)
+    response_time_count = Column(Integer, default=0, nullable=False)
+    fastest_response_seconds = Column(Float, nullable=True)
+
+    refreshed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (Index("idx_user_notification_rollup_bucket", "bucket_start"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserNotificationHourlyRollup(user_id={self.user_id}, "
+            f"bucket={self.bucket_start})>"
+        )
+
+
 class UserNotificationPattern(Base):
     """User-specific notification behavior patterns for personalization."""
 
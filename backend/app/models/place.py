@@ -18,7 +18,9 @@ from sqlalchemy import (
     Text,
     func,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
+from sqlalchemy.orm import deferred
+from sqlalchemy.schema import FetchedValue
 
 from app.db.base_class import Base
 
@@ -70,6 +72,17 @@ class Place(Base):
     tags = Column(ARRAY(String), nullable=True, default=[])
     keywords = Column(ARRAY(String), nullable=True, default=[])
 
+    # Weighted full-text vector (name A, tags B, description C, address D),
+    # maintained by the trg_places_search_vector trigger
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            nullable=True,
+            server_default=FetchedValue(),
+            server_onupdate=FetchedValue(),
+        )
+    )
+
     # Geographical data (PostGIS)
     coordinates = Column(
         Geography("POINT", srid=4326, spatial_index=True), nullable=True
@@ -105,6 +118,20 @@ class Place(Base):
             ),
             postgresql_using="gin",
         ),
+        # Stored full-text vector and trigram fuzzy matching
+        Index("idx_places_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_places_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_places_address_trgm",
+            "address",
+            postgresql_using="gin",
+            postgresql_ops={"address": "gin_trgm_ops"},
+        ),
         # Tag search optimization
         Index("idx_place_tags", "tags", postgresql_using="gin"),
         # Status filtering
@@ -175,3 +202,31 @@ class Place(Base):
             self.tags.remove(normalized_tag)
             return True
         return False
+
+
+class OnboardingSamplePlace(Base):
+    """
+    Popular-place pool used for onboarding samples.
+
+    Rebuilt in the background by OnboardingSamplePool from ``places``: the
+    places saved by the most distinct users in each region and category,
+    one row per real place (copies saved by different users are merged).
+    """
+
+    __tablename__ = "onboarding_sample_pool"
+
+    place_id = Column(UUID(as_uuid=True), primary_key=True)  # Representative copy
+    region_key = Column(String(32), nullable=False)
+    category = Column(String(50), nullable=False, index=True)
+    name = Column(String(255), nullable=False)
+    address = Column(String(500), nullable=True)
+    coordinates = Column(
+        Geography("POINT", srid=4326, spatial_index=True), nullable=False
+    )
+    popularity = Column(Integer, nullable=False)  # Distinct users who saved it
+    recommendation_score = Column(Float, nullable=True)  # Average across copies
+    region_rank = Column(Integer, nullable=False)
+    refreshed_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<OnboardingSamplePlace(place_id={self.place_id}, region={self.region_key}, category={self.category})>"
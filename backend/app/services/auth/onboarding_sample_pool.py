@@ -0,0 +1,227 @@
+"""
+Popular-place pool for onboarding samples.
+
+New users need a handful of real places near them in the categories they
+picked, and signup spikes make that query hot. Instead of ranking the whole
+``places`` table per signup, a background job (``app.workers.
+onboarding_pool_worker``) rebuilds ``onboarding_sample_pool``: copies of the
+same real place saved by different users are merged, ranked by the number of
+distinct users who saved them, and the top ``places_per_region`` per
+region (a ``region_degrees`` grid cell) and category are kept. The pool is
+bounded by the number of populated regions, not by the size of ``places``.
+
+Sampling is one PostGIS query: for each selected category a KNN (``<->``)
+scan of the pool's GiST index within ``radius_km``, run under a statement
+timeout. The per-category lists are then interleaved so every category is
+represented before any repeats.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+REGION_DEGREES = 0.1  # ~11km cells
+PLACES_PER_REGION = 50  # Per category
+DUPLICATE_SNAP_DEGREES = 0.0005  # ~50m: same name within one cell is one place
+
+REBUILD_POOL_SQL = """
+    WITH copies AS (
+        SELECT
+            id, user_id, name, category, recommendation_score, is_verified,
+            created_at,
+            floor(ST_Y(coordinates::geometry) / :snap_degrees)::bigint AS spot_y,
+            floor(ST_X(coordinates::geometry) / :snap_degrees)::bigint AS spot_x
+        FROM places
+        WHERE status = 'active' AND coordinates IS NOT NULL
+    ),
+    merged AS (
+        SELECT
+            (array_agg(
+                id ORDER BY is_verified DESC, recommendation_score DESC NULLS LAST,
+                created_at
+            ))[1] AS place_id,
+            category,
+            floor(spot_y * :snap_degrees / :region_degrees)::int || ':'
+                || floor(spot_x * :snap_degrees / :region_degrees)::int
+                AS region_key,
+            count(DISTINCT user_id) AS popularity,
+            avg(recommendation_score) AS recommendation_score
+        FROM copies
+        GROUP BY lower(name), category, spot_y, spot_x
+    ),
+    ranked AS (
+        SELECT
+            merged.*,
+            row_number() OVER (
+                PARTITION BY region_key, category
+                ORDER BY popularity DESC, recommendation_score DESC NULLS LAST,
+                    place_id
+            ) AS region_rank
+        FROM merged
+    )
+    INSERT INTO onboarding_sample_pool (
+        place_id, region_key, category, name, address, coordinates,
+        popularity, recommendation_score, region_rank, refreshed_at
+    )
+    SELECT
+        ranked.place_id, ranked.region_key, ranked.category, places.name,
+        places.address, places.coordinates, ranked.popularity,
+        ranked.recommendation_score, ranked.region_rank, :refreshed_at
+    FROM ranked
+    JOIN places ON places.id = ranked.place_id
+    WHERE ranked.region_rank <= :places_per_region
+"""
+
+NEAREST_SAMPLES_SQL = """
+    SELECT
+        nearest.place_id, nearest.name, nearest.address, nearest.category,
+        ST_Y(nearest.coordinates::geometry) AS latitude,
+        ST_X(nearest.coordinates::geometry) AS longitude,
+        ST_Distance(nearest.coordinates, origin.point) AS distance_m,
+        nearest.popularity, nearest.recommendation_score
+    FROM (
+        SELECT CAST(
+            ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326) AS geography
+        ) AS point
+    ) AS origin
+    CROSS JOIN unnest(CAST(:categories AS text[])) WITH ORDINALITY
+        AS selected(category, position)
+    CROSS JOIN LATERAL (
+        SELECT pool.*
+        FROM onboarding_sample_pool AS pool
+        WHERE pool.category = selected.category
+          AND ST_DWithin(pool.coordinates, origin.point, :radius_m)
+        ORDER BY pool.coordinates <-> origin.point
+        LIMIT :per_category
+    ) AS nearest
+    ORDER BY selected.position, distance_m
+"""
+
+
+def interleave_by_category(
+    places: Sequence[Dict[str, Any]], categories: Sequence[str], limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Round-robin places across categories in selection order.
+
+    ``places`` are nearest-first within each category. Categories that run
+    out are skipped, so the others fill the remaining slots; a place listed
+    under two selected categories is returned once.
+    """
+    queues: Dict[str, List[Dict[str, Any]]] = {category: [] for category in categories}
+    for place in places:
+        if place["category"] in queues:
+            queues[place["category"]].append(place)
+
+    picked: List[Dict[str, Any]] = []
+    seen = set()
+    depth = 0
+    while len(picked) < limit and any(len(queue) > depth for queue in queues.values()):
+        for category in categories:
+            queue = queues[category]
+            if depth < len(queue) and queue[depth]["place_id"] not in seen:
+                seen.add(queue[depth]["place_id"])
+                picked.append(queue[depth])
+                if len(picked) == limit:
+                    break
+        depth += 1
+    return picked
+
+
+class OnboardingSamplePool:
+    """Rebuilds and queries the onboarding popular-place pool."""
+
+    def __init__(
+        self,
+        db: Session,
+        region_degrees: float = REGION_DEGREES,
+        places_per_region: int = PLACES_PER_REGION,
+    ):
+        self.db = db
+        self.region_degrees = region_degrees
+        self.places_per_region = places_per_region
+
+    def refresh(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Rebuild the pool from ``places`` in one transaction.
+
+        Readers keep seeing the previous pool until the rebuild commits.
+        """
+        started = time.perf_counter()
+        try:
+            self.db.execute(text("DELETE FROM onboarding_sample_pool"))
+            result = self.db.execute(
+                text(REBUILD_POOL_SQL),
+                {
+                    "snap_degrees": DUPLICATE_SNAP_DEGREES,
+                    "region_degrees": self.region_degrees,
+                    "places_per_region": self.places_per_region,
+                    "refreshed_at": now or datetime.utcnow(),
+                },
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        summary = {
+            "places": result.rowcount,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        logger.info(f"Onboarding sample pool refreshed: {summary}")
+        return summary
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        categories: Sequence[str],
+        limit: int,
+        radius_km: Optional[float] = None,
+        timeout_ms: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Nearest popular places across ``categories``, interleaved.
+
+        Each category contributes up to ``limit`` candidates so others can
+        fill in for a category with nothing nearby. Raises on timeout; the
+        caller should roll back the session.
+        """
+        categories = list(dict.fromkeys(categories))
+        if not categories or limit <= 0:
+            return []
+
+        radius_km = radius_km or settings.ONBOARDING_SAMPLE_RADIUS_KM
+        timeout_ms = timeout_ms or settings.ONBOARDING_SAMPLE_TIMEOUT_MS
+        previous_timeout = self.db.execute(
+            text(
+                "SELECT current_setting('statement_timeout'), "
+                "set_config('statement_timeout', :timeout, true)"
+            ),
+            {"timeout": str(timeout_ms)},
+        ).scalar()
+        rows = self.db.execute(
+            text(NEAREST_SAMPLES_SQL),
+            {
+                "latitude": latitude,
+                "longitude": longitude,
+                "categories": categories,
+                "radius_m": radius_km * 1000,
+                "per_category": limit,
+            },
+        ).mappings()
+        places = [dict(row) for row in rows]
+        self.db.execute(
+            text("SELECT set_config('statement_timeout', :timeout, true)"),
+            {"timeout": previous_timeout},
+        )
+
+        return interleave_by_category(places, categories, limit)
@@ -8,6 +8,8 @@ from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
+from app.services.auth.onboarding_sample_pool import OnboardingSamplePool
+
 logger = logging.getLogger(__name__)
 
 
@@ -643,6 +645,11 @@ class OnboardingSampleService:
         """
         Generate sample places for onboarding exploration.
 
+        Samples are the nearest popular places in the selected categories,
+        taken from the precomputed onboarding pool in one KNN query. If the
+        pool has nothing nearby or the query fails (e.g. times out),
+        placeholder samples around the user's location are returned instead.
+
         Args:
             user_id: User identifier
             user_location: User's current location
@@ -653,27 +660,24 @@ class OnboardingSampleService:
             Sample places for onboarding exploration
         """
         try:
-            # Generate diverse samples based on user preferences
-            sample_places = []
-
-            for i in range(sample_count):
-                category = selected_categories[i % len(selected_categories)]
-
-                # Mock sample place generation
-                sample_place = {
-                    "sample_id": f"sample_{category}_{i}",
-                    "place_name": f"추천 {category} #{i + 1}",
-                    "category": category,
-                    "latitude": user_location["latitude"] + (i * 0.001),
-                    "longitude": user_location["longitude"] + (i * 0.001),
-                    "distance_km": 0.5 + (i * 0.3),
-                    "rating": 4.2 + (i * 0.1),
-                    "why_recommended": f"{category} 카테고리 관심사 기반 추천",
-                    "sample_type": "category_matched" if i < 2 else "popular_local",
-                    "interaction_encouragement": "탭해서 자세한 정보를 확인해보세요!",
-                }
+            try:
+                nearby_places = OnboardingSamplePool(self.db).nearest(
+                    user_location["latitude"],
+                    user_location["longitude"],
+                    selected_categories,
+                    sample_count,
+                )
+            except Exception as e:
+                logger.warning(f"Sample pool lookup failed, using placeholders: {e}")
+                self.db.rollback()
+                nearby_places = []
 
-                sample_places.append(sample_place)
+            if nearby_places:
+                sample_places = self._pool_samples(nearby_places)
+            else:
+                sample_places = self._placeholder_samples(
+                    user_location, selected_categories, sample_count
+                )
 
             sample_result = {
                 "sample_places": sample_places,
@@ -684,15 +688,78 @@ class OnboardingSampleService:
                 ),
                 "sample_generated_at": datetime.utcnow().isoformat(),
                 "personalization_applied": True,
+                "sample_source": "popular_pool" if nearby_places else "placeholder",
             }
 
-            logger.info(f"Generated {sample_count} sample places for user {user_id}")
+            logger.info(
+                f"Generated {len(sample_places)} sample places for user {user_id}"
+            )
             return sample_result
 
         except Exception as e:
             logger.error(f"Error generating sample places: {e}")
             raise
 
+    def _pool_samples(self, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Format pool places as samples; the first per category is the match."""
+        samples = []
+        seen_categories = set()
+        for place in places:
+            category = place["category"]
+            score = place["recommendation_score"]
+            samples.append(
+                {
+                    "sample_id": str(place["place_id"]),
+                    "place_id": str(place["place_id"]),
+                    "place_name": place["name"],
+                    "address": place["address"],
+                    "category": category,
+                    "latitude": place["latitude"],
+                    "longitude": place["longitude"],
+                    "distance_km": round(place["distance_m"] / 1000, 2),
+                    "rating": round(float(score), 1) if score is not None else None,
+                    "popularity": place["popularity"],
+                    "why_recommended": f"근처에서 {place['popularity']}명이 저장한 {category} 장소",
+                    "sample_type": (
+                        "popular_local"
+                        if category in seen_categories
+                        else "category_matched"
+                    ),
+                    "interaction_encouragement": "탭해서 자세한 정보를 확인해보세요!",
+                }
+            )
+            seen_categories.add(category)
+        return samples
+
+    def _placeholder_samples(
+        self,
+        user_location: Dict[str, float],
+        selected_categories: List[str],
+        sample_count: int,
+    ) -> List[Dict[str, Any]]:
+        """Placeholder samples around the user when no real places are nearby."""
+        sample_places = []
+
+        for i in range(sample_count):
+            category = selected_categories[i % len(selected_categories)]
+
+            sample_place = {
+                "sample_id": f"sample_{category}_{i}",
+                "place_name": f"추천 {category} #{i + 1}",
+                "category": category,
+                "latitude": user_location["latitude"] + (i * 0.001),
+                "longitude": user_location["longitude"] + (i * 0.001),
+                "distance_km": 0.5 + (i * 0.3),
+                "rating": 4.2 + (i * 0.1),
+                "why_recommended": f"{category} 카테고리 관심사 기반 추천",
+                "sample_type": "category_matched" if i < 2 else "popular_local",
+                "interaction_encouragement": "탭해서 자세한 정보를 확인해보세요!",
+            }
+
+            sample_places.append(sample_place)
+
+        return sample_places
+
     def _analyze_interactions(
         self, sample_interactions: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
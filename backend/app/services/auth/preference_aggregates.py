@@ -0,0 +1,585 @@
+"""
+Per-user preference aggregates.
+
+A user's behavior history over an analysis window is reduced to additive
+totals: counts and rating sums per place category, price band, hour of day,
+time-of-day/day-of-week label and ambiance tag, rating moments and a recent
+count for the confidence score, and coordinate sums per location cell. One
+grouped SQL statement computes all of them (behaviors joined to places,
+action weights applied in SQL), and a new behavior only adds to a handful
+of totals, so cached aggregates are updated in place when it is recorded.
+
+Windows are whole UTC days (the current day plus the N days before it).
+Aggregates for the windows in ``CACHED_WINDOWS`` live in one Redis hash per
+user and window with fields ``<dimension>|<stat>|<key>``; the hash expires
+at the next UTC midnight, when the window slides and the next read rebuilds
+it. A read is one HGETALL whose size depends on the number of distinct
+categories, tags and cells, not on the length of the history. Expiry also
+bounds drift from a write racing a rebuild. If Redis is unavailable,
+aggregates are computed straight from the database.
+"""
+
+import logging
+import math
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from geoalchemy2 import Geometry
+from redis import Redis
+from sqlalchemy import (
+    Float,
+    Integer,
+    String,
+    case,
+    cast,
+    extract,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.place import Place
+from app.models.user_behavior import UserBehavior
+from app.utils.hotspots import HotspotDetector
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "hotly:preference_aggregates"
+BUILT_FIELD = "_built"
+CACHED_WINDOWS = (30, 60, 90)  # Analysis windows used by UserPreferenceService
+RECENT_DAYS = 30
+REDIS_RETRY_SECONDS = 30.0
+
+ACTION_WEIGHTS = {"visit": 1.5, "save": 1.2, "share": 1.3}
+NEUTRAL_RATING = 3.0
+AMBIANCE_KEYWORDS = ("조용", "분위기", "로맨틱", "활기", "편안")
+LOCATION_CELL_DEGREES = 0.005  # ~500m cells, clustered into hotspots on read
+
+# Visits are weighted at their cell centroid, so the radius floor covers a cell
+hotspot_detector = HotspotDetector(
+    cell_size_km=1.0, min_cell_share=0.005, min_hotspot_weight=2.0, min_radius_km=0.5
+)
+
+# Dimensions
+ALL = "all"
+RECENT = "recent"
+RATING = "rating"
+CATEGORY = "category"
+PRICE = "price"
+HOUR = "hour"
+TIME_OF_DAY = "time"
+DAY_OF_WEEK = "day"
+AMBIANCE = "ambiance"
+CELL = "cell"
+
+# Stats
+COUNT = "n"
+TOTAL = "s"
+TOTAL_SQ = "q"
+LATITUDE_SUM = "la"
+LONGITUDE_SUM = "lo"
+
+STATS = (COUNT, TOTAL, TOTAL_SQ, LATITUDE_SUM, LONGITUDE_SUM)
+
+Aggregates = Dict[str, float]
+Totals = Dict[Tuple[str, str, str], float]
+DistanceFn = Callable[[float, float, float, float], float]
+
+
+def aggregate_field(dimension: str, stat: str, key: str = "") -> str:
+    return f"{dimension}|{stat}|{key}"
+
+
+def window_start(now: datetime, days: int) -> datetime:
+    """UTC midnight starting a window of today plus the previous ``days``."""
+    return datetime.combine(now.date(), datetime.min.time()) - timedelta(days=days)
+
+
+def seconds_until_rollover(now: datetime) -> int:
+    """Seconds until the next UTC midnight, when cached windows slide."""
+    return max(1, math.ceil((window_start(now, -1) - now).total_seconds()))
+
+
+def location_cell(latitude: float, longitude: float) -> str:
+    return (
+        f"{math.floor(latitude / LOCATION_CELL_DEGREES)}:"
+        f"{math.floor(longitude / LOCATION_CELL_DEGREES)}"
+    )
+
+
+def _utc(moment: datetime) -> datetime:
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def behavior_aggregates(
+    behavior: Any, place: Optional[Any], recent: bool = True
+) -> Aggregates:
+    """
+    Aggregate increments contributed by one behavior.
+
+    Mirrors ``build_aggregate_query`` row for row, so adding these to cached
+    aggregates gives the same result as rebuilding them.
+
+    Args:
+        behavior: UserBehavior (or any object with the same attributes)
+        place: The behavior's place, or None if it has none
+        recent: Whether the behavior falls in the last ``RECENT_DAYS``
+
+    Returns:
+        Field -> increment
+    """
+    rating = behavior.rating or None
+    increments: Aggregates = defaultdict(float)
+
+    def add(dimension: str, key: str = "", **stats: float) -> None:
+        for stat, value in stats.items():
+            increments[aggregate_field(dimension, stat, key)] += value
+
+    add(ALL, n=1)
+    if recent:
+        add(RECENT, n=1)
+    if rating is not None:
+        add(RATING, n=1, s=rating, q=rating * rating)
+        for dimension, key in _rated_keys(behavior):
+            add(dimension, key, n=1, s=rating)
+
+    if place is not None:
+        weighted = ACTION_WEIGHTS.get(behavior.action, 1.0) * (rating or NEUTRAL_RATING)
+        for dimension, key in ((CATEGORY, place.category), (PRICE, place.price_range)):
+            if key:
+                add(dimension, key, n=1, s=weighted)
+        latitude, longitude = place.latitude, place.longitude
+        if latitude is not None and longitude is not None:
+            add(
+                CELL, location_cell(latitude, longitude), n=1, la=latitude, lo=longitude
+            )
+
+    return dict(increments)
+
+
+def _rated_keys(behavior: Any) -> List[Tuple[str, str]]:
+    """Hour, label and ambiance tag buckets a rated behavior counts toward."""
+    keys = [(HOUR, str(_utc(behavior.created_at).hour))]
+    for dimension, key in (
+        (TIME_OF_DAY, behavior.time_of_day),
+        (DAY_OF_WEEK, behavior.day_of_week),
+    ):
+        if key:
+            keys.append((dimension, key))
+    for tag in behavior.tags_added or []:
+        if any(keyword in tag for keyword in AMBIANCE_KEYWORDS):
+            keys.append((AMBIANCE, tag))
+    return keys
+
+
+def build_aggregate_query(user_id: Any, since: datetime, recent_since: datetime):
+    """
+    One statement computing every aggregate for a user's window.
+
+    Behaviors are left-joined to places once in a CTE (action weights, UTC
+    hour, recency and location cells are computed there); each dimension is
+    an aggregate over that CTE and the results are combined with UNION ALL.
+    Rows are ``(dimension, key, n, s, q, la, lo)``.
+    """
+    rating = func.nullif(UserBehavior.rating, 0)
+    weight = case(
+        *[(UserBehavior.action == action, w) for action, w in ACTION_WEIGHTS.items()],
+        else_=1.0,
+    )
+    point = cast(Place.coordinates, Geometry("POINT", srid=4326))
+    latitude = func.ST_Y(point)
+    longitude = func.ST_X(point)
+
+    facts = (
+        select(
+            (UserBehavior.created_at >= recent_since).label("recent"),
+            cast(
+                extract("hour", func.timezone("UTC", UserBehavior.created_at)),
+                Integer,
+            ).label("hour"),
+            rating.label("rating"),
+            (weight * func.coalesce(rating, NEUTRAL_RATING)).label("weighted"),
+            UserBehavior.tags_added.label("tags"),
+            UserBehavior.time_of_day.label("time_of_day"),
+            UserBehavior.day_of_week.label("day_of_week"),
+            Place.id.label("place_id"),
+            Place.category.label("category"),
+            Place.price_range.label("price_range"),
+            latitude.label("latitude"),
+            longitude.label("longitude"),
+            cast(func.floor(latitude / LOCATION_CELL_DEGREES), Integer).label(
+                "lat_cell"
+            ),
+            cast(func.floor(longitude / LOCATION_CELL_DEGREES), Integer).label(
+                "lng_cell"
+            ),
+        )
+        .select_from(UserBehavior)
+        .outerjoin(Place, Place.id == UserBehavior.place_id)
+        .where(UserBehavior.user_id == user_id, UserBehavior.created_at >= since)
+        .cte("behavior_facts")
+    )
+    tags = (
+        select(facts.c.rating, func.unnest(facts.c.tags).label("tag"))
+        .where(facts.c.rating.isnot(None))
+        .subquery("behavior_tags")
+    )
+
+    def aggregate(source, dimension, keys, where=None, **stats):
+        # Group keys are plain columns; multi-column keys are joined with ":"
+        if keys:
+            key = func.concat_ws(":", *[cast(k, String) for k in keys])
+        else:
+            key = literal("")
+        columns = [
+            literal(dimension).label("dimension"),
+            key.label("key"),
+            func.count().label(COUNT),
+        ]
+        for stat in STATS[1:]:
+            value = stats.get(stat)
+            columns.append(
+                cast(value if value is not None else null(), Float).label(stat)
+            )
+        query = select(*columns).select_from(source)
+        if where is not None:
+            query = query.where(where)
+        return query.group_by(*keys) if keys else query
+
+    c = facts.c
+    rated = c.rating.isnot(None)
+    has_place = c.place_id.isnot(None)
+    return union_all(
+        aggregate(facts, ALL, []),
+        aggregate(facts, RECENT, [], c.recent),
+        aggregate(
+            facts,
+            RATING,
+            [],
+            rated,
+            s=func.sum(c.rating),
+            q=func.sum(c.rating * c.rating),
+        ),
+        aggregate(facts, HOUR, [c.hour], rated, s=func.sum(c.rating)),
+        aggregate(
+            facts,
+            TIME_OF_DAY,
+            [c.time_of_day],
+            rated & c.time_of_day.isnot(None),
+            s=func.sum(c.rating),
+        ),
+        aggregate(
+            facts,
+            DAY_OF_WEEK,
+            [c.day_of_week],
+            rated & c.day_of_week.isnot(None),
+            s=func.sum(c.rating),
+        ),
+        aggregate(
+            tags,
+            AMBIANCE,
+            [tags.c.tag],
+            or_(*[tags.c.tag.contains(keyword) for keyword in AMBIANCE_KEYWORDS]),
+            s=func.sum(tags.c.rating),
+        ),
+        aggregate(
+            facts,
+            CATEGORY,
+            [c.category],
+            has_place & c.category.isnot(None),
+            s=func.sum(c.weighted),
+        ),
+        aggregate(
+            facts,
+            PRICE,
+            [c.price_range],
+            has_place & c.price_range.isnot(None),
+            s=func.sum(c.weighted),
+        ),
+        aggregate(
+            facts,
+            CELL,
+            [c.lat_cell, c.lng_cell],
+            c.latitude.isnot(None) & c.longitude.isnot(None),
+            la=func.sum(c.latitude),
+            lo=func.sum(c.longitude),
+        ),
+    )
+
+
+def query_aggregates(
+    db: Session, user_id: Any, since: datetime, recent_since: datetime
+) -> Aggregates:
+    """Compute a user's aggregates since ``since`` in one database round trip."""
+    aggregates: Aggregates = {}
+    query = build_aggregate_query(user_id, since, recent_since)
+    for row in db.execute(query).all():
+        for stat in STATS:
+            value = getattr(row, stat)
+            if value:
+                field = aggregate_field(row.dimension, stat, row.key)
+                aggregates[field] = float(value)
+    return aggregates
+
+
+def confidence_score(
+    count: float,
+    recent_count: float,
+    rating_count: float,
+    rating_sum: float,
+    rating_sum_sq: float,
+) -> float:
+    """
+    Confidence in a preference analysis from aggregate counts.
+
+    Averages a data-volume score (saturating at 50 behaviors), the share of
+    recent behaviors, and rating consistency (1 - variance/4).
+    """
+    if not count:
+        return 0.0
+
+    data_points_score = min(count / 50, 1.0)
+    recency_score = recent_count / count
+
+    if rating_count > 1:
+        rating_variance = max(
+            rating_sum_sq - rating_sum * rating_sum / rating_count, 0.0
+        ) / (rating_count - 1)
+        consistency_score = max(0, 1.0 - (rating_variance / 4.0))
+    else:
+        consistency_score = 0.5
+
+    confidence = (data_points_score + recency_score + consistency_score) / 3
+    return round(confidence, 3)
+
+
+def summarize_preferences(
+    aggregates: Aggregates, distance: DistanceFn
+) -> Optional[Dict[str, Any]]:
+    """
+    Turn a window's aggregates into preference dimensions.
+
+    Args:
+        aggregates: Field -> value, as stored in the cache
+        distance: Haversine distance in km ``(lat1, lng1, lat2, lng2)``
+
+    Returns:
+        Keyword arguments for PreferenceAnalysisResponse (without user_id and
+        analysis_date), or None if there are no behaviors in the window
+    """
+    totals: Totals = {}
+    for field, value in aggregates.items():
+        if field != BUILT_FIELD:
+            dimension, stat, key = field.split("|", 2)
+            totals[dimension, stat, key] = float(value)
+
+    count = totals.get((ALL, COUNT, ""), 0.0)
+    if not count:
+        return None
+
+    def normalized(dimension: str) -> Dict[str, float]:
+        return {
+            key: min(totals.get((dimension, TOTAL, key), 0.0) / n / 5.0, 1.0)
+            for key, n in _counts(totals, dimension)
+        }
+
+    time_preferences = normalized(TIME_OF_DAY)
+    time_preferences.update(normalized(DAY_OF_WEEK))
+    for hour, score in normalized(HOUR).items():
+        time_preferences[f"hour_{int(hour):02d}"] = score
+
+    return {
+        "cuisine_preferences": normalized(CATEGORY),
+        "ambiance_preferences": normalized(AMBIANCE),
+        "price_preferences": normalized(PRICE),
+        "location_preferences": _location_preferences(totals, distance),
+        "time_preferences": time_preferences,
+        "confidence_score": confidence_score(
+            count,
+            totals.get((RECENT, COUNT, ""), 0.0),
+            totals.get((RATING, COUNT, ""), 0.0),
+            totals.get((RATING, TOTAL, ""), 0.0),
+            totals.get((RATING, TOTAL_SQ, ""), 0.0),
+        ),
+        "data_points_count": int(count),
+    }
+
+
+def _counts(totals: Totals, dimension: str) -> Iterable[Tuple[str, float]]:
+    for (dim, stat, key), count in totals.items():
+        if dim == dimension and stat == COUNT and count:
+            yield key, count
+
+
+def _location_preferences(totals: Totals, distance: DistanceFn) -> Dict[str, Any]:
+    cells = [
+        (
+            count,
+            totals.get((CELL, LATITUDE_SUM, key), 0.0) / count,
+            totals.get((CELL, LONGITUDE_SUM, key), 0.0) / count,
+        )
+        for key, count in _counts(totals, CELL)
+    ]
+    if not cells:
+        return {"preferred_areas": [], "travel_radius_km": 5.0}
+
+    visits = sum(count for count, _, _ in cells)
+    center_lat = sum(count * lat for count, lat, _ in cells) / visits
+    center_lng = sum(count * lng for count, _, lng in cells) / visits
+    # Average distance to the center, with each visit at its cell centroid
+    avg_radius = (
+        sum(
+            count * distance(center_lat, center_lng, lat, lng)
+            for count, lat, lng in cells
+        )
+        / visits
+    )
+
+    hotspots = hotspot_detector.detect((lat, lng, count) for count, lat, lng in cells)
+
+    return {
+        "preferred_center": {"latitude": center_lat, "longitude": center_lng},
+        "travel_radius_km": round(avg_radius, 1),
+        "activity_hotspots": [hotspot.to_dict() for hotspot in hotspots],
+    }
+
+
+class PreferenceAggregateCache:
+    """Redis hash per user and analysis window holding preference aggregates."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Optional[Redis] = None,
+        windows: Tuple[int, ...] = CACHED_WINDOWS,
+        prefix: str = CACHE_PREFIX,
+    ):
+        self.redis_url = redis_url
+        self.windows = windows
+        self.prefix = prefix
+
+        self._client = client
+        self._redis_retry_at = 0.0
+        self._stats: Counter = Counter()
+
+    def key(self, user_id: Any, window_days: int) -> str:
+        return f"{self.prefix}:{user_id}:{window_days}"
+
+    def get(self, user_id: Any, window_days: int) -> Optional[Aggregates]:
+        """Return a user's cached aggregates for a window, or None if not built."""
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            raw = client.hgetall(self.key(user_id, window_days))
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+
+        if BUILT_FIELD not in raw:
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        return {field: float(value) for field, value in raw.items()}
+
+    def store(
+        self,
+        user_id: Any,
+        window_days: int,
+        aggregates: Aggregates,
+        expires_in: int,
+    ) -> None:
+        """Replace a user's aggregates for a window with a fresh build."""
+        client = self._get_client()
+        if client is None:
+            return
+        key = self.key(user_id, window_days)
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.hset(key, mapping={**aggregates, BUILT_FIELD: time.time()})
+            pipe.expire(key, expires_in)
+            pipe.execute()
+            self._stats["builds"] += 1
+        except Exception as e:
+            self._redis_failed(e)
+
+    def built_windows(self, user_id: Any) -> List[int]:
+        """Windows with built aggregates for a user."""
+        client = self._get_client()
+        if client is None:
+            return []
+        try:
+            pipe = client.pipeline(transaction=False)
+            for window_days in self.windows:
+                pipe.hexists(self.key(user_id, window_days), BUILT_FIELD)
+            built = pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            return []
+        return [window for window, exists in zip(self.windows, built) if exists]
+
+    def increment(
+        self, user_id: Any, windows: List[int], increments: Aggregates
+    ) -> None:
+        """
+        Add one behavior's increments to a user's built windows.
+
+        Callers pass ``built_windows``; if a hash expires in between, the
+        increments land in a hash without the built marker, which the next
+        read replaces with a fresh build.
+        """
+        client = self._get_client()
+        if client is None or not windows or not increments:
+            return
+        try:
+            pipe = client.pipeline(transaction=True)
+            for window_days in windows:
+                key = self.key(user_id, window_days)
+                for field, value in increments.items():
+                    pipe.hincrbyfloat(key, field, value)
+            pipe.execute()
+            self._stats["increments"] += 1
+        except Exception as e:
+            self._redis_failed(e)
+
+    def invalidate(self, user_id: Any) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            client.delete(*[self.key(user_id, window) for window in self.windows])
+        except Exception as e:
+            self._redis_failed(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["redis_available"] = time.monotonic() >= self._redis_retry_at
+        return stats
+
+    # Redis -----------------------------------------------------------------
+
+    def _get_client(self) -> Optional[Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._client is None and self.redis_url is not None:
+            self._client = Redis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._stats["redis_errors"] += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Preference aggregate cache Redis unavailable: {error}")
+
+
+# Shared by every UserPreferenceService instance
+preference_aggregate_cache = PreferenceAggregateCache(redis_url=settings.REDIS_URL)
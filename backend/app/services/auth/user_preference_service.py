@@ -1,9 +1,8 @@
 """User preference analysis and profiling service."""
 
 import logging
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
@@ -15,6 +14,19 @@ from app.schemas.preference import (
     UserBehaviorCreate,
     UserProfileResponse,
 )
+from app.services.auth.preference_aggregates import (
+    RECENT_DAYS,
+    Aggregates,
+    PreferenceAggregateCache,
+    behavior_aggregates,
+    confidence_score,
+    preference_aggregate_cache,
+    query_aggregates,
+    seconds_until_rollover,
+    summarize_preferences,
+    window_start,
+)
+from app.utils.distance_calculator import DistanceCalculator
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +34,11 @@ logger = logging.getLogger(__name__)
 class UserPreferenceService:
     """Service for analyzing user preferences and building user profiles."""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self, db: Session, aggregate_cache: Optional[PreferenceAggregateCache] = None
+    ):
         self.db = db
+        self.aggregate_cache = aggregate_cache or preference_aggregate_cache
 
     def record_user_behavior(
         self, user_id: UUID, behavior_data: UserBehaviorCreate
@@ -55,6 +70,7 @@ class UserPreferenceService:
             self.db.add(behavior)
             self.db.commit()
             self.db.refresh(behavior)
+            self._update_cached_aggregates(user_id, behavior)
 
             logger.info(f"Recorded behavior for user {user_id}: {behavior_data.action}")
             return behavior
@@ -78,49 +94,63 @@ class UserPreferenceService:
             Comprehensive preference analysis
         """
         try:
-            # Get user behavior data
-            cutoff_date = datetime.utcnow() - timedelta(days=analysis_window_days)
-
-            behaviors = (
-                self.db.query(UserBehavior)
-                .filter(
-                    UserBehavior.user_id == user_id,
-                    UserBehavior.created_at >= cutoff_date,
-                )
-                .all()
+            now = datetime.utcnow()
+            aggregates = self._load_aggregates(user_id, analysis_window_days, now)
+            summary = summarize_preferences(
+                aggregates, DistanceCalculator(self.db).haversine_distance
             )
 
-            if not behaviors:
+            if summary is None:
                 return self._default_preferences()
 
-            # Analyze different preference dimensions
-            cuisine_prefs = self._analyze_cuisine_preferences(user_id, behaviors)
-            ambiance_prefs = self._analyze_ambiance_preferences(behaviors)
-            price_prefs = self._analyze_price_preferences(user_id, behaviors)
-            location_prefs = self._analyze_location_preferences(user_id, behaviors)
-            time_prefs = self._analyze_time_preferences(behaviors)
-
-            # Calculate overall confidence
-            confidence_score = self._calculate_confidence_score(behaviors)
-
             logger.info(f"Preference analysis completed for user {user_id}")
 
             return PreferenceAnalysisResponse(
-                user_id=str(user_id),
-                cuisine_preferences=cuisine_prefs,
-                ambiance_preferences=ambiance_prefs,
-                price_preferences=price_prefs,
-                location_preferences=location_prefs,
-                time_preferences=time_prefs,
-                confidence_score=confidence_score,
-                analysis_date=datetime.utcnow(),
-                data_points_count=len(behaviors),
+                user_id=str(user_id), analysis_date=now, **summary
             )
 
         except Exception as e:
             logger.error(f"Failed to analyze preferences for user {user_id}: {e}")
             raise
 
+    def _load_aggregates(
+        self, user_id: UUID, analysis_window_days: int, now: datetime
+    ) -> Aggregates:
+        """Get cached aggregates, building them with one grouped query on a miss."""
+        since = window_start(now, analysis_window_days)
+        recent_since = window_start(now, RECENT_DAYS)
+        if analysis_window_days not in self.aggregate_cache.windows:
+            return query_aggregates(self.db, user_id, since, recent_since)
+
+        aggregates = self.aggregate_cache.get(user_id, analysis_window_days)
+        if aggregates is None:
+            aggregates = query_aggregates(self.db, user_id, since, recent_since)
+            self.aggregate_cache.store(
+                user_id,
+                analysis_window_days,
+                aggregates,
+                seconds_until_rollover(now),
+            )
+        return aggregates
+
+    def _update_cached_aggregates(self, user_id: UUID, behavior: UserBehavior):
+        """Add a recorded behavior to the user's cached aggregates, if built."""
+        try:
+            windows = self.aggregate_cache.built_windows(user_id)
+            if not windows:
+                return  # Built from the database, including this row, on next read
+            place = None
+            if behavior.place_id:
+                place = (
+                    self.db.query(Place).filter(Place.id == behavior.place_id).first()
+                )
+            self.aggregate_cache.increment(
+                user_id, windows, behavior_aggregates(behavior, place)
+            )
+        except Exception as e:
+            # The next rebuild picks the behavior up
+            logger.error(f"Failed to update preference aggregates: {e}")
+
     def update_preferences_from_feedback(
         self,
         user_id: UUID,
@@ -177,72 +207,6 @@ class UserPreferenceService:
             logger.error(f"Failed to update preferences from feedback: {e}")
             return False
 
-    def _analyze_cuisine_preferences(
-        self, user_id: UUID, behaviors: List[UserBehavior]
-    ) -> Dict[str, float]:
-        """Analyze cuisine preferences from behavior data."""
-        # Get places associated with behaviors
-        place_ids = [b.place_id for b in behaviors if b.place_id]
-        places = self.db.query(Place).filter(Place.id.in_(place_ids)).all()
-        place_map = {str(p.id): p for p in places}
-
-        # Count interactions by category
-        category_scores = defaultdict(list)
-
-        for behavior in behaviors:
-            if behavior.place_id and str(behavior.place_id) in place_map:
-                place = place_map[str(behavior.place_id)]
-                score = behavior.rating or 3.0  # Default neutral rating
-
-                # Weight by action type
-                if behavior.action == "visit":
-                    score *= 1.5
-                elif behavior.action == "save":
-                    score *= 1.2
-                elif behavior.action == "share":
-                    score *= 1.3
-
-                category_scores[place.category].append(score)
-
-        # Calculate preference scores
-        preferences = {}
-        for category, scores in category_scores.items():
-            if scores:
-                avg_score = sum(scores) / len(scores)
-                preferences[category] = min(avg_score / 5.0, 1.0)  # Normalize to 0-1
-
-        return preferences
-
-    def _analyze_ambiance_preferences(
-        self, behaviors: List[UserBehavior]
-    ) -> Dict[str, float]:
-        """Analyze ambiance preferences from tags and behavior."""
-        ambiance_tags = defaultdict(list)
-
-        for behavior in behaviors:
-            if behavior.tags_added and behavior.rating:
-                for tag in behavior.tags_added:
-                    # Categorize ambiance-related tags
-                    if any(amb in tag for amb in ["조용", "분위기", "로맨틱", "활기", "편안"]):
-                        ambiance_tags[tag].append(behavior.rating)
-
-        # Calculate preferences
-        preferences = {}
-        for tag, ratings in ambiance_tags.items():
-            if ratings:
-                avg_rating = sum(ratings) / len(ratings)
-                preferences[tag] = min(avg_rating / 5.0, 1.0)
-
-        return preferences
-
-    def _analyze_price_preferences(
-        self, user_id: UUID, behaviors: List[UserBehavior]
-    ) -> Dict[str, float]:
-        """Analyze price range preferences."""
-        # This would analyze price-related behavior
-        # For now, return default preferences
-        return {"budget": 0.3, "moderate": 0.5, "expensive": 0.2}
-
     async def get_notification_settings(self, user_id: str):
         """Get user's notification settings."""
         # Mock implementation for now
@@ -268,99 +232,17 @@ class UserPreferenceService:
             ),
         )
 
-    def _analyze_location_preferences(
-        self, user_id: UUID, behaviors: List[UserBehavior]
-    ) -> Dict[str, Any]:
-        """Analyze location preferences."""
-        place_ids = [b.place_id for b in behaviors if b.place_id]
-        places = self.db.query(Place).filter(Place.id.in_(place_ids)).all()
-
-        if not places:
-            return {"preferred_areas": [], "travel_radius_km": 5.0}
-
-        # Analyze preferred geographic areas
-        coordinates = [
-            (p.latitude, p.longitude) for p in places if p.latitude and p.longitude
-        ]
-
-        if coordinates:
-            # Calculate center of activity
-            center_lat = sum(lat for lat, lng in coordinates) / len(coordinates)
-            center_lng = sum(lng for lat, lng in coordinates) / len(coordinates)
-
-            # Calculate average travel distance
-            from app.utils.distance_calculator import DistanceCalculator
-
-            calc = DistanceCalculator()
-
-            distances = []
-            for lat, lng in coordinates:
-                dist = calc.haversine_distance(center_lat, center_lng, lat, lng)
-                distances.append(dist)
-
-            avg_radius = sum(distances) / len(distances) if distances else 5.0
-
-            return {
-                "preferred_center": {"latitude": center_lat, "longitude": center_lng},
-                "travel_radius_km": round(avg_radius, 1),
-                "activity_hotspots": self._identify_hotspots(coordinates),
-            }
-
-        return {"preferred_areas": [], "travel_radius_km": 5.0}
-
-    def _analyze_time_preferences(
-        self, behaviors: List[UserBehavior]
-    ) -> Dict[str, float]:
-        """Analyze temporal preferences."""
-        time_patterns = defaultdict(list)
-
-        for behavior in behaviors:
-            if behavior.time_of_day and behavior.rating:
-                time_patterns[behavior.time_of_day].append(behavior.rating)
-
-            if behavior.day_of_week and behavior.rating:
-                time_patterns[behavior.day_of_week].append(behavior.rating)
-
-        preferences = {}
-        for time_period, ratings in time_patterns.items():
-            if ratings:
-                avg_rating = sum(ratings) / len(ratings)
-                preferences[time_period] = min(avg_rating / 5.0, 1.0)
-
-        return preferences
-
     def _calculate_confidence_score(self, behaviors: List[UserBehavior]) -> float:
         """Calculate confidence in preference analysis."""
-        if not behaviors:
-            return 0.0
-
-        # Factors affecting confidence:
-        # 1. Number of data points
-        # 2. Recency of data
-        # 3. Consistency of ratings
-
-        data_points_score = min(len(behaviors) / 50, 1.0)  # Normalize to 50 behaviors
-
-        # Recency score
         now = datetime.utcnow()
-        recent_behaviors = [b for b in behaviors if (now - b.created_at).days <= 30]
-        recency_score = len(recent_behaviors) / len(behaviors) if behaviors else 0
-
-        # Consistency score (lower variance in ratings = higher consistency)
         ratings = [b.rating for b in behaviors if b.rating]
-        if len(ratings) > 1:
-            import statistics
-
-            rating_variance = statistics.variance(ratings)
-            consistency_score = max(
-                0, 1.0 - (rating_variance / 4.0)
-            )  # Normalize variance
-        else:
-            consistency_score = 0.5
-
-        # Combined confidence score
-        confidence = (data_points_score + recency_score + consistency_score) / 3
-        return round(confidence, 3)
+        return confidence_score(
+            len(behaviors),
+            sum(1 for b in behaviors if (now - b.created_at).days <= RECENT_DAYS),
+            len(ratings),
+            sum(ratings),
+            sum(r * r for r in ratings),
+        )
 
     def _default_preferences(self) -> PreferenceAnalysisResponse:
         """Return default preferences for new users."""
@@ -388,59 +270,6 @@ class UserPreferenceService:
         else:
             return "night"
 
-    def _identify_hotspots(
-        self, coordinates: List[Tuple[float, float]]
-    ) -> List[Dict[str, Any]]:
-        """Identify geographic hotspots from coordinate data."""
-        if not coordinates:
-            return []
-
-        # Simple clustering to identify hotspots
-        # In production, would use more sophisticated clustering algorithm
-
-        hotspots = []
-        used_coords = set()
-
-        for i, (lat1, lng1) in enumerate(coordinates):
-            if i in used_coords:
-                continue
-
-            cluster_coords = [(lat1, lng1)]
-            used_coords.add(i)
-
-            # Find nearby coordinates
-            for j, (lat2, lng2) in enumerate(coordinates):
-                if j in used_coords or j <= i:
-                    continue
-
-                from app.utils.distance_calculator import DistanceCalculator
-
-                calc = DistanceCalculator()
-                distance = calc.haversine_distance(lat1, lng1, lat2, lng2)
-
-                if distance <= 2.0:  # 2km threshold for hotspot
-                    cluster_coords.append((lat2, lng2))
-                    used_coords.add(j)
-
-            # Create hotspot if enough points
-            if len(cluster_coords) >= 2:
-                center_lat = sum(lat for lat, lng in cluster_coords) / len(
-                    cluster_coords
-                )
-                center_lng = sum(lng for lat, lng in cluster_coords) / len(
-                    cluster_coords
-                )
-
-                hotspots.append(
-                    {
-                        "center": {"latitude": center_lat, "longitude": center_lng},
-                        "visit_count": len(cluster_coords),
-                        "radius_km": 2.0,
-                    }
-                )
-
-        return hotspots
-
     def _update_preference_weights(
         self, user_id: UUID, place: Place, rating: float, visited: bool
     ):
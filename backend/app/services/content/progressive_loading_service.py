@@ -14,14 +14,38 @@ import json
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 import redis.asyncio as redis
 from sqlalchemy.orm import Session
 
+from app.core.cache import CompressionManager
+
 logger = logging.getLogger(__name__)
 
+# 이 개수를 넘는 나머지 결과는 청크 단위로 압축 저장
+COMPRESSION_MIN_RESULTS = 100
+
+# ID만 저장할 때 장소 본문을 읽어오는 함수 (ID 목록 -> {ID: 장소})
+PlaceLoader = Callable[[List[str]], Awaitable[Dict[str, Dict[str, Any]]]]
+
+# 청크와 장소 본문은 배치 메타데이터보다 이 배수만큼 오래 보관
+# (요청마다 다음 배치가 읽을 키만 연장하므로 나머지는 이 여유로 버팀)
+BATCH_DATA_TTL_MULTIPLIER = 4
+
+# 읽은 뒤 커서를 옮길 때 동시 요청과 충돌하면 다시 시도하는 횟수
+CURSOR_ADVANCE_ATTEMPTS = 10
+
+# 커서가 읽기 시작 시점 값 그대로일 때만 전진 (compare-and-set)
+ADVANCE_CURSOR_SCRIPT = """
+if redis.call("HGET", KEYS[1], "cursor") == ARGV[1] then
+    redis.call("HSET", KEYS[1], "cursor", ARGV[2])
+    return 1
+end
+return 0
+"""
+
 
 class ProgressiveLoadingService:
     """점진적 로딩 서비스"""
@@ -49,6 +73,9 @@ class ProgressiveLoadingService:
         max_memory_mb: int = 200,
         personalization_enabled: bool = True,
         batch_ttl_seconds: int = 300,
+        storage_chunk_size: int = 50,
+        store_ids_only: bool = False,
+        place_loader: Optional[PlaceLoader] = None,
     ):
         self.redis = redis_client
         self.db = db_session
@@ -71,9 +98,18 @@ class ProgressiveLoadingService:
         self.max_memory_mb = max_memory_mb
         self.personalization_enabled = personalization_enabled
         self.batch_ttl = batch_ttl_seconds
+        self.batch_data_ttl = batch_ttl_seconds * BATCH_DATA_TTL_MULTIPLIER
+        self.storage_chunk_size = storage_chunk_size
+        self.store_ids_only = store_ids_only
+        self.place_loader = place_loader
 
         # Redis 키 패턴
+        # 배치 메타데이터(해시)와 고정 크기 청크(문자열)로 나눠 저장해
+        # 다음 배치 요청 시 필요한 청크만 읽고 나머지는 다시 쓰지 않음
         self.batch_key_pattern = "progressive_loading:batch:{user_id}:{token}"
+        self.chunk_key_pattern = "progressive_loading:batch:{user_id}:{token}:{index}"
+        # ID만 저장할 때 세션 간 공유되는 장소 본문 캐시
+        self.place_key_pattern = "progressive_loading:place:{place_id}"
         self.session_key_pattern = "progressive_loading:session:{user_id}:{session_id}"
         self.analytics_key_pattern = "progressive_loading:analytics:{user_id}:{date}"
 
@@ -109,7 +145,11 @@ class ProgressiveLoadingService:
             # 나머지 결과 저장 (배치별로 분할)
             if remaining_results:
                 await self._store_remaining_results(
-                    user_id, batch_token, remaining_results, search_params
+                    user_id,
+                    batch_token,
+                    remaining_results,
+                    search_params,
+                    offset=len(initial_batch),
                 )
 
             # 응답 구성
@@ -173,10 +213,10 @@ class ProgressiveLoadingService:
                         user_id, {}, "batch"
                     )
 
-                # 저장된 결과 조회
-                batch_data = await self._get_stored_batch_data(user_id, batch_token)
+                # 저장된 배치 메타데이터 조회
+                batch_meta = await self._get_batch_meta(user_id, batch_token)
 
-                if not batch_data:
+                if not batch_meta:
                     return {
                         "error": {
                             "type": "batch_not_found",
@@ -185,22 +225,21 @@ class ProgressiveLoadingService:
                         }
                     }
 
-                # 다음 배치 추출
-                remaining_results = batch_data["results"]
-                current_batch = remaining_results[:effective_batch_size]
-                updated_remaining = remaining_results[effective_batch_size:]
+                # 범위를 읽은 뒤에만 커서 전진 (읽기 실패 시 재시도가 같은 범위를 다시 읽음)
+                batch_meta, current_batch, start, end = await self._read_next_range(
+                    user_id, batch_token, batch_meta, effective_batch_size
+                )
+                remaining_count = batch_meta["remaining_count"]
+                has_more = end < remaining_count
 
                 # 진행 상황 계산
-                total_count = batch_data["total_count"]
-                loaded_count = batch_data.get("loaded_count", 0) + len(current_batch)
+                total_count = batch_meta["total_count"]
+                loaded_count = batch_meta["offset"] + end
 
-                # 업데이트된 데이터 저장
-                if updated_remaining:
-                    await self._update_stored_batch_data(
-                        user_id, batch_token, updated_remaining, loaded_count
-                    )
+                if has_more:
+                    await self._touch_batch_data(user_id, batch_token, batch_meta, end)
                 else:
-                    await self._cleanup_batch_data(user_id, batch_token)
+                    await self._cleanup_batch_data(user_id, batch_token, batch_meta)
 
                 # 응답 구성
                 response = {
@@ -208,8 +247,8 @@ class ProgressiveLoadingService:
                     "loading_metadata": {
                         "total_count": total_count,
                         "loaded_count": loaded_count,
-                        "has_more": len(updated_remaining) > 0,
-                        "next_batch_token": batch_token if updated_remaining else None,
+                        "has_more": has_more,
+                        "next_batch_token": batch_token if has_more else None,
                         "batch_number": self._calculate_batch_number(
                             loaded_count, effective_batch_size
                         ),
@@ -218,7 +257,8 @@ class ProgressiveLoadingService:
                     },
                     "performance_metrics": {
                         "batch_load_time_ms": int((time.time() - start_time) * 1000),
-                        "cache_hit": batch_data.get("cached", False),
+                        "chunks_read": self._chunk_span(batch_meta, start, end),
+                        "compressed": batch_meta["compressed"],
                     },
                 }
 
@@ -497,9 +537,9 @@ class ProgressiveLoadingService:
             analytics_data = {
                 "loading_time_ms": loading_time_ms,
                 "batch_performance": {
-                    "avg_item_load_time": loading_time_ms / len(results)
-                    if results
-                    else 0,
+                    "avg_item_load_time": (
+                        loading_time_ms / len(results) if results else 0
+                    ),
                     "loading_efficiency_score": self._calculate_efficiency_score(
                         len(results), loading_time_ms
                     ),
@@ -611,96 +651,274 @@ class ProgressiveLoadingService:
 
     # Private helper methods
 
+    def _batch_key(self, user_id: UUID, batch_token: str) -> str:
+        return self.batch_key_pattern.format(user_id=user_id, token=batch_token)
+
+    def _chunk_key(self, user_id: UUID, batch_token: str, index: int) -> str:
+        return self.chunk_key_pattern.format(
+            user_id=user_id, token=batch_token, index=index
+        )
+
+    def _chunk_span(self, batch_meta: Dict[str, Any], start: int, end: int) -> int:
+        """[start, end) 범위가 걸치는 청크 수"""
+        if end <= start:
+            return 0
+        chunk_size = batch_meta["chunk_size"]
+        return (end - 1) // chunk_size - start // chunk_size + 1
+
+    async def _read_next_range(
+        self,
+        user_id: UUID,
+        batch_token: str,
+        batch_meta: Dict[str, Any],
+        batch_size: int,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], int, int]:
+        """
+        커서 위치부터 batch_size만큼 읽고 커서를 전진
+
+        동시 요청이 먼저 커서를 옮겼으면 메타데이터를 다시 읽어 이어지는 범위를 읽는다.
+        """
+        batch_key = self._batch_key(user_id, batch_token)
+        for _ in range(CURSOR_ADVANCE_ATTEMPTS):
+            start = min(batch_meta["cursor"], batch_meta["remaining_count"])
+            end = min(start + batch_size, batch_meta["remaining_count"])
+            current_batch = await self._read_stored_range(
+                user_id, batch_token, batch_meta, start, end
+            )
+            if end == start or await self.redis.eval(
+                ADVANCE_CURSOR_SCRIPT, 1, batch_key, str(start), str(end)
+            ):
+                return batch_meta, current_batch, start, end
+
+            batch_meta = await self._get_batch_meta(user_id, batch_token)
+            if not batch_meta:
+                raise RuntimeError("batch data expired while loading")
+
+        raise RuntimeError("batch cursor contention")
+
+    def _encode_chunk(self, items: List[Any], compressed: bool) -> str:
+        if compressed:
+            return CompressionManager.compress_data(items)
+        return json.dumps(items, default=str)
+
+    def _decode_chunk(self, value: str, compressed: bool) -> List[Any]:
+        if compressed:
+            return CompressionManager.decompress_data(value)
+        return json.loads(value)
+
     async def _store_remaining_results(
         self,
         user_id: UUID,
         batch_token: str,
         remaining_results: List[Dict[str, Any]],
         search_params: Dict[str, Any],
+        offset: int = 0,
     ) -> None:
-        """나머지 결과 저장"""
+        """
+        나머지 결과를 고정 크기 청크로 저장
+
+        ID만 저장하는 경우 장소 본문은 공유 장소 캐시에 한 번만 기록하고
+        청크에는 ID 목록만 넣는다. 대용량 결과는 청크별로 압축한다.
+        """
         try:
-            batch_key = self.batch_key_pattern.format(
-                user_id=user_id, token=batch_token
+            chunk_size = self.storage_chunk_size
+            compressed = (
+                self.compression and len(remaining_results) > COMPRESSION_MIN_RESULTS
+            )
+            chunk_count = self._calculate_total_batches(
+                len(remaining_results), chunk_size
             )
 
-            batch_data = {
-                "results": remaining_results,
-                "search_params": search_params,
-                "total_count": len(remaining_results),
-                "loaded_count": 0,
-                "created_at": datetime.utcnow().isoformat(),
-            }
-
-            # 압축 적용 (대용량 데이터)
-            if self.compression and len(remaining_results) > 100:
-                batch_data = await self._compress_batch_data(batch_data)
+            pipe = self.redis.pipeline(transaction=False)
+            if self.store_ids_only:
+                items: List[Any] = [result.get("id") for result in remaining_results]
+                for result in remaining_results:
+                    pipe.setex(
+                        self.place_key_pattern.format(place_id=result.get("id")),
+                        self.batch_data_ttl,
+                        json.dumps(result, default=str),
+                    )
+            else:
+                items = remaining_results
+
+            for index in range(chunk_count):
+                chunk = items[index * chunk_size : (index + 1) * chunk_size]
+                pipe.setex(
+                    self._chunk_key(user_id, batch_token, index),
+                    self.batch_data_ttl,
+                    self._encode_chunk(chunk, compressed),
+                )
 
-            await self.redis.setex(
-                batch_key, self.batch_ttl, json.dumps(batch_data, default=str)
+            batch_key = self._batch_key(user_id, batch_token)
+            pipe.hset(
+                batch_key,
+                mapping={
+                    "search_params": json.dumps(search_params, default=str),
+                    "total_count": offset + len(remaining_results),
+                    "remaining_count": len(remaining_results),
+                    "offset": offset,
+                    "cursor": 0,
+                    "chunk_size": chunk_size,
+                    "chunk_count": chunk_count,
+                    "ids_only": int(self.store_ids_only),
+                    "compressed": int(compressed),
+                    "created_at": datetime.utcnow().isoformat(),
+                },
             )
+            pipe.expire(batch_key, self.batch_ttl)
+            await pipe.execute()
 
         except Exception as e:
             logger.error(f"Storing remaining results failed: {str(e)}")
 
-    async def _get_stored_batch_data(
+    async def _get_batch_meta(
         self, user_id: UUID, batch_token: str
     ) -> Optional[Dict[str, Any]]:
-        """저장된 배치 데이터 조회"""
+        """저장된 배치 메타데이터 조회"""
         try:
-            batch_key = self.batch_key_pattern.format(
-                user_id=user_id, token=batch_token
-            )
-            batch_data = await self.redis.get(batch_key)
-
-            if batch_data:
-                data = json.loads(batch_data)
-
-                # 압축 해제 (필요시)
-                if data.get("compressed"):
-                    data = await self._decompress_batch_data(data)
-
-                return data
+            raw = await self.redis.hgetall(self._batch_key(user_id, batch_token))
+            if not raw:
+                return None
 
-            return None
+            return {
+                "search_params": json.loads(raw["search_params"]),
+                "total_count": int(raw["total_count"]),
+                "remaining_count": int(raw["remaining_count"]),
+                "offset": int(raw["offset"]),
+                "cursor": int(raw["cursor"]),
+                "chunk_size": int(raw["chunk_size"]),
+                "chunk_count": int(raw["chunk_count"]),
+                "ids_only": raw["ids_only"] == "1",
+                "compressed": raw["compressed"] == "1",
+            }
 
         except Exception as e:
             logger.error(f"Getting stored batch data failed: {str(e)}")
             return None
 
-    async def _update_stored_batch_data(
+    async def _read_stored_range(
         self,
         user_id: UUID,
         batch_token: str,
-        updated_results: List[Dict[str, Any]],
-        loaded_count: int,
-    ) -> None:
-        """저장된 배치 데이터 업데이트"""
-        try:
-            batch_key = self.batch_key_pattern.format(
-                user_id=user_id, token=batch_token
-            )
+        batch_meta: Dict[str, Any],
+        start: int,
+        end: int,
+    ) -> List[Dict[str, Any]]:
+        """[start, end) 범위가 걸친 청크만 읽어 결과 복원"""
+        if end <= start:
+            return []
+
+        chunk_size = batch_meta["chunk_size"]
+        first_chunk = start // chunk_size
+        chunk_keys = [
+            self._chunk_key(user_id, batch_token, index)
+            for index in range(first_chunk, (end - 1) // chunk_size + 1)
+        ]
+        items: List[Any] = []
+        for value in await self.redis.mget(chunk_keys):
+            if value is None:
+                # 청크가 만료되었으면 이후 결과는 복원 불가
+                break
+            items.extend(self._decode_chunk(value, batch_meta["compressed"]))
+
+        base = first_chunk * chunk_size
+        items = items[start - base : end - base]
+
+        if batch_meta["ids_only"]:
+            return await self._hydrate_places(items)
+        return items
+
+    async def _hydrate_places(self, place_ids: List[str]) -> List[Dict[str, Any]]:
+        """장소 캐시에서 본문 복원 (없으면 place_loader로 조회)"""
+        if not place_ids:
+            return []
+
+        cached = await self.redis.mget(
+            [self.place_key_pattern.format(place_id=pid) for pid in place_ids]
+        )
+        places = {
+            pid: json.loads(value)
+            for pid, value in zip(place_ids, cached)
+            if value is not None
+        }
 
-            updated_data = {
-                "results": updated_results,
-                "loaded_count": loaded_count,
-                "updated_at": datetime.utcnow().isoformat(),
-            }
+        missing = [pid for pid in place_ids if pid not in places]
+        if missing and self.place_loader:
+            try:
+                places.update(await self.place_loader(missing))
+            except Exception as e:
+                logger.error(f"Place hydration failed: {str(e)}")
 
-            await self.redis.setex(
-                batch_key, self.batch_ttl, json.dumps(updated_data, default=str)
-            )
+        unresolved = [pid for pid in place_ids if pid not in places]
+        if unresolved:
+            logger.warning(f"Dropping {len(unresolved)} unresolved places from batch")
+        return [places[pid] for pid in place_ids if pid in places]
 
+    async def _touch_batch_data(
+        self,
+        user_id: UUID,
+        batch_token: str,
+        batch_meta: Dict[str, Any],
+        read_end: int = 0,
+    ) -> None:
+        """
+        배치 데이터 TTL 연장 (내용은 다시 쓰지 않음)
+
+        다음 요청이 읽을 수 있는 범위(최대 배치 크기)의 청크만 연장한다.
+        ID만 저장한 배치는 그 범위의 장소 본문 캐시 TTL도 함께 연장하고,
+        더 뒤의 청크와 본문은 저장 시 넉넉히 잡은 TTL로 유지된다.
+        """
+        try:
+            chunk_size = batch_meta["chunk_size"]
+            next_end = min(
+                read_end + self.max_batch_size, batch_meta["remaining_count"]
+            )
+            chunk_keys = [
+                self._chunk_key(user_id, batch_token, index)
+                for index in range(
+                    read_end // chunk_size, (next_end - 1) // chunk_size + 1
+                )
+            ]
+            place_ids: List[str] = []
+            if batch_meta["ids_only"] and chunk_keys:
+                items: List[Any] = []
+                for value in await self.redis.mget(chunk_keys):
+                    if value is not None:
+                        items.extend(
+                            self._decode_chunk(value, batch_meta["compressed"])
+                        )
+                base = read_end // chunk_size * chunk_size
+                place_ids = items[read_end - base : next_end - base]
+
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.expire(self._batch_key(user_id, batch_token), self.batch_ttl)
+            for chunk_key in chunk_keys:
+                pipe.expire(chunk_key, self.batch_data_ttl)
+            for place_id in place_ids:
+                pipe.expire(
+                    self.place_key_pattern.format(place_id=place_id),
+                    self.batch_data_ttl,
+                )
+            await pipe.execute()
         except Exception as e:
             logger.error(f"Updating stored batch data failed: {str(e)}")
 
-    async def _cleanup_batch_data(self, user_id: UUID, batch_token: str) -> None:
+    async def _cleanup_batch_data(
+        self,
+        user_id: UUID,
+        batch_token: str,
+        batch_meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """배치 데이터 정리"""
         try:
-            batch_key = self.batch_key_pattern.format(
-                user_id=user_id, token=batch_token
+            chunk_count = batch_meta["chunk_count"] if batch_meta else 0
+            await self.redis.delete(
+                self._batch_key(user_id, batch_token),
+                *(
+                    self._chunk_key(user_id, batch_token, index)
+                    for index in range(chunk_count)
+                ),
             )
-            await self.redis.delete(batch_key)
         except Exception as e:
             logger.error(f"Batch data cleanup failed: {str(e)}")
 
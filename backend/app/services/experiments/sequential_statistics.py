@@ -0,0 +1,236 @@
+"""
+Streaming sequential statistics for experiment analysis.
+
+Each variant keeps constant-size sufficient statistics (unit count, sums and
+sums of squares of the outcome, plus the same for an optional pre-experiment
+covariate and the outcome/covariate cross sum). They can be updated one event
+at a time or merged across shards, and every test below reads only them.
+
+- mSPRT (mixture sequential probability ratio test) gives an always-valid
+  p-value and confidence sequence, so results may be checked after every
+  event and an experiment stopped as soon as it is decided without
+  inflating the false positive rate.
+- CUPED adjusts the outcome with the pre-experiment covariate, removing the
+  variance it explains and shrinking the sample needed to reach a decision.
+"""
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_ALPHA = 0.05
+
+
+@dataclass
+class SufficientStatistics:
+    """Per-variant sufficient statistics for outcome y and covariate x."""
+
+    n: int = 0
+    sum_y: float = 0.0
+    sum_y2: float = 0.0
+    sum_x: float = 0.0
+    sum_x2: float = 0.0
+    sum_xy: float = 0.0
+
+    def add(self, y: float, x: float = 0.0) -> None:
+        """Add one unit observation."""
+        self.n += 1
+        self.sum_y += y
+        self.sum_y2 += y * y
+        self.sum_x += x
+        self.sum_x2 += x * x
+        self.sum_xy += x * y
+
+    def merge(self, other: "SufficientStatistics") -> "SufficientStatistics":
+        """Combine statistics of two disjoint sets of units."""
+        return SufficientStatistics(
+            n=self.n + other.n,
+            sum_y=self.sum_y + other.sum_y,
+            sum_y2=self.sum_y2 + other.sum_y2,
+            sum_x=self.sum_x + other.sum_x,
+            sum_x2=self.sum_x2 + other.sum_x2,
+            sum_xy=self.sum_xy + other.sum_xy,
+        )
+
+    @property
+    def mean(self) -> float:
+        return self.sum_y / self.n if self.n else 0.0
+
+    @property
+    def mean_x(self) -> float:
+        return self.sum_x / self.n if self.n else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of y."""
+        if self.n < 2:
+            return 0.0
+        return max(self.sum_y2 - self.n * self.mean**2, 0.0) / (self.n - 1)
+
+    @property
+    def variance_x(self) -> float:
+        """Sample variance of x."""
+        if self.n < 2:
+            return 0.0
+        return max(self.sum_x2 - self.n * self.mean_x**2, 0.0) / (self.n - 1)
+
+    @property
+    def covariance(self) -> float:
+        """Sample covariance of x and y."""
+        if self.n < 2:
+            return 0.0
+        return (self.sum_xy - self.n * self.mean_x * self.mean) / (self.n - 1)
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SufficientStatistics":
+        return cls(
+            n=int(data.get("n", 0)),
+            **{
+                field: float(data.get(field, 0.0))
+                for field in ("sum_y", "sum_y2", "sum_x", "sum_x2", "sum_xy")
+            },
+        )
+
+
+def cuped_theta(
+    control: SufficientStatistics, treatment: SufficientStatistics
+) -> float:
+    """CUPED coefficient cov(x, y) / var(x) over both variants pooled."""
+    pooled = control.merge(treatment)
+    variance_x = pooled.variance_x
+    if variance_x <= 0:
+        return 0.0
+    return pooled.covariance / variance_x
+
+
+def adjusted_variance(stats: SufficientStatistics, theta: float) -> float:
+    """Variance of y - theta * x."""
+    return max(
+        stats.variance - 2 * theta * stats.covariance + theta**2 * stats.variance_x,
+        0.0,
+    )
+
+
+def difference_estimate(
+    control: SufficientStatistics,
+    treatment: SufficientStatistics,
+    use_cuped: bool = True,
+) -> Tuple[float, float, float]:
+    """
+    Estimate the treatment - control mean difference.
+
+    Returns:
+        (difference, variance of the difference, variance reduction ratio)
+    """
+    theta = cuped_theta(control, treatment) if use_cuped else 0.0
+    difference = (treatment.mean - control.mean) - theta * (
+        treatment.mean_x - control.mean_x
+    )
+    variance = (
+        adjusted_variance(treatment, theta) / treatment.n
+        + adjusted_variance(control, theta) / control.n
+    )
+
+    raw_variance = treatment.variance / treatment.n + control.variance / control.n
+    reduction = 1 - variance / raw_variance if raw_variance > 0 else 0.0
+    return difference, variance, reduction
+
+
+def msprt_test(
+    control: SufficientStatistics,
+    treatment: SufficientStatistics,
+    alpha: float = DEFAULT_ALPHA,
+    tau: Optional[float] = None,
+    use_cuped: bool = True,
+    null_difference: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Two-sample mixture SPRT on the mean difference.
+
+    Uses a normal mixing distribution N(null_difference, tau^2) over the
+    effect. The likelihood ratio is checked against 1 / alpha; the test may be
+    evaluated after every observation while keeping the type I error at
+    alpha.
+
+    Args:
+        control: control variant statistics
+        treatment: treatment variant statistics
+        alpha: significance level
+        tau: mixing standard deviation, roughly the effect size worth
+            detecting (defaults to the pooled outcome standard deviation)
+        use_cuped: apply the CUPED covariate adjustment
+        null_difference: difference under the null hypothesis
+
+    Returns:
+        Test result with always-valid p-value and confidence sequence
+    """
+    if control.n < 2 or treatment.n < 2:
+        return {
+            "test_type": "msprt",
+            "decided": False,
+            "likelihood_ratio": 1.0,
+            "p_value": 1.0,
+            "effect_size": treatment.mean - control.mean,
+            "confidence_interval": None,
+            "variance_reduction": 0.0,
+        }
+
+    difference, variance, reduction = difference_estimate(control, treatment, use_cuped)
+    if tau is None:
+        tau = math.sqrt(control.merge(treatment).variance)
+    tau_sq = tau**2
+
+    if variance <= 0 or tau_sq <= 0:
+        # Degenerate (constant outcomes): decided only by an exact difference
+        decided = difference != null_difference and variance <= 0
+        return {
+            "test_type": "msprt",
+            "decided": decided,
+            "likelihood_ratio": math.inf if decided else 1.0,
+            "p_value": 0.0 if decided else 1.0,
+            "effect_size": difference,
+            "confidence_interval": [difference, difference] if decided else None,
+            "variance_reduction": reduction,
+        }
+
+    shift = difference - null_difference
+    log_ratio = 0.5 * math.log(variance / (variance + tau_sq)) + (
+        tau_sq * shift**2
+    ) / (2 * variance * (variance + tau_sq))
+    likelihood_ratio = math.exp(min(log_ratio, 700.0))
+
+    half_width = math.sqrt(
+        variance
+        * (variance + tau_sq)
+        / tau_sq
+        * (math.log((variance + tau_sq) / variance) + 2 * math.log(1 / alpha))
+    )
+
+    return {
+        "test_type": "msprt",
+        "decided": likelihood_ratio >= 1 / alpha,
+        "likelihood_ratio": likelihood_ratio,
+        "p_value": min(1.0, 1 / likelihood_ratio),
+        "effect_size": difference,
+        "confidence_interval": [difference - half_width, difference + half_width],
+        "variance_reduction": reduction,
+    }
+
+
+def z_test(
+    control: SufficientStatistics, treatment: SufficientStatistics
+) -> Dict[str, Any]:
+    """Fixed-horizon two-sample z test (valid only at a single, planned look)."""
+    difference, variance, _ = difference_estimate(control, treatment, use_cuped=False)
+    if variance <= 0:
+        return {"test_type": "z_test", "p_value": 1.0, "effect_size": difference}
+    z_score = difference / math.sqrt(variance)
+    return {
+        "test_type": "z_test",
+        "z_statistic": z_score,
+        "p_value": math.erfc(abs(z_score) / math.sqrt(2)),
+        "effect_size": difference,
+    }
@@ -9,17 +9,31 @@ from sqlalchemy.orm import Session
 
 from app.models.place import Place, PlaceStatus
 from app.schemas.geo import GeoBoundingBox, GeoClusterResponse
+from app.services.maps.viewport_tile_cache import (
+    MAX_TILE_ZOOM,
+    POINTS,
+    ViewportTileCache,
+    choose_tile_zoom,
+    in_bounds,
+    query_point_tiles,
+    tiles_covering,
+    user_scope,
+    viewport_tile_cache,
+)
 from app.utils.distance_calculator import DistanceCalculator
 
 logger = logging.getLogger(__name__)
 
+MAX_BOUNDING_BOX_TILES = 16
+
 
 class GeoService:
     """Service for geographic search and spatial operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, tile_cache: Optional[ViewportTileCache] = None):
         self.db = db
-        self.distance_calculator = DistanceCalculator()
+        self.distance_calculator = DistanceCalculator(db)
+        self.tile_cache = tile_cache or viewport_tile_cache
 
     def search_places_in_radius(
         self,
@@ -91,6 +105,10 @@ class GeoService:
         """
         Get places within a bounding box.
 
+        Place ids are resolved from the user's cached viewport tiles (only
+        uncached tiles hit the spatial index); the places themselves are
+        then loaded by primary key.
+
         Args:
             user_id: User identifier
             bounding_box: Geographic bounding box
@@ -100,29 +118,44 @@ class GeoService:
             List of places within the bounding box
         """
         try:
-            pass
-
-            # Create bounding box polygon
-            bbox_polygon = func.ST_MakeEnvelope(
-                bounding_box.min_longitude,
+            bounds = (
                 bounding_box.min_latitude,
-                bounding_box.max_longitude,
+                bounding_box.min_longitude,
                 bounding_box.max_latitude,
-                4326,  # WGS84 SRID
+                bounding_box.max_longitude,
             )
-
-            places = (
-                self.db.query(Place)
-                .filter(
-                    Place.user_id == user_id,
-                    Place.status == PlaceStatus.ACTIVE,
-                    func.ST_Within(Place.coordinates, bbox_polygon),
-                )
-                .limit(limit)
-                .all()
+            zoom = choose_tile_zoom(bounds, MAX_TILE_ZOOM, MAX_BOUNDING_BOX_TILES)
+            tiles = tiles_covering(bounds, zoom)
+            filters = [Place.user_id == user_id, Place.status == PlaceStatus.ACTIVE]
+
+            tile_data = self.tile_cache.get_tiles(
+                user_scope(user_id),
+                POINTS,
+                zoom,
+                tiles,
+                lambda tile_zoom, missing: query_point_tiles(
+                    self.db, filters, tile_zoom, missing
+                ),
             )
+            place_ids = [
+                place["place_id"]
+                for tile in tiles
+                for place in tile_data[tile]["places"]
+                if in_bounds(place["latitude"], place["longitude"], bounds)
+            ][:limit]
+
+            places = []
+            if place_ids:
+                # Re-check filters: a tile may predate a concurrent write
+                places = (
+                    self.db.query(Place)
+                    .filter(Place.id.in_([UUID(pid) for pid in place_ids]), *filters)
+                    .all()
+                )
 
-            logger.info(f"Found {len(places)} places in bounding box")
+            logger.info(
+                f"Found {len(places)} places in bounding box ({len(tiles)} tiles)"
+            )
             return places
 
         except Exception as e:
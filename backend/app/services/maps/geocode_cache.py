@@ -0,0 +1,261 @@
+"""
+Shared cache for geocoding and keyword place search results.
+
+Lookups are keyed on a normalized query (NFKC, lower-cased, whitespace
+collapsed) plus any rounded search parameters, so "서울 강남구  테헤란로 " and
+"서울 강남구 테헤란로" share one entry. Each process keeps a small LRU in front
+of Redis; Redis is the copy shared across API and worker processes.
+
+Found results live for a long time (addresses rarely move); "not found"
+results are cached too, but with a much shorter TTL so newly registered
+places show up quickly. If Redis is unavailable the cache degrades to the
+local LRU and retries Redis after a short pause.
+
+Only responses from the real Kakao API go through this cache; the mock
+Google/Kakao services in location_service and map_service must not, or
+their fabricated coordinates would be served to every process for a month.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "hotly:geocode"
+MAX_KEY_QUERY_LENGTH = 200
+LOCAL_MAX_TTL_SECONDS = 3600
+REDIS_RETRY_SECONDS = 30.0
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """Normalize an address or keyword for use as a cache key."""
+    text = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def is_not_found(value: Any) -> bool:
+    """Whether a lookup result means "nothing found" (cached with short TTL)."""
+    if isinstance(value, dict):
+        return not any(v is not None for v in value.values())
+    return not value
+
+
+class GeocodeCache:
+    """
+    Two-level (local LRU + Redis) cache for map lookups.
+
+    ``get_or_fetch`` returns the cached value or calls ``fetch`` once, even
+    when several coroutines ask for the same key at the same time.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Optional[redis.Redis] = None,
+        ttl_seconds: int = 30 * 24 * 3600,
+        negative_ttl_seconds: int = 3600,
+        local_size: int = 4096,
+        prefix: str = CACHE_PREFIX,
+    ):
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.local_size = local_size
+        self.prefix = prefix
+
+        self._client = client
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_retry_at = 0.0
+        self._local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, Counter] = {}
+
+    def make_key(self, namespace: str, query: str, *params: Any) -> str:
+        """Build the cache key for a query and its search parameters."""
+        normalized = normalize_query(query)
+        if params:
+            normalized += "|" + "|".join("" if p is None else str(p) for p in params)
+        if len(normalized) > MAX_KEY_QUERY_LENGTH:
+            normalized = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        return f"{self.prefix}:{namespace}:{normalized}"
+
+    async def get_or_fetch(
+        self,
+        namespace: str,
+        query: str,
+        fetch: Callable[[], Awaitable[Any]],
+        *params: Any,
+    ) -> Any:
+        """
+        Return the cached result for ``query`` or fetch and store it.
+
+        ``fetch`` must return JSON-serializable data; empty results
+        (see ``is_not_found``) are stored with the negative TTL. Exceptions
+        raised by ``fetch`` are propagated and never cached.
+        """
+        key = self.make_key(namespace, query, *params)
+        stats = self._stats.setdefault(namespace, Counter())
+        stats["requests"] += 1
+
+        raw = self._local_get(key)
+        if raw is not None:
+            stats["local_hits"] += 1
+            return self._decode(raw, stats)
+
+        raw = await self._redis_get(key, stats)
+        if raw is not None:
+            stats["redis_hits"] += 1
+            self._local_set(key, raw, self._ttl_for(json.loads(raw)))
+            return self._decode(raw, stats)
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            stats["coalesced"] += 1
+            return json.loads(await asyncio.shield(pending))
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            stats["misses"] += 1
+            value = await fetch()
+            raw = json.dumps(value, ensure_ascii=False)
+            ttl = self._ttl_for(value)
+            self._local_set(key, raw, ttl)
+            await self._redis_set(key, raw, ttl, stats)
+            future.set_result(raw)
+            return json.loads(raw)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            stats["fetch_errors"] += 1
+            future.set_exception(e)
+            # Waiters get the error; mark it retrieved for the no-waiter case
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters overall and per namespace, with hit rates."""
+        namespaces = {ns: self._with_hit_rate(c) for ns, c in self._stats.items()}
+        overall = Counter()
+        for counter in self._stats.values():
+            overall.update(counter)
+        return {
+            "overall": self._with_hit_rate(overall),
+            "namespaces": namespaces,
+            "local_entries": len(self._local),
+            "redis_available": time.monotonic() >= self._redis_retry_at,
+        }
+
+    def reset_stats(self) -> None:
+        self._stats.clear()
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+    @staticmethod
+    def _with_hit_rate(counter: Counter) -> Dict[str, Any]:
+        stats = dict(counter)
+        requests = counter["requests"]
+        hits = counter["local_hits"] + counter["redis_hits"] + counter["coalesced"]
+        stats["hit_rate"] = round(hits / requests, 4) if requests else 0.0
+        return stats
+
+    def _ttl_for(self, value: Any) -> int:
+        return self.negative_ttl_seconds if is_not_found(value) else self.ttl_seconds
+
+    def _decode(self, raw: str, stats: Counter) -> Any:
+        value = json.loads(raw)
+        if is_not_found(value):
+            stats["negative_hits"] += 1
+        return value
+
+    # Local LRU -------------------------------------------------------------
+
+    def _local_get(self, key: str) -> Optional[str]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, raw = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return raw
+
+    def _local_set(self, key: str, raw: str, ttl: int) -> None:
+        if self.local_size <= 0:
+            return
+        expires_at = time.monotonic() + min(ttl, LOCAL_MAX_TTL_SECONDS)
+        self._local[key] = (expires_at, raw)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
+
+    # Redis -----------------------------------------------------------------
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self.redis_url is None:
+            return self._client
+
+        # Connections are bound to the loop that opened them; sync callers
+        # (asyncio.run per call) get a fresh client on their own loop.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = redis.from_url(
+                self.redis_url, encoding="utf-8", decode_responses=True
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _redis_failed(self, error: Exception, stats: Counter) -> None:
+        stats["redis_errors"] += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Geocode cache Redis unavailable, using local cache: {error}")
+
+    async def _redis_get(self, key: str, stats: Counter) -> Optional[str]:
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            return await client.get(key)
+        except Exception as e:
+            self._redis_failed(e, stats)
+            return None
+
+    async def _redis_set(self, key: str, raw: str, ttl: int, stats: Counter) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            await client.set(key, raw, ex=ttl)
+        except Exception as e:
+            self._redis_failed(e, stats)
+
+
+# Shared by every KakaoMapService instance and the map/location services
+geocode_cache = GeocodeCache(
+    redis_url=settings.REDIS_URL,
+    ttl_seconds=settings.GEOCODE_CACHE_TTL_SECONDS,
+    negative_ttl_seconds=settings.GEOCODE_NEGATIVE_CACHE_TTL_SECONDS,
+    local_size=settings.GEOCODE_LOCAL_CACHE_SIZE,
+)
@@ -11,6 +11,8 @@ import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.services.maps.geocode_cache import GeocodeCache, geocode_cache
+from app.utils.concurrency import ApiConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,8 @@ class KakaoMapService:
         timeout: float = 10.0,
         max_retries: int = 3,
         enable_cache: bool = True,
+        cache: Optional[GeocodeCache] = None,
+        limiter: Optional[ApiConcurrencyLimiter] = None,
     ):
         """
         Initialize Kakao Map service.
@@ -54,7 +58,9 @@ class KakaoMapService:
             api_key: Kakao REST API key (defaults to settings.KAKAO_API_KEY)
             timeout: HTTP request timeout in seconds
             max_retries: Number of retry attempts for failed requests
-            enable_cache: Enable result caching (future implementation)
+            enable_cache: Cache geocode/search results in the shared cache
+            cache: Cache to use (defaults to the process-wide geocode_cache)
+            limiter: Caps concurrent Kakao API calls; cache hits bypass it
 
         Raises:
             ConfigError: If API key is not configured
@@ -66,7 +72,14 @@ class KakaoMapService:
         self.timeout = timeout
         self.max_retries = max_retries
         self.enable_cache = enable_cache
-        self._cache: Dict[str, any] = {} if enable_cache else None
+        self.cache = (cache or geocode_cache) if enable_cache else None
+        self._limiter = limiter or ApiConcurrencyLimiter()
+
+    async def _cached(self, namespace: str, query: str, fetch, *params):
+        """Run ``fetch`` through the shared cache when caching is enabled."""
+        if self.cache is None:
+            return await fetch()
+        return await self.cache.get_or_fetch(namespace, query, fetch, *params)
 
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers with authorization."""
@@ -102,7 +115,10 @@ class KakaoMapService:
         headers = self._get_headers()
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with (
+                self._limiter.limit("kakao"),
+                httpx.AsyncClient(timeout=self.timeout) as client,
+            ):
                 response = await client.get(url, headers=headers, params=params)
 
                 # Handle rate limiting
@@ -142,11 +158,6 @@ class KakaoMapService:
             ValueError: If address is not found
             KakaoMapServiceError: For API errors
         """
-        # Check cache
-        if self.enable_cache and address in self._cache:
-            logger.info(f"Cache hit for address: {address}")
-            return self._cache[address]
-
         import asyncio
 
         loop = asyncio.get_event_loop()
@@ -155,21 +166,24 @@ class KakaoMapService:
                 "address_to_coordinate() cannot be called from an async context. "
                 "Use await _address_to_coordinate_async() instead."
             )
-        result = asyncio.run(self._address_to_coordinate_async(address))
-
-        if self.enable_cache:
-            self._cache[address] = result
-
-        return result
+        return asyncio.run(self._address_to_coordinate_async(address))
 
     async def _address_to_coordinate_async(self, address: str) -> Dict[str, float]:
         """Async implementation of address_to_coordinate."""
+        result = await self._cached(
+            "address", address, lambda: self._fetch_address(address)
+        )
+        if result is None:
+            raise ValueError(f"Address not found: {address}")
+        return result
+
+    async def _fetch_address(self, address: str) -> Optional[Dict[str, float]]:
         params = {"query": address}
         data = await self._make_request("search/address.json", params)
 
         documents = data.get("documents", [])
         if not documents:
-            raise ValueError(f"Address not found: {address}")
+            return None
 
         # Use first result
         doc = documents[0]
@@ -210,6 +224,15 @@ class KakaoMapService:
         self, latitude: float, longitude: float
     ) -> Dict[str, Optional[str]]:
         """Async implementation of coordinate_to_address."""
+        return await self._cached(
+            "reverse",
+            f"{latitude:.5f},{longitude:.5f}",
+            lambda: self._fetch_coordinate_address(latitude, longitude),
+        )
+
+    async def _fetch_coordinate_address(
+        self, latitude: float, longitude: float
+    ) -> Dict[str, Optional[str]]:
         params = {"x": longitude, "y": latitude}  # Kakao: x=lng, y=lat
         data = await self._make_request("geo/coord2address.json", params)
 
@@ -283,6 +306,31 @@ class KakaoMapService:
         limit: int,
     ) -> List[Dict[str, any]]:
         """Async implementation of search_places_by_keyword."""
+        # Centers are rounded to ~10m so nearby map positions share an entry
+        center = (
+            (round(center_latitude, 4), round(center_longitude, 4))
+            if center_latitude is not None and center_longitude is not None
+            else (None, None)
+        )
+        return await self._cached(
+            "keyword",
+            keyword,
+            lambda: self._fetch_keyword_places(
+                keyword, center[0], center[1], radius_km, limit
+            ),
+            *center,
+            radius_km,
+            limit,
+        )
+
+    async def _fetch_keyword_places(
+        self,
+        keyword: str,
+        center_latitude: Optional[float],
+        center_longitude: Optional[float],
+        radius_km: Optional[float],
+        limit: int,
+    ) -> List[Dict[str, any]]:
         params = {"query": keyword, "size": min(limit, 45)}
 
         # Add location bias if provided
@@ -6,7 +6,18 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
-from app.models.place import Place
+from app.services.maps.viewport_tile_cache import (
+    CLUSTER_MAX_ZOOM,
+    CLUSTERS,
+    POINTS,
+    ViewportTileCache,
+    choose_tile_zoom,
+    in_bounds,
+    query_cluster_tiles,
+    query_point_tiles,
+    tiles_covering,
+    viewport_tile_cache,
+)
 from app.utils.distance_calculator import DistanceCalculator
 
 logger = logging.getLogger(__name__)
@@ -15,11 +26,17 @@ logger = logging.getLogger(__name__)
 class MapService:
     """Service for Kakao Map SDK integration and map visualization."""
 
-    def __init__(self, db: Session, kakao_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        db: Session,
+        kakao_api_key: Optional[str] = None,
+        tile_cache: Optional[ViewportTileCache] = None,
+    ):
         self.db = db
         self.kakao_api_key = kakao_api_key or "mock_kakao_api_key"
-        self.distance_calculator = DistanceCalculator()
+        self.distance_calculator = DistanceCalculator(db)
         self.map_cache = {}  # In-memory cache for map data
+        self.tile_cache = tile_cache or viewport_tile_cache
 
     def initialize_map(
         self, center: Dict[str, float], zoom: int = 15, map_type: str = "normal"
@@ -307,22 +324,25 @@ class MapService:
         """
         Load places within viewport bounds for performance.
 
+        The viewport is assembled from cached z/x/y tiles; only tiles not yet
+        cached are queried. At low zoom, pre-clustered tiles are returned
+        instead of individual places.
+
         Args:
             viewport_bounds: Map viewport boundaries
             zoom_level: Current zoom level
 
         Returns:
-            Places within viewport
+            Places (or clusters at low zoom) within viewport
         """
         try:
             ne = viewport_bounds["northeast"]
             sw = viewport_bounds["southwest"]
+            bounds = (sw["latitude"], sw["longitude"], ne["latitude"], ne["longitude"])
 
-            # Query places within bounds
-            places_query = self.db.query(Place).filter(
-                Place.latitude.between(sw["latitude"], ne["latitude"]),
-                Place.longitude.between(sw["longitude"], ne["longitude"]),
-            )
+            tile_zoom = choose_tile_zoom(bounds, zoom_level)
+            tiles = tiles_covering(bounds, tile_zoom)
+            clustered = zoom_level <= CLUSTER_MAX_ZOOM
 
             # Limit results based on zoom level for performance
             limit_by_zoom = {
@@ -338,33 +358,65 @@ class MapService:
                     limit = zoom_limit
                     break
 
-            places = places_query.limit(limit).all()
-
-            # Convert to map format
             viewport_places = []
-            for place in places:
-                viewport_places.append(
-                    {
-                        "place_id": str(place.id),
-                        "latitude": place.latitude,
-                        "longitude": place.longitude,
-                        "name": place.name,
-                        "category": place.category,
-                        "in_viewport": True,
-                    }
+            viewport_clusters = []
+            if clustered:
+                tile_data = self.tile_cache.get_tiles(
+                    "all",
+                    CLUSTERS,
+                    tile_zoom,
+                    tiles,
+                    lambda zoom, missing: query_cluster_tiles(
+                        self.db, [], zoom, missing
+                    ),
                 )
+                for tile in tiles:
+                    viewport_clusters.extend(
+                        cluster
+                        for cluster in tile_data[tile]["clusters"]
+                        if in_bounds(
+                            cluster["center"]["latitude"],
+                            cluster["center"]["longitude"],
+                            bounds,
+                        )
+                    )
+            else:
+                tile_data = self.tile_cache.get_tiles(
+                    "all",
+                    POINTS,
+                    tile_zoom,
+                    tiles,
+                    lambda zoom, missing: query_point_tiles(self.db, [], zoom, missing),
+                )
+                for tile in tiles:
+                    viewport_places.extend(
+                        {**place, "in_viewport": True}
+                        for place in tile_data[tile]["places"]
+                        if in_bounds(place["latitude"], place["longitude"], bounds)
+                    )
+
+            limit_applied = len(viewport_places) > limit
+            viewport_places = viewport_places[:limit]
 
             viewport_data = {
                 "places_count": len(viewport_places),
                 "viewport_bounds": viewport_bounds,
                 "zoom_level": zoom_level,
                 "places": viewport_places,
-                "performance_limit_applied": len(places) == limit,
+                "clustered": clustered,
+                "clusters": viewport_clusters,
+                "clustered_places_count": sum(
+                    c["place_count"] for c in viewport_clusters
+                ),
+                "tile_zoom": tile_zoom,
+                "tile_count": len(tiles),
+                "performance_limit_applied": limit_applied,
                 "loaded_at": datetime.utcnow().isoformat(),
             }
 
             logger.info(
-                f"Loaded {len(viewport_places)} places for viewport at zoom {zoom_level}"
+                f"Loaded {len(viewport_places)} places, {len(viewport_clusters)} "
+                f"clusters for viewport at zoom {zoom_level} ({len(tiles)} tiles)"
             )
             return viewport_data
 
@@ -7,10 +7,13 @@ Kakao Map API를 활용한 실제 경로 거리/시간 계산 서비스
 - Distance Matrix API 연동
 - 다중 이동수단 지원 (도보/대중교통/자동차)
 - 다층 캐싱 (L1: 메모리, L2: Redis 예정)
+- 좌표 없는 장소는 공유 지오코딩 캐시를 거쳐 주소로 좌표 확인
 - Fallback: Haversine 직선거리
 """
 
+import asyncio
 import hashlib
+import logging
 import math
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -19,6 +22,8 @@ from pydantic import BaseModel, Field
 
 from app.services.maps.kakao_map_service import KakaoMapService
 
+logger = logging.getLogger(__name__)
+
 
 class TransportMethod(str, Enum):
     """이동수단"""
@@ -126,6 +131,8 @@ class RouteCalculator:
         if len(places) < 2:
             raise ValueError("최소 2개 이상의 장소가 필요합니다")
 
+        places = await self._resolve_coordinates(places)
+
         # 캐시 확인
         cache_key = self._generate_cache_key(places, transport_method)
         if self.enable_cache and cache_key in self._cache:
@@ -171,6 +178,50 @@ class RouteCalculator:
 
         return matrix
 
+    async def _resolve_coordinates(
+        self, places: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        좌표가 없는 장소를 주소로 지오코딩 (공유 지오코딩 캐시 사용)
+
+        같은 주소는 워커 간에도 한 번만 Kakao API를 호출한다.
+
+        Raises:
+            ValueError: 좌표도 주소도 확인할 수 없는 장소가 있을 경우
+        """
+        missing = [
+            i
+            for i, place in enumerate(places)
+            if place.get("latitude") is None or place.get("longitude") is None
+        ]
+        if not missing:
+            return places
+
+        if self.kakao_service is None:
+            raise ValueError("좌표가 없는 장소가 있어 경로를 계산할 수 없습니다")
+
+        async def geocode(place: Dict[str, Any]) -> Optional[Dict[str, float]]:
+            if not place.get("address"):
+                return None
+            try:
+                return await self.kakao_service._address_to_coordinate_async(
+                    place["address"]
+                )
+            except Exception as e:
+                logger.warning(f"Geocoding failed for {place.get('address')}: {e}")
+                return None
+
+        coords = await asyncio.gather(*(geocode(places[i]) for i in missing))
+
+        resolved = list(places)
+        for i, coord in zip(missing, coords):
+            if coord is None:
+                raise ValueError(
+                    f"장소 좌표를 확인할 수 없습니다: {places[i].get('id', i)}"
+                )
+            resolved[i] = {**places[i], **coord}
+        return resolved
+
     async def get_route_segment(
         self,
         origin: Dict[str, Any],
@@ -0,0 +1,451 @@
+"""
+Tile cache for viewport place loading.
+
+Map viewports are quantized into Web Mercator z/x/y tiles. Each tile holds
+compact place summaries (id, lat/lng, name, category) in Redis, so a pan or
+zoom that overlaps the previous viewport reads most of its tiles with one
+MGET and only queries the database for the tiles newly scrolled into view
+(one query for all of them). Viewports are assembled from tiles and then
+trimmed to the exact bounds.
+
+At low zoom (``CLUSTER_MAX_ZOOM`` and below) tiles hold pre-aggregated
+clusters instead of individual places: the database groups places into
+child tiles ``CLUSTER_GRID_BITS`` levels down and returns only a count and
+centroid per cell.
+
+Tiles are scoped (all places for the map view, one scope per user for geo
+search). Place writes delete every tile containing the old and new
+coordinates, across all zoom levels and scopes; the TTL bounds staleness
+from a load racing with a write. If Redis is unavailable, tiles are loaded
+straight from the database and Redis is retried after a short pause.
+
+Invalidation deletes run on a single background thread: place CRUD calls
+them from async endpoints, and a Redis round trip there would block the
+event loop. The single worker keeps deletes in submission order.
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import product
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from geoalchemy2 import Geography, Geometry
+from redis import Redis
+from sqlalchemy import cast, func, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.place import Place
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "hotly:viewport"
+MIN_TILE_ZOOM = 2
+MAX_TILE_ZOOM = 16
+CLUSTER_MAX_ZOOM = 11
+CLUSTER_GRID_BITS = 3  # 8x8 cluster cells per tile
+MAX_VIEWPORT_TILES = 64
+TILE_PLACE_LIMIT = 500
+TILE_MARGIN_RATIO = 0.01
+REDIS_RETRY_SECONDS = 30.0
+
+MAX_LATITUDE = 85.05112878
+MERCATOR_ORIGIN = 20037508.342789244  # Half the EPSG:3857 world width in meters
+
+POINTS = "p"
+CLUSTERS = "c"
+
+Tile = Tuple[int, int]
+Bounds = Tuple[float, float, float, float]  # south, west, north, east
+TileLoader = Callable[[int, List[Tile]], Dict[Tile, Dict[str, Any]]]
+
+
+# Tile math ----------------------------------------------------------------
+
+
+def lat_lng_to_tile(latitude: float, longitude: float, zoom: int) -> Tile:
+    """Tile (x, y) containing a coordinate at ``zoom``."""
+    n = 1 << zoom
+    latitude = max(-MAX_LATITUDE, min(MAX_LATITUDE, latitude))
+    x = int((longitude + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(latitude))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> Bounds:
+    """(south, west, north, east) of a tile in degrees."""
+    n = 1 << zoom
+
+    def tile_latitude(tile_y: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return (
+        tile_latitude(y + 1),
+        x / n * 360.0 - 180.0,
+        tile_latitude(y),
+        (x + 1) / n * 360.0 - 180.0,
+    )
+
+
+def _tile_range(bounds: Bounds, zoom: int) -> Tuple[int, int, int, int]:
+    """(min_x, min_y, max_x, max_y) of the tiles intersecting ``bounds``."""
+    south, west, north, east = bounds
+    min_x, min_y = lat_lng_to_tile(north, west, zoom)
+    max_x, max_y = lat_lng_to_tile(south, east, zoom)
+    return min_x, min_y, max_x, max_y
+
+
+def tile_count(bounds: Bounds, zoom: int) -> int:
+    """Number of tiles ``tiles_covering`` would return, without building them."""
+    min_x, min_y, max_x, max_y = _tile_range(bounds, zoom)
+    return max(max_x - min_x + 1, 0) * max(max_y - min_y + 1, 0)
+
+
+def tiles_covering(bounds: Bounds, zoom: int) -> List[Tile]:
+    """
+    Tiles intersecting ``bounds`` at ``zoom``, row by row.
+
+    Pick ``zoom`` with ``choose_tile_zoom`` first: a large box at a high zoom
+    covers billions of tiles.
+    """
+    min_x, min_y, max_x, max_y = _tile_range(bounds, zoom)
+    return [
+        (x, y) for y, x in product(range(min_y, max_y + 1), range(min_x, max_x + 1))
+    ]
+
+
+def choose_tile_zoom(
+    bounds: Bounds, zoom_level: int, max_tiles: int = MAX_VIEWPORT_TILES
+) -> int:
+    """
+    Tile zoom for a viewport.
+
+    Starts at the map zoom (clamped to the cached range) and zooms out until
+    the viewport is covered by at most ``max_tiles`` tiles. Tile counts are
+    computed from the tile ranges, so any box size costs O(zoom levels).
+    """
+    zoom = max(MIN_TILE_ZOOM, min(MAX_TILE_ZOOM, zoom_level))
+    while zoom > MIN_TILE_ZOOM and tile_count(bounds, zoom) > max_tiles:
+        zoom -= 1
+    return zoom
+
+
+def in_bounds(latitude: float, longitude: float, bounds: Bounds) -> bool:
+    south, west, north, east = bounds
+    return south <= latitude <= north and west <= longitude <= east
+
+
+# Database loaders -----------------------------------------------------------
+
+
+def _tiles_filter(zoom: int, tiles: Iterable[Tile]):
+    """Index-backed filter for places in any of ``tiles`` (slightly padded)."""
+    envelopes = []
+    for x, y in tiles:
+        south, west, north, east = tile_bounds(zoom, x, y)
+        # Geography envelope edges are geodesics; pad so no tile edge is missed
+        margin_lat = (north - south) * TILE_MARGIN_RATIO
+        margin_lng = (east - west) * TILE_MARGIN_RATIO
+        envelope = func.ST_MakeEnvelope(
+            west - margin_lng,
+            south - margin_lat,
+            east + margin_lng,
+            north + margin_lat,
+            4326,
+        )
+        envelopes.append(
+            func.ST_Intersects(Place.coordinates, cast(envelope, Geography(srid=4326)))
+        )
+    return or_(*envelopes)
+
+
+def query_point_tiles(
+    db: Session,
+    filters: Sequence[Any],
+    zoom: int,
+    tiles: List[Tile],
+    limit_per_tile: int = TILE_PLACE_LIMIT,
+) -> Dict[Tile, Dict[str, Any]]:
+    """Place summaries for ``tiles`` in a single query."""
+    point = cast(Place.coordinates, Geometry("POINT", srid=4326))
+    rows = (
+        db.query(
+            Place.id,
+            func.ST_Y(point),
+            func.ST_X(point),
+            Place.name,
+            Place.category,
+        )
+        .filter(*filters, Place.coordinates.isnot(None), _tiles_filter(zoom, tiles))
+        .all()
+    )
+
+    loaded = {tile: {"places": [], "truncated": False} for tile in tiles}
+    for place_id, latitude, longitude, name, category in rows:
+        entry = loaded.get(lat_lng_to_tile(latitude, longitude, zoom))
+        if entry is None:
+            continue  # Inside the padding of a requested tile
+        if len(entry["places"]) >= limit_per_tile:
+            entry["truncated"] = True
+            continue
+        entry["places"].append(
+            {
+                "place_id": str(place_id),
+                "latitude": latitude,
+                "longitude": longitude,
+                "name": name,
+                "category": category,
+            }
+        )
+    return loaded
+
+
+def query_cluster_tiles(
+    db: Session,
+    filters: Sequence[Any],
+    zoom: int,
+    tiles: List[Tile],
+    grid_bits: int = CLUSTER_GRID_BITS,
+) -> Dict[Tile, Dict[str, Any]]:
+    """
+    Pre-clustered ``tiles`` in a single grouped query.
+
+    Cells are the child tiles ``grid_bits`` levels down, computed from the
+    EPSG:3857 projection so they nest exactly inside the requested tiles.
+    """
+    point = cast(Place.coordinates, Geometry("POINT", srid=4326))
+    mercator = func.ST_Transform(point, 3857)
+    cells = float(1 << (zoom + grid_bits))
+    world = 2 * MERCATOR_ORIGIN
+    cell_x = func.floor((func.ST_X(mercator) + MERCATOR_ORIGIN) / world * cells)
+    cell_y = func.floor((MERCATOR_ORIGIN - func.ST_Y(mercator)) / world * cells)
+
+    rows = (
+        db.query(
+            cell_x,
+            cell_y,
+            func.count(Place.id),
+            func.avg(func.ST_Y(point)),
+            func.avg(func.ST_X(point)),
+        )
+        .filter(*filters, Place.coordinates.isnot(None), _tiles_filter(zoom, tiles))
+        .group_by(cell_x, cell_y)
+        .all()
+    )
+
+    loaded = {tile: {"clusters": [], "place_count": 0} for tile in tiles}
+    for x, y, count, latitude, longitude in rows:
+        x, y = int(x), int(y)
+        entry = loaded.get((x >> grid_bits, y >> grid_bits))
+        if entry is None:
+            continue
+        entry["place_count"] += int(count)
+        entry["clusters"].append(
+            {
+                "cluster_id": f"{zoom + grid_bits}/{x}/{y}",
+                "center": {"latitude": float(latitude), "longitude": float(longitude)},
+                "place_count": int(count),
+            }
+        )
+    return loaded
+
+
+# Cache ----------------------------------------------------------------------
+
+
+class ViewportTileCache:
+    """Redis-backed per-scope tile cache for viewport queries."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Optional[Redis] = None,
+        ttl_seconds: int = 600,
+        prefix: str = CACHE_PREFIX,
+    ):
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+        self._client = client
+        self._redis_retry_at = 0.0
+        self._stats: Counter = Counter()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._writer_lock = threading.Lock()
+
+    def tile_key(self, scope: str, kind: str, zoom: int, tile: Tile) -> str:
+        return f"{self.prefix}:{scope}:{kind}:{zoom}:{tile[0]}:{tile[1]}"
+
+    def get_tiles(
+        self,
+        scope: str,
+        kind: str,
+        zoom: int,
+        tiles: List[Tile],
+        load: TileLoader,
+    ) -> Dict[Tile, Dict[str, Any]]:
+        """
+        Return cached tiles, loading and storing the missing ones.
+
+        Args:
+            scope: Cache scope (e.g. ``"all"`` or ``"user:<id>"``)
+            kind: ``POINTS`` or ``CLUSTERS``
+            zoom: Tile zoom level
+            tiles: Tiles to return
+            load: Called once with ``(zoom, missing_tiles)``; returns
+                JSON-serializable tile data for each of them
+
+        Returns:
+            Tile data keyed by tile
+        """
+        self._stats["requests"] += 1
+        self._stats["tiles"] += len(tiles)
+        keys = [self.tile_key(scope, kind, zoom, tile) for tile in tiles]
+
+        found: Dict[Tile, Dict[str, Any]] = {}
+        for tile, raw in zip(tiles, self._redis_mget(keys)):
+            if raw is not None:
+                found[tile] = json.loads(raw)
+        self._stats["tile_hits"] += len(found)
+
+        missing = [tile for tile in tiles if tile not in found]
+        if missing:
+            self._stats["tile_misses"] += len(missing)
+            self._stats["loads"] += 1
+            loaded = load(zoom, missing)
+            self._redis_set_many(
+                {
+                    self.tile_key(scope, kind, zoom, tile): json.dumps(
+                        loaded[tile], ensure_ascii=False
+                    )
+                    for tile in missing
+                }
+            )
+            found.update(loaded)
+        return found
+
+    def invalidate_point(
+        self, scopes: Iterable[str], latitude: float, longitude: float
+    ) -> Future:
+        """
+        Delete every cached tile (all zooms and kinds) containing a point.
+
+        The delete runs in the background; the returned future completes
+        once it has been sent.
+        """
+        keys = []
+        for zoom in range(MIN_TILE_ZOOM, MAX_TILE_ZOOM + 1):
+            tile = lat_lng_to_tile(latitude, longitude, zoom)
+            for scope in scopes:
+                keys.append(self.tile_key(scope, POINTS, zoom, tile))
+                if zoom <= CLUSTER_MAX_ZOOM:
+                    keys.append(self.tile_key(scope, CLUSTERS, zoom, tile))
+        return self._submit(self._redis_delete, keys)
+
+    def invalidate_place(
+        self,
+        user_id: Any,
+        coordinates: Iterable[Tuple[Optional[float], Optional[float]]],
+    ) -> None:
+        """
+        Invalidate tiles after a place write (deletes run in the background).
+
+        Args:
+            user_id: Owner of the place
+            coordinates: (latitude, longitude) pairs the place occupied
+                before and after the write; ``None`` pairs are skipped
+        """
+        scopes = place_scopes(user_id)
+        for latitude, longitude in set(coordinates):
+            if latitude is not None and longitude is not None:
+                self.invalidate_point(scopes, latitude, longitude)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Wait for queued invalidations (tests, shutdown)."""
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        tiles = self._stats["tiles"]
+        stats["hit_rate"] = round(self._stats["tile_hits"] / tiles, 4) if tiles else 0.0
+        stats["redis_available"] = time.monotonic() >= self._redis_retry_at
+        return stats
+
+    def reset_stats(self) -> None:
+        self._stats.clear()
+
+    # Redis -----------------------------------------------------------------
+
+    def _get_client(self) -> Optional[Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._client is None and self.redis_url is not None:
+            self._client = Redis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._stats["redis_errors"] += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Viewport tile cache Redis unavailable: {error}")
+
+    def _submit(self, fn: Callable[..., None], *args: Any) -> Future:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="viewport-tile-cache"
+                )
+        return self._writer.submit(fn, *args)
+
+    def _redis_delete(self, keys: List[str]) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            client.delete(*keys)
+            self._stats["invalidations"] += 1
+        except Exception as e:
+            self._redis_failed(e)
+
+    def _redis_mget(self, keys: List[str]) -> List[Optional[str]]:
+        client = self._get_client()
+        if client is None or not keys:
+            return [None] * len(keys)
+        try:
+            return client.mget(keys)
+        except Exception as e:
+            self._redis_failed(e)
+            return [None] * len(keys)
+
+    def _redis_set_many(self, values: Dict[str, str]) -> None:
+        client = self._get_client()
+        if client is None or not values:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, raw in values.items():
+                pipe.set(key, raw, ex=self.ttl_seconds)
+            pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+
+
+def place_scopes(user_id: Any) -> List[str]:
+    """Cache scopes that include a user's places."""
+    return ["all", user_scope(user_id)]
+
+
+def user_scope(user_id: Any) -> str:
+    return f"user:{user_id}"
+
+
+# Shared by MapService, GeoService and the place CRUD invalidation hooks
+viewport_tile_cache = ViewportTileCache(
+    redis_url=settings.REDIS_URL,
+    ttl_seconds=settings.VIEWPORT_TILE_CACHE_TTL_SECONDS,
+)
@@ -9,6 +9,7 @@
 
 import logging
 import pickle
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
@@ -16,14 +17,22 @@ from uuid import UUID
 import numpy as np
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.linear_model import SGDRegressor
-from sklearn.metrics import mean_squared_error, r2_score
-from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
 from app.core.cache import CacheService
+from app.services.ml.training_jobs import (
+    TrainingMatrixBuilder,
+    TrainingReport,
+    fit_relevance_models,
+    run_training_job,
+)
 
 logger = logging.getLogger(__name__)
 
+MODEL_CACHE_KEY = "ml:model:current"
+MODEL_VERSION_KEY = "ml:model:version"
+MODEL_VERSION_CHECK_INTERVAL = 60  # 초
+
 
 class MLEngine:
     """머신러닝 엔진"""
@@ -45,9 +54,12 @@ class MLEngine:
         self.is_trained = False
         self.last_training = None
         self.model_version = "1.0.0"
+        self.last_training_report: Optional[TrainingReport] = None
+        self._last_version_check = float("-inf")
 
         # 캐시 TTL
         self.model_cache_ttl = 3600  # 1시간
+        self.published_model_ttl = 7 * 24 * 3600  # 배포 모델은 재학습 전까지 유지
         self.prediction_cache_ttl = 300  # 5분
 
     async def predict_relevance(
@@ -177,33 +189,25 @@ class MLEngine:
                 logger.warning("Insufficient data for training")
                 return False
 
-            # 데이터 분할
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
+            # 학습 프로세스 풀에서 훈련 (이벤트 루프 차단 방지)
+            result, report = await run_training_job(
+                "search_relevance", fit_relevance_models, X, y
+            )
+            self.relevance_model = result["relevance_model"]
+            self.personalization_model = result["personalization_model"]
+            self.scaler = result["scaler"]
+            self.model_version = report.model_version
+            self.last_training_report = report
+
+            logger.info(
+                f"Model trained - MSE: {report.metrics['mse']:.4f}, "
+                f"R2: {report.metrics['r2']:.4f}"
             )
-
-            # 특성 스케일링
-            self.scaler.fit(X_train)
-            X_train_scaled = self.scaler.transform(X_train)
-            X_test_scaled = self.scaler.transform(X_test)
-
-            # 관련도 모델 훈련
-            self.relevance_model.fit(X_train_scaled, y_train)
-
-            # 개인화 모델 훈련
-            self.personalization_model.fit(X_train_scaled, y_train)
-
-            # 모델 평가
-            y_pred = self.relevance_model.predict(X_test_scaled)
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
-
-            logger.info(f"Model trained - MSE: {mse:.4f}, R2: {r2:.4f}")
 
             self.is_trained = True
             self.last_training = datetime.utcnow()
 
-            # 모델 저장
+            # 모델 배포 (서빙 워커는 버전 키 변경을 보고 다시 로드)
             await self._save_model()
 
             return True
@@ -221,6 +225,9 @@ class MLEngine:
                 if self.last_training
                 else None,
                 "model_version": self.model_version,
+                "last_training_report": self.last_training_report.to_dict()
+                if self.last_training_report
+                else None,
                 "feature_importance": {},
                 "prediction_cache_hit_rate": 0.0,
             }
@@ -413,22 +420,24 @@ class MLEngine:
         self, data: List[Dict[str, Any]]
     ) -> Tuple[np.ndarray, np.ndarray]:
         """훈련용 특성과 라벨 준비"""
-        features = []
-        labels = []
+        feature_names = self._get_feature_names()
+        builder = TrainingMatrixBuilder(len(feature_names), max(len(data), 1))
 
         for item in data:
             try:
-                feature_vector = self._convert_features_to_array(
-                    [item.get("features", {})]
+                features = item.get("features", {})
+                builder.append(
+                    [
+                        float(value) if isinstance(value, (int, float)) else 0.0
+                        for value in (features.get(name, 0.0) for name in feature_names)
+                    ],
+                    item.get("label", 0.5),
                 )
-                if len(feature_vector) > 0:
-                    features.extend(feature_vector)
-                    labels.append(item.get("label", 0.5))
             except Exception as e:
                 logger.warning(f"Failed to prepare training sample: {e}")
                 continue
 
-        return np.array(features), np.array(labels)
+        return builder.arrays()
 
     async def _perform_online_learning(
         self, training_data: List[Dict[str, Any]]
@@ -544,7 +553,10 @@ class MLEngine:
             }
 
             await self.cache.set(
-                "ml:model:current", model_data, ttl=self.model_cache_ttl
+                MODEL_CACHE_KEY, model_data, ttl=self.published_model_ttl
+            )
+            await self.cache.set(
+                MODEL_VERSION_KEY, self.model_version, ttl=self.published_model_ttl
             )
 
         except Exception as e:
@@ -553,7 +565,7 @@ class MLEngine:
     async def _load_model(self):
         """캐시에서 모델 로드"""
         try:
-            model_data = await self.cache.get("ml:model:current")
+            model_data = await self.cache.get(MODEL_CACHE_KEY)
             if not model_data:
                 return False
 
@@ -574,6 +586,27 @@ class MLEngine:
             logger.error(f"Failed to load model: {e}")
             return False
 
+    async def refresh_published_model(self) -> bool:
+        """배포된 모델 버전이 바뀌었으면 다시 로드 (확인 주기 제한)"""
+        now = time.monotonic()
+        if now - self._last_version_check < MODEL_VERSION_CHECK_INTERVAL:
+            return False
+        self._last_version_check = now
+
+        try:
+            published_version = await self.cache.get(MODEL_VERSION_KEY)
+            if not published_version or published_version == self.model_version:
+                return False
+
+            logger.info(
+                f"Reloading ML model {self.model_version} -> {published_version}"
+            )
+            return await self._load_model()
+
+        except Exception as e:
+            logger.error(f"Failed to check published model version: {e}")
+            return False
+
     async def _invalidate_model_cache(self):
         """모델 캐시 무효화"""
         try:
@@ -603,6 +636,9 @@ async def get_ml_engine() -> MLEngine:
 
         # 저장된 모델 로드 시도
         await _ml_engine._load_model()
+    else:
+        # 다른 워커가 새 모델을 배포했으면 교체
+        await _ml_engine.refresh_published_model()
 
     return _ml_engine
 
@@ -0,0 +1,228 @@
+"""
+모델 학습 잡 러너
+
+이벤트 루프 밖에서 모델을 학습시키기 위한 공용 유틸리티
+- 학습 행을 NumPy 배열로 직접 적재 (행 단위 리스트 생성 없음)
+- 별도 프로세스 풀에서 fit 실행 후 결과 모델만 돌려받음
+- fit 시간, 행 수, 메모리 피크 리포트
+- 서빙 워커가 감지할 수 있는 모델 버전 발급
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import resource
+import time
+import tracemalloc
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 서버 사용자 수와 무관하게 학습은 한 번에 하나씩만 실행
+TRAINING_MAX_WORKERS = 1
+# 서버 사이드 커서에서 한 번에 가져오는 행 수
+TRAINING_FETCH_SIZE = 5000
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+@dataclass
+class TrainingReport:
+    """학습 잡 실행 결과"""
+
+    job: str
+    model_version: str
+    rows: int
+    fit_seconds: float
+    peak_memory_mb: float
+    max_rss_mb: float
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class TrainingMatrixBuilder:
+    """학습 행을 미리 할당한 NumPy 배열에 순서대로 채우는 빌더"""
+
+    def __init__(self, n_features: int, initial_capacity: int = 1024) -> None:
+        self.n_features = n_features
+        self._features = np.empty((initial_capacity, n_features), dtype=np.float64)
+        self._labels = np.empty(initial_capacity, dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, features: Sequence[float], label: float) -> None:
+        """한 행 추가 (용량이 차면 두 배로 확장)"""
+        if self._size == len(self._labels):
+            capacity = max(len(self._labels) * 2, 1)
+            self._features = np.resize(self._features, (capacity, self.n_features))
+            self._labels = np.resize(self._labels, capacity)
+        self._features[self._size] = features
+        self._labels[self._size] = label
+        self._size += 1
+
+    def extend(self, rows: Iterable[Tuple[Sequence[float], float]]) -> None:
+        for features, label in rows:
+            self.append(features, label)
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """채워진 구간의 (X, y) 반환"""
+        return self._features[: self._size], self._labels[: self._size]
+
+
+def new_model_version() -> str:
+    """배포용 모델 버전 (UTC 타임스탬프)"""
+    return datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S%f")
+
+
+def fit_timing_model(X: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    """알림 타이밍 분류 모델 학습 (프로세스 풀에서 실행)"""
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X_scaled, y, test_size=0.2, random_state=42
+    )
+
+    model = RandomForestClassifier(
+        n_estimators=100,
+        random_state=42,
+        max_depth=10,
+        min_samples_split=5,
+        min_samples_leaf=2,
+    )
+    model.fit(X_train, y_train)
+    accuracy = float((model.predict(X_test) == y_test).mean())
+
+    return {
+        "model": model,
+        "scaler": scaler,
+        "metrics": {"accuracy": accuracy},
+    }
+
+
+def fit_relevance_models(X: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    """검색 관련도/개인화 회귀 모델 학습 (프로세스 풀에서 실행)"""
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.linear_model import SGDRegressor
+    from sklearn.metrics import mean_squared_error, r2_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+    scaler = StandardScaler().fit(X_train)
+    X_train_scaled = scaler.transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+
+    relevance_model = RandomForestRegressor(
+        n_estimators=100, max_depth=10, random_state=42
+    )
+    relevance_model.fit(X_train_scaled, y_train)
+    personalization_model = SGDRegressor(alpha=0.01, random_state=42)
+    personalization_model.fit(X_train_scaled, y_train)
+
+    y_pred = relevance_model.predict(X_test_scaled)
+    return {
+        "relevance_model": relevance_model,
+        "personalization_model": personalization_model,
+        "scaler": scaler,
+        "metrics": {
+            "mse": float(mean_squared_error(y_test, y_pred)),
+            "r2": float(r2_score(y_test, y_pred)),
+        },
+    }
+
+
+def _measured_fit(
+    fit: Callable[[np.ndarray, np.ndarray], Dict[str, Any]],
+    X: np.ndarray,
+    y: np.ndarray,
+) -> Tuple[Dict[str, Any], float, float, float]:
+    """fit 실행 + 소요 시간/할당 피크/최대 RSS 측정 (워커 프로세스 내부)"""
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    try:
+        result = fit(X, y)
+        fit_seconds = time.perf_counter() - start_time
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Linux 기준 ru_maxrss 단위는 KB
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result, fit_seconds, peak_bytes / 1024 / 1024, max_rss_kb / 1024
+
+
+def get_training_executor() -> ProcessPoolExecutor:
+    """학습 전용 프로세스 풀 (spawn: API 서버 스레드 상태를 fork하지 않음)"""
+    global _executor
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=TRAINING_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_training_executor() -> None:
+    """학습 프로세스 풀 종료"""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+async def run_training_job(
+    job: str,
+    fit: Callable[[np.ndarray, np.ndarray], Dict[str, Any]],
+    X: np.ndarray,
+    y: np.ndarray,
+    executor: Optional[Executor] = None,
+) -> Tuple[Dict[str, Any], TrainingReport]:
+    """
+    이벤트 루프를 막지 않고 별도 프로세스에서 모델 학습
+
+    Args:
+        job: 리포트/로그용 잡 이름
+        fit: 모듈 최상위 학습 함수 (피클 가능해야 함)
+        X: 특성 배열
+        y: 라벨 배열
+        executor: 실행기 (기본값: 학습 전용 프로세스 풀)
+
+    Returns:
+        (학습 결과, 실행 리포트)
+    """
+    loop = asyncio.get_running_loop()
+    result, fit_seconds, peak_memory_mb, max_rss_mb = await loop.run_in_executor(
+        executor or get_training_executor(), _measured_fit, fit, X, y
+    )
+
+    report = TrainingReport(
+        job=job,
+        model_version=new_model_version(),
+        rows=len(X),
+        fit_seconds=round(fit_seconds, 3),
+        peak_memory_mb=round(peak_memory_mb, 1),
+        max_rss_mb=round(max_rss_mb, 1),
+        metrics=result.get("metrics", {}),
+    )
+    logger.info(
+        f"Training job {job} finished: rows={report.rows} "
+        f"fit={report.fit_seconds}s peak={report.peak_memory_mb}MB "
+        f"rss={report.max_rss_mb}MB metrics={report.metrics}"
+    )
+    return result, report
@@ -5,17 +5,37 @@
 TDD 방식으로 개발된 프로덕션 레디 로깅 시스템입니다.
 """
 
+import atexit
+import itertools
 import json
+import logging
+import re
 import threading
+import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left, bisect_right
+from collections import deque
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 # from app.core.config import settings
 
+# 파이프라인 자체의 오류는 표준 로거로 보고 (중앙 파이프라인으로 되돌리지 않음)
+logger = logging.getLogger(__name__)
+
+LOG_SEGMENT_SIZE = 4096  # 세그먼트당 항목 수
+LOG_RETENTION_MAX_ENTRIES = 500_000  # 보존 항목 수 상한 (세그먼트 단위로 삭제)
+LOG_RETENTION_MAX_AGE = timedelta(days=1)
+LOG_TOKEN_PATTERN = re.compile(r"\w+")
+
+LOG_QUEUE_CAPACITY = 10000  # 링 버퍼 최대 대기 로그 수
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL_SECONDS = 0.05  # 큐가 비었을 때 소비자 대기 시간
+LOG_SAMPLE_WATERMARK = 0.8  # 샘플링 정책: 이 비율 이상 차면 저중요도 로그 샘플링
+LOG_SAMPLE_RATE = 10  # 샘플링 시 N개 중 1개 유지
+
 
 class LogLevel(str, Enum):
     """로그 레벨"""
@@ -27,6 +47,13 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+class LogOverflowPolicy(str, Enum):
+    """로그 큐 포화 시 정책"""
+
+    DROP = "drop"  # 큐가 가득 차면 새 로그 폐기
+    SAMPLE = "sample"  # 임계치 이상이면 DEBUG/INFO 샘플링, 가득 차면 폐기
+
+
 @dataclass
 class LogEntry:
     """구조화된 로그 항목"""
@@ -64,10 +91,11 @@ class StructuredLogger:
         trace_id: str = None,
         user_id: str = None,
         extra_fields: Dict[str, Any] = None,
+        timestamp: datetime = None,
     ) -> Dict[str, Any]:
         """구조화된 로그 생성"""
         log_entry = LogEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=(timestamp or datetime.now()).isoformat(),
             level=level.upper(),
             message=message,
             service=self.service_name,
@@ -162,27 +190,36 @@ class LogCollector:
 
     def collect_log(self, service_name: str, log_entry: Dict[str, Any]):
         """로그 수집"""
+        self.collect_logs([(service_name, log_entry)])
+
+    def collect_logs(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """로그 일괄 수집 (잠금 한 번)"""
         with self._lock:
-            if service_name not in self.services:
-                self.services[service_name] = {
-                    "log_count": 0,
-                    "last_log_time": None,
-                    "error_count": 0,
-                    "warning_count": 0,
-                }
+            for service_name, log_entry in batch:
+                self._collect_locked(service_name, log_entry)
+
+    def _collect_locked(self, service_name: str, log_entry: Dict[str, Any]):
+        """잠금을 잡은 상태에서 로그 한 건 반영"""
+        if service_name not in self.services:
+            self.services[service_name] = {
+                "log_count": 0,
+                "last_log_time": None,
+                "error_count": 0,
+                "warning_count": 0,
+            }
 
-            service_stats = self.services[service_name]
-            service_stats["log_count"] += 1
-            service_stats["last_log_time"] = datetime.now()
+        service_stats = self.services[service_name]
+        service_stats["log_count"] += 1
+        service_stats["last_log_time"] = datetime.now()
 
-            level = log_entry.get("level", "").upper()
-            if level == "ERROR":
-                service_stats["error_count"] += 1
-            elif level == "WARNING":
-                service_stats["warning_count"] += 1
+        level = log_entry.get("level", "").upper()
+        if level == "ERROR":
+            service_stats["error_count"] += 1
+        elif level == "WARNING":
+            service_stats["warning_count"] += 1
 
-            self.total_logs += 1
-            self.log_buffer.append({"service": service_name, **log_entry})
+        self.total_logs += 1
+        self.log_buffer.append({"service": service_name, **log_entry})
 
     def get_service_stats(self, service_name: str) -> Dict[str, Any]:
         """서비스별 로그 통계"""
@@ -199,28 +236,162 @@ class LogCollector:
             }
 
 
-class LogSearchEngine:
-    """로그 검색 및 필터링 엔진"""
+class _LogSegment:
+    """
+    시간순 로그 세그먼트
+
+    항목은 추가만 되며 게시 목록(posting)은 세그먼트 내 위치 오름차순이다.
+    검색은 스냅샷 시점의 항목 수까지만 읽으므로 추가 중인 세그먼트도 잠금 없이 읽는다.
+    """
 
     def __init__(self):
-        self.log_database: List[Dict] = []
+        self.entries: List[Dict[str, Any]] = []
+        self.timestamps: List[datetime] = []
+        self.messages: List[str] = []  # 소문자 메시지 (검색 시 재변환하지 않음)
+        self.by_level: Dict[str, List[int]] = {}
+        self.by_service: Dict[str, List[int]] = {}
+        self.by_token: Dict[str, List[int]] = {}
+
+    def append(
+        self,
+        entry: Dict[str, Any],
+        timestamp: datetime,
+        term_segments: Dict[str, int],
+    ):
+        """항목 추가 (세그먼트에 처음 나온 토큰은 엔진 토큰 사전에 등록)"""
+        position = len(self.entries)
+        lowered = entry["message"].lower()
+
+        self.by_level.setdefault(entry["level"], []).append(position)
+        self.by_service.setdefault(entry["service"], []).append(position)
+        for token in set(_tokenize(lowered)):
+            postings = self.by_token.get(token)
+            if postings is None:
+                postings = self.by_token[token] = []
+                term_segments[token] = term_segments.get(token, 0) + 1
+            postings.append(position)
+
+        # 게시 목록을 먼저 채우고 항목을 마지막에 추가 (스냅샷 길이 이전 위치만 노출)
+        self.messages.append(lowered)
+        self.timestamps.append(timestamp)
+        self.entries.append(entry)
+
+
+def _tokenize(text: str) -> List[str]:
+    return LOG_TOKEN_PATTERN.findall(text)
+
+
+def _term_matcher(needle: str, index: int, token_count: int, token: str):
+    """
+    부분 문자열 검색어의 index번째 토큰과 맞을 수 있는 색인 토큰 판별 함수
+
+    검색어 안쪽 토큰은 메시지 토큰과 정확히 같아야 하고, 검색어가 단어 문자로
+    시작/끝나면 첫/마지막 토큰은 메시지 토큰의 접미/접두 부분일 수 있다.
+    """
+    open_left = index == 0 and LOG_TOKEN_PATTERN.match(needle[0]) is not None
+    open_right = (
+        index == token_count - 1 and LOG_TOKEN_PATTERN.match(needle[-1]) is not None
+    )
+    if open_left and open_right:
+        return lambda term: token in term
+    if open_left:
+        return lambda term: term.endswith(token)
+    if open_right:
+        return lambda term: term.startswith(token)
+    return None
+
+
+def _positions_in_range(postings: List[int], start: int, end: int) -> List[int]:
+    return postings[bisect_left(postings, start) : bisect_left(postings, end)]
+
+
+class LogSearchEngine:
+    """
+    로그 검색 및 필터링 엔진
+
+    - 시간순 세그먼트: 시간 범위는 세그먼트 최소/최대 시각으로 건너뛰고 내부는 이진 탐색
+    - 세그먼트별 레벨/서비스 게시 목록과 메시지 토큰 역색인
+    - 보존 한도(항목 수/보관 기간)를 넘으면 가장 오래된 세그먼트를 통째로 삭제
+    - 추가는 잠금으로 직렬화하고 검색은 세그먼트 목록 스냅샷을 잠금 없이 읽음
+    """
+
+    def __init__(
+        self,
+        segment_size: int = LOG_SEGMENT_SIZE,
+        max_entries: int = LOG_RETENTION_MAX_ENTRIES,
+        max_age: timedelta = LOG_RETENTION_MAX_AGE,
+    ):
+        self.segment_size = segment_size
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._segments: List[_LogSegment] = [_LogSegment()]
+        # 보존 중인 세그먼트 전체의 토큰 사전 (토큰 → 포함 세그먼트 수)
+        self._term_segments: Dict[str, int] = {}
+        self._retained_entries = 0
+        self._next_id = 1
+        self._last_timestamp: Optional[datetime] = None
         self._lock = threading.Lock()
 
     def add_log_entry(
         self, level: str, message: str, service: str, extra: Dict = None
     ) -> Dict:
         """로그 항목 추가"""
+        return self.add_log_entries([(level, message, service, extra)])[0]
+
+    def add_log_entries(
+        self, items: List[Tuple[str, str, str, Optional[Dict]]]
+    ) -> List[Dict]:
+        """로그 항목 일괄 추가 ((레벨, 메시지, 서비스, 추가 필드) 목록, 잠금 한 번)"""
         with self._lock:
-            entry = {
-                "id": len(self.log_database) + 1,
-                "timestamp": datetime.now(),
-                "level": level,
-                "message": message,
-                "service": service,
-                **(extra or {}),
-            }
-            self.log_database.append(entry)
-            return entry
+            # 시계가 뒤로 가도 세그먼트 내 시각은 비감소로 유지 (이진 탐색 전제)
+            timestamp = datetime.now()
+            if self._last_timestamp and timestamp < self._last_timestamp:
+                timestamp = self._last_timestamp
+            self._last_timestamp = timestamp
+
+            entries = []
+            for level, message, service, extra in items:
+                entry = {
+                    "id": self._next_id,
+                    "timestamp": timestamp,
+                    "level": level,
+                    "message": message,
+                    "service": service,
+                    **(extra or {}),
+                }
+                self._next_id += 1
+
+                segment = self._segments[-1]
+                if len(segment.entries) >= self.segment_size:
+                    segment = _LogSegment()
+                    self._segments = self._segments + [segment]
+                segment.append(entry, timestamp, self._term_segments)
+                self._retained_entries += 1
+                entries.append(entry)
+
+            self._enforce_retention(timestamp)
+            return entries
+
+    def _enforce_retention(self, now: datetime):
+        """보존 한도를 넘은 가장 오래된 세그먼트 삭제 (추가 중인 세그먼트는 유지)"""
+        cutoff = now - self.max_age
+        dropped = 0
+        segments = self._segments
+        while len(segments) - dropped > 1:
+            oldest = segments[dropped]
+            over_size = self._retained_entries - len(oldest.entries) >= self.max_entries
+            if not over_size and oldest.timestamps[-1] >= cutoff:
+                break
+            self._retained_entries -= len(oldest.entries)
+            for term in oldest.by_token:
+                remaining = self._term_segments[term] - 1
+                if remaining:
+                    self._term_segments[term] = remaining
+                else:
+                    del self._term_segments[term]
+            dropped += 1
+        if dropped:
+            self._segments = segments[dropped:]
 
     def search_logs(
         self,
@@ -231,38 +402,98 @@ class LogSearchEngine:
         time_to: datetime = None,
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
-        """로그 검색"""
-        with self._lock:
-            results = []
-
-            for log in self.log_database:
-                # 레벨 필터
-                if level and log["level"] != level:
+        """로그 검색 (오래된 순, 최대 limit개)"""
+        # 스냅샷: 세그먼트 목록과 각 세그먼트의 현재 항목 수
+        # (토큰은 항목보다 먼저 등록되므로 스냅샷 이후 사전 조회가 누락 없음)
+        snapshot = [(segment, len(segment.entries)) for segment in self._segments]
+
+        needle = message_contains.lower() if message_contains else None
+        token_terms = self._resolve_token_terms(needle) if needle else []
+        results: List[Dict[str, Any]] = []
+
+        for segment, count in snapshot:
+            if not count:
+                continue
+            if time_to and segment.timestamps[0] > time_to:
+                break
+            if time_from and segment.timestamps[count - 1] < time_from:
+                continue
+
+            start = (
+                bisect_left(segment.timestamps, time_from, 0, count) if time_from else 0
+            )
+            end = (
+                bisect_right(segment.timestamps, time_to, 0, count)
+                if time_to
+                else count
+            )
+
+            for position in self._candidate_positions(
+                segment, level, service, token_terms, start, end
+            ):
+                entry = segment.entries[position]
+                if level and entry["level"] != level:
                     continue
-
-                # 서비스 필터
-                if service and log["service"] != service:
-                    continue
-
-                # 메시지 검색
-                if (
-                    message_contains
-                    and message_contains.lower() not in log["message"].lower()
-                ):
-                    continue
-
-                # 시간 범위 필터
-                if time_from and log["timestamp"] < time_from:
+                if service and entry["service"] != service:
                     continue
-                if time_to and log["timestamp"] > time_to:
+                if needle and needle not in segment.messages[position]:
                     continue
 
-                results.append(log)
-
+                results.append(entry)
                 if len(results) >= limit:
-                    break
-
-            return results
+                    return results
+
+        return results
+
+    def _resolve_token_terms(self, needle: str) -> List[List[str]]:
+        """검색어 토큰별로 맞을 수 있는 색인 토큰 목록 (질의당 한 번만 사전 조회)"""
+        tokens = _tokenize(needle)
+        vocabulary = None
+        token_terms = []
+        for index, token in enumerate(tokens):
+            matcher = _term_matcher(needle, index, len(tokens), token)
+            if matcher is None:
+                token_terms.append([token])
+                continue
+            if vocabulary is None:
+                vocabulary = list(self._term_segments)
+            token_terms.append([term for term in vocabulary if matcher(term)])
+        return token_terms
+
+    def _candidate_positions(
+        self,
+        segment: _LogSegment,
+        level: Optional[str],
+        service: Optional[str],
+        token_terms: List[List[str]],
+        start: int,
+        end: int,
+    ):
+        """가장 짧은 게시 목록에서 후보 위치 선택 (나머지 조건은 호출자가 확인)"""
+        candidates = []
+        if level:
+            candidates.append([segment.by_level.get(level, [])])
+        if service:
+            candidates.append([segment.by_service.get(service, [])])
+        for terms in token_terms:
+            candidates.append(
+                [segment.by_token[term] for term in terms if term in segment.by_token]
+            )
+
+        if not candidates:
+            return range(start, end)
+
+        # 토큰이 여러 색인 토큰에 맞으면 게시 목록 합집합 (가장 작은 후보만 만듦)
+        postings = min(candidates, key=lambda lists: sum(map(len, lists)))
+        if len(postings) == 1:
+            return _positions_in_range(postings[0], start, end)
+        return sorted(
+            {
+                p
+                for posting in postings
+                for p in _positions_in_range(posting, start, end)
+            }
+        )
 
 
 class LogRotationManager:
@@ -276,15 +507,27 @@ class LogRotationManager:
 
     def add_log_entry(self, log_entry: Dict[str, Any]):
         """로그 항목 추가"""
-        with self._lock:
-            log_size = len(json.dumps(log_entry))
+        self.add_log_entries([log_entry])
 
+    def add_log_entries(self, log_entries: List[Dict[str, Any]]):
+        """
+        로그 항목 일괄 추가
+
+        배치 전체를 한 번에 직렬화해 크기를 계산하고 로테이션은 배치 경계에서 판단한다.
+        json.dumps(list)는 "[" + ", ".join(항목) + "]" 이므로 구분자를 빼면 항목 크기 합이다.
+        """
+        if not log_entries:
+            return
+        batch_size = len(json.dumps(log_entries, default=str)) - 2
+        batch_size -= 2 * (len(log_entries) - 1)
+
+        with self._lock:
             # 로테이션 필요한지 체크
-            if self.storage["current_size"] + log_size > self.max_log_size:
+            if self.storage["current_size"] + batch_size > self.max_log_size:
                 self._rotate_logs()
 
-            self.storage["current_logs"].append(log_entry)
-            self.storage["current_size"] += log_size
+            self.storage["current_logs"].extend(log_entries)
+            self.storage["current_size"] += batch_size
 
     def _rotate_logs(self):
         """로그 로테이션 (internal method)"""
@@ -292,7 +535,7 @@ class LogRotationManager:
             # 현재 로그를 아카이브로 이동
             archived_file = {
                 "filename": f"app-{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
-                "logs": self.storage["current_logs"].copy(),
+                "logs": self.storage["current_logs"],
                 "size": self.storage["current_size"],
                 "archived_at": datetime.now(),
             }
@@ -304,7 +547,7 @@ class LogRotationManager:
                 removed_file = self.storage["archived_files"].pop(0)
                 print(f"Archived file deleted: {removed_file['filename']}")
 
-            # 현재 로그 초기화
+            # 현재 로그 초기화 (아카이브가 기존 목록을 그대로 가져가므로 새 목록)
             self.storage["current_logs"] = []
             self.storage["current_size"] = 0
 
@@ -327,16 +570,170 @@ class LogRotationManager:
             }
 
 
+class LogPipeline:
+    """
+    큐 기반 로그 파이프라인
+
+    호출자는 경계가 있는 링 버퍼에 레코드를 넣기만 하고, 전용 소비자 스레드가
+    배치 단위로 꺼내 처리기에 넘긴다. 큐가 차면 정책에 따라 폐기하거나 샘플링하고
+    카운터에 기록한다. 추가 경로에는 잠금이 없다 (deque append/popleft는 원자적).
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], None],
+        capacity: int = LOG_QUEUE_CAPACITY,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SECONDS,
+        overflow_policy: LogOverflowPolicy = LogOverflowPolicy.SAMPLE,
+        sample_watermark: float = LOG_SAMPLE_WATERMARK,
+        sample_rate: int = LOG_SAMPLE_RATE,
+    ):
+        self.handler = handler
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.sample_threshold = int(capacity * sample_watermark)
+        self.sample_rate = sample_rate
+
+        self._queue: Deque[Any] = deque()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # itertools.count의 next()는 스레드 간에도 원자적 (샘플링 순번)
+        self._sample_sequence = itertools.count()
+        # 폐기/샘플링 카운터는 포화 시에만 갱신되므로 잠금 비용이 요청 경로에 없음
+        self._counter_lock = threading.Lock()
+        self._dropped = 0
+        self._sampled_out = 0
+        self._processed = 0
+        self._batches = 0
+        self._handler_errors = 0
+
+    def submit(self, record: Any, low_priority: bool = False) -> bool:
+        """
+        레코드 추가 (요청 경로에서 호출)
+
+        Args:
+            record: 처리기에 넘길 레코드
+            low_priority: 샘플링 대상 여부 (DEBUG/INFO)
+
+        Returns:
+            큐에 들어갔으면 True (폐기/샘플링 제외면 False)
+        """
+        if self._thread is None:
+            self._start()
+
+        depth = len(self._queue)
+        if depth >= self.capacity or self._stopped:
+            with self._counter_lock:
+                self._dropped += 1
+            return False
+        if (
+            low_priority
+            and self.overflow_policy == LogOverflowPolicy.SAMPLE
+            and depth >= self.sample_threshold
+            and next(self._sample_sequence) % self.sample_rate
+        ):
+            with self._counter_lock:
+                self._sampled_out += 1
+            return False
+
+        self._queue.append(record)
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """큐에 쌓인 레코드가 모두 처리될 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        while self._queue or not self._idle.is_set():
+            if self._thread is None or time.monotonic() >= deadline:
+                return not self._queue and self._idle.is_set()
+            self._wakeup.set()
+            time.sleep(0.001)
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        """남은 레코드를 처리하고 소비자 스레드 종료"""
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            # 종료된 파이프라인이 프로세스 종료 시까지 참조되지 않도록 해제
+            atexit.unregister(self.stop)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """파이프라인 카운터"""
+        return {
+            "queue_depth": len(self._queue),
+            "capacity": self.capacity,
+            "overflow_policy": self.overflow_policy.value,
+            "processed": self._processed,
+            "batches": self._batches,
+            "dropped": self._dropped,
+            "sampled_out": self._sampled_out,
+            "handler_errors": self._handler_errors,
+        }
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="log-pipeline", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def _run(self):
+        while True:
+            batch = self._drain()
+            if batch:
+                try:
+                    self.handler(batch)
+                except Exception as e:
+                    self._handler_errors += 1
+                    logger.error(f"Log pipeline handler failed: {e}")
+                self._processed += len(batch)
+                self._batches += 1
+                continue
+
+            self._idle.set()
+            if self._stopped:
+                return
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+
+    def _drain(self) -> List[Any]:
+        batch = []
+        queue = self._queue
+        if queue:
+            # 꺼내기 전에 표시해야 flush가 처리 중인 배치를 놓치지 않음
+            self._idle.clear()
+        try:
+            while len(batch) < self.batch_size:
+                batch.append(queue.popleft())
+        except IndexError:
+            pass
+        return batch
+
+
 class CentralizedLoggingService:
     """중앙집중식 로깅 서비스"""
 
-    def __init__(self):
+    def __init__(self, overflow_policy: LogOverflowPolicy = LogOverflowPolicy.SAMPLE):
         self.structured_logger = StructuredLogger()
         self.request_tracer = RequestTracer()
         self.log_collector = LogCollector()
         self.search_engine = LogSearchEngine()
         self.rotation_manager = LogRotationManager()
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        # 요청 경로는 큐에 넣기만 하고 구조화/마스킹/색인은 소비자 스레드가 배치로 처리
+        self.pipeline = LogPipeline(
+            self._process_batch, overflow_policy=overflow_policy
+        )
 
     def log(
         self,
@@ -347,40 +744,59 @@ class CentralizedLoggingService:
         service: str = None,
         extra_fields: Dict[str, Any] = None,
     ):
-        """로그 기록"""
-        service_name = service or self.structured_logger.service_name
-
-        # 구조화된 로그 생성
-        log_entry = self.structured_logger.create_structured_log(
-            level=level.value,
-            message=message,
-            trace_id=trace_id,
-            user_id=user_id,
-            extra_fields=extra_fields,
+        """로그 기록 (큐에 넣기만 하고 즉시 반환)"""
+        self.pipeline.submit(
+            (
+                datetime.now(),
+                level,
+                message,
+                trace_id,
+                user_id,
+                service,
+                dict(extra_fields) if extra_fields else None,
+            ),
+            low_priority=level in (LogLevel.DEBUG, LogLevel.INFO),
         )
 
-        # 민감정보 마스킹
-        if extra_fields:
-            log_entry = self.structured_logger.mask_sensitive_data(log_entry)
-
-        # 비동기로 로그 처리
-        self.executor.submit(self._process_log, service_name, log_entry)
+    def flush(self, timeout: float = 5.0) -> bool:
+        """대기 중인 로그가 모두 처리될 때까지 대기"""
+        return self.pipeline.flush(timeout)
+
+    def _process_batch(self, records: List[Tuple]):
+        """로그 배치 처리 (소비자 스레드)"""
+        processed = []
+        for timestamp, level, message, trace_id, user_id, service, extra in records:
+            # 구조화된 로그 생성
+            log_entry = self.structured_logger.create_structured_log(
+                level=level.value,
+                message=message,
+                trace_id=trace_id,
+                user_id=user_id,
+                extra_fields=extra,
+                timestamp=timestamp,
+            )
+
+            # 민감정보 마스킹
+            if extra:
+                log_entry = self.structured_logger.mask_sensitive_data(log_entry)
+
+            processed.append(
+                (service or self.structured_logger.service_name, log_entry)
+            )
 
-    def _process_log(self, service_name: str, log_entry: Dict[str, Any]):
-        """로그 처리 (내부 메서드)"""
         # 로그 수집
-        self.log_collector.collect_log(service_name, log_entry)
+        self.log_collector.collect_logs(processed)
 
         # 검색 엔진에 추가
-        self.search_engine.add_log_entry(
-            level=log_entry["level"],
-            message=log_entry["message"],
-            service=service_name,
-            extra=log_entry,
+        self.search_engine.add_log_entries(
+            [
+                (log_entry["level"], log_entry["message"], service_name, log_entry)
+                for service_name, log_entry in processed
+            ]
         )
 
-        # 로테이션 관리자에 추가
-        self.rotation_manager.add_log_entry(log_entry)
+        # 로테이션 관리자에 추가 (배치 단위 직렬화/크기 계산)
+        self.rotation_manager.add_log_entries([log_entry for _, log_entry in processed])
 
     def start_request_trace(self, request_id: str) -> str:
         """요청 추적 시작"""
@@ -417,6 +833,7 @@ class CentralizedLoggingService:
             **collector_stats,
             **rotation_stats,
             "total_traces": len(self.request_tracer.traces),
+            "pipeline": self.pipeline.get_stats(),
         }
 
 
@@ -0,0 +1,269 @@
+"""Batched FCM delivery engine.
+
+Splits a token list into FCM-sized multicast chunks, sends the chunks
+concurrently in worker threads (the Firebase Admin SDK is blocking), retries
+transient failures with exponential backoff and reports which tokens are
+permanently invalid so callers can prune them in one update.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+from firebase_admin import exceptions as firebase_exceptions
+from firebase_admin import messaging
+
+logger = logging.getLogger(__name__)
+
+# FCM rejects multicast messages with more than 500 tokens
+FCM_MULTICAST_LIMIT = 500
+
+# The token is gone or belongs to another sender; resending will never work
+INVALID_TOKEN_ERRORS = (
+    messaging.UnregisteredError,
+    messaging.SenderIdMismatchError,
+)
+
+# INVALID_ARGUMENT is also returned for malformed payloads, which say nothing
+# about the token. Only these markers (error message or field violation)
+# identify a malformed registration token.
+INVALID_TOKEN_ARGUMENT_MARKERS = ("registration token", "message.token")
+
+# Server-side or quota problems that are worth retrying
+TRANSIENT_ERRORS = (
+    firebase_exceptions.UnavailableError,
+    firebase_exceptions.InternalError,
+    firebase_exceptions.DeadlineExceededError,
+    firebase_exceptions.ResourceExhaustedError,
+    firebase_exceptions.UnknownError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+def is_invalid_token_error(error: Optional[BaseException]) -> bool:
+    """Whether a per-token send error means the token should be deactivated."""
+    if isinstance(error, INVALID_TOKEN_ERRORS):
+        return True
+    if not isinstance(error, firebase_exceptions.InvalidArgumentError):
+        return False
+
+    details = str(error)
+    http_response = getattr(error, "http_response", None)
+    if http_response is not None:
+        details += f" {getattr(http_response, 'text', '')}"
+    details = details.lower()
+    return any(marker in details for marker in INVALID_TOKEN_ARGUMENT_MARKERS)
+
+
+class FirebaseMessagingTransport:
+    """Transport that sends multicast messages through the Firebase Admin SDK."""
+
+    def send_multicast(self, message: messaging.MulticastMessage) -> Any:
+        """Send one multicast message and return the SDK ``BatchResponse``."""
+        return messaging.send_each_for_multicast(message)
+
+
+@dataclass
+class DeliveryBatchResult:
+    """Outcome of sending one multicast chunk."""
+
+    batch_index: int
+    token_count: int
+    success_count: int = 0
+    failure_count: int = 0
+    failed_tokens: List[str] = field(default_factory=list)
+    invalid_tokens: List[str] = field(default_factory=list)
+    attempts: int = 0
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Throughput of this batch."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.token_count / self.duration_seconds
+
+
+@dataclass
+class DeliveryReport:
+    """Aggregated outcome of a delivery run."""
+
+    batches: List[DeliveryBatchResult] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @property
+    def token_count(self) -> int:
+        return sum(batch.token_count for batch in self.batches)
+
+    @property
+    def success_count(self) -> int:
+        return sum(batch.success_count for batch in self.batches)
+
+    @property
+    def failure_count(self) -> int:
+        return sum(batch.failure_count for batch in self.batches)
+
+    @property
+    def failed_tokens(self) -> List[str]:
+        return [token for batch in self.batches for token in batch.failed_tokens]
+
+    @property
+    def invalid_tokens(self) -> List[str]:
+        return [token for batch in self.batches for token in batch.invalid_tokens]
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Overall throughput across all batches."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.token_count / self.duration_seconds
+
+
+class FCMDeliveryEngine:
+    """Send multicast notifications in concurrent, retried FCM-sized chunks."""
+
+    def __init__(
+        self,
+        transport: Optional[Any] = None,
+        chunk_size: int = FCM_MULTICAST_LIMIT,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        executor: Optional[Executor] = None,
+    ):
+        if not 0 < chunk_size <= FCM_MULTICAST_LIMIT:
+            raise ValueError(f"chunk_size must be between 1 and {FCM_MULTICAST_LIMIT}")
+        self.transport = transport or FirebaseMessagingTransport()
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._executor = executor
+
+    async def deliver(
+        self,
+        tokens: Iterable[str],
+        build_message: Callable[[List[str]], messaging.MulticastMessage],
+    ) -> DeliveryReport:
+        """
+        Deliver a message to every token.
+
+        Args:
+            tokens: Device tokens; duplicates are sent once
+            build_message: Builds the multicast message for a chunk of tokens
+
+        Returns:
+            Delivery report with per-batch results
+        """
+        unique_tokens = list(dict.fromkeys(tokens))
+        chunks = [
+            unique_tokens[i : i + self.chunk_size]
+            for i in range(0, len(unique_tokens), self.chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch_index: int, chunk: List[str]) -> DeliveryBatchResult:
+            async with semaphore:
+                return await self._send_chunk(batch_index, chunk, build_message)
+
+        start_time = time.perf_counter()
+        batches = await asyncio.gather(
+            *(run(index, chunk) for index, chunk in enumerate(chunks))
+        )
+        report = DeliveryReport(
+            batches=list(batches), duration_seconds=time.perf_counter() - start_time
+        )
+
+        if chunks:
+            logger.info(
+                f"FCM delivery: {report.token_count} tokens in {len(chunks)} batches, "
+                f"{report.success_count} success, {report.failure_count} failures, "
+                f"{report.tokens_per_second:.0f} tokens/s"
+            )
+        return report
+
+    async def _send_chunk(
+        self,
+        batch_index: int,
+        tokens: List[str],
+        build_message: Callable[[List[str]], messaging.MulticastMessage],
+    ) -> DeliveryBatchResult:
+        """Send one chunk, retrying the whole call or only transient tokens."""
+        result = DeliveryBatchResult(batch_index=batch_index, token_count=len(tokens))
+        pending = tokens
+        start_time = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        while pending:
+            result.attempts += 1
+            try:
+                response = await loop.run_in_executor(
+                    self._executor,
+                    self.transport.send_multicast,
+                    build_message(pending),
+                )
+            except TRANSIENT_ERRORS as e:
+                if result.attempts > self.max_retries:
+                    result.error = str(e)
+                    self._fail(result, pending)
+                    break
+                logger.warning(
+                    f"FCM batch {batch_index} attempt {result.attempts} failed: {e}"
+                )
+                await asyncio.sleep(self._backoff(result.attempts))
+                continue
+            except Exception as e:
+                result.error = str(e)
+                self._fail(result, pending)
+                break
+
+            retry_tokens = self._apply_response(result, pending, response.responses)
+            if retry_tokens and result.attempts <= self.max_retries:
+                await asyncio.sleep(self._backoff(result.attempts))
+                pending = retry_tokens
+            else:
+                self._fail(result, retry_tokens)
+                pending = []
+
+        result.duration_seconds = time.perf_counter() - start_time
+        logger.debug(
+            f"FCM batch {batch_index}: {result.token_count} tokens, "
+            f"{result.attempts} attempts, {result.tokens_per_second:.0f} tokens/s"
+        )
+        return result
+
+    @staticmethod
+    def _apply_response(
+        result: DeliveryBatchResult, tokens: Sequence[str], responses: Sequence[Any]
+    ) -> List[str]:
+        """Record per-token outcomes; return tokens that should be retried."""
+        retry_tokens = []
+        for token, response in zip(tokens, responses):
+            if response.success:
+                result.success_count += 1
+            elif isinstance(response.exception, TRANSIENT_ERRORS):
+                retry_tokens.append(token)
+            else:
+                result.failure_count += 1
+                result.failed_tokens.append(token)
+                if is_invalid_token_error(response.exception):
+                    result.invalid_tokens.append(token)
+        return retry_tokens
+
+    @staticmethod
+    def _fail(result: DeliveryBatchResult, tokens: Sequence[str]) -> None:
+        result.failure_count += len(tokens)
+        result.failed_tokens.extend(tokens)
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, delay)
@@ -1,5 +1,6 @@
 """Firebase Cloud Messaging service for push notifications."""
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
@@ -15,16 +16,23 @@ from app.db.deps import get_db
 from app.models.notification import Notification, NotificationStatus
 from app.models.user_device import UserDevice
 from app.schemas.notification import PushNotificationRequest, PushNotificationResponse
+from app.services.notifications.fcm_delivery import DeliveryReport, FCMDeliveryEngine
 
 logger = logging.getLogger(__name__)
 
+# Shared engine so concurrent requests respect one concurrency limit
+fcm_delivery_engine = FCMDeliveryEngine()
+
 
 class FCMService:
     """Firebase Cloud Messaging service for push notifications."""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self, db: Session, delivery_engine: Optional[FCMDeliveryEngine] = None
+    ):
         """Initialize FCM service with database session."""
         self.db = db
+        self.delivery_engine = delivery_engine or fcm_delivery_engine
         self._initialize_firebase()
 
     def _initialize_firebase(self) -> None:
@@ -164,16 +172,58 @@ class FCMService:
             logger.error(f"Failed to get device tokens for user {user_id}: {e}")
             return []
 
-    def send_push_notification(
+    def get_device_tokens_for_users(self, user_ids: List[str]) -> List[str]:
+        """Get all active device tokens for the given users in one query."""
+        if not user_ids:
+            return []
+
+        try:
+            rows = (
+                self.db.query(UserDevice.fcm_token)
+                .filter(
+                    UserDevice.user_id.in_(list(user_ids)),
+                    UserDevice.is_active.is_(True),
+                    UserDevice.fcm_token.isnot(None),
+                )
+                .all()
+            )
+
+            return [row.fcm_token for row in rows]
+
+        except Exception as e:
+            logger.error(f"Failed to get device tokens for {len(user_ids)} users: {e}")
+            return []
+
+    def get_device_tokens_by_user(self, user_ids: List[str]) -> Dict[str, List[str]]:
+        """Get active device tokens for the given users in one query, per user."""
+        if not user_ids:
+            return {}
+
+        rows = (
+            self.db.query(UserDevice.user_id, UserDevice.fcm_token)
+            .filter(
+                UserDevice.user_id.in_(list(user_ids)),
+                UserDevice.is_active.is_(True),
+                UserDevice.fcm_token.isnot(None),
+            )
+            .all()
+        )
+
+        tokens_by_user: Dict[str, List[str]] = {}
+        for row in rows:
+            tokens_by_user.setdefault(str(row.user_id), []).append(row.fcm_token)
+        return tokens_by_user
+
+    async def send_push_notification_async(
         self, request: PushNotificationRequest
     ) -> PushNotificationResponse:
-        """Send push notification to multiple users."""
+        """Send push notification to multiple users via the delivery engine."""
         try:
-            # Collect all device tokens for target users
-            all_tokens = []
-            for user_id in request.user_ids:
-                tokens = self.get_user_device_tokens(user_id)
-                all_tokens.extend(tokens)
+            # Collect all device tokens for target users (sync DB query, so
+            # keep it off the event loop)
+            all_tokens = await asyncio.to_thread(
+                self.get_device_tokens_for_users, request.user_ids
+            )
 
             if not all_tokens:
                 logger.warning("No active device tokens found for target users")
@@ -183,51 +233,13 @@ class FCMService:
                     failure_count=len(request.user_ids),
                 )
 
-            # Create FCM message
-            message = self._build_fcm_message(
-                request, all_tokens[0]
-            )  # Single token for now
-
-            # Send to multiple tokens
-            response = messaging.send_multicast(
-                messaging.MulticastMessage(
-                    tokens=all_tokens,
-                    notification=message.notification,
-                    data=message.data,
-                    android=message.android,
-                    apns=message.apns,
-                )
-            )
-
-            # Process response
-            success_count = response.success_count
-            failure_count = response.failure_count
-            failed_tokens = []
-
-            # Handle failed tokens
-            if response.responses:
-                for idx, resp in enumerate(response.responses):
-                    if not resp.success:
-                        failed_tokens.append(all_tokens[idx])
-                        logger.warning(f"Failed to send to token: {resp.exception}")
-
-            # Record notification in database
-            self._record_notification(request, success_count, failure_count)
-
-            # Clean up invalid tokens
-            if failed_tokens:
-                self._handle_invalid_tokens(failed_tokens)
-
-            logger.info(
-                f"Push notification sent: {success_count} success, "
-                f"{failure_count} failures"
-            )
+            report = await self._deliver(request, all_tokens)
 
             return PushNotificationResponse(
-                success=success_count > 0,
-                success_count=success_count,
-                failure_count=failure_count,
-                failed_tokens=failed_tokens,
+                success=report.success_count > 0,
+                success_count=report.success_count,
+                failure_count=report.failure_count,
+                failed_tokens=report.failed_tokens,
             )
 
         except Exception as e:
@@ -236,6 +248,77 @@ class FCMService:
                 success=False, error=str(e), failure_count=len(request.user_ids)
             )
 
+    async def send_to_users_async(
+        self, request: PushNotificationRequest, tokens_by_user: Dict[str, List[str]]
+    ) -> Dict[str, bool]:
+        """
+        Send one payload to several users whose tokens are already loaded.
+
+        All tokens go through the delivery engine together, so they are sent
+        in concurrent multicast chunks of up to 500 tokens.
+
+        Returns:
+            Per-user success: at least one of the user's devices accepted it
+        """
+        all_tokens = [token for tokens in tokens_by_user.values() for token in tokens]
+        if not all_tokens:
+            return {user_id: False for user_id in tokens_by_user}
+
+        report = await self._deliver(request, all_tokens)
+        failed = set(report.failed_tokens)
+        return {
+            user_id: any(token not in failed for token in tokens)
+            for user_id, tokens in tokens_by_user.items()
+        }
+
+    async def _deliver(
+        self, request: PushNotificationRequest, tokens: List[str]
+    ) -> DeliveryReport:
+        """Deliver to tokens, then record the result and prune invalid tokens."""
+        # Build the shared payload once; chunks only differ by tokens
+        template = self._build_fcm_message(request, tokens[0])
+
+        def build_message(chunk: List[str]) -> messaging.MulticastMessage:
+            return messaging.MulticastMessage(
+                tokens=chunk,
+                notification=template.notification,
+                data=template.data,
+                android=template.android,
+                apns=template.apns,
+            )
+
+        report = await self.delivery_engine.deliver(tokens, build_message)
+
+        # Record notification in database
+        await asyncio.to_thread(
+            self._record_notification,
+            request,
+            report.success_count,
+            report.failure_count,
+        )
+
+        # Clean up invalid tokens
+        if report.invalid_tokens:
+            await asyncio.to_thread(self._handle_invalid_tokens, report.invalid_tokens)
+
+        logger.info(
+            f"Push notification sent: {report.success_count} success, "
+            f"{report.failure_count} failures in {len(report.batches)} batches "
+            f"({report.tokens_per_second:.0f} tokens/s)"
+        )
+        return report
+
+    def send_push_notification(
+        self, request: PushNotificationRequest
+    ) -> PushNotificationResponse:
+        """
+        Send push notification to multiple users, blocking until done.
+
+        For scripts and worker threads; async callers should await
+        ``send_push_notification_async`` instead.
+        """
+        return asyncio.run(self.send_push_notification_async(request))
+
     def send_to_single_device(
         self,
         device_token: str,
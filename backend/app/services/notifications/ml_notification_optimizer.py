@@ -1,12 +1,15 @@
 """ML-based notification timing optimization service."""
 
+import asyncio
 import logging
+import os
 import pickle
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
+from sqlalchemy import exists, select, true
 from sqlalchemy.orm import Session
 
 from app.models.notification_analytics import (
@@ -15,9 +18,23 @@ from app.models.notification_analytics import (
     NotificationLog,
     UserNotificationPattern,
 )
+from app.services.ml.training_jobs import (
+    TRAINING_FETCH_SIZE,
+    TrainingMatrixBuilder,
+    TrainingReport,
+    fit_timing_model,
+    run_training_job,
+)
 
 logger = logging.getLogger(__name__)
 
+# Length of the vector built by _extract_prediction_features
+TIMING_FEATURE_COUNT = 18
+
+# Published model payloads by path, keyed on file mtime so per-request
+# optimizers share one unpickled model until a new version is published
+_published_models: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
 
 class NotificationTimingOptimizer:
     """ML-based notification timing optimizer."""
@@ -28,26 +45,40 @@ class NotificationTimingOptimizer:
         self.model = None
         self.feature_scaler = None
         self.is_trained = False
+        self.model_version: Optional[str] = None
+        self.last_training_report: Optional[TrainingReport] = None
 
         # Load existing model if available
         self._load_model()
 
     def _load_model(self) -> None:
-        """Load pre-trained model if available."""
+        """Load the currently published model, reusing it if already loaded."""
         try:
             model_file = Path(self.model_path)
-            if model_file.exists():
+            if not model_file.exists():
+                return
+
+            mtime_ns = model_file.stat().st_mtime_ns
+            cached = _published_models.get(self.model_path)
+            if cached is None or cached[0] != mtime_ns:
                 with open(model_file, "rb") as f:
-                    model_data = pickle.load(f)
-                    self.model = model_data.get("model")
-                    self.feature_scaler = model_data.get("scaler")
-                    self.is_trained = True
-                logger.info("Loaded pre-trained notification timing model")
+                    cached = (mtime_ns, pickle.load(f))
+                _published_models[self.model_path] = cached
+                logger.info(
+                    "Loaded notification timing model "
+                    f"{cached[1].get('model_version', 'unversioned')}"
+                )
+
+            model_data = cached[1]
+            self.model = model_data.get("model")
+            self.feature_scaler = model_data.get("scaler")
+            self.model_version = model_data.get("model_version")
+            self.is_trained = True
         except Exception as e:
             logger.warning(f"Failed to load model: {e}")
 
     def _save_model(self) -> None:
-        """Save trained model to disk."""
+        """Publish the trained model; serving workers pick it up on next load."""
         try:
             model_file = Path(self.model_path)
             model_file.parent.mkdir(parents=True, exist_ok=True)
@@ -55,20 +86,23 @@ class NotificationTimingOptimizer:
             model_data = {
                 "model": self.model,
                 "scaler": self.feature_scaler,
+                "model_version": self.model_version,
                 "trained_at": datetime.now(timezone.utc).isoformat(),
             }
 
-            with open(model_file, "wb") as f:
+            # Write then rename so readers never see a half-written file
+            tmp_file = model_file.with_name(f"{model_file.name}.tmp")
+            with open(tmp_file, "wb") as f:
                 pickle.dump(model_data, f)
+            os.replace(tmp_file, model_file)
 
-            logger.info(f"Saved model to {self.model_path}")
+            logger.info(f"Published model {self.model_version} to {self.model_path}")
         except Exception as e:
             logger.error(f"Failed to save model: {e}")
 
     async def train_timing_model(self, min_samples: int = 100) -> bool:
-        """Train ML model for optimal notification timing."""
+        """Train the timing model in the training process pool and publish it."""
         try:
-            # Get training data
             features, labels = await self._prepare_training_data(min_samples)
 
             if len(features) < min_samples:
@@ -77,46 +111,21 @@ class NotificationTimingOptimizer:
                 )
                 return False
 
-            # Use scikit-learn for training (would be imported here)
-            try:
-                from sklearn.ensemble import RandomForestClassifier
-                from sklearn.model_selection import train_test_split
-                from sklearn.preprocessing import StandardScaler
-            except ImportError:
-                logger.error("scikit-learn not available for ML training")
-                return False
-
-            # Prepare features and labels
-            X = np.array(features)
-            y = np.array(labels)
-
-            # Scale features
-            self.feature_scaler = StandardScaler()
-            X_scaled = self.feature_scaler.fit_transform(X)
-
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(
-                X_scaled, y, test_size=0.2, random_state=42
-            )
-
-            # Train model
-            self.model = RandomForestClassifier(
-                n_estimators=100,
-                random_state=42,
-                max_depth=10,
-                min_samples_split=5,
-                min_samples_leaf=2,
+            result, report = await run_training_job(
+                "notification_timing",
+                fit_timing_model,
+                np.asarray(features, dtype=np.float64),
+                np.asarray(labels),
             )
+            self.last_training_report = report
 
-            self.model.fit(X_train, y_train)
-
-            # Evaluate model
-            predictions = self.model.predict(X_test)
-            accuracy = (predictions == y_test).mean()
-
+            accuracy = report.metrics["accuracy"]
             logger.info(f"Model trained with accuracy: {accuracy:.3f}")
 
             if accuracy > 0.6:  # Minimum acceptable accuracy
+                self.model = result["model"]
+                self.feature_scaler = result["scaler"]
+                self.model_version = report.model_version
                 self.is_trained = True
                 self._save_model()
                 return True
@@ -298,61 +307,68 @@ class NotificationTimingOptimizer:
             }
 
     async def _prepare_training_data(
-        self, min_samples: int
-    ) -> Tuple[List[List[float]], List[int]]:
-        """Prepare training data for ML model."""
-        features = []
-        labels = []
-
+        self, min_samples: int, max_logs_per_user: int = 100
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Prepare training arrays off the event loop."""
         try:
-            # Get users with sufficient notification history
-            patterns = (
-                self.db.query(UserNotificationPattern)
-                .filter(UserNotificationPattern.total_notifications_received >= 10)
-                .all()
+            return await asyncio.to_thread(
+                self._load_training_arrays, max_logs_per_user
             )
-
-            for pattern in patterns:
-                # Get notification logs for this user
-                logs = (
-                    self.db.query(NotificationLog)
-                    .filter(
-                        NotificationLog.user_id == pattern.user_id,
-                        NotificationLog.success.is_(True),
-                    )
-                    .limit(100)  # Limit to prevent memory issues
-                    .all()
-                )
-
-                for log in logs:
-                    # Get interactions for this notification
-                    interactions = (
-                        self.db.query(NotificationInteraction)
-                        .filter(
-                            NotificationInteraction.notification_log_id == log.id,
-                            NotificationInteraction.interaction_type.in_(
-                                [InteractionType.OPENED, InteractionType.CLICKED]
-                            ),
-                        )
-                        .first()
-                    )
-
-                    # Create training sample
-                    feature_vector = self._extract_prediction_features(
-                        pattern, log.notification_type, log.sent_at
-                    )
-
-                    label = 1 if interactions else 0  # 1 = engaged, 0 = not engaged
-
-                    features.append(feature_vector)
-                    labels.append(label)
-
-            logger.info(f"Prepared {len(features)} training samples")
-            return features, labels
-
         except Exception as e:
             logger.error(f"Failed to prepare training data: {e}")
-            return [], []
+            return np.empty((0, TIMING_FEATURE_COUNT)), np.empty(0)
+
+    def _load_training_arrays(
+        self, max_logs_per_user: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Stream (pattern, log, engaged) rows from a server-side cursor into arrays.
+
+        One query replaces the per-user log query and per-log interaction
+        lookup: the most recent successful logs of each qualifying user come
+        from a LATERAL subquery and engagement from a correlated EXISTS.
+        """
+        engaged = (
+            exists()
+            .where(
+                NotificationInteraction.notification_log_id == NotificationLog.id,
+                NotificationInteraction.interaction_type.in_(
+                    [InteractionType.OPENED.value, InteractionType.CLICKED.value]
+                ),
+            )
+            .label("engaged")
+        )
+        recent_logs = (
+            select(NotificationLog.notification_type, NotificationLog.sent_at, engaged)
+            .where(
+                NotificationLog.user_id == UserNotificationPattern.user_id,
+                NotificationLog.success.is_(True),
+            )
+            .order_by(NotificationLog.sent_at.desc())
+            .limit(max_logs_per_user)
+            .lateral("recent_logs")
+        )
+        rows = (
+            self.db.query(
+                UserNotificationPattern,
+                recent_logs.c.notification_type,
+                recent_logs.c.sent_at,
+                recent_logs.c.engaged,
+            )
+            .join(recent_logs, true())
+            .filter(UserNotificationPattern.total_notifications_received >= 10)
+            .yield_per(TRAINING_FETCH_SIZE)
+        )
+
+        builder = TrainingMatrixBuilder(TIMING_FEATURE_COUNT)
+        for pattern, notification_type, sent_at, is_engaged in rows:
+            builder.append(
+                self._extract_prediction_features(pattern, notification_type, sent_at),
+                1 if is_engaged else 0,  # 1 = engaged, 0 = not engaged
+            )
+
+        features, labels = builder.arrays()
+        logger.info(f"Prepared {len(features)} training samples")
+        return features, labels.astype(np.int8)
 
     def _extract_prediction_features(
         self,
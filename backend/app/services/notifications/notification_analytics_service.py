@@ -5,7 +5,7 @@ import random
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from app.models.notification_analytics import (
@@ -23,6 +23,12 @@ from app.schemas.notification_analytics import (
     NotificationLogCreate,
     PersonalizationInsights,
 )
+from app.services.notifications.notification_rollup_service import (
+    MetricCounts,
+    MetricRow,
+    NotificationRollupService,
+    summarize,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +36,11 @@ logger = logging.getLogger(__name__)
 class NotificationAnalyticsService:
     """Service for notification analytics, personalization, and A/B testing."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(
+        self, db: Session, rollups: Optional[NotificationRollupService] = None
+    ) -> None:
         self.db: Session = db
+        self.rollups = rollups or NotificationRollupService(db)
 
     async def log_notification_sent(
         self, log_data: NotificationLogCreate
@@ -86,46 +95,19 @@ class NotificationAnalyticsService:
                 .first()
             )
 
-            # Get notification logs for the period
-            since_date = datetime.now(timezone.utc) - timedelta(
-                days=analysis_period_days
-            )
-            notification_logs = (
-                self.db.query(NotificationLog)
-                .filter(
-                    and_(
-                        NotificationLog.user_id == user_id,
-                        NotificationLog.sent_at >= since_date,
-                        NotificationLog.success.is_(True),
-                    )
-                )
-                .all()
-            )
+            # Hourly rollups (plus raw rows for the current partial hour)
+            since_date = datetime.utcnow() - timedelta(days=analysis_period_days)
+            metric_rows = self.rollups.load_user_metrics(user_id, since_date)
 
-            if not notification_logs:
+            if not metric_rows:
                 # Return default pattern for new users
                 if existing_pattern:
                     return existing_pattern
                 else:
                     return await self._create_default_pattern(user_id)
 
-            # Get interactions for these notifications
-            notification_ids = [log.id for log in notification_logs]
-            interactions = (
-                self.db.query(NotificationInteraction)
-                .filter(
-                    and_(
-                        NotificationInteraction.notification_log_id.in_(
-                            notification_ids
-                        ),
-                        NotificationInteraction.user_id == user_id,
-                    )
-                )
-                .all()
-            )
-
             # Analyze patterns
-            pattern_data = self._analyze_patterns(notification_logs, interactions)
+            pattern_data = self._analyze_patterns(metric_rows)
 
             if existing_pattern:
                 # Update existing pattern
@@ -215,58 +197,16 @@ class NotificationAnalyticsService:
     ) -> NotificationAnalyticsReport:
         """종합 알림 분석 리포트 생성."""
         try:
-            # Basic metrics
-            total_sent = (
-                self.db.query(NotificationLog)
-                .filter(
-                    and_(
-                        NotificationLog.sent_at >= start_date,
-                        NotificationLog.sent_at <= end_date,
-                    )
-                )
-                .count()
-            )
+            # Single pass over rollups/raw edges instead of one COUNT per metric
+            metric_rows = self.rollups.load_report_metrics(start_date, end_date)
+            totals = MetricCounts()
+            for row in metric_rows:
+                totals.add(row.counts)
 
-            total_delivered = (
-                self.db.query(NotificationLog)
-                .filter(
-                    and_(
-                        NotificationLog.sent_at >= start_date,
-                        NotificationLog.sent_at <= end_date,
-                        NotificationLog.success.is_(True),
-                    )
-                )
-                .count()
-            )
-
-            # Interaction metrics
-            opened_count = (
-                self.db.query(NotificationInteraction)
-                .join(NotificationLog)
-                .filter(
-                    and_(
-                        NotificationLog.sent_at >= start_date,
-                        NotificationLog.sent_at <= end_date,
-                        NotificationInteraction.interaction_type
-                        == InteractionType.OPENED,
-                    )
-                )
-                .count()
-            )
-
-            clicked_count = (
-                self.db.query(NotificationInteraction)
-                .join(NotificationLog)
-                .filter(
-                    and_(
-                        NotificationLog.sent_at >= start_date,
-                        NotificationLog.sent_at <= end_date,
-                        NotificationInteraction.interaction_type
-                        == InteractionType.CLICKED,
-                    )
-                )
-                .count()
-            )
+            total_sent = totals.sent
+            total_delivered = totals.delivered
+            opened_count = totals.opened
+            clicked_count = totals.clicked
 
             # Calculate rates
             delivery_rate = (total_delivered / total_sent) if total_sent > 0 else 0
@@ -275,22 +215,29 @@ class NotificationAnalyticsService:
 
             # Average delivery time
             avg_delivery_time = (
-                self.db.query(func.avg(NotificationLog.delivery_time_seconds))
-                .filter(
-                    and_(
-                        NotificationLog.sent_at >= start_date,
-                        NotificationLog.sent_at <= end_date,
-                        NotificationLog.success.is_(True),
-                    )
-                )
-                .scalar()
-                or 0.0
+                totals.delivery_time_sum / totals.delivery_time_count
+                if totals.delivery_time_count
+                else 0.0
             )
 
-            # Type breakdown (simplified for now)
-            type_breakdown = {}
-            platform_breakdown = {}
-            hourly_performance = {}
+            type_breakdown = {
+                notification_type: self._breakdown_entry(counts)
+                for notification_type, counts in summarize(
+                    metric_rows, lambda row: row.notification_type
+                ).items()
+            }
+            platform_breakdown = {
+                platform: self._breakdown_entry(counts)
+                for platform, counts in summarize(
+                    metric_rows, lambda row: row.platform
+                ).items()
+            }
+            hourly_performance = {
+                str(hour): (counts.opened / counts.delivered if counts.delivered else 0)
+                for hour, counts in sorted(
+                    summarize(metric_rows, lambda row: row.bucket_start.hour).items()
+                )
+            }
             ab_test_performance = []
 
             # Personalization effectiveness (if available)
@@ -570,20 +517,26 @@ class NotificationAnalyticsService:
         self.db.refresh(default_pattern)
         return default_pattern
 
-    def _analyze_patterns(
-        self, logs: List[NotificationLog], interactions: List[NotificationInteraction]
-    ) -> Dict[str, Any]:
-        """알림 로그와 상호작용 데이터를 분석하여 패턴 추출."""
-        total_notifications = len(logs)
-        opens = len(
-            [i for i in interactions if i.interaction_type == InteractionType.OPENED]
-        )
-        clicks = len(
-            [i for i in interactions if i.interaction_type == InteractionType.CLICKED]
-        )
-        dismissals = len(
-            [i for i in interactions if i.interaction_type == InteractionType.DISMISSED]
-        )
+    @staticmethod
+    def _breakdown_entry(counts: MetricCounts) -> Dict[str, Any]:
+        return {
+            "sent": counts.sent,
+            "delivered": counts.delivered,
+            "opened": counts.opened,
+            "clicked": counts.clicked,
+            "open_rate": counts.opened / counts.delivered if counts.delivered else 0,
+            "click_rate": counts.clicked / counts.delivered if counts.delivered else 0,
+        }
+
+    def _analyze_patterns(self, rows: List[MetricRow]) -> Dict[str, Any]:
+        """시간대별 집계 행으로 사용자 알림 패턴 추출."""
+        totals = MetricCounts()
+        for row in rows:
+            totals.add(row.counts)
+
+        total_notifications = totals.sent
+        opens = totals.opened
+        clicks = totals.clicked
 
         # Calculate rates
         open_rate = opens / total_notifications if total_notifications > 0 else 0
@@ -592,39 +545,27 @@ class NotificationAnalyticsService:
             (opens + clicks) / total_notifications if total_notifications > 0 else 0
         )
 
-        # Hourly pattern analysis
-        hourly_stats = {}
-        for log in logs:
-            hour = str(log.sent_at.hour)
-            if hour not in hourly_stats:
-                hourly_stats[hour] = {"sent": 0, "engaged": 0}
-            hourly_stats[hour]["sent"] += 1
-
-        # Count engagements by hour
-        for interaction in interactions:
-            if interaction.interaction_type in [
-                InteractionType.OPENED,
-                InteractionType.CLICKED,
-            ]:
-                # Find the corresponding log
-                log = next(
-                    (
-                        log_item
-                        for log_item in logs
-                        if log_item.id == interaction.notification_log_id
-                    ),
-                    None,
-                )
-                if log:
-                    hour = str(log.sent_at.hour)
-                    if hour in hourly_stats:
-                        hourly_stats[hour]["engaged"] += 1
-
-        # Calculate engagement rates by hour
-        preferred_hours = {}
-        for hour, stats in hourly_stats.items():
-            if stats["sent"] > 0:
-                preferred_hours[hour] = stats["engaged"] / stats["sent"]
+        # Engagement rate by hour of day and day of week (0=Monday)
+        preferred_hours = {
+            str(hour): counts.engaged / counts.sent
+            for hour, counts in summarize(
+                rows, lambda row: row.bucket_start.hour
+            ).items()
+            if counts.sent > 0
+        }
+        preferred_days = {
+            str(day): counts.engaged / counts.sent
+            for day, counts in summarize(
+                rows, lambda row: row.bucket_start.weekday()
+            ).items()
+            if counts.sent > 0
+        }
+        type_preferences = {
+            notification_type: {"sent": counts.sent, "engaged": counts.engaged}
+            for notification_type, counts in summarize(
+                rows, lambda row: row.notification_type
+            ).items()
+        }
 
         # Find most/least active hours
         most_active_hour = None
@@ -632,31 +573,33 @@ class NotificationAnalyticsService:
         if preferred_hours:
             most_active_hour = int(max(preferred_hours, key=preferred_hours.get))
             least_active_hour = int(min(preferred_hours, key=preferred_hours.get))
+        most_active_day = (
+            int(max(preferred_days, key=preferred_days.get)) if preferred_days else None
+        )
 
         # Response time analysis
-        response_times = []
-        for interaction in interactions:
-            if interaction.time_from_delivery:
-                response_times.append(interaction.time_from_delivery)
-
         avg_response_time = (
-            sum(response_times) / len(response_times) if response_times else None
+            totals.response_time_sum / totals.response_time_count
+            if totals.response_time_count
+            else None
         )
-        fastest_response_time = min(response_times) if response_times else None
 
         return {
             "total_notifications_received": total_notifications,
             "total_notifications_opened": opens,
             "total_notifications_clicked": clicks,
-            "total_notifications_dismissed": dismissals,
+            "total_notifications_dismissed": totals.dismissed,
             "open_rate": open_rate,
             "click_rate": click_rate,
             "engagement_rate": engagement_rate,
             "preferred_hours": preferred_hours if preferred_hours else None,
             "most_active_hour": most_active_hour,
             "least_active_hour": least_active_hour,
+            "preferred_days": preferred_days if preferred_days else None,
+            "most_active_day": most_active_day,
+            "type_preferences": type_preferences if type_preferences else None,
             "avg_response_time_seconds": avg_response_time,
-            "fastest_response_time_seconds": fastest_response_time,
+            "fastest_response_time_seconds": totals.fastest_response_seconds,
         }
 
     def _generate_personalization_recommendations(
@@ -0,0 +1,408 @@
+"""
+Pre-aggregated notification metrics.
+
+Dashboards and per-user pattern analysis read hourly rollup rows instead of
+scanning notification_logs/notification_interactions. Rollups are rebuilt
+per hour bucket with single-pass conditional aggregates: a background job
+(app.workers.notification_rollup_worker) calls ``refresh`` periodically and
+only buckets touched by new logs or interactions since the last run are
+recomputed. Reads combine rollup rows for complete hours with the same
+aggregate over raw rows for the partial hours at either end of the range.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from sqlalchemy import DateTime, and_, case, func, literal, select, union
+from sqlalchemy.orm import Session
+
+from app.models.notification_analytics import (
+    InteractionType,
+    NotificationHourlyRollup,
+    NotificationInteraction,
+    NotificationLog,
+    UserNotificationHourlyRollup,
+)
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_BUCKET = timedelta(hours=1)
+DEFAULT_BACKFILL_DAYS = 30
+# Rows committed slightly after their sent_at/timestamp are picked up by
+# re-scanning this much before the previous refresh.
+LATE_DATA_MARGIN = timedelta(minutes=5)
+
+# (lower bound, upper bound, upper bound inclusive)
+RawRange = Tuple[datetime, datetime, bool]
+
+
+def floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def ceil_hour(value: datetime) -> datetime:
+    floored = floor_hour(value)
+    return floored if floored == value else floored + ROLLUP_BUCKET
+
+
+@dataclass
+class MetricCounts:
+    """Additive notification counters for one group of logs."""
+
+    sent: int = 0
+    delivered: int = 0
+    opened: int = 0
+    clicked: int = 0
+    dismissed: int = 0
+    delivery_time_sum: float = 0.0
+    delivery_time_count: int = 0
+    response_time_sum: float = 0.0
+    response_time_count: int = 0
+    fastest_response_seconds: Optional[float] = None
+
+    def add(self, other: "MetricCounts") -> None:
+        for f in fields(self):
+            if f.name == "fastest_response_seconds":
+                continue
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+        if other.fastest_response_seconds is not None and (
+            self.fastest_response_seconds is None
+            or other.fastest_response_seconds < self.fastest_response_seconds
+        ):
+            self.fastest_response_seconds = other.fastest_response_seconds
+
+    @property
+    def engaged(self) -> int:
+        return self.opened + self.clicked
+
+
+@dataclass
+class MetricRow:
+    """Counters for one hour bucket and notification type (and platform)."""
+
+    bucket_start: datetime
+    notification_type: str
+    platform: Optional[str] = None
+    counts: MetricCounts = field(default_factory=MetricCounts)
+
+
+def summarize(
+    rows: Iterable[MetricRow], key: Callable[[MetricRow], Hashable]
+) -> Dict[Hashable, MetricCounts]:
+    """Sum rollup rows into one MetricCounts per ``key(row)``."""
+    totals: Dict[Hashable, MetricCounts] = {}
+    for row in rows:
+        totals.setdefault(key(row), MetricCounts()).add(row.counts)
+    return totals
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _hour_bucket():
+    return func.date_trunc("hour", NotificationLog.sent_at)
+
+
+def _interaction_counts(log_conditions: List[Any]):
+    """Per-log interaction counters, limited to logs matching the conditions."""
+    interaction = NotificationInteraction
+    interaction_type = interaction.interaction_type
+    response_time = func.nullif(interaction.time_from_delivery, 0)
+    return (
+        select(
+            interaction.notification_log_id.label("log_id"),
+            _count_if(interaction_type == InteractionType.OPENED.value).label("opened"),
+            _count_if(interaction_type == InteractionType.CLICKED.value).label(
+                "clicked"
+            ),
+            _count_if(interaction_type == InteractionType.DISMISSED.value).label(
+                "dismissed"
+            ),
+            func.sum(response_time).label("response_time_sum"),
+            func.count(response_time).label("response_time_count"),
+            func.min(response_time).label("fastest_response_seconds"),
+        )
+        .join(NotificationLog, NotificationLog.id == interaction.notification_log_id)
+        .where(*log_conditions)
+        .group_by(interaction.notification_log_id)
+        .subquery()
+    )
+
+
+def hourly_metrics_select(
+    log_conditions: List[Any], refreshed_at: Optional[datetime] = None
+):
+    """One pass over logs: hourly counters per notification type and platform."""
+    log = NotificationLog
+    counts = _interaction_counts(log_conditions)
+    bucket = _hour_bucket()
+    delivery_time = case((log.success.is_(True), log.delivery_time_seconds))
+    columns = [
+        bucket.label("bucket_start"),
+        log.notification_type,
+        log.platform,
+        func.count().label("sent"),
+        _count_if(log.success.is_(True)).label("delivered"),
+        func.coalesce(func.sum(counts.c.opened), 0).label("opened"),
+        func.coalesce(func.sum(counts.c.clicked), 0).label("clicked"),
+        func.coalesce(func.sum(counts.c.dismissed), 0).label("dismissed"),
+        func.coalesce(func.sum(delivery_time), 0.0).label("delivery_time_sum"),
+        func.count(delivery_time).label("delivery_time_count"),
+    ]
+    if refreshed_at is not None:
+        columns.append(literal(refreshed_at, DateTime).label("refreshed_at"))
+    return (
+        select(*columns)
+        .select_from(log)
+        .outerjoin(counts, counts.c.log_id == log.id)
+        .where(*log_conditions)
+        .group_by(bucket, log.notification_type, log.platform)
+    )
+
+
+def user_metrics_select(
+    log_conditions: List[Any], refreshed_at: Optional[datetime] = None
+):
+    """One pass over delivered logs: hourly counters per user and type."""
+    log = NotificationLog
+    log_conditions = [*log_conditions, log.success.is_(True)]
+    counts = _interaction_counts(log_conditions)
+    bucket = _hour_bucket()
+    columns = [
+        log.user_id,
+        bucket.label("bucket_start"),
+        log.notification_type,
+        func.count().label("received"),
+        func.coalesce(func.sum(counts.c.opened), 0).label("opened"),
+        func.coalesce(func.sum(counts.c.clicked), 0).label("clicked"),
+        func.coalesce(func.sum(counts.c.dismissed), 0).label("dismissed"),
+        func.coalesce(func.sum(counts.c.response_time_sum), 0.0).label(
+            "response_time_sum"
+        ),
+        func.coalesce(func.sum(counts.c.response_time_count), 0).label(
+            "response_time_count"
+        ),
+        func.min(counts.c.fastest_response_seconds).label("fastest_response_seconds"),
+    ]
+    if refreshed_at is not None:
+        columns.append(literal(refreshed_at, DateTime).label("refreshed_at"))
+    return (
+        select(*columns)
+        .select_from(log)
+        .outerjoin(counts, counts.c.log_id == log.id)
+        .where(*log_conditions)
+        .group_by(log.user_id, bucket, log.notification_type)
+    )
+
+
+def _hourly_row(row: Any) -> MetricRow:
+    return MetricRow(
+        bucket_start=row.bucket_start,
+        notification_type=row.notification_type,
+        platform=row.platform,
+        counts=MetricCounts(
+            sent=row.sent,
+            delivered=row.delivered,
+            opened=row.opened,
+            clicked=row.clicked,
+            dismissed=row.dismissed,
+            delivery_time_sum=row.delivery_time_sum or 0.0,
+            delivery_time_count=row.delivery_time_count,
+        ),
+    )
+
+
+def _user_row(row: Any) -> MetricRow:
+    return MetricRow(
+        bucket_start=row.bucket_start,
+        notification_type=row.notification_type,
+        counts=MetricCounts(
+            sent=row.received,
+            delivered=row.received,
+            opened=row.opened,
+            clicked=row.clicked,
+            dismissed=row.dismissed,
+            response_time_sum=row.response_time_sum or 0.0,
+            response_time_count=row.response_time_count,
+            fastest_response_seconds=row.fastest_response_seconds,
+        ),
+    )
+
+
+class NotificationRollupService:
+    """Maintains and reads the hourly notification rollup tables."""
+
+    def __init__(self, db: Session, backfill_days: int = DEFAULT_BACKFILL_DAYS):
+        self.db = db
+        self.backfill_days = backfill_days
+
+    # Maintenance ---------------------------------------------------------------
+
+    def refresh(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Recompute buckets touched by logs or interactions since the last run.
+
+        The first run backfills ``backfill_days``. Safe to run concurrently
+        with writers; each bucket is replaced in one transaction.
+        """
+        now = now or datetime.utcnow()
+        started = time.perf_counter()
+        last_refreshed = self.last_refreshed_at()
+        since = (
+            last_refreshed - LATE_DATA_MARGIN
+            if last_refreshed
+            else now - timedelta(days=self.backfill_days)
+        )
+
+        buckets = self._changed_buckets(since)
+        if buckets:
+            self._rebuild_buckets(buckets, now)
+
+        result = {
+            "since": since,
+            "buckets": len(buckets),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        logger.info(f"Notification rollups refreshed: {result}")
+        return result
+
+    def rebuild(
+        self, start: datetime, end: datetime, now: Optional[datetime] = None
+    ) -> int:
+        """Recompute every hour bucket in [start, end], e.g. after a backfill."""
+        buckets = []
+        bucket = floor_hour(start)
+        while bucket <= end:
+            buckets.append(bucket)
+            bucket += ROLLUP_BUCKET
+        if buckets:
+            self._rebuild_buckets(buckets, now or datetime.utcnow())
+        return len(buckets)
+
+    def last_refreshed_at(self) -> Optional[datetime]:
+        return self.db.query(func.max(NotificationHourlyRollup.refreshed_at)).scalar()
+
+    def _changed_buckets(self, since: datetime) -> List[datetime]:
+        bucket = _hour_bucket()
+        sent = select(bucket).where(NotificationLog.sent_at >= since)
+        interacted = (
+            select(bucket)
+            .select_from(NotificationInteraction)
+            .join(
+                NotificationLog,
+                NotificationLog.id == NotificationInteraction.notification_log_id,
+            )
+            .where(NotificationInteraction.timestamp >= since)
+        )
+        return sorted(self.db.execute(union(sent, interacted)).scalars().all())
+
+    def _rebuild_buckets(self, buckets: List[datetime], now: datetime) -> None:
+        conditions = [
+            NotificationLog.sent_at >= min(buckets),
+            NotificationLog.sent_at < max(buckets) + ROLLUP_BUCKET,
+            _hour_bucket().in_(buckets),
+        ]
+        hourly = NotificationHourlyRollup.__table__
+        per_user = UserNotificationHourlyRollup.__table__
+        try:
+            for table, build_select in (
+                (hourly, hourly_metrics_select),
+                (per_user, user_metrics_select),
+            ):
+                query = build_select(conditions, refreshed_at=now)
+                self.db.execute(table.delete().where(table.c.bucket_start.in_(buckets)))
+                self.db.execute(
+                    table.insert().from_select(
+                        [column.name for column in query.selected_columns], query
+                    )
+                )
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Failed to rebuild notification rollups: {e}")
+            self.db.rollback()
+            raise
+
+    # Reads ---------------------------------------------------------------------
+
+    def load_report_metrics(self, start: datetime, end: datetime) -> List[MetricRow]:
+        """Hourly metrics per type/platform for logs sent in [start, end]."""
+        rollup_range, raw_ranges = self._plan(start, end)
+        rows: List[MetricRow] = []
+
+        if rollup_range:
+            lo, hi = rollup_range
+            rollups = (
+                self.db.query(NotificationHourlyRollup)
+                .filter(
+                    and_(
+                        NotificationHourlyRollup.bucket_start >= lo,
+                        NotificationHourlyRollup.bucket_start < hi,
+                    )
+                )
+                .all()
+            )
+            rows.extend(_hourly_row(rollup) for rollup in rollups)
+
+        for raw_range in raw_ranges:
+            query = hourly_metrics_select(self._raw_conditions(raw_range))
+            rows.extend(_hourly_row(row) for row in self.db.execute(query))
+        return rows
+
+    def load_user_metrics(
+        self, user_id: str, since: datetime, until: Optional[datetime] = None
+    ) -> List[MetricRow]:
+        """Hourly delivered/engagement counters for one user since ``since``."""
+        rollup_range, raw_ranges = self._plan(since, until or datetime.utcnow())
+        rows: List[MetricRow] = []
+
+        if rollup_range:
+            lo, hi = rollup_range
+            rollups = (
+                self.db.query(UserNotificationHourlyRollup)
+                .filter(
+                    and_(
+                        UserNotificationHourlyRollup.user_id == user_id,
+                        UserNotificationHourlyRollup.bucket_start >= lo,
+                        UserNotificationHourlyRollup.bucket_start < hi,
+                    )
+                )
+                .all()
+            )
+            rows.extend(_user_row(rollup) for rollup in rollups)
+
+        for raw_range in raw_ranges:
+            conditions = self._raw_conditions(raw_range)
+            conditions.append(NotificationLog.user_id == user_id)
+            query = user_metrics_select(conditions)
+            rows.extend(_user_row(row) for row in self.db.execute(query))
+        return rows
+
+    def _plan(
+        self, start: datetime, end: datetime
+    ) -> Tuple[Optional[Tuple[datetime, datetime]], List[RawRange]]:
+        """Split [start, end] into complete rolled-up hours and raw edges."""
+        last_refreshed = self.last_refreshed_at()
+        first_full = ceil_hour(start)
+        rollup_end = (
+            min(floor_hour(end), floor_hour(last_refreshed)) if last_refreshed else None
+        )
+        if rollup_end is None or rollup_end <= first_full:
+            return None, [(start, end, True)]
+
+        raw_ranges: List[RawRange] = []
+        if start < first_full:
+            raw_ranges.append((start, first_full, False))
+        raw_ranges.append((rollup_end, end, True))
+        return (first_full, rollup_end), raw_ranges
+
+    @staticmethod
+    def _raw_conditions(raw_range: RawRange) -> List[Any]:
+        lo, hi, inclusive = raw_range
+        upper = (
+            NotificationLog.sent_at <= hi if inclusive else NotificationLog.sent_at < hi
+        )
+        return [NotificationLog.sent_at >= lo, upper]
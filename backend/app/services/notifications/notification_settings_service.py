@@ -7,6 +7,7 @@ Task 2-2-4: 알림 설정 UI 및 개인화 전송 기능
 
 import logging
 from datetime import datetime
+from typing import Dict, Iterable
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
@@ -20,6 +21,9 @@ from app.schemas.notification import (
 
 logger = logging.getLogger(__name__)
 
+# Keeps IN lists well below driver/planner limits for campaign-sized sends
+SETTINGS_QUERY_CHUNK_SIZE = 1000
+
 
 class NotificationSettingsNotFoundError(Exception):
     """Raised when notification settings are not found for a user."""
@@ -301,25 +305,15 @@ class NotificationSettingsService:
         """
         current_time = current_time or datetime.utcnow()
 
-        # Get all unique user IDs
-        user_ids = list(set(pair[0] for pair in user_notification_pairs))
-
         # Bulk fetch all user settings
-        user_settings = (
-            self.db.query(UserNotificationSettings)
-            .filter(UserNotificationSettings.user_id.in_(user_ids))
-            .all()
+        settings_lookup = self.load_settings_for_users(
+            pair[0] for pair in user_notification_pairs
         )
 
-        # Create lookup dictionary
-        settings_lookup = {
-            str(settings.user_id): settings for settings in user_settings
-        }
-
         # Check permissions for each pair
         results = {}
         for user_id, notification_type in user_notification_pairs:
-            settings = settings_lookup.get(user_id)
+            settings = settings_lookup.get(str(user_id))
             if settings:
                 allowed = settings.is_notification_allowed(
                     notification_type, current_time
@@ -332,6 +326,33 @@ class NotificationSettingsService:
 
         return results
 
+    def load_settings_for_users(
+        self, user_ids: Iterable[str], chunk_size: int = SETTINGS_QUERY_CHUNK_SIZE
+    ) -> Dict[str, UserNotificationSettings]:
+        """
+        Load settings for many users with chunked IN queries.
+
+        Args:
+            user_ids: User identifiers (duplicates are ignored)
+            chunk_size: Maximum user IDs per query
+
+        Returns:
+            Dictionary mapping user_id (as str) -> settings
+        """
+        unique_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+
+        settings_lookup: Dict[str, UserNotificationSettings] = {}
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start : start + chunk_size]
+            for settings in (
+                self.db.query(UserNotificationSettings)
+                .filter(UserNotificationSettings.user_id.in_(chunk))
+                .all()
+            ):
+                settings_lookup[str(settings.user_id)] = settings
+
+        return settings_lookup
+
 
 # Factory function for dependency injection
 def get_notification_settings_service(
@@ -6,9 +6,11 @@ Handles personalized notification delivery with timing optimization
 based on user preferences and behavioral patterns.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
@@ -27,6 +29,9 @@ from app.services.notifications.notification_settings_service import (
 
 logger = logging.getLogger(__name__)
 
+# Users per timing-prediction batch in bulk sends
+BULK_TIMING_BATCH_SIZE = 1000
+
 
 class PersonalizedNotificationService:
     """Service for sending personalized notifications with timing optimization."""
@@ -138,7 +143,9 @@ class PersonalizedNotificationService:
                 # Update the user_ids to include only this user
                 notification_request.user_ids = [user_id]
 
-                response = self.fcm_service.send_push_notification(notification_request)
+                response = await self.fcm_service.send_push_notification_async(
+                    notification_request
+                )
 
                 return {
                     "success": response.success,
@@ -173,13 +180,20 @@ class PersonalizedNotificationService:
             return {"success": False, "error": str(e), "user_id": user_id}
 
     async def send_bulk_personalized_notifications(
-        self, notification_requests: List[Dict[str, Any]]
+        self,
+        notification_requests: List[Dict[str, Any]],
+        batch_size: int = BULK_TIMING_BATCH_SIZE,
     ) -> Dict[str, Any]:
         """
         Send personalized notifications to multiple users efficiently.
 
+        Permissions for all users are checked in one set-based pass, then
+        allowed users are streamed through timing prediction and sending in
+        batches of ``batch_size``.
+
         Args:
             notification_requests: List of dicts with user_id and notification_request
+            batch_size: Users per timing prediction batch
 
         Returns:
             Bulk sending results with per-user optimization info
@@ -187,6 +201,7 @@ class PersonalizedNotificationService:
         logger.info(
             f"Sending bulk personalized notifications to {len(notification_requests)} users"
         )
+        start_time = time.perf_counter()
 
         results = {
             "total_users": len(notification_requests),
@@ -201,114 +216,200 @@ class PersonalizedNotificationService:
             },
         }
 
-        # 1. Check permissions for all users first
-        user_permissions = {}
-        for request in notification_requests:
-            user_id = request["user_id"]
-            notification_req = request["notification_request"]
+        # 1. Check permissions for all users in one pass
+        user_permissions = await self._check_bulk_permissions(notification_requests)
 
-            is_allowed = self.settings_service.is_notification_allowed_for_user(
-                user_id=user_id, notification_type=notification_req.notification_type
-            )
-
-            user_permissions[user_id] = is_allowed
-
-            if not is_allowed:
+        allowed_requests = []
+        for request in notification_requests:
+            notification_type = request["notification_request"].notification_type
+            if user_permissions.get((request["user_id"], notification_type), True):
+                allowed_requests.append(request)
+            else:
                 results["blocked_sends"].append(
-                    {"user_id": user_id, "reason": "blocked_by_user_settings"}
+                    {
+                        "user_id": request["user_id"],
+                        "reason": "blocked_by_user_settings",
+                    }
                 )
                 results["optimization_stats"]["blocked_count"] += 1
 
-        # 2. Batch optimize timing for allowed users
-        allowed_requests = [
-            req
-            for req in notification_requests
-            if user_permissions.get(req["user_id"], False)
+        # 2. Optimize timing and send in bounded batches
+        batch_count = 0
+        for start in range(0, len(allowed_requests), batch_size):
+            await self._process_bulk_batch(
+                allowed_requests[start : start + batch_size], results
+            )
+            batch_count += 1
+
+        duration = time.perf_counter() - start_time
+        results["performance"] = {
+            "duration_seconds": duration,
+            "batch_count": batch_count,
+            "users_per_second": (
+                len(notification_requests) / duration if duration > 0 else 0.0
+            ),
+        }
+
+        logger.info(
+            "Bulk personalized notifications complete: "
+            f"{results['optimization_stats']}, "
+            f"{results['performance']['users_per_second']:.0f} users/s"
+        )
+        return results
+
+    async def _check_bulk_permissions(
+        self, notification_requests: List[Dict[str, Any]]
+    ) -> Dict[Tuple[str, str], bool]:
+        """Check permissions for all (user_id, notification_type) pairs at once."""
+        pairs = [
+            (request["user_id"], request["notification_request"].notification_type)
+            for request in notification_requests
+        ]
+        try:
+            return await self.settings_service.bulk_check_notification_permissions(
+                pairs, current_time=datetime.now()
+            )
+        except Exception as e:
+            # Same fallback as the per-user check: be permissive on errors
+            logger.error(f"Bulk permission check failed: {e}")
+            return {}
+
+    async def _process_bulk_batch(
+        self, batch: List[Dict[str, Any]], results: Dict[str, Any]
+    ) -> None:
+        """Predict timing for one batch and send or schedule each notification."""
+        timing_requests = [
+            PersonalizedTimingRequest(
+                user_id=request["user_id"],
+                notification_type=request["notification_request"].notification_type,
+                default_time=datetime.utcnow(),
+            )
+            for request in batch
         ]
 
-        if allowed_requests:
-            # Prepare timing requests for batch optimization
-            timing_requests = []
-            for request in allowed_requests:
-                timing_requests.append(
-                    PersonalizedTimingRequest(
-                        user_id=request["user_id"],
-                        notification_type=request[
-                            "notification_request"
-                        ].notification_type,
-                        default_time=datetime.utcnow(),
-                    )
-                )
+        try:
+            predictions = await self.personalization_engine.optimize_batch_timing(
+                timing_requests
+            )
+        except Exception as e:
+            logger.error(f"Batch timing optimization failed: {e}")
+            predictions = []  # Fall back to immediate sending
+
+        # 3. Process each user's notification
+        current_time = datetime.utcnow()
+        immediate: List[Tuple[str, PushNotificationRequest, Dict[str, Any]]] = []
+
+        for i, request in enumerate(batch):
+            user_id = request["user_id"]
+            notification_req = request["notification_request"]
 
             try:
-                predictions = await self.personalization_engine.optimize_batch_timing(
-                    timing_requests
-                )
+                # Get optimization result if available
+                prediction = predictions[i] if i < len(predictions) else None
+
+                if prediction:
+                    optimized_time = prediction.predicted_time
+                    optimization_info = {
+                        "optimized": True,
+                        "confidence": prediction.confidence_score,
+                        "improvement_score": prediction.improvement_score,
+                    }
+                    results["optimization_stats"]["optimized_count"] += 1
+                else:
+                    optimized_time = current_time
+                    optimization_info = {"optimized": False, "fallback": True}
+                    results["optimization_stats"]["fallback_count"] += 1
+
+                # Decide immediate vs scheduled
+                if optimized_time <= current_time + timedelta(minutes=5):
+                    # Send immediately, together with the rest of the batch
+                    immediate.append((user_id, notification_req, optimization_info))
+                else:
+                    # Schedule for later
+                    results["scheduled_sends"].append(
+                        {
+                            "user_id": user_id,
+                            "scheduled_for": optimized_time.isoformat(),
+                            "optimization_info": optimization_info,
+                        }
+                    )
+
             except Exception as e:
-                logger.error(f"Batch timing optimization failed: {e}")
-                predictions = []  # Fall back to immediate sending
+                logger.error(f"Failed to process notification for user {user_id}: {e}")
+                results["failed_sends"].append({"user_id": user_id, "error": str(e)})
 
-            # 3. Process each user's notification
-            current_time = datetime.utcnow()
+        await self._send_immediate(immediate, results)
 
-            for i, request in enumerate(allowed_requests):
-                user_id = request["user_id"]
-                notification_req = request["notification_request"]
+    async def _send_immediate(
+        self,
+        sends: List[Tuple[str, PushNotificationRequest, Dict[str, Any]]],
+        results: Dict[str, Any],
+    ) -> None:
+        """
+        Send a batch's due notifications.
 
-                try:
-                    # Get optimization result if available
-                    prediction = predictions[i] if i < len(predictions) else None
-
-                    if prediction:
-                        optimized_time = prediction.predicted_time
-                        optimization_info = {
-                            "optimized": True,
-                            "confidence": prediction.confidence_score,
-                            "improvement_score": prediction.improvement_score,
-                        }
-                        results["optimization_stats"]["optimized_count"] += 1
-                    else:
-                        optimized_time = current_time
-                        optimization_info = {"optimized": False, "fallback": True}
-                        results["optimization_stats"]["fallback_count"] += 1
-
-                    # Decide immediate vs scheduled
-                    if optimized_time <= current_time + timedelta(minutes=5):
-                        # Send immediately
-                        notification_req.user_ids = [user_id]
-                        response = self.fcm_service.send_push_notification(
-                            notification_req
-                        )
-
-                        results["immediate_sends"].append(
-                            {
-                                "user_id": user_id,
-                                "success": response.success,
-                                "optimization_info": optimization_info,
-                            }
-                        )
-                    else:
-                        # Schedule for later
-                        results["scheduled_sends"].append(
-                            {
-                                "user_id": user_id,
-                                "scheduled_for": optimized_time.isoformat(),
-                                "optimization_info": optimization_info,
-                            }
-                        )
+        Device tokens for the whole batch are loaded in one query, and users
+        sharing the same payload are delivered together. The delivery engine
+        sends their tokens in concurrent multicast chunks.
+        """
+        if not sends:
+            return
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to process notification for user {user_id}: {e}"
-                    )
-                    results["failed_sends"].append(
-                        {"user_id": user_id, "error": str(e)}
-                    )
+        try:
+            tokens_by_user = await asyncio.to_thread(
+                self.fcm_service.get_device_tokens_by_user,
+                [user_id for user_id, _, _ in sends],
+            )
+        except Exception as e:
+            logger.error(f"Failed to load device tokens for {len(sends)} users: {e}")
+            self._record_failed_sends(sends, e, results)
+            return
 
-        logger.info(
-            f"Bulk personalized notifications complete: {results['optimization_stats']}"
-        )
-        return results
+        groups: Dict[str, List[Tuple[str, PushNotificationRequest, Dict]]] = {}
+        for send in sends:
+            payload = send[1].json(exclude={"user_ids"}, sort_keys=True)
+            groups.setdefault(payload, []).append(send)
+
+        # Groups run one at a time: they share this request's DB session
+        for group in groups.values():
+            await self._send_group(group, tokens_by_user, results)
+
+    async def _send_group(
+        self,
+        group: List[Tuple[str, PushNotificationRequest, Dict[str, Any]]],
+        tokens_by_user: Dict[str, List[str]],
+        results: Dict[str, Any],
+    ) -> None:
+        """Deliver one payload to every user in the group."""
+        user_ids = [user_id for user_id, _, _ in group]
+        request = group[0][1].copy(update={"user_ids": user_ids})
+        try:
+            delivered = await self.fcm_service.send_to_users_async(
+                request,
+                {user_id: tokens_by_user.get(user_id, []) for user_id in user_ids},
+            )
+        except Exception as e:
+            logger.error(f"Failed to send notification to {len(group)} users: {e}")
+            self._record_failed_sends(group, e, results)
+            return
+
+        for user_id, _, optimization_info in group:
+            results["immediate_sends"].append(
+                {
+                    "user_id": user_id,
+                    "success": delivered.get(user_id, False),
+                    "optimization_info": optimization_info,
+                }
+            )
+
+    @staticmethod
+    def _record_failed_sends(
+        sends: List[Tuple[str, PushNotificationRequest, Dict[str, Any]]],
+        error: Exception,
+        results: Dict[str, Any],
+    ) -> None:
+        for user_id, _, _ in sends:
+            results["failed_sends"].append({"user_id": user_id, "error": str(error)})
 
     async def get_user_notification_insights(self, user_id: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,532 @@
+"""Place 추출 작업 큐.
+
+아카이브 API는 추출 작업을 Redis 큐에 넣기만 하고, 별도 워커 프로세스
+(``python -m app.workers.extraction_worker``)가 Kakao 지오코딩과 DB 저장을
+수행한다. 재시작/배포 중에도 작업이 유실되지 않는다.
+
+- 멱등성: (user_id, source_content_hash) 단위로 중복 적재를 막는다.
+- 재시도: 일시 오류는 지수 백오프로 지연 큐에 넣고, 한도를 넘으면 dead-letter로 옮긴다.
+- 신뢰성: 꺼낸 작업은 처리 중 목록에 보관되고 리스(만료 시각)가 붙는다.
+  처리 중인 워커가 주기적으로 리스를 연장하며, 연장되지 않고 만료된 작업만
+  대기 큐로 되돌린다 (살아 있는 워커의 작업은 가져가지 않음).
+- 지표: 큐 깊이, 대기/처리 시간, 성공/재시도/실패 카운터.
+
+테스트에서는 ``InMemoryJobBroker``로 Redis 없이 같은 흐름을 검증한다.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.services.places.place_extractor import (
+    PlaceExtractorService,
+    compute_source_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUE_PREFIX = "hotly:extraction"
+
+# 카운터 필드 (큐 지표)
+STAT_FIELDS = (
+    "enqueued",
+    "duplicates",
+    "succeeded",
+    "retried",
+    "dead_lettered",
+    "wait_seconds_total",
+    "run_seconds_total",
+)
+
+
+@dataclass
+class ExtractionJob:
+    """큐에 저장되는 추출 작업."""
+
+    job_id: str
+    user_id: str
+    source_hash: str
+    payload: Dict[str, Any]
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+    available_at: float = field(default_factory=time.time)
+    last_error: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, default=str)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "ExtractionJob":
+        return cls(**json.loads(raw))
+
+
+class RedisJobBroker:
+    """Redis 기반 브로커: 대기 리스트, 처리 중 리스트, 지연 ZSET, dead-letter 리스트."""
+
+    def __init__(self, client: redis.Redis, prefix: str = QUEUE_PREFIX):
+        self.client = client
+        self.ready_key = f"{prefix}:ready"
+        self.processing_key = f"{prefix}:processing"
+        self.delayed_key = f"{prefix}:delayed"
+        self.dead_key = f"{prefix}:dead"
+        self.stats_key = f"{prefix}:stats"
+        self.leases_key = f"{prefix}:leases"
+        self.dedupe_prefix = f"{prefix}:dedupe"
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisJobBroker":
+        return cls(redis.from_url(url, encoding="utf-8", decode_responses=True))
+
+    async def claim(self, dedupe_key: str, job_id: str, ttl_seconds: int) -> bool:
+        return bool(
+            await self.client.set(
+                f"{self.dedupe_prefix}:{dedupe_key}", job_id, nx=True, ex=ttl_seconds
+            )
+        )
+
+    async def release(self, dedupe_key: str) -> None:
+        await self.client.delete(f"{self.dedupe_prefix}:{dedupe_key}")
+
+    async def push(self, raw: str) -> None:
+        await self.client.lpush(self.ready_key, raw)
+
+    async def pop(self, timeout: float) -> Optional[str]:
+        # 처리 중 목록으로 원자적으로 옮겨 워커 장애 시에도 작업을 보존
+        return await self.client.blmove(
+            self.ready_key, self.processing_key, timeout, "RIGHT", "LEFT"
+        )
+
+    async def ack(self, raw: str) -> None:
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.lrem(self.processing_key, 1, raw)
+            pipe.zrem(self.leases_key, raw)
+            await pipe.execute()
+
+    async def lease(self, raws: List[str], until: float) -> None:
+        """처리 중 작업의 리스를 ``until``까지 연장한다 (하트비트)."""
+        if raws:
+            await self.client.zadd(self.leases_key, {raw: until for raw in raws})
+
+    async def schedule(self, raw: str, run_at: float) -> None:
+        await self.client.zadd(self.delayed_key, {raw: run_at})
+
+    async def promote_due(self, now: float) -> int:
+        due = await self.client.zrangebyscore(self.delayed_key, 0, now)
+        promoted = 0
+        for raw in due:
+            # ZREM 성공한 워커만 옮겨 여러 워커가 동시에 승격해도 중복되지 않음
+            if await self.client.zrem(self.delayed_key, raw):
+                await self.client.lpush(self.ready_key, raw)
+                promoted += 1
+        return promoted
+
+    async def dead_letter(self, raw: str) -> None:
+        await self.client.lpush(self.dead_key, raw)
+
+    async def recover_expired(self, now: float, lease_seconds: float) -> int:
+        """
+        리스가 만료된 처리 중 작업을 대기 큐로 되돌린다.
+
+        리스가 없는 작업(꺼낸 직후 워커가 죽은 경우)은 지금부터 리스를 부여해
+        그동안 하트비트가 없으면 다음 점검 때 복구한다.
+        """
+        processing = await self.client.lrange(self.processing_key, 0, -1)
+        if processing:
+            await self.client.zadd(
+                self.leases_key,
+                {raw: now + lease_seconds for raw in processing},
+                nx=True,
+            )
+
+        recovered = 0
+        for raw in await self.client.zrangebyscore(self.leases_key, 0, now):
+            # ZREM 성공한 워커만 옮겨 여러 워커가 동시에 복구해도 중복되지 않음
+            if not await self.client.zrem(self.leases_key, raw):
+                continue
+            if await self.client.lrem(self.processing_key, 1, raw):
+                await self.client.lpush(self.ready_key, raw)
+                recovered += 1
+        return recovered
+
+    async def oldest_ready(self) -> Optional[str]:
+        return await self.client.lindex(self.ready_key, -1)
+
+    async def depths(self) -> Dict[str, int]:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.llen(self.ready_key)
+            pipe.llen(self.processing_key)
+            pipe.zcard(self.delayed_key)
+            pipe.llen(self.dead_key)
+            ready, processing, delayed, dead = await pipe.execute()
+        return {
+            "ready": ready,
+            "processing": processing,
+            "delayed": delayed,
+            "dead": dead,
+        }
+
+    async def incr_stats(self, **values: float) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for name, value in values.items():
+                pipe.hincrbyfloat(self.stats_key, name, value)
+            await pipe.execute()
+
+    async def get_stats(self) -> Dict[str, float]:
+        raw = await self.client.hgetall(self.stats_key)
+        return {name: float(value) for name, value in raw.items()}
+
+
+class InMemoryJobBroker:
+    """단일 프로세스용 브로커 (테스트 및 로컬 개발)."""
+
+    def __init__(self) -> None:
+        self.ready: Deque[str] = deque()
+        self.processing: List[str] = []
+        self.delayed: Dict[str, float] = {}
+        self.dead: List[str] = []
+        self.stats: Dict[str, float] = {}
+        self.leases: Dict[str, float] = {}
+        self._claims: Dict[str, float] = {}
+        self._available = asyncio.Condition()
+
+    async def claim(self, dedupe_key: str, job_id: str, ttl_seconds: int) -> bool:
+        now = time.time()
+        if self._claims.get(dedupe_key, 0) > now:
+            return False
+        self._claims[dedupe_key] = now + ttl_seconds
+        return True
+
+    async def release(self, dedupe_key: str) -> None:
+        self._claims.pop(dedupe_key, None)
+
+    async def push(self, raw: str) -> None:
+        async with self._available:
+            self.ready.appendleft(raw)
+            self._available.notify()
+
+    async def pop(self, timeout: float) -> Optional[str]:
+        async with self._available:
+            try:
+                await asyncio.wait_for(
+                    self._available.wait_for(lambda: bool(self.ready)), timeout
+                )
+            except asyncio.TimeoutError:
+                return None
+            raw = self.ready.pop()
+            self.processing.append(raw)
+            return raw
+
+    async def ack(self, raw: str) -> None:
+        if raw in self.processing:
+            self.processing.remove(raw)
+        self.leases.pop(raw, None)
+
+    async def lease(self, raws: List[str], until: float) -> None:
+        for raw in raws:
+            self.leases[raw] = until
+
+    async def schedule(self, raw: str, run_at: float) -> None:
+        self.delayed[raw] = run_at
+
+    async def promote_due(self, now: float) -> int:
+        due = [raw for raw, run_at in self.delayed.items() if run_at <= now]
+        for raw in due:
+            del self.delayed[raw]
+            await self.push(raw)
+        return len(due)
+
+    async def dead_letter(self, raw: str) -> None:
+        self.dead.insert(0, raw)
+
+    async def recover_expired(self, now: float, lease_seconds: float) -> int:
+        for raw in self.processing:
+            self.leases.setdefault(raw, now + lease_seconds)
+        expired = [raw for raw, until in self.leases.items() if until <= now]
+        recovered = 0
+        for raw in expired:
+            del self.leases[raw]
+            if raw in self.processing:
+                self.processing.remove(raw)
+                await self.push(raw)
+                recovered += 1
+        return recovered
+
+    async def oldest_ready(self) -> Optional[str]:
+        return self.ready[-1] if self.ready else None
+
+    async def depths(self) -> Dict[str, int]:
+        return {
+            "ready": len(self.ready),
+            "processing": len(self.processing),
+            "delayed": len(self.delayed),
+            "dead": len(self.dead),
+        }
+
+    async def incr_stats(self, **values: float) -> None:
+        for name, value in values.items():
+            self.stats[name] = self.stats.get(name, 0.0) + value
+
+    async def get_stats(self) -> Dict[str, float]:
+        return dict(self.stats)
+
+
+class ExtractionJobQueue:
+    """Place 추출 작업 큐 (적재, 완료/재시도/실패 처리, 지표)."""
+
+    # 입력 데이터 자체가 잘못된 경우: 재시도해도 결과가 같음
+    PERMANENT_ERRORS = (ValueError, TypeError, KeyError)
+
+    def __init__(
+        self,
+        broker: Any,
+        max_attempts: int = 5,
+        backoff_base: float = 2.0,
+        backoff_max: float = 300.0,
+        dedupe_ttl_seconds: int = 86400,
+    ):
+        self.broker = broker
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.dedupe_ttl_seconds = dedupe_ttl_seconds
+
+    async def enqueue(self, user_id: Any, snapshot: Dict[str, Any]) -> Optional[str]:
+        """
+        추출 작업을 적재한다.
+
+        Args:
+            user_id: Place를 소유할 사용자 ID
+            snapshot: PlaceExtractorService.extract 인자 (user_id 제외)
+
+        Returns:
+            적재된 작업 ID. Place 콘텐츠가 아니거나 중복이면 None
+        """
+        if snapshot.get("content_type") != "place":
+            return None
+
+        source_hash = compute_source_hash(
+            title=snapshot.get("title"),
+            url=snapshot["url"],
+            named_entities=snapshot.get("named_entities"),
+            type_specific_data=snapshot.get("type_specific_data"),
+        )
+        if not source_hash:
+            logger.info(f"Skipping extraction job without name: {snapshot['url']}")
+            return None
+
+        job = ExtractionJob(
+            job_id=uuid.uuid4().hex,
+            user_id=str(user_id),
+            source_hash=source_hash,
+            payload=snapshot,
+        )
+        if not await self.broker.claim(
+            self._dedupe_key(job), job.job_id, self.dedupe_ttl_seconds
+        ):
+            await self.broker.incr_stats(duplicates=1)
+            logger.info(f"Duplicate extraction job skipped: {source_hash}")
+            return None
+
+        await self.broker.push(job.to_json())
+        await self.broker.incr_stats(enqueued=1)
+        return job.job_id
+
+    async def complete(self, raw: str, job: ExtractionJob, run_seconds: float) -> None:
+        """성공한 작업을 처리 중 목록에서 제거한다."""
+        await self.broker.ack(raw)
+        await self.broker.incr_stats(succeeded=1, run_seconds_total=run_seconds)
+
+    async def fail(
+        self, raw: str, job: ExtractionJob, error: Exception, run_seconds: float
+    ) -> bool:
+        """
+        실패한 작업을 재시도 예약하거나 dead-letter로 옮긴다.
+
+        Returns:
+            재시도가 예약되면 True
+        """
+        job.attempts += 1
+        job.last_error = f"{type(error).__name__}: {error}"
+
+        permanent = isinstance(error, self.PERMANENT_ERRORS)
+        if permanent or job.attempts >= self.max_attempts:
+            await self.broker.dead_letter(job.to_json())
+            await self.broker.ack(raw)
+            # 다시 아카이빙하면 재적재할 수 있도록 중복 방지 키 해제
+            await self.broker.release(self._dedupe_key(job))
+            await self.broker.incr_stats(dead_lettered=1, run_seconds_total=run_seconds)
+            logger.error(
+                f"Extraction job {job.job_id} dead-lettered after "
+                f"{job.attempts} attempts: {job.last_error}"
+            )
+            return False
+
+        job.available_at = time.time() + self._backoff(job.attempts)
+        await self.broker.schedule(job.to_json(), job.available_at)
+        await self.broker.ack(raw)
+        await self.broker.incr_stats(retried=1, run_seconds_total=run_seconds)
+        logger.warning(
+            f"Extraction job {job.job_id} failed (attempt {job.attempts}), "
+            f"retrying: {job.last_error}"
+        )
+        return True
+
+    async def get_metrics(self) -> Dict[str, Any]:
+        """큐 깊이, 지연 시간, 카운터를 반환한다."""
+        depths = await self.broker.depths()
+        stats = await self.broker.get_stats()
+        stats = {name: stats.get(name, 0.0) for name in STAT_FIELDS}
+
+        oldest_age = 0.0
+        oldest = await self.broker.oldest_ready()
+        if oldest:
+            oldest_age = max(
+                0.0, time.time() - ExtractionJob.from_json(oldest).available_at
+            )
+
+        finished = stats["succeeded"] + stats["retried"] + stats["dead_lettered"]
+        return {
+            "depth": depths,
+            "oldest_ready_age_seconds": oldest_age,
+            "avg_wait_seconds": (
+                stats["wait_seconds_total"] / finished if finished else 0.0
+            ),
+            "avg_run_seconds": (
+                stats["run_seconds_total"] / finished if finished else 0.0
+            ),
+            "counters": {
+                name: int(stats[name])
+                for name in (
+                    "enqueued",
+                    "duplicates",
+                    "succeeded",
+                    "retried",
+                    "dead_lettered",
+                )
+            },
+        }
+
+    def _dedupe_key(self, job: ExtractionJob) -> str:
+        return f"{job.user_id}:{job.source_hash}"
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+
+class ExtractionWorker:
+    """큐에서 작업을 꺼내 PlaceExtractorService로 처리하는 워커."""
+
+    def __init__(
+        self,
+        queue: ExtractionJobQueue,
+        extractor: PlaceExtractorService,
+        concurrency: int = 4,
+        poll_timeout: float = 1.0,
+        promote_interval: float = 1.0,
+        lease_seconds: float = 60.0,
+    ):
+        self.queue = queue
+        self.extractor = extractor
+        self.concurrency = concurrency
+        self.poll_timeout = poll_timeout
+        self.promote_interval = promote_interval
+        # 처리 중 작업 리스: lease_seconds/3마다 연장, 연장이 끊기면 만료 후 복구
+        self.lease_seconds = lease_seconds
+        self._in_flight: set = set()
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """``stop_event``가 설정될 때까지 작업을 처리한다."""
+        tasks = [
+            asyncio.create_task(self._consume(stop_event))
+            for _ in range(self.concurrency)
+        ]
+        tasks.append(asyncio.create_task(self._promote(stop_event)))
+        await asyncio.gather(*tasks)
+
+    async def process_next(self) -> bool:
+        """작업 하나를 처리한다. 대기 작업이 없으면 False."""
+        raw = await self.queue.broker.pop(self.poll_timeout)
+        if raw is None:
+            return False
+
+        self._in_flight.add(raw)
+        try:
+            await self.queue.broker.lease([raw], time.time() + self.lease_seconds)
+            await self._process(raw)
+        finally:
+            self._in_flight.discard(raw)
+        return True
+
+    async def _process(self, raw: str) -> None:
+        try:
+            job = ExtractionJob.from_json(raw)
+        except Exception as e:
+            logger.error(f"Dropping malformed extraction job: {e}")
+            await self.queue.broker.dead_letter(raw)
+            await self.queue.broker.ack(raw)
+            return
+
+        await self.queue.broker.incr_stats(
+            wait_seconds_total=max(0.0, time.time() - job.available_at)
+        )
+
+        start_time = time.perf_counter()
+        try:
+            await self.extractor.extract(user_id=UUID(job.user_id), **job.payload)
+        except Exception as e:
+            await self.queue.fail(raw, job, e, time.perf_counter() - start_time)
+        else:
+            await self.queue.complete(raw, job, time.perf_counter() - start_time)
+
+    async def _consume(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                await self.process_next()
+            except Exception as e:
+                # 브로커 연결 오류 등: 잠시 쉬고 계속
+                logger.error(f"Extraction worker error: {e}")
+                await asyncio.sleep(self.poll_timeout)
+
+    async def _promote(self, stop_event: asyncio.Event) -> None:
+        """지연 작업 승격, 처리 중 작업 리스 연장, 만료된 리스 복구."""
+        last_heartbeat = 0.0
+        while not stop_event.is_set():
+            now = time.time()
+            try:
+                await self.queue.broker.promote_due(now)
+                if now - last_heartbeat >= self.lease_seconds / 3:
+                    await self.queue.broker.lease(
+                        list(self._in_flight), now + self.lease_seconds
+                    )
+                    last_heartbeat = now
+                    recovered = await self.queue.broker.recover_expired(
+                        now, self.lease_seconds
+                    )
+                    if recovered:
+                        logger.info(
+                            f"Recovered {recovered} extraction jobs with expired leases"
+                        )
+            except Exception as e:
+                logger.error(f"Failed to maintain extraction jobs: {e}")
+            try:
+                await asyncio.wait_for(stop_event.wait(), self.promote_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+# 아카이브 API와 워커가 공유하는 큐 (Redis 연결은 첫 사용 시 생성)
+extraction_queue = ExtractionJobQueue(
+    RedisJobBroker.from_url(settings.REDIS_URL),
+    max_attempts=settings.EXTRACTION_MAX_ATTEMPTS,
+)
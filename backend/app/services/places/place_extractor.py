@@ -1,5 +1,6 @@
 """ArchivedContent → Place 자동 추출 서비스."""
 
+import asyncio
 import hashlib
 import logging
 import re
@@ -14,6 +15,7 @@ from app.services.maps.kakao_map_service import (
     KakaoMapService,
     KakaoMapServiceError,
 )
+from app.utils.concurrency import ApiConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -155,9 +157,39 @@ def _choose_place_name(
     return None
 
 
+def _raw_place_name(
+    title: Optional[str], named_entities: Optional[List[str]]
+) -> Optional[str]:
+    """source_content_hash 입력에 쓰이는 원본 이름 (dedup 호환용)."""
+    return (title or "").strip() or (
+        (named_entities or [None])[0] if named_entities else None
+    )
+
+
+def compute_source_hash(
+    *,
+    title: Optional[str],
+    url: str,
+    named_entities: Optional[List[str]],
+    type_specific_data: Optional[dict],
+) -> Optional[str]:
+    """추출 결과 Place의 source_content_hash를 계산한다. 이름이 없으면 None."""
+    raw_name = _raw_place_name(title, named_entities)
+    if not raw_name:
+        return None
+    address = _safe_str((type_specific_data or {}).get("address"), 500)
+    return hashlib.sha256(f"{raw_name}_{address or ''}_{url}".encode()).hexdigest()
+
+
 class PlaceExtractorService:
     """ArchivedContent 데이터로부터 Place를 추출해 DB에 저장한다."""
 
+    def __init__(self, limiter: Optional[ApiConcurrencyLimiter] = None):
+        # 외부 API("kakao")별 동시 호출 수 제한; 기본은 제한 없음
+        self._limiter = limiter or ApiConcurrencyLimiter()
+        # 추출마다 새로 만들지 않고 재사용; 결과는 공유 지오코딩 캐시를 거친다
+        self._kakao: Optional[KakaoMapService] = None
+
     async def extract_and_create(
         self,
         *,
@@ -171,17 +203,15 @@ class PlaceExtractorService:
         user_id: UUID,
     ) -> None:
         """아카이브 데이터를 Place로 변환해 저장한다. 모든 예외를 내부에서 처리한다."""
-        if content_type != "place":
-            return
-
         try:
-            await self._run(
+            await self.extract(
+                content_type=content_type,
                 title=title,
                 url=url,
                 platform=platform,
                 keywords_main=keywords_main,
                 named_entities=named_entities,
-                type_specific_data=type_specific_data or {},
+                type_specific_data=type_specific_data,
                 user_id=user_id,
             )
         except Exception:
@@ -189,6 +219,37 @@ class PlaceExtractorService:
                 "Place extraction failed for url=%s user_id=%s", url, user_id
             )
 
+    async def extract(
+        self,
+        *,
+        content_type: str,
+        title: Optional[str],
+        url: str,
+        platform: str,
+        keywords_main: Optional[List[str]],
+        named_entities: Optional[List[str]],
+        type_specific_data: Optional[dict],
+        user_id: UUID,
+    ) -> None:
+        """
+        extract_and_create와 같지만 예외를 호출자(작업 큐 워커)에게 전달한다.
+
+        Kakao 일시 오류(타임아웃, 429, 5xx)도 전파되므로 좌표 없이 저장되지 않고
+        큐의 재시도/백오프를 탄다.
+        """
+        if content_type != "place":
+            return
+
+        await self._run(
+            title=title,
+            url=url,
+            platform=platform,
+            keywords_main=keywords_main,
+            named_entities=named_entities,
+            type_specific_data=type_specific_data or {},
+            user_id=user_id,
+        )
+
     async def _run(
         self,
         *,
@@ -201,9 +262,7 @@ class PlaceExtractorService:
         user_id: UUID,
     ) -> None:
         # 기존 의미의 raw_name — source_content_hash 입력 보존용 (dedup 호환)
-        raw_name = (title or "").strip() or (
-            (named_entities or [None])[0] if named_entities else None
-        )
+        raw_name = _raw_place_name(title, named_entities)
         if not raw_name:
             logger.info("Skipping place extraction: no usable name for url=%s", url)
             return
@@ -224,9 +283,12 @@ class PlaceExtractorService:
         if website and not website.startswith(("http://", "https://")):
             website = None
 
-        source_hash = hashlib.sha256(
-            f"{raw_name}_{address or ''}_{url}".encode()
-        ).hexdigest()
+        source_hash = compute_source_hash(
+            title=title,
+            url=url,
+            named_entities=named_entities,
+            type_specific_data=tsd,
+        )
 
         # 캡션이 entity와 다르면 description으로 보존
         description: Optional[str] = None
@@ -259,6 +321,24 @@ class PlaceExtractorService:
             place_create.latitude = latitude
             place_create.longitude = longitude
 
+        # 동기 DB 쓰기는 이벤트 루프 밖에서 실행
+        await asyncio.to_thread(
+            self._save_place,
+            user_id=user_id,
+            source_hash=source_hash,
+            place_create=place_create,
+            url=url,
+        )
+
+    def _save_place(
+        self,
+        *,
+        user_id: UUID,
+        source_hash: str,
+        place_create: PlaceCreate,
+        url: str,
+    ) -> None:
+        latitude, longitude = place_create.latitude, place_create.longitude
         db = SessionLocal()
         try:
             existing = place_crud.get_by_source_hash(
@@ -301,8 +381,16 @@ class PlaceExtractorService:
         named_entities: List[str],
         keywords_main: List[str],
     ) -> tuple[Optional[float], Optional[float]]:
+        """
+        주소, 키워드 후보 순으로 좌표를 찾는다.
+
+        "찾지 못함"(ValueError)만 다음 후보로 넘어가고, 타임아웃/429/5xx 같은
+        일시 오류는 그대로 전파해 작업 큐가 재시도하게 한다.
+        """
         try:
-            kakao = KakaoMapService()
+            if self._kakao is None:
+                self._kakao = KakaoMapService(limiter=self._limiter)
+            kakao = self._kakao
         except ConfigError:
             logger.error("KAKAO_API_KEY not configured — skipping geocoding")
             return None, None
@@ -315,16 +403,26 @@ class PlaceExtractorService:
                 logger.info(
                     "Address not found in Kakao: %r, trying keyword search", address
                 )
-            except Exception as exc:
-                logger.warning("Kakao geocoding failed for address %r: %s", address, exc)
 
+        return await self._keyword_coordinates(
+            kakao, name, named_entities, keywords_main
+        )
+
+    async def _keyword_coordinates(
+        self,
+        kakao: KakaoMapService,
+        name: str,
+        named_entities: List[str],
+        keywords_main: List[str],
+    ) -> tuple[Optional[float], Optional[float]]:
+        """키워드 후보를 차례로 검색해 개체명과 가장 잘 맞는 결과의 좌표를 돌려준다."""
         entity = _choose_entity(named_entities)
         candidates = _build_keyword_candidates(name, named_entities, keywords_main)
         for kw in candidates:
             try:
                 results = await kakao._search_places_async(kw, None, None, None, 5)
-            except Exception as exc:
-                logger.warning("Kakao keyword search failed for %r: %s", kw, exc)
+            except ValueError as exc:
+                logger.info("Kakao keyword search found nothing for %r: %s", kw, exc)
                 continue
             picked = _pick_best_result(results or [], entity)
             if picked:
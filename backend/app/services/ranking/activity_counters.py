@@ -0,0 +1,425 @@
+"""
+스트리밍 활동 카운터
+
+조회/클릭/저장 이벤트가 들어올 때마다 Redis 카운터를 갱신해서
+인기도, 트렌딩 장소, 트렌딩 태그를 전체 재계산 없이 바로 읽는다.
+
+- 장소: 감쇠 반감기별 정렬 집합 (popularity 6시간, short 1시간, long 24시간)
+  이벤트마다 ZINCRBY, 시간이 바뀔 때 한 번만 전체 점수에 감쇠 계수 적용
+- 태그: 장소 생성일 기준 일 단위 버킷 + 전체 누적 집합
+  기간별 합계는 버킷 합집합을 짧게 캐시해서 재사용
+- Redis 장애 시 기본값을 반환하고 잠시 뒤 재시도 (호출 측은 기존 경로로 대체)
+"""
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+COUNTER_PREFIX = "hotly:activity"
+REDIS_RETRY_SECONDS = 30.0
+
+# 이벤트 타입별 가중치 (save는 bookmark와 동일하게 취급)
+EVENT_WEIGHTS = {
+    "view": 1.0,
+    "click": 2.0,
+    "bookmark": 4.0,
+    "save": 4.0,
+    "visit": 5.0,
+    "share": 3.0,
+}
+
+# 장소 카운터 시리즈별 반감기 (시간)
+PLACE_HALF_LIVES = {"popularity": 6.0, "short": 1.0, "long": 24.0}
+# 감쇠 후 이 값보다 작아진 항목은 제거해 집합 크기를 제한
+MIN_RETAINED_SCORE = 0.01
+# popularity 점수가 0.5가 되는 감쇠 가중 활동량
+POPULARITY_HALF_SCORE = 50.0
+# 트렌딩 후보가 되기 위한 최소 short 시리즈 활동량
+MIN_TRENDING_ACTIVITY = 10.0
+DECAY_LOCK_TTL_SECONDS = 300
+
+# 태그 일 버킷 보관 기간 / 기간 합계 캐시 / DB 재동기화 주기
+TAG_BUCKET_RETENTION_DAYS = 31
+TAG_WINDOW_TTL_SECONDS = 300
+TAG_SEED_TTL_SECONDS = 24 * 3600
+# 재적재 중인 워커가 있으면 다른 워커는 DB 집계 없이 기존 경로로 대체
+TAG_SEED_LOCK_TTL_SECONDS = 300
+
+
+def popularity_from_score(score: float) -> float:
+    """감쇠 가중 활동량을 0~1 인기도 점수로 변환"""
+    if score <= 0:
+        return 0.0
+    return score / (score + POPULARITY_HALF_SCORE)
+
+
+def _mean_lifetime_hours(series: str) -> float:
+    """일정한 이벤트율 r에서 시리즈 점수 ≈ r × 평균 수명 (반감기 / ln 2)"""
+    return PLACE_HALF_LIVES[series] / 0.6931471805599453
+
+
+class ActivityCounters:
+    """Redis 기반 시간 버킷/감쇠 활동 카운터"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Optional[redis.Redis] = None,
+        prefix: str = COUNTER_PREFIX,
+    ):
+        self.redis_url = redis_url
+        self.prefix = prefix
+
+        self._client = client
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_retry_at = 0.0
+
+    # 키 ---------------------------------------------------------------------
+
+    def _place_key(self, series: str) -> str:
+        return f"{self.prefix}:place:{series}"
+
+    def _tag_day_key(self, day: date) -> str:
+        return f"{self.prefix}:tag:day:{day:%Y%m%d}"
+
+    def _tag_window_key(self, days: int, today: date) -> str:
+        return f"{self.prefix}:tag:window:{days}:{today:%Y%m%d}"
+
+    @property
+    def _tag_total_key(self) -> str:
+        return f"{self.prefix}:tag:total"
+
+    @property
+    def _tag_seeded_key(self) -> str:
+        return f"{self.prefix}:tag:seeded"
+
+    @property
+    def _tag_seed_lock_key(self) -> str:
+        return f"{self.prefix}:tag:seed_lock"
+
+    @property
+    def _decay_hour_key(self) -> str:
+        return f"{self.prefix}:place:decayed_hour"
+
+    # Redis ------------------------------------------------------------------
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self.redis_url is None:
+            return self._client
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = redis.from_url(
+                self.redis_url, encoding="utf-8", decode_responses=True
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _redis_failed(self, action: str, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Activity counters unavailable ({action}): {error}")
+
+    # 장소 이벤트 -------------------------------------------------------------
+
+    async def record_place_event(
+        self, place_id: Any, event_type: str, count: int = 1
+    ) -> bool:
+        """장소 활동 이벤트 1건 기록"""
+        return await self.record_place_events([(place_id, event_type, count)])
+
+    async def record_place_events(self, events: Iterable[Tuple[Any, str, int]]) -> bool:
+        """
+        장소 활동 이벤트 일괄 기록 (파이프라인 1회 왕복)
+
+        Args:
+            events: (장소 ID, 이벤트 타입, 횟수) 목록
+
+        Returns:
+            기록 성공 여부
+        """
+        client = self._get_client()
+        if client is None:
+            return False
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            queued = 0
+            for place_id, event_type, count in events:
+                weight = EVENT_WEIGHTS.get(event_type)
+                if not weight:
+                    continue
+                for series in PLACE_HALF_LIVES:
+                    pipe.zincrby(self._place_key(series), weight * count, str(place_id))
+                queued += 1
+            if queued:
+                await pipe.execute()
+            return True
+        except Exception as e:
+            self._redis_failed("record_place_events", e)
+            return False
+
+    async def apply_decay(self, now: Optional[float] = None) -> int:
+        """
+        시간이 바뀌었으면 장소 점수 전체에 감쇠 적용 (워커 간 1회만 실행)
+
+        Returns:
+            적용한 경과 시간 수
+        """
+        client = self._get_client()
+        if client is None:
+            return 0
+
+        hour = int((now if now is not None else time.time()) // 3600)
+        try:
+            last_hour = await client.get(self._decay_hour_key)
+            if last_hour is None:
+                await client.set(self._decay_hour_key, hour, nx=True)
+                return 0
+
+            elapsed = hour - int(last_hour)
+            if elapsed <= 0:
+                return 0
+            lock_key = f"{self._decay_hour_key}:lock:{hour}"
+            if not await client.set(lock_key, 1, nx=True, ex=DECAY_LOCK_TTL_SECONDS):
+                return 0
+
+            pipe = client.pipeline(transaction=True)
+            for series, half_life in PLACE_HALF_LIVES.items():
+                key = self._place_key(series)
+                pipe.zunionstore(key, {key: 0.5 ** (elapsed / half_life)})
+                pipe.zremrangebyscore(key, "-inf", MIN_RETAINED_SCORE)
+            pipe.set(self._decay_hour_key, hour)
+            await pipe.execute()
+            return elapsed
+        except Exception as e:
+            self._redis_failed("apply_decay", e)
+            return 0
+
+    async def get_popularity(self, place_ids: Sequence[Any]) -> Dict[str, float]:
+        """장소별 인기도 점수 (0~1, 한 번의 ZMSCORE)"""
+        ids = [str(place_id) for place_id in place_ids]
+        client = self._get_client()
+        if not ids or client is None:
+            return {}
+
+        try:
+            scores = await client.zmscore(self._place_key("popularity"), ids)
+        except Exception as e:
+            self._redis_failed("get_popularity", e)
+            return {}
+        return {
+            place_id: popularity_from_score(score or 0.0)
+            for place_id, score in zip(ids, scores)
+        }
+
+    async def get_active_places(self, limit: int = 100) -> List[str]:
+        """최근 1시간 가중 활동량 상위 장소 ID"""
+        client = self._get_client()
+        if client is None:
+            return []
+
+        try:
+            return await client.zrevrange(self._place_key("short"), 0, limit - 1)
+        except Exception as e:
+            self._redis_failed("get_active_places", e)
+            return []
+
+    async def get_trending_places(
+        self, limit: int = 20, min_activity: float = MIN_TRENDING_ACTIVITY
+    ) -> List[Dict[str, Any]]:
+        """
+        단기(1시간) 이벤트율이 장기(24시간) 대비 증가한 장소
+
+        Returns:
+            activity_increase(증가율) 내림차순 장소 목록
+        """
+        client = self._get_client()
+        if client is None:
+            return []
+
+        try:
+            candidates = await client.zrevrangebyscore(
+                self._place_key("short"),
+                "+inf",
+                min_activity,
+                start=0,
+                num=limit * 5,
+                withscores=True,
+            )
+            if not candidates:
+                return []
+            long_scores = await client.zmscore(
+                self._place_key("long"), [place_id for place_id, _ in candidates]
+            )
+        except Exception as e:
+            self._redis_failed("get_trending_places", e)
+            return []
+
+        trending = []
+        for (place_id, short_score), long_score in zip(candidates, long_scores):
+            short_rate = short_score / _mean_lifetime_hours("short")
+            long_rate = (long_score or short_score) / _mean_lifetime_hours("long")
+            trending.append(
+                {
+                    "place_id": place_id,
+                    "activity_increase": short_rate / long_rate - 1.0,
+                    "recent_activity": short_score,
+                }
+            )
+        trending.sort(key=lambda item: item["activity_increase"], reverse=True)
+        return trending[:limit]
+
+    # 태그 사용량 -------------------------------------------------------------
+
+    def _tag_bucket_expiry(self, day: date) -> int:
+        expires = datetime.combine(
+            day + timedelta(days=TAG_BUCKET_RETENTION_DAYS), datetime.min.time()
+        )
+        return max(int((expires - datetime.utcnow()).total_seconds()), 1)
+
+    async def record_tag_usage(
+        self,
+        added: Iterable[str] = (),
+        removed: Iterable[str] = (),
+        created_at: Optional[datetime] = None,
+    ) -> bool:
+        """
+        장소 생성/수정/삭제로 바뀐 태그 사용량 반영
+
+        Args:
+            added: 새로 붙은 태그
+            removed: 제거된 태그 (장소 삭제 포함)
+            created_at: 장소 생성 시각 (일 버킷 결정)
+        """
+        deltas: Dict[str, int] = {}
+        for tag in added or ():
+            deltas[tag] = deltas.get(tag, 0) + 1
+        for tag in removed or ():
+            deltas[tag] = deltas.get(tag, 0) - 1
+        deltas = {tag: delta for tag, delta in deltas.items() if delta}
+        client = self._get_client()
+        if not deltas or client is None:
+            return False
+
+        day = (created_at or datetime.utcnow()).date()
+        track_day = (datetime.utcnow().date() - day).days < TAG_BUCKET_RETENTION_DAYS
+        try:
+            pipe = client.pipeline(transaction=False)
+            for tag, delta in deltas.items():
+                pipe.zincrby(self._tag_total_key, delta, tag)
+                if track_day:
+                    pipe.zincrby(self._tag_day_key(day), delta, tag)
+            pipe.zremrangebyscore(self._tag_total_key, "-inf", 0)
+            if track_day:
+                pipe.zremrangebyscore(self._tag_day_key(day), "-inf", 0)
+                pipe.expire(self._tag_day_key(day), self._tag_bucket_expiry(day))
+            await pipe.execute()
+            return True
+        except Exception as e:
+            self._redis_failed("record_tag_usage", e)
+            return False
+
+    async def claim_tag_seed(self) -> bool:
+        """
+        태그 카운터 재적재 권한 획득 (워커 간 1개만, SET NX)
+
+        Redis 장애(재시도 대기 중 포함)거나 다른 워커가 재적재 중이면 False.
+        호출 측은 False일 때 DB 집계를 건너뛰고 기존 경로로 대체한다.
+        """
+        client = self._get_client()
+        if client is None:
+            return False
+
+        try:
+            return bool(
+                await client.set(
+                    self._tag_seed_lock_key,
+                    1,
+                    nx=True,
+                    ex=TAG_SEED_LOCK_TTL_SECONDS,
+                )
+            )
+        except Exception as e:
+            self._redis_failed("claim_tag_seed", e)
+            return False
+
+    async def seed_tag_counts(
+        self, daily_counts: Dict[date, Dict[str, int]], totals: Dict[str, int]
+    ) -> bool:
+        """DB 집계로 태그 카운터 전체 재적재 (콜드 스타트/주기적 재동기화)"""
+        client = self._get_client()
+        if client is None:
+            return False
+
+        today = datetime.utcnow().date()
+        days = [today - timedelta(days=i) for i in range(TAG_BUCKET_RETENTION_DAYS)]
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.delete(self._tag_total_key, *(self._tag_day_key(day) for day in days))
+            if totals:
+                pipe.zadd(self._tag_total_key, totals)
+            for day, counts in daily_counts.items():
+                if counts and day in days:
+                    pipe.zadd(self._tag_day_key(day), counts)
+                    pipe.expire(self._tag_day_key(day), self._tag_bucket_expiry(day))
+            pipe.set(self._tag_seeded_key, today.isoformat(), ex=TAG_SEED_TTL_SECONDS)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            self._redis_failed("seed_tag_counts", e)
+            return False
+
+    async def get_tag_counts(
+        self, days: int, limit: int, today: Optional[date] = None
+    ) -> Optional[Tuple[List[Tuple[str, float]], Dict[str, float]]]:
+        """
+        최근 days일 태그 사용량 상위 limit개와 전체 누적 사용량
+
+        Returns:
+            ([(태그, 기간 사용량)], {태그: 전체 사용량}),
+            카운터가 아직 채워지지 않았거나 Redis 장애면 None
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+
+        today = today or datetime.utcnow().date()
+        window_key = self._tag_window_key(days, today)
+        try:
+            if not await client.exists(self._tag_seeded_key):
+                return None
+            if not await client.exists(window_key):
+                day_keys = [
+                    self._tag_day_key(today - timedelta(days=i)) for i in range(days)
+                ]
+                pipe = client.pipeline(transaction=True)
+                pipe.zunionstore(window_key, day_keys)
+                pipe.expire(window_key, TAG_WINDOW_TTL_SECONDS)
+                await pipe.execute()
+
+            recent = await client.zrevrange(window_key, 0, limit - 1, withscores=True)
+            if not recent:
+                return [], {}
+            tags = [tag for tag, _ in recent]
+            totals = await client.zmscore(self._tag_total_key, tags)
+        except Exception as e:
+            self._redis_failed("get_tag_counts", e)
+            return None
+
+        return recent, {
+            tag: total for tag, total in zip(tags, totals) if total is not None
+        }
+
+
+# API 워커, 랭킹 서비스, 태그 서비스가 공유
+activity_counters = ActivityCounters(redis_url=settings.REDIS_URL)
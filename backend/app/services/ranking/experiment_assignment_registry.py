@@ -0,0 +1,197 @@
+"""
+랭킹 실험 사용자 배정 레지스트리
+
+변형은 (실험 ID, 사용자 ID) 해시로 결정되므로 배정 시 기존 배정을 조회하지 않는다.
+레지스트리는 배정 결과만 기록한다.
+- 실험별 배정 해시 (사용자 → 변형): 이벤트 기록 시 O(1) 조회
+- 실험/변형별 참가자 집합: 참가자 수를 SCARD로 정확히 집계 (변형 수에 비례)
+- 사용자의 활성 실험 배정을 실험 수와 무관하게 한 번의 왕복으로 일괄 조회
+트래픽 할당은 실험 시작 후 바뀌지 않으므로 해시 결과와 기록된 배정은 항상 같다.
+"""
+
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Set
+
+import redis.asyncio as redis
+
+from app.core.cache import CacheService, RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+ASSIGNMENT_TTL_SECONDS = 86400 * 31  # 실험보다 조금 더 오래 보관
+
+
+def bucket_variant(
+    experiment_id: str, user_id: Any, traffic_allocation: Dict[str, float]
+) -> str:
+    """
+    결정적 변형 배정
+
+    (실험 ID, 사용자 ID) 해시를 0-1 구간 값으로 바꿔 누적 할당 비율로 변형을 고른다.
+    같은 입력이면 어느 워커에서든 같은 변형이 나온다.
+    """
+    user_hash = hashlib.md5(f"{experiment_id}:{user_id}".encode()).hexdigest()
+    hash_value = int(user_hash[:8], 16) / (16**8)
+
+    cumulative_allocation = 0.0
+    for variant_name, allocation in traffic_allocation.items():
+        cumulative_allocation += allocation
+        if hash_value <= cumulative_allocation:
+            return variant_name
+
+    # 할당 합이 1보다 조금 작을 때의 기본값 (첫 번째 변형)
+    return next(iter(traffic_allocation))
+
+
+class ExperimentAssignmentRegistry(ABC):
+    """실험 배정 레지스트리 인터페이스"""
+
+    @abstractmethod
+    async def record_assignment(
+        self, experiment_id: str, user_id: Any, variant: str
+    ) -> bool:
+        """
+        배정 기록
+
+        Returns:
+            새 참가자이면 True (이미 배정된 사용자면 False)
+        """
+
+    @abstractmethod
+    async def get_variant(self, experiment_id: str, user_id: Any) -> Optional[str]:
+        """사용자의 배정 변형 (미배정이면 None)"""
+
+    @abstractmethod
+    async def get_user_variants(
+        self, experiment_ids: List[str], user_id: Any
+    ) -> Dict[str, str]:
+        """여러 실험의 사용자 배정 일괄 조회 (배정된 실험만 포함)"""
+
+    @abstractmethod
+    async def count_participants(
+        self, experiment_id: str, variants: List[str]
+    ) -> Dict[str, int]:
+        """변형별 참가자 수"""
+
+    @abstractmethod
+    async def clear(self, experiment_id: str, variants: List[str]) -> None:
+        """실험 배정 삭제"""
+
+
+class RedisExperimentAssignmentRegistry(ExperimentAssignmentRegistry):
+    """Redis 해시 + 집합 기반 배정 레지스트리"""
+
+    def __init__(
+        self, redis_client: redis.Redis, ttl_seconds: int = ASSIGNMENT_TTL_SECONDS
+    ):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _assignments_key(experiment_id: str) -> str:
+        return f"experiment_assignments:{experiment_id}"
+
+    @staticmethod
+    def _members_key(experiment_id: str, variant: str) -> str:
+        return f"experiment_members:{experiment_id}:{variant}"
+
+    async def record_assignment(
+        self, experiment_id: str, user_id: Any, variant: str
+    ) -> bool:
+        assignments_key = self._assignments_key(experiment_id)
+        members_key = self._members_key(experiment_id, variant)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(assignments_key, str(user_id), variant)
+            pipe.sadd(members_key, str(user_id))
+            pipe.expire(assignments_key, self.ttl_seconds)
+            pipe.expire(members_key, self.ttl_seconds)
+            created, _, _, _ = await pipe.execute()
+        return bool(created)
+
+    async def get_variant(self, experiment_id: str, user_id: Any) -> Optional[str]:
+        return await self.redis.hget(self._assignments_key(experiment_id), str(user_id))
+
+    async def get_user_variants(
+        self, experiment_ids: List[str], user_id: Any
+    ) -> Dict[str, str]:
+        if not experiment_ids:
+            return {}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for experiment_id in experiment_ids:
+                pipe.hget(self._assignments_key(experiment_id), str(user_id))
+            variants = await pipe.execute()
+        return {
+            experiment_id: variant
+            for experiment_id, variant in zip(experiment_ids, variants)
+            if variant is not None
+        }
+
+    async def count_participants(
+        self, experiment_id: str, variants: List[str]
+    ) -> Dict[str, int]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for variant in variants:
+                pipe.scard(self._members_key(experiment_id, variant))
+            counts = await pipe.execute()
+        return {variant: int(count) for variant, count in zip(variants, counts)}
+
+    async def clear(self, experiment_id: str, variants: List[str]) -> None:
+        await self.redis.delete(
+            self._assignments_key(experiment_id),
+            *(self._members_key(experiment_id, variant) for variant in variants),
+        )
+
+
+class MemoryExperimentAssignmentRegistry(ExperimentAssignmentRegistry):
+    """메모리 기반 배정 레지스트리 (테스트/개발용)"""
+
+    def __init__(self):
+        self._assignments: Dict[str, Dict[str, str]] = {}
+        self._members: Dict[tuple, Set[str]] = {}
+
+    async def record_assignment(
+        self, experiment_id: str, user_id: Any, variant: str
+    ) -> bool:
+        assignments = self._assignments.setdefault(experiment_id, {})
+        created = str(user_id) not in assignments
+        assignments.setdefault(str(user_id), variant)
+        self._members.setdefault((experiment_id, variant), set()).add(str(user_id))
+        return created
+
+    async def get_variant(self, experiment_id: str, user_id: Any) -> Optional[str]:
+        return self._assignments.get(experiment_id, {}).get(str(user_id))
+
+    async def get_user_variants(
+        self, experiment_ids: List[str], user_id: Any
+    ) -> Dict[str, str]:
+        variants = {}
+        for experiment_id in experiment_ids:
+            variant = await self.get_variant(experiment_id, user_id)
+            if variant is not None:
+                variants[experiment_id] = variant
+        return variants
+
+    async def count_participants(
+        self, experiment_id: str, variants: List[str]
+    ) -> Dict[str, int]:
+        return {
+            variant: len(self._members.get((experiment_id, variant), ()))
+            for variant in variants
+        }
+
+    async def clear(self, experiment_id: str, variants: List[str]) -> None:
+        self._assignments.pop(experiment_id, None)
+        for variant in variants:
+            self._members.pop((experiment_id, variant), None)
+
+
+def create_assignment_registry(
+    cache_service: CacheService,
+) -> ExperimentAssignmentRegistry:
+    """캐시 서비스와 같은 백엔드의 배정 레지스트리 생성 (Redis가 아니면 메모리)"""
+    if isinstance(cache_service, RedisCacheService):
+        return RedisExperimentAssignmentRegistry(cache_service.redis)
+    return MemoryExperimentAssignmentRegistry()
@@ -0,0 +1,304 @@
+"""
+랭킹 실험 이벤트 저장소
+
+실험 이벤트를 변형별 추가 전용(append-only) 로그에 기록하고
+변형별 집계 카운터(이벤트 타입별 수)를 함께 갱신한다.
+- Redis: 변형별 스트림(XADD, 최대 길이 근사 트리밍) + 변형별 카운터 해시(HINCRBY)와
+  충분통계량 스크립트를 하나의 MULTI/EXEC 파이프라인으로 기록해 동시 작성자 간
+  이벤트 유실이나 카운터 불일치가 없음
+- 메모리: 테스트/개발용 프로세스 내 구현
+결과 조회는 원본 이벤트를 다시 훑지 않고 카운터만 읽는다 (변형당 O(1)).
+
+카운터 해시에는 순차 검정용 충분통계량도 함께 쌓는다. 사용자별 이벤트 수 y와
+실험 전 공변량 x(CUPED)에 대해 Σy(이벤트 수), Σy², Σxy, Σx, Σx²를 유지한다.
+사용자 이벤트 수가 c로 증가할 때 Σy²에 2c-1을 더하므로 증가 순서와 무관하게
+합이 맞고, 사용자별 상태는 (사용자, 이벤트 타입)당 정수 하나뿐이다.
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+import redis.asyncio as redis
+
+from app.core.cache import CacheService, RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+EVENT_LOG_MAX_LENGTH = 10000  # 변형별 보관 이벤트 수
+EVENT_STORE_TTL_SECONDS = 86400 * 31
+EVENT_FIELD_PREFIX = "event:"
+SUM_SQ_FIELD_PREFIX = "sum_sq:"
+SUM_XY_FIELD_PREFIX = "sum_xy:"
+COVARIATE_SUM_FIELD = "covariate:sum"
+COVARIATE_SUM_SQ_FIELD = "covariate:sum_sq"
+
+# 사용자 이벤트 수가 c가 되면 Σy²는 c² - (c-1)² = 2c-1 만큼 증가.
+# 사용자 카운트 증가와 Σy²/Σxy 갱신을 한 스크립트로 묶어 이벤트 카운터와 같은
+# MULTI/EXEC 안에서 원자적으로 실행한다 (중간 실패 시 Σy²만 어긋나는 일이 없음).
+USER_STATISTICS_SCRIPT = """
+local count = redis.call("HINCRBY", KEYS[1], ARGV[1], 1)
+local covariate = tonumber(redis.call("HGET", KEYS[1], ARGV[2]) or "0")
+redis.call("HINCRBY", KEYS[2], ARGV[3], 2 * count - 1)
+if covariate ~= 0 then
+    redis.call("HINCRBYFLOAT", KEYS[2], ARGV[4], covariate)
+end
+redis.call("EXPIRE", KEYS[1], ARGV[5])
+return count
+"""
+
+
+def _prefixed_fields(fields: Dict[str, Any], prefix: str, cast=float) -> Dict[str, Any]:
+    return {
+        field[len(prefix) :]: cast(value)
+        for field, value in fields.items()
+        if field.startswith(prefix)
+    }
+
+
+class ExperimentEventStore(ABC):
+    """실험 이벤트 저장소 인터페이스"""
+
+    @abstractmethod
+    async def append_event(
+        self, experiment_id: str, variant: str, event_record: Dict[str, Any]
+    ) -> None:
+        """이벤트 추가 및 변형 카운터/충분통계량 갱신"""
+
+    @abstractmethod
+    async def record_covariate(
+        self, experiment_id: str, variant: str, user_id: str, value: float
+    ) -> None:
+        """사용자의 실험 전 공변량 기록 (CUPED, 배정 시 한 번)"""
+
+    @abstractmethod
+    async def get_variant_aggregates(
+        self, experiment_id: str, variants: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        변형별 집계 조회
+
+        Returns:
+            {변형: {
+                "event_counts": {이벤트 타입: int},  # Σy
+                "sum_squares": {이벤트 타입: float},  # Σy²
+                "cross_sums": {이벤트 타입: float},  # Σxy
+                "covariate_sum": float,  # Σx
+                "covariate_sum_sq": float,  # Σx²
+            }}
+        """
+
+    @abstractmethod
+    async def get_recent_events(
+        self, experiment_id: str, variant: str, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """변형의 최근 이벤트 (오래된 순)"""
+
+    @abstractmethod
+    async def clear(self, experiment_id: str, variants: List[str]) -> None:
+        """실험 이벤트/카운터 삭제"""
+
+
+class RedisExperimentEventStore(ExperimentEventStore):
+    """Redis 스트림 + 카운터 해시 기반 이벤트 저장소"""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        max_events: int = EVENT_LOG_MAX_LENGTH,
+        ttl_seconds: int = EVENT_STORE_TTL_SECONDS,
+    ):
+        self.redis = redis_client
+        self.max_events = max_events
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _stream_key(experiment_id: str, variant: str) -> str:
+        return f"experiment_events:{experiment_id}:{variant}"
+
+    @staticmethod
+    def _counters_key(experiment_id: str, variant: str) -> str:
+        return f"experiment_counters:{experiment_id}:{variant}"
+
+    @staticmethod
+    def _users_key(experiment_id: str, variant: str) -> str:
+        return f"experiment_user_counts:{experiment_id}:{variant}"
+
+    async def append_event(
+        self, experiment_id: str, variant: str, event_record: Dict[str, Any]
+    ) -> None:
+        stream_key = self._stream_key(experiment_id, variant)
+        counters_key = self._counters_key(experiment_id, variant)
+        users_key = self._users_key(experiment_id, variant)
+        event_type = event_record["event_type"]
+        user_id = event_record.get("user_id")
+        payload = json.dumps(event_record, default=str)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(
+                stream_key,
+                {"event": payload},
+                maxlen=self.max_events,
+                approximate=True,
+            )
+            pipe.hincrby(counters_key, f"{EVENT_FIELD_PREFIX}{event_type}", 1)
+            if user_id is not None:
+                pipe.eval(
+                    USER_STATISTICS_SCRIPT,
+                    2,
+                    users_key,
+                    counters_key,
+                    f"{user_id}:{event_type}",
+                    f"{user_id}:x",
+                    f"{SUM_SQ_FIELD_PREFIX}{event_type}",
+                    f"{SUM_XY_FIELD_PREFIX}{event_type}",
+                    self.ttl_seconds,
+                )
+            pipe.expire(stream_key, self.ttl_seconds)
+            pipe.expire(counters_key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def record_covariate(
+        self, experiment_id: str, variant: str, user_id: str, value: float
+    ) -> None:
+        counters_key = self._counters_key(experiment_id, variant)
+        users_key = self._users_key(experiment_id, variant)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(users_key, f"{user_id}:x", value)
+            pipe.hincrbyfloat(counters_key, COVARIATE_SUM_FIELD, value)
+            pipe.hincrbyfloat(counters_key, COVARIATE_SUM_SQ_FIELD, value * value)
+            pipe.expire(users_key, self.ttl_seconds)
+            pipe.expire(counters_key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def get_variant_aggregates(
+        self, experiment_id: str, variants: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for variant in variants:
+                pipe.hgetall(self._counters_key(experiment_id, variant))
+            counters = await pipe.execute()
+
+        aggregates = {}
+        for variant, fields in zip(variants, counters):
+            fields = fields or {}
+            aggregates[variant] = {
+                "event_counts": _prefixed_fields(fields, EVENT_FIELD_PREFIX, int),
+                "sum_squares": _prefixed_fields(fields, SUM_SQ_FIELD_PREFIX),
+                "cross_sums": _prefixed_fields(fields, SUM_XY_FIELD_PREFIX),
+                "covariate_sum": float(fields.get(COVARIATE_SUM_FIELD, 0.0)),
+                "covariate_sum_sq": float(fields.get(COVARIATE_SUM_SQ_FIELD, 0.0)),
+            }
+        return aggregates
+
+    async def get_recent_events(
+        self, experiment_id: str, variant: str, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        entries = await self.redis.xrevrange(
+            self._stream_key(experiment_id, variant), count=limit
+        )
+        return [json.loads(fields["event"]) for _, fields in reversed(entries)]
+
+    async def clear(self, experiment_id: str, variants: List[str]) -> None:
+        keys = []
+        for variant in variants:
+            keys.append(self._stream_key(experiment_id, variant))
+            keys.append(self._counters_key(experiment_id, variant))
+            keys.append(self._users_key(experiment_id, variant))
+        if keys:
+            await self.redis.delete(*keys)
+
+
+class MemoryExperimentEventStore(ExperimentEventStore):
+    """메모리 기반 이벤트 저장소 (테스트/개발용)"""
+
+    def __init__(self, max_events: int = EVENT_LOG_MAX_LENGTH):
+        self.max_events = max_events
+        self._events: Dict[tuple, Deque[Dict[str, Any]]] = {}
+        self._event_counts: Dict[tuple, Counter] = {}
+        self._sum_squares: Dict[tuple, Counter] = {}
+        self._cross_sums: Dict[tuple, Counter] = {}
+        self._covariate_sums: Dict[tuple, List[float]] = {}
+        self._user_counts: Dict[tuple, Counter] = {}
+        self._covariates: Dict[tuple, Dict[str, float]] = {}
+
+    async def append_event(
+        self, experiment_id: str, variant: str, event_record: Dict[str, Any]
+    ) -> None:
+        key = (experiment_id, variant)
+        event_type = event_record["event_type"]
+        if key not in self._events:
+            self._events[key] = deque(maxlen=self.max_events)
+        self._events[key].append(event_record)
+        self._event_counts.setdefault(key, Counter())[event_type] += 1
+
+        user_id = event_record.get("user_id")
+        if user_id is None:
+            return
+        user_counts = self._user_counts.setdefault(key, Counter())
+        user_counts[(user_id, event_type)] += 1
+        user_count = user_counts[(user_id, event_type)]
+        covariate = self._covariates.get(key, {}).get(user_id, 0.0)
+        self._sum_squares.setdefault(key, Counter())[event_type] += 2 * user_count - 1
+        self._cross_sums.setdefault(key, Counter())[event_type] += covariate
+
+    async def record_covariate(
+        self, experiment_id: str, variant: str, user_id: str, value: float
+    ) -> None:
+        key = (experiment_id, variant)
+        self._covariates.setdefault(key, {})[user_id] = value
+        sums = self._covariate_sums.setdefault(key, [0.0, 0.0])
+        sums[0] += value
+        sums[1] += value * value
+
+    async def get_variant_aggregates(
+        self, experiment_id: str, variants: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        aggregates = {}
+        for variant in variants:
+            key = (experiment_id, variant)
+            covariate_sum, covariate_sum_sq = self._covariate_sums.get(key, (0.0, 0.0))
+            aggregates[variant] = {
+                "event_counts": dict(self._event_counts.get(key, {})),
+                "sum_squares": {
+                    event_type: float(value)
+                    for event_type, value in self._sum_squares.get(key, {}).items()
+                },
+                "cross_sums": dict(self._cross_sums.get(key, {})),
+                "covariate_sum": covariate_sum,
+                "covariate_sum_sq": covariate_sum_sq,
+            }
+        return aggregates
+
+    async def get_recent_events(
+        self, experiment_id: str, variant: str, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        events = self._events.get((experiment_id, variant), ())
+        return list(events)[-limit:]
+
+    async def clear(self, experiment_id: str, variants: List[str]) -> None:
+        for variant in variants:
+            key = (experiment_id, variant)
+            self._events.pop(key, None)
+            for values in (
+                self._event_counts,
+                self._sum_squares,
+                self._cross_sums,
+                self._covariate_sums,
+                self._user_counts,
+                self._covariates,
+            ):
+                values.pop(key, None)
+
+
+def create_event_store(
+    cache_service: CacheService, max_events: Optional[int] = None
+) -> ExperimentEventStore:
+    """캐시 서비스와 같은 백엔드의 이벤트 저장소 생성 (Redis가 아니면 메모리)"""
+    max_events = max_events or EVENT_LOG_MAX_LENGTH
+    if isinstance(cache_service, RedisCacheService):
+        return RedisExperimentEventStore(cache_service.redis, max_events=max_events)
+    return MemoryExperimentEventStore(max_events=max_events)
@@ -0,0 +1,370 @@
+"""
+실시간 랭킹 WebSocket 브로드캐스트
+
+여러 uvicorn 워커에 흩어진 WebSocket 연결로 랭킹 알림을 전달한다.
+- 사용자별 Redis pub/sub 채널: 각 워커는 자신에게 연결된 사용자 채널만 구독
+- 메시지 병합: 짧은 구간 안에 같은 사용자/타입 알림이 여러 번 오면 하나로 합쳐 발행
+- 백프레셔: 연결마다 크기 제한 송신 큐, 가득 차면 가장 오래된 메시지 드롭
+  연속 드롭이 한도를 넘거나 전송이 시간 초과되면 느린 클라이언트 연결 종료
+- Redis 장애 시 현재 워커에 연결된 사용자에게만 전달하고 잠시 뒤 재시도
+- 재동기화: 드롭이 생긴 연결, Redis 장애 중 발행된 사용자에게 resync_required를
+  보내 클라이언트가 전체 순서 스냅샷을 다시 받게 함 (버전이 건너뛰어도 동일)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import redis.asyncio as redis
+from fastapi import WebSocket
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "hotly:ranking:user"
+REDIS_RETRY_SECONDS = 5.0
+COALESCE_WINDOW_SECONDS = 0.2
+SEND_QUEUE_SIZE = 32
+SEND_TIMEOUT_SECONDS = 5.0
+MAX_CONSECUTIVE_DROPS = 64
+LISTEN_POLL_SECONDS = 1.0
+RESYNC_REQUIRED = json.dumps({"type": "resync_required"})
+
+
+def coalesce_messages(pending: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    같은 타입의 대기 메시지와 새 메시지 병합
+
+    ranking_update는 트리거 타입을 모으고 갱신 검색 수는 최댓값을 유지,
+    순서 변경분(patches)은 클라이언트가 차례로 적용하도록 이어 붙인다.
+    그 외 타입은 최신 메시지로 교체한다.
+    """
+    if new.get("type") != "ranking_update":
+        return new
+
+    trigger_types = set(pending.get("trigger_types") or [pending.get("trigger_type")])
+    trigger_types.add(new.get("trigger_type"))
+    merged = {
+        **new,
+        "updated_searches": max(
+            pending.get("updated_searches", 0), new.get("updated_searches", 0)
+        ),
+        "trigger_types": sorted(t for t in trigger_types if t),
+        "coalesced": pending.get("coalesced", 1) + 1,
+    }
+    if "patches" in pending or "patches" in new:
+        merged["patches"] = pending.get("patches", []) + new.get("patches", [])
+    return merged
+
+
+class ClientConnection:
+    """WebSocket 연결 1개와 크기 제한 송신 큐"""
+
+    def __init__(self, user_id: str, websocket: WebSocket, queue_size: int) -> None:
+        self.user_id = user_id
+        self.websocket = websocket
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.consecutive_drops = 0
+        # 드롭된 메시지가 있어 다음 전송 전에 재동기화 요청을 보내야 함
+        self.resync_pending = False
+        self.sender: Optional[asyncio.Task] = None
+
+    def offer(self, payload: str) -> bool:
+        """
+        송신 큐에 메시지 추가 (가득 차면 가장 오래된 메시지 드롭)
+
+        Returns:
+            드롭 없이 추가되었는지 여부
+        """
+        dropped = False
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            self.consecutive_drops += 1
+            self.resync_pending = True
+            dropped = True
+        self.queue.put_nowait(payload)
+        return not dropped
+
+
+class RankingBroadcaster:
+    """Redis pub/sub 기반 워커 간 랭킹 알림 전달"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Optional[redis.Redis] = None,
+        channel_prefix: str = CHANNEL_PREFIX,
+        coalesce_window: float = COALESCE_WINDOW_SECONDS,
+        queue_size: int = SEND_QUEUE_SIZE,
+        send_timeout: float = SEND_TIMEOUT_SECONDS,
+        max_consecutive_drops: int = MAX_CONSECUTIVE_DROPS,
+    ):
+        self.redis_url = redis_url
+        self.channel_prefix = channel_prefix
+        self.coalesce_window = coalesce_window
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.max_consecutive_drops = max_consecutive_drops
+
+        self._client = client
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_retry_at = 0.0
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+        self._connections: Dict[str, Set[ClientConnection]] = {}
+        self._pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._flush_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        # Redis 장애 중 로컬로만 전달된 사용자 (다른 워커 연결은 놓쳤을 수 있음)
+        self._resync_users: Set[str] = set()
+        self._stats: Counter = Counter()
+
+    def _channel(self, user_id: str) -> str:
+        return f"{self.channel_prefix}:{user_id}"
+
+    # Redis ------------------------------------------------------------------
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self.redis_url is None:
+            return self._client
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = redis.from_url(
+                self.redis_url, encoding="utf-8", decode_responses=True
+            )
+            self._client_loop = loop
+            self._pubsub = None
+        return self._client
+
+    def _redis_failed(self, action: str, error: Exception) -> None:
+        self._stats["redis_errors"] += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        self._pubsub = None
+        logger.warning(f"Ranking broadcast Redis unavailable ({action}): {error}")
+
+    async def _subscribe(self, user_ids: List[str]) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            if self._pubsub is None:
+                self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(*(self._channel(uid) for uid in user_ids))
+        except Exception as e:
+            self._redis_failed("subscribe", e)
+            return
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _unsubscribe(self, user_id: str) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(self._channel(user_id))
+        except Exception as e:
+            self._redis_failed("unsubscribe", e)
+
+    async def _listen(self) -> None:
+        """구독 채널 메시지를 로컬 연결 송신 큐로 전달"""
+        prefix_length = len(self.channel_prefix) + 1
+        while self._connections:
+            pubsub = self._pubsub
+            if pubsub is None:
+                # Redis 복구 후 현재 연결된 사용자 채널 재구독
+                await asyncio.sleep(REDIS_RETRY_SECONDS)
+                if self._connections:
+                    await self._subscribe(list(self._connections))
+                continue
+            try:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=LISTEN_POLL_SECONDS
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._redis_failed("listen", e)
+                continue
+            if message and message.get("type") == "message":
+                self._stats["received"] += 1
+                self._deliver_local(message["channel"][prefix_length:], message["data"])
+
+    # 연결 관리 --------------------------------------------------------------
+
+    async def connect(self, user_id: Any, websocket: WebSocket) -> ClientConnection:
+        """WebSocket 연결 등록 (사용자의 첫 연결이면 채널 구독)"""
+        user_id = str(user_id)
+        connection = ClientConnection(user_id, websocket, self.queue_size)
+        connection.sender = asyncio.create_task(self._run_sender(connection))
+
+        first = user_id not in self._connections
+        self._connections.setdefault(user_id, set()).add(connection)
+        if first:
+            await self._subscribe([user_id])
+        return connection
+
+    async def disconnect(self, connection: ClientConnection) -> None:
+        """WebSocket 연결 해제 (사용자의 마지막 연결이면 구독 해제)"""
+        connections = self._connections.get(connection.user_id)
+        if connections is not None and connection in connections:
+            connections.discard(connection)
+            if not connections:
+                del self._connections[connection.user_id]
+                await self._unsubscribe(connection.user_id)
+
+        sender = connection.sender
+        if sender and not sender.done() and sender is not asyncio.current_task():
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+
+    def local_user_ids(self) -> List[str]:
+        """현재 워커에 연결된 사용자 ID"""
+        return list(self._connections)
+
+    async def _run_sender(self, connection: ClientConnection) -> None:
+        """연결별 송신 루프 (시간 초과/오류 시 연결 종료)"""
+        try:
+            while True:
+                payload = await connection.queue.get()
+                if connection.resync_pending:
+                    connection.resync_pending = False
+                    await asyncio.wait_for(
+                        connection.websocket.send_text(RESYNC_REQUIRED),
+                        self.send_timeout,
+                    )
+                    self._stats["resync_requested"] += 1
+                await asyncio.wait_for(
+                    connection.websocket.send_text(payload), self.send_timeout
+                )
+                connection.consecutive_drops = 0
+                self._stats["sent"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"Dropping ranking WebSocket for user {connection.user_id}: {e}"
+            )
+            await self._close(connection, "send_failures")
+
+    async def _close(self, connection: ClientConnection, reason: str) -> None:
+        self._stats[reason] += 1
+        try:
+            await connection.websocket.close()
+        except Exception:
+            pass
+        await self.disconnect(connection)
+
+    def _deliver_local(self, user_id: str, payload: str) -> None:
+        for connection in list(self._connections.get(user_id, ())):
+            if not connection.offer(payload):
+                self._stats["dropped"] += 1
+            if connection.consecutive_drops >= self.max_consecutive_drops:
+                logger.warning(f"Closing slow ranking WebSocket for user {user_id}")
+                connection.consecutive_drops = 0
+                asyncio.create_task(self._close(connection, "slow_clients"))
+
+    # 발행 -------------------------------------------------------------------
+
+    async def publish(self, user_id: Any, message: Dict[str, Any]) -> None:
+        """
+        사용자 알림 발행 (병합 구간이 끝나면 한 번에 전송)
+
+        Args:
+            user_id: 수신 사용자 ID
+            message: JSON 직렬화 가능한 메시지 (type 필드로 병합 단위 구분)
+        """
+        key = (str(user_id), message.get("type", ""))
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._pending[key] = coalesce_messages(pending, message)
+            self._stats["coalesced"] += 1
+            return
+
+        if self.coalesce_window <= 0:
+            await self._publish_now(key[0], message)
+            return
+        self._pending[key] = message
+        self._flush_tasks[key] = asyncio.create_task(self._flush_later(key))
+
+    async def _flush_later(self, key: Tuple[str, str]) -> None:
+        await asyncio.sleep(self.coalesce_window)
+        self._flush_tasks.pop(key, None)
+        message = self._pending.pop(key, None)
+        if message is not None:
+            await self._publish_now(key[0], message)
+
+    async def flush(self) -> None:
+        """병합 대기 중인 메시지 즉시 발행"""
+        for task in list(self._flush_tasks.values()):
+            task.cancel()
+        self._flush_tasks.clear()
+        pending, self._pending = self._pending, {}
+        for (user_id, _), message in pending.items():
+            await self._publish_now(user_id, message)
+
+    async def _publish_now(self, user_id: str, message: Dict[str, Any]) -> None:
+        payload = json.dumps(message)
+        client = self._get_client()
+        if client is not None:
+            try:
+                await client.publish(self._channel(user_id), payload)
+                self._stats["published"] += 1
+                await self._publish_resyncs(client)
+                return
+            except Exception as e:
+                self._redis_failed("publish", e)
+
+        # Redis 없이도 이 워커에 연결된 사용자에게는 전달
+        self._stats["published_local"] += 1
+        self._resync_users.add(user_id)
+        self._deliver_local(user_id, payload)
+
+    async def _publish_resyncs(self, client: redis.Redis) -> None:
+        """Redis 복구 후 장애 중 발행된 사용자 모든 연결에 재동기화 요청"""
+        while self._resync_users:
+            user_id = self._resync_users.pop()
+            try:
+                await client.publish(self._channel(user_id), RESYNC_REQUIRED)
+            except Exception as e:
+                self._resync_users.add(user_id)
+                self._redis_failed("publish", e)
+                return
+            self._stats["resync_requested"] += 1
+
+    async def close(self) -> None:
+        """대기 메시지 발행 후 구독/연결 정리"""
+        await self.flush()
+        for connections in list(self._connections.values()):
+            for connection in list(connections):
+                await self.disconnect(connection)
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "local_users": len(self._connections),
+            "local_connections": sum(len(c) for c in self._connections.values()),
+            "pending": len(self._pending),
+            "resync_pending_users": len(self._resync_users),
+        }
+
+
+# 같은 워커의 RealtimeRankingService 인스턴스가 공유
+ranking_broadcaster = RankingBroadcaster(redis_url=settings.REDIS_URL)
@@ -0,0 +1,88 @@
+"""
+랭킹 순서 변경분(diff) 계산
+
+클라이언트에 마지막으로 보낸 순서와 새 순서를 비교해 최소한의 이동/삽입/삭제만 전달한다.
+- 삭제: 새 순서에 없는 ID
+- 삽입: 기존 순서에 없는 ID
+- 이동: 공통 ID 중 최장 증가 부분수열(LIS)에 속하지 않는 ID (이동 수 최소)
+
+적용 순서: 삭제·이동 대상 ID 제거 후, 이동/삽입을 목표 위치 오름차순으로 끼워 넣는다.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence, Set
+
+
+def _longest_increasing_indices(values: Sequence[int]) -> Set[int]:
+    """값이 증가하는 최장 부분수열의 위치 집합 (O(n log n))"""
+    tails: List[int] = []  # 길이별 마지막 값
+    tail_positions: List[int] = []
+    previous = [-1] * len(values)
+
+    for position, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else -1
+
+    kept = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position != -1:
+        kept.add(position)
+        position = previous[position]
+    return kept
+
+
+def compute_ranking_diff(
+    old_ids: Sequence[str], new_ids: Sequence[str]
+) -> Dict[str, List[Any]]:
+    """
+    이전 순서를 새 순서로 바꾸는 최소 변경분 계산
+
+    Args:
+        old_ids: 마지막으로 전달한 결과 ID 순서
+        new_ids: 새 결과 ID 순서
+
+    Returns:
+        {"remove": [id], "move": [{"id", "to"}], "insert": [{"id", "to"}]}
+        순서가 같으면 모든 목록이 비어 있음
+    """
+    old_positions = {place_id: i for i, place_id in enumerate(old_ids)}
+    new_set = set(new_ids)
+
+    common = [place_id for place_id in new_ids if place_id in old_positions]
+    kept_positions = _longest_increasing_indices(
+        [old_positions[place_id] for place_id in common]
+    )
+    kept = {common[i] for i in kept_positions}
+
+    moves, inserts = [], []
+    for index, place_id in enumerate(new_ids):
+        if place_id in kept:
+            continue
+        op = {"id": place_id, "to": index}
+        (moves if place_id in old_positions else inserts).append(op)
+
+    return {
+        "remove": [place_id for place_id in old_ids if place_id not in new_set],
+        "move": moves,
+        "insert": inserts,
+    }
+
+
+def is_empty_diff(diff: Dict[str, List[Any]]) -> bool:
+    return not (diff["remove"] or diff["move"] or diff["insert"])
+
+
+def apply_ranking_diff(old_ids: Sequence[str], diff: Dict[str, List[Any]]) -> List[str]:
+    """변경분 적용 (클라이언트 적용 규칙과 동일)"""
+    moved = {op["id"] for op in diff["move"]}
+    removed = set(diff["remove"]) | moved
+    order = [place_id for place_id in old_ids if place_id not in removed]
+    for op in sorted(diff["move"] + diff["insert"], key=lambda op: op["to"]):
+        order.insert(op["to"], op["id"])
+    return order
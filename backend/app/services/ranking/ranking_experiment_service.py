@@ -5,22 +5,32 @@ A/B 테스트를 통한 검색 랭킹 알고리즘 성능 비교 및 최적화
 - 실험 설계 및 관리
 - 사용자 분할 및 배정
 - 실험 결과 수집 및 분석
-- 통계적 유의성 검정
+- 통계적 유의성 검정 (변형별 충분통계량 기반 mSPRT + CUPED, 상시 조회 가능)
 - 자동 승자 결정 및 배포
 """
 
-import hashlib
 import logging
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-import numpy as np
-from scipy import stats
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.cache import CacheService
+from app.services.experiments.sequential_statistics import (
+    SufficientStatistics,
+    msprt_test,
+)
+from app.services.ranking.experiment_assignment_registry import (
+    ExperimentAssignmentRegistry,
+    bucket_variant,
+    create_assignment_registry,
+)
+from app.services.ranking.experiment_event_store import (
+    ExperimentEventStore,
+    create_event_store,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,13 +63,32 @@ class MetricType(str, Enum):
     REVENUE = "revenue"
 
 
+# 사용자당 이벤트 수로 계산하는 지표 → 이벤트 타입
+METRIC_EVENT_TYPES = {
+    MetricType.CLICK_THROUGH_RATE.value: "click",
+    MetricType.CONVERSION_RATE.value: "conversion",
+}
+
+
 class RankingExperimentService:
     """랭킹 실험 서비스"""
 
-    def __init__(self, db: AsyncSession, cache_service: CacheService):
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache_service: CacheService,
+        event_store: Optional[ExperimentEventStore] = None,
+        assignment_registry: Optional[ExperimentAssignmentRegistry] = None,
+    ):
         """서비스 초기화"""
         self.db = db
         self.cache = cache_service
+        # 변형별 추가 전용 이벤트 로그 + 집계 카운터
+        self.event_store = event_store or create_event_store(cache_service)
+        # 사용자 배정 + 변형별 참가자 집합
+        self.assignments = assignment_registry or create_assignment_registry(
+            cache_service
+        )
 
         # 실험 설정
         self.default_confidence_level = 0.95
@@ -70,7 +99,8 @@ class RankingExperimentService:
         # 통계적 검정 설정
         self.alpha = 0.05  # 유의수준
         self.beta = 0.2  # 검정력 (1-beta = 0.8)
-        self.minimum_effect_size = 0.05  # 최소 효과 크기
+        self.minimum_effect_size = 0.05  # 최소 효과 크기 (mSPRT 혼합분포 표준편차)
+        self.minimum_sequential_sample_size = 30  # 변형별 최소 참가자 수
 
     async def create_experiment(
         self,
@@ -173,7 +203,7 @@ class RankingExperimentService:
             ).isoformat()
 
             # 실험별 결과 저장소 초기화
-            await self._initialize_experiment_storage(experiment_id)
+            await self._initialize_experiment_storage(experiment)
 
             # 업데이트된 실험 저장
             await self.cache.set(
@@ -214,30 +244,20 @@ class RankingExperimentService:
             if not await self._check_targeting_criteria(user_id, experiment, context):
                 return None
 
-            # 이미 할당된 변형 확인
-            assignment_key = f"experiment_assignment:{experiment_id}:{user_id}"
-            existing_assignment = await self.cache.get(assignment_key)
-            if existing_assignment:
-                return existing_assignment["variant"]
-
-            # 새로운 할당 결정
+            # 해시 기반 결정적 할당 (기존 배정 조회 없음)
             variant = self._determine_variant_assignment(experiment, user_id)
 
-            # 할당 정보 저장
-            assignment_data = {
-                "experiment_id": experiment_id,
-                "user_id": str(user_id),
-                "variant": variant,
-                "assigned_at": datetime.utcnow().isoformat(),
-                "context": context or {},
-            }
-
-            await self.cache.set(
-                assignment_key, assignment_data, ttl=86400 * 31  # 실험보다 조금 더 오래 보관
+            # 배정 기록 + 변형 참가자 집합 추가 (재배정이면 변화 없음)
+            created = await self.assignments.record_assignment(
+                experiment_id, user_id, variant
             )
 
-            # 실험 참가자 수 업데이트
-            await self._increment_participant_count(experiment_id, variant)
+            # 실험 전 지표를 CUPED 공변량으로 기록 (신규 참가자만)
+            covariate = (context or {}).get("pre_experiment_metric")
+            if created and covariate is not None:
+                await self.event_store.record_covariate(
+                    experiment_id, variant, str(user_id), float(covariate)
+                )
 
             return variant
 
@@ -268,37 +288,23 @@ class RankingExperimentService:
         """
         try:
             # 사용자 변형 할당 확인
-            assignment_key = f"experiment_assignment:{experiment_id}:{user_id}"
-            assignment = await self.cache.get(assignment_key)
+            variant = await self.assignments.get_variant(experiment_id, user_id)
 
-            if not assignment:
+            if not variant:
                 return False
 
             # 이벤트 데이터 구성
             event_record = {
                 "experiment_id": experiment_id,
                 "user_id": str(user_id),
-                "variant": assignment["variant"],
+                "variant": variant,
                 "event_type": event_type,
                 "event_data": event_data,
                 "timestamp": (timestamp or datetime.utcnow()).isoformat(),
             }
 
-            # 이벤트 저장
-            events_key = f"experiment_events:{experiment_id}"
-            events = await self.cache.get(events_key) or []
-            events.append(event_record)
-
-            # 이벤트 수 제한 (메모리 관리)
-            if len(events) > 10000:
-                events = events[-10000:]
-
-            await self.cache.set(events_key, events, ttl=86400 * 31)
-
-            # 실시간 지표 업데이트
-            await self._update_realtime_metrics(
-                experiment_id, assignment["variant"], event_record
-            )
+            # 변형별 로그에 추가하면서 집계 카운터도 함께 갱신 (원자적)
+            await self.event_store.append_event(experiment_id, variant, event_record)
 
             return True
 
@@ -315,15 +321,25 @@ class RankingExperimentService:
             if not experiment:
                 return None
 
-            # 실험 데이터 수집
-            events = await self.cache.get(f"experiment_events:{experiment_id}") or []
-            assignments = await self._get_experiment_assignments(experiment_id)
+            # 변형별 집계 조회 (원본 이벤트/참가자 목록은 다시 읽지 않음)
+            variants = list(experiment["traffic_allocation"].keys())
+            aggregates = await self.event_store.get_variant_aggregates(
+                experiment_id, variants
+            )
+            participants = await self.assignments.count_participants(
+                experiment_id, variants
+            )
 
             # 변형별 결과 분석
             variant_results = {}
-            for variant_name in experiment["traffic_allocation"].keys():
+            for variant_name in variants:
                 variant_results[variant_name] = await self._analyze_variant_results(
-                    experiment, variant_name, events, assignments
+                    experiment,
+                    variant_name,
+                    {
+                        **aggregates[variant_name],
+                        "participant_count": participants[variant_name],
+                    },
                 )
 
             # 통계적 유의성 검정
@@ -337,7 +353,9 @@ class RankingExperimentService:
                 "experiment_name": experiment["name"],
                 "status": experiment["status"],
                 "duration": self._calculate_experiment_duration(experiment),
-                "total_participants": len(assignments),
+                "total_participants": sum(
+                    result["participant_count"] for result in variant_results.values()
+                ),
                 "variant_results": variant_results,
                 "statistical_tests": statistical_tests,
                 "conclusion": self._generate_experiment_conclusion(statistical_tests),
@@ -351,31 +369,25 @@ class RankingExperimentService:
             return None
 
     async def check_experiment_completion(self, experiment_id: str) -> bool:
-        """실험 완료 조건 확인"""
+        """
+        실험 완료 조건 확인
+
+        mSPRT는 언제 조회해도 1종 오류가 유의수준 이하로 유지되므로
+        최소 실행 기간/목표 샘플 크기를 기다리지 않고 결정되는 즉시 종료한다.
+        """
         try:
             experiment = await self._get_experiment(experiment_id)
             if not experiment or experiment["status"] != ExperimentStatus.ACTIVE.value:
                 return False
 
-            # 최소 실행 시간 확인
-            started_at = datetime.fromisoformat(experiment["started_at"])
-            min_duration = timedelta(days=self.default_minimum_runtime_days)
-
-            if datetime.utcnow() - started_at < min_duration:
-                return False
-
             # 최대 실행 시간 확인
+            started_at = datetime.fromisoformat(experiment["started_at"])
             max_duration = timedelta(days=self.default_maximum_runtime_days)
             if datetime.utcnow() - started_at >= max_duration:
                 logger.info(f"Experiment {experiment_id} reached maximum duration")
                 return True
 
-            # 샘플 크기 확인
-            assignments = await self._get_experiment_assignments(experiment_id)
-            if len(assignments) < experiment["sample_size_target"]:
-                return False
-
-            # 통계적 유의성 확인
+            # 순차 검정 결정 확인 (충분통계량만 읽음)
             results = await self.get_experiment_results(experiment_id)
             if results and results["statistical_tests"]:
                 for test in results["statistical_tests"].values():
@@ -434,17 +446,10 @@ class RankingExperimentService:
     async def get_user_experiment_config(self, user_id: UUID) -> Dict[str, str]:
         """사용자별 실험 설정 조회"""
         try:
-            user_config = {}
             active_experiments = await self.cache.get("active_experiments") or []
 
-            for experiment_id in active_experiments:
-                assignment_key = f"experiment_assignment:{experiment_id}:{user_id}"
-                assignment = await self.cache.get(assignment_key)
-
-                if assignment:
-                    user_config[experiment_id] = assignment["variant"]
-
-            return user_config
+            # 활성 실험 수와 무관하게 한 번의 왕복으로 조회
+            return await self.assignments.get_user_variants(active_experiments, user_id)
 
         except Exception as e:
             logger.error(f"Failed to get user experiment config: {e}")
@@ -503,107 +508,43 @@ class RankingExperimentService:
     def _determine_variant_assignment(
         self, experiment: Dict[str, Any], user_id: UUID
     ) -> str:
-        """변형 할당 결정"""
-        # 사용자 ID 기반 해시를 사용하여 일관된 할당
-        user_hash = hashlib.md5(f"{experiment['id']}:{user_id}".encode()).hexdigest()
-
-        # 해시를 0-1 범위의 값으로 변환
-        hash_value = int(user_hash[:8], 16) / (16**8)
-
-        # 트래픽 할당 비율에 따라 변형 결정
-        cumulative_allocation = 0.0
-        for variant_name, allocation in experiment["traffic_allocation"].items():
-            cumulative_allocation += allocation
-            if hash_value <= cumulative_allocation:
-                return variant_name
-
-        # 기본값 (첫 번째 변형)
-        return list(experiment["traffic_allocation"].keys())[0]
-
-    async def _initialize_experiment_storage(self, experiment_id: str):
-        """실험별 저장소 초기화"""
-        # 이벤트 저장소
-        await self.cache.set(f"experiment_events:{experiment_id}", [], ttl=86400 * 31)
-
-        # 실시간 지표 저장소
-        await self.cache.set(f"experiment_metrics:{experiment_id}", {}, ttl=86400 * 31)
-
-    async def _increment_participant_count(self, experiment_id: str, variant: str):
-        """참가자 수 증가"""
-        metrics_key = f"experiment_metrics:{experiment_id}"
-        metrics = await self.cache.get(metrics_key) or {}
-
-        if "participant_counts" not in metrics:
-            metrics["participant_counts"] = {}
-
-        metrics["participant_counts"][variant] = (
-            metrics["participant_counts"].get(variant, 0) + 1
+        """변형 할당 결정 (사용자 ID 기반 해시를 사용하여 일관된 할당)"""
+        return bucket_variant(
+            experiment["id"], user_id, experiment["traffic_allocation"]
         )
 
-        await self.cache.set(metrics_key, metrics, ttl=86400 * 31)
-
-    async def _update_realtime_metrics(
-        self, experiment_id: str, variant: str, event_record: Dict[str, Any]
-    ):
-        """실시간 지표 업데이트"""
-        metrics_key = f"experiment_metrics:{experiment_id}"
-        metrics = await self.cache.get(metrics_key) or {}
-
-        event_type = event_record["event_type"]
-
-        # 변형별 이벤트 카운터
-        if "event_counts" not in metrics:
-            metrics["event_counts"] = {}
-
-        if variant not in metrics["event_counts"]:
-            metrics["event_counts"][variant] = {}
-
-        metrics["event_counts"][variant][event_type] = (
-            metrics["event_counts"][variant].get(event_type, 0) + 1
-        )
-
-        await self.cache.set(metrics_key, metrics, ttl=86400 * 31)
-
-    async def _get_experiment_assignments(
-        self, experiment_id: str
-    ) -> List[Dict[str, Any]]:
-        """실험 할당 목록 조회"""
-        # 실제 구현에서는 더 효율적인 조회 방법 필요
-        # 여기서는 간단한 캐시 패턴 스캔
-        assignments = []
-
-        # 캐시에서 할당 데이터 수집 (실제로는 DB나 전용 저장소 사용)
-        # 이는 예시 구현이며, 프로덕션에서는 최적화 필요
-
-        return assignments
+    async def _initialize_experiment_storage(self, experiment: Dict[str, Any]):
+        """실험별 저장소 초기화"""
+        variants = list(experiment["traffic_allocation"].keys())
+        await self.event_store.clear(experiment["id"], variants)
+        await self.assignments.clear(experiment["id"], variants)
 
     async def _analyze_variant_results(
         self,
         experiment: Dict[str, Any],
         variant_name: str,
-        events: List[Dict[str, Any]],
-        assignments: List[Dict[str, Any]],
+        aggregate: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """변형별 결과 분석"""
-        variant_events = [e for e in events if e.get("variant") == variant_name]
-        variant_assignments = [
-            a for a in assignments if a.get("variant") == variant_name
-        ]
-
+        """변형별 결과 분석 (집계 카운터 기반)"""
         results = {
             "variant_name": variant_name,
-            "participant_count": len(variant_assignments),
-            "event_counts": {},
+            "participant_count": aggregate["participant_count"],
+            "event_counts": dict(aggregate["event_counts"]),
             "conversion_metrics": {},
             "performance_metrics": {},
+            "statistics": {},
         }
 
-        # 이벤트 카운트
-        for event in variant_events:
-            event_type = event["event_type"]
-            results["event_counts"][event_type] = (
-                results["event_counts"].get(event_type, 0) + 1
-            )
+        # 지표별 충분통계량 (사용자당 이벤트 수 y, 실험 전 공변량 x)
+        for metric, event_type in METRIC_EVENT_TYPES.items():
+            results["statistics"][metric] = SufficientStatistics(
+                n=aggregate["participant_count"],
+                sum_y=aggregate["event_counts"].get(event_type, 0),
+                sum_y2=aggregate.get("sum_squares", {}).get(event_type, 0.0),
+                sum_x=aggregate.get("covariate_sum", 0.0),
+                sum_x2=aggregate.get("covariate_sum_sq", 0.0),
+                sum_xy=aggregate.get("cross_sums", {}).get(event_type, 0.0),
+            ).to_dict()
 
         # 전환율 계산
         if results["participant_count"] > 0:
@@ -645,8 +586,8 @@ class RankingExperimentService:
         for treatment_variant in treatment_variants:
             treatment_results = variant_results[treatment_variant]
 
-            # 클릭률 비교 (비율 검정)
-            test_result = self._perform_proportion_test(
+            # 클릭률 비교 (순차 검정)
+            test_result = self._perform_sequential_test(
                 control_results, treatment_results, "click_through_rate"
             )
 
@@ -654,71 +595,60 @@ class RankingExperimentService:
 
         return tests
 
-    def _perform_proportion_test(
+    def _perform_sequential_test(
         self,
         control_results: Dict[str, Any],
         treatment_results: Dict[str, Any],
         metric: str,
     ) -> Dict[str, Any]:
-        """비율 검정 수행"""
+        """mSPRT 순차 검정 수행 (CUPED 보정, 상시 유효 p-값/신뢰 수열)"""
         try:
-            control_rate = control_results["conversion_metrics"].get(metric, 0)
-            treatment_rate = treatment_results["conversion_metrics"].get(metric, 0)
+            control = SufficientStatistics.from_dict(
+                control_results["statistics"][metric]
+            )
+            treatment = SufficientStatistics.from_dict(
+                treatment_results["statistics"][metric]
+            )
 
-            control_n = control_results["participant_count"]
-            treatment_n = treatment_results["participant_count"]
+            result = {
+                "metric": metric,
+                "control_rate": control.mean,
+                "treatment_rate": treatment.mean,
+                "control_sample_size": control.n,
+                "treatment_sample_size": treatment.n,
+            }
 
-            if control_n < 30 or treatment_n < 30:
+            if min(control.n, treatment.n) < self.minimum_sequential_sample_size:
                 return {
-                    "metric": metric,
-                    "test_type": "proportion_test",
+                    **result,
+                    "test_type": "msprt",
                     "statistically_significant": False,
                     "insufficient_sample_size": True,
                     "p_value": None,
-                    "effect_size": treatment_rate - control_rate,
+                    "effect_size": treatment.mean - control.mean,
                     "confidence_interval": None,
                 }
 
-            # Z 검정 수행
-            control_successes = int(control_rate * control_n)
-            treatment_successes = int(treatment_rate * treatment_n)
-
-            # scipy.stats를 사용한 비율 검정
-            z_stat, p_value = stats.proportions_ztest(
-                [control_successes, treatment_successes], [control_n, treatment_n]
-            )
-
-            # 효과 크기 (절대 차이)
-            effect_size = treatment_rate - control_rate
-
-            # 신뢰구간 계산
-            se = np.sqrt(
-                (control_rate * (1 - control_rate) / control_n)
-                + (treatment_rate * (1 - treatment_rate) / treatment_n)
+            test = msprt_test(
+                control, treatment, alpha=self.alpha, tau=self.minimum_effect_size
             )
 
-            ci_lower = effect_size - 1.96 * se
-            ci_upper = effect_size + 1.96 * se
-
             return {
-                "metric": metric,
-                "test_type": "proportion_test",
-                "statistically_significant": p_value < self.alpha,
-                "p_value": float(p_value),
-                "z_statistic": float(z_stat),
-                "effect_size": effect_size,
-                "confidence_interval": [ci_lower, ci_upper],
-                "control_rate": control_rate,
-                "treatment_rate": treatment_rate,
-                "control_sample_size": control_n,
-                "treatment_sample_size": treatment_n,
+                **result,
+                "test_type": test["test_type"],
+                "statistically_significant": test["decided"],
+                "p_value": test["p_value"],
+                "likelihood_ratio": test["likelihood_ratio"],
+                "effect_size": test["effect_size"],
+                "confidence_interval": test["confidence_interval"],
+                "variance_reduction": test["variance_reduction"],
             }
 
         except Exception as e:
-            logger.error(f"Failed to perform proportion test: {e}")
+            logger.error(f"Failed to perform sequential test: {e}")
             return {
                 "metric": metric,
-                "test_type": "proportion_test",
+                "test_type": "msprt",
                 "error": str(e),
                 "statistically_significant": False,
             }
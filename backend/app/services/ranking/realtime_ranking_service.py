@@ -5,14 +5,16 @@
 - 실시간 사용자 행동 추적
 - 컨텍스트 변화 감지 (위치, 시간, 날씨 등)
 - 인기도 실시간 업데이트
-- 랭킹 무효화 및 재계산 트리거
-- WebSocket을 통한 실시간 알림
+- 랭킹 재계산 트리거 (관련 요인만 재계산, 순서 변경분만 전송)
+- 변경분은 세션별 버전을 가지며, 클라이언트는 버전이 건너뛰거나 resync_required를
+  받으면 resync를 요청해 전체 순서 스냅샷(ranking_snapshot)으로 맞춘다
+- WebSocket을 통한 실시간 알림 (Redis pub/sub으로 워커 간 전달)
 """
 
 import asyncio
 import json
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
@@ -20,10 +22,28 @@ from fastapi import WebSocket
 
 from app.core.cache import CacheService
 from app.services.ml.ml_engine import MLEngine
+from app.services.ranking.activity_counters import ActivityCounters, activity_counters
+from app.services.ranking.ranking_broadcaster import (
+    ClientConnection,
+    RankingBroadcaster,
+    ranking_broadcaster,
+)
+from app.services.ranking.ranking_diff import compute_ranking_diff, is_empty_diff
 from app.services.search.search_ranking_service import SearchRankingService
+from app.utils.distance_calculator import DistanceCalculator
 
 logger = logging.getLogger(__name__)
 
+# 트리거별 재계산 대상 랭킹 요인 (그 외 트리거는 전체 재랭킹)
+TRIGGER_FACTORS: Dict[str, Set[str]] = {
+    "location": {"contextual"},  # 거리 기반 조정
+    "time": {"contextual"},  # 시간대 조정
+    "weather": {"contextual"},
+    "context_update": {"contextual"},
+    "popularity": {"behavior_score", "real_time"},
+    "activity_change": {"behavior_score", "real_time"},
+}
+
 
 class RealtimeRankingService:
     """실시간 랭킹 업데이트 서비스"""
@@ -33,14 +53,21 @@ class RealtimeRankingService:
         cache_service: CacheService,
         ml_engine: MLEngine,
         ranking_service: SearchRankingService,
+        counters: Optional[ActivityCounters] = None,
+        broadcaster: Optional[RankingBroadcaster] = None,
     ):
         """서비스 초기화"""
         self.cache = cache_service
         self.ml_engine = ml_engine
         self.ranking_service = ranking_service
+        self.counters = counters or activity_counters
+        # WebSocket 연결 관리 (워커 간 Redis pub/sub 전달)
+        self.broadcaster = broadcaster or ranking_broadcaster
+
+        self._distance = DistanceCalculator(db=None)
 
-        # 활성 WebSocket 연결 관리
-        self.active_connections: Dict[str, WebSocket] = {}
+        # 마지막으로 알린 장소별 인기도 (변화 감지용, 활성 장소만 유지)
+        self._last_popularity: Dict[str, float] = {}
 
         # 실시간 업데이트 설정
         self.update_intervals = {
@@ -98,12 +125,15 @@ class RealtimeRankingService:
 
         self._background_tasks.clear()
 
+        # 병합 대기 중인 알림 발행
+        await self.broadcaster.flush()
+
         logger.info("Realtime ranking updates stopped")
 
     async def register_websocket(self, websocket: WebSocket, user_id: str):
         """WebSocket 연결 등록"""
         await websocket.accept()
-        self.active_connections[user_id] = websocket
+        connection = await self.broadcaster.connect(user_id, websocket)
 
         logger.info(f"WebSocket connection registered for user {user_id}")
 
@@ -115,7 +145,9 @@ class RealtimeRankingService:
             while True:
                 try:
                     data = await websocket.receive_text()
-                    await self._handle_websocket_message(user_id, json.loads(data))
+                    await self._handle_websocket_message(
+                        user_id, json.loads(data), connection
+                    )
                 except Exception as e:
                     logger.error(
                         f"WebSocket message handling error for user {user_id}: {e}"
@@ -125,8 +157,7 @@ class RealtimeRankingService:
         except Exception as e:
             logger.error(f"WebSocket error for user {user_id}: {e}")
         finally:
-            if user_id in self.active_connections:
-                del self.active_connections[user_id]
+            await self.broadcaster.disconnect(connection)
             logger.info(f"WebSocket connection closed for user {user_id}")
 
     async def trigger_ranking_update(
@@ -161,18 +192,35 @@ class RealtimeRankingService:
             if not active_searches:
                 return False
 
-            # 각 활성 검색에 대해 랭킹 업데이트
-            updated_count = 0
+            # 각 활성 검색에 대해 랭킹 업데이트 (순서가 바뀐 세션의 변경분만 수집)
+            previous_states = [
+                self._session_state(search_session)
+                for search_session in active_searches
+            ]
+            patches = []
             for search_session in active_searches:
-                updated = await self._update_search_ranking(
+                patch = await self._update_search_ranking(
                     user_id, search_session, trigger_type, context
                 )
-                if updated:
-                    updated_count += 1
+                if patch:
+                    patches.append(patch)
+            updated_count = len(patches)
+
+            # 순서가 그대로여도 요인 기여도/컨텍스트가 바뀌었으면 세션 저장
+            state_changed = any(
+                self._session_state(search_session) != previous
+                for search_session, previous in zip(active_searches, previous_states)
+            )
+            if updated_count > 0 or state_changed:
+                await self.cache.set(
+                    f"active_searches:{user_id}", active_searches, ttl=3600
+                )
 
-            # WebSocket으로 업데이트 알림
+            # 순서 변경분만 알림
             if updated_count > 0:
-                await self._notify_ranking_update(user_id, trigger_type, updated_count)
+                await self._notify_ranking_update(
+                    user_id, trigger_type, updated_count, patches
+                )
 
             logger.info(
                 f"Triggered ranking update for user {user_id}: "
@@ -186,27 +234,29 @@ class RealtimeRankingService:
             return False
 
     async def update_popularity_scores(self, place_ids: List[UUID]) -> bool:
-        """장소 인기도 점수 실시간 업데이트"""
+        """장소 인기도 점수 실시간 업데이트 (스트리밍 카운터에서 일괄 조회)"""
         try:
-            popularity_updates = {}
-
-            for place_id in place_ids:
-                # 최근 활동 데이터 수집
-                recent_activity = await self._collect_recent_activity(place_id)
+            # 시간이 바뀌었으면 감쇠 적용 (워커 간 1회)
+            await self.counters.apply_decay()
 
-                # 인기도 점수 계산
-                new_popularity = self._calculate_popularity_score(recent_activity)
+            new_scores = await self.counters.get_popularity(place_ids)
 
-                # 기존 점수와 비교
-                current_popularity = await self._get_current_popularity(place_id)
-
-                if self._should_update_popularity(current_popularity, new_popularity):
-                    popularity_updates[str(place_id)] = new_popularity
+            # 마지막으로 알린 점수와 비교
+            popularity_updates = {
+                place_id: popularity
+                for place_id, popularity in new_scores.items()
+                if self._should_update_popularity(
+                    self._last_popularity.get(place_id, 0.0), popularity
+                )
+            }
+            self._last_popularity = {
+                place_id: popularity_updates.get(
+                    place_id, self._last_popularity.get(place_id, 0.0)
+                )
+                for place_id in new_scores
+            }
 
             if popularity_updates:
-                # 캐시 업데이트
-                await self._update_popularity_cache(popularity_updates)
-
                 # 영향받는 사용자들에게 알림
                 await self._notify_popularity_changes(popularity_updates)
 
@@ -223,9 +273,8 @@ class RealtimeRankingService:
     async def detect_trending_places(self) -> List[Dict[str, Any]]:
         """트렌딩 장소 감지"""
         try:
-            # 최근 활동 데이터 분석
-            recent_window = datetime.utcnow() - timedelta(hours=6)
-            trend_data = await self._analyze_trending_activity(recent_window)
+            # 단기/장기 감쇠 카운터 비교
+            trend_data = await self.counters.get_trending_places()
 
             # 트렌드 점수 계산
             trending_places = []
@@ -296,8 +345,8 @@ class RealtimeRankingService:
         """컨텍스트 변화 모니터링 배경 작업"""
         while self._is_running:
             try:
-                # 활성 사용자들의 컨텍스트 변화 감지
-                active_users = list(self.active_connections.keys())
+                # 이 워커에 연결된 사용자들의 컨텍스트 변화 감지
+                active_users = self.broadcaster.local_user_ids()
 
                 for user_id in active_users:
                     await self._monitor_user_context(UUID(user_id))
@@ -397,84 +446,174 @@ class RealtimeRankingService:
         search_session: Dict[str, Any],
         trigger_type: str,
         context: Optional[Dict[str, Any]],
-    ) -> bool:
-        """특정 검색 세션의 랭킹 업데이트"""
+    ) -> Optional[Dict[str, Any]]:
+        """
+        특정 검색 세션의 랭킹 업데이트
+
+        트리거와 관련된 요인만 다시 계산하고 (이전 요인 기여도가 없으면 전체 재랭킹),
+        마지막으로 보낸 순서와 비교한 최소 변경분을 만든다.
+
+        Returns:
+            클라이언트에 보낼 변경분 (순서 변화가 없으면 None)
+        """
         try:
-            # 검색 결과 재랭킹
             search_results = search_session.get("results", [])
             if not search_results:
-                return False
+                return None
 
-            # 새로운 컨텍스트로 랭킹 재계산
+            # 새로운 컨텍스트 반영
             updated_context = search_session.get("context", {})
             if context:
                 updated_context.update(context)
+            search_session["context"] = updated_context
+            if trigger_type == "location":
+                self._refresh_distances(search_results, updated_context)
 
-            # 랭킹 서비스를 통해 재계산
-            new_ranking = await self.ranking_service.rank_search_results(
-                user_id=user_id,
-                search_results=search_results,
-                query=search_session.get("query"),
-                context=updated_context,
-                personalization_strength=0.7,
+            factors = TRIGGER_FACTORS.get(trigger_type)
+            factor_scores = search_session.get("factor_scores") or {}
+            incremental = factors and all(
+                result.get("id") in factor_scores for result in search_results
             )
 
-            # 랭킹이 실제로 변경되었는지 확인
-            if self._has_ranking_changed(search_results, new_ranking):
-                # 새 랭킹 저장
-                search_session["results"] = new_ranking
-                search_session["last_updated"] = datetime.utcnow().isoformat()
-                search_session["update_trigger"] = trigger_type
-
-                # 캐시 업데이트
-                cache_key = f"active_searches:{user_id}"
-                active_searches = await self.cache.get(cache_key) or []
-
-                for i, search in enumerate(active_searches):
-                    if search.get("session_id") == search_session.get("session_id"):
-                        active_searches[i] = search_session
-                        break
-
-                await self.cache.set(cache_key, active_searches, ttl=3600)
-
-                return True
-
-            return False
+            if incremental:
+                new_ranking = await self._rescore_search_results(
+                    user_id, search_results, updated_context, factors, factor_scores
+                )
+            else:
+                new_ranking = await self.ranking_service.rank_search_results(
+                    user_id=user_id,
+                    search_results=search_results,
+                    query=search_session.get("query"),
+                    context=updated_context,
+                    personalization_strength=0.7,
+                )
+                factor_scores = {
+                    result.get("id"): self.ranking_service.factor_contributions(result)
+                    for result in new_ranking
+                }
+                if not all(factor_scores.values()):
+                    factor_scores = {}  # 대체 랭킹 결과는 요인 정보 없음
+                # 요인 객체는 캐시(JSON)에 넣지 않고 기여도만 보관
+                new_ranking = [
+                    {k: v for k, v in result.items() if k != "ranking_factors"}
+                    for result in new_ranking
+                ]
+
+            search_session["results"] = new_ranking
+            search_session["factor_scores"] = factor_scores
+
+            # 마지막으로 보낸 순서 대비 변경분
+            pushed_order = search_session.get("pushed_order") or [
+                result.get("id") for result in search_results
+            ]
+            new_order = [result.get("id") for result in new_ranking]
+            diff = compute_ranking_diff(pushed_order, new_order)
+            if is_empty_diff(diff):
+                return None
+
+            version = search_session.get("ranking_version", 0) + 1
+            search_session["pushed_order"] = new_order
+            search_session["ranking_version"] = version
+            search_session["last_updated"] = datetime.utcnow().isoformat()
+            search_session["update_trigger"] = trigger_type
+
+            return {
+                "session_id": search_session.get("session_id"),
+                "version": version,
+                **diff,
+            }
 
         except Exception as e:
             logger.error(f"Failed to update search ranking: {e}")
-            return False
+            return None
+
+    def _session_state(self, search_session: Dict[str, Any]) -> str:
+        """저장 여부 판단용 세션 상태 (컨텍스트 + 요인 기여도, 제자리 수정 대비 직렬화)"""
+        return json.dumps(
+            {
+                "context": search_session.get("context"),
+                "factor_scores": search_session.get("factor_scores"),
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    async def _rescore_search_results(
+        self,
+        user_id: UUID,
+        search_results: List[Dict[str, Any]],
+        context: Dict[str, Any],
+        factors: Set[str],
+        factor_scores: Dict[str, Dict[str, float]],
+    ) -> List[Dict[str, Any]]:
+        """트리거 관련 요인만 재계산해 재정렬 (나머지 요인은 이전 기여도 재사용)"""
+        rescored = await self.ranking_service.rescore_factors(
+            user_id, search_results, context, factors
+        )
+        for result in search_results:
+            scores = factor_scores[result.get("id")]
+            scores.update(rescored.get(result.get("id"), {}))
+            result["final_rank_score"] = self.ranking_service.score_from_contributions(
+                scores
+            )
+
+        ranked = sorted(
+            search_results, key=lambda x: x["final_rank_score"], reverse=True
+        )
+        if context.get("diversity_enabled", True):
+            ranked = await self.ranking_service._apply_diversity_injection(
+                ranked, context.get("diversity_threshold", 0.3)
+            )
+        for idx, result in enumerate(ranked):
+            result["final_rank"] = idx + 1
+        return ranked
+
+    def _refresh_distances(
+        self, search_results: List[Dict[str, Any]], context: Dict[str, Any]
+    ) -> None:
+        """새 위치 기준으로 결과별 거리(distance_km) 갱신"""
+        latitude, longitude = context.get("latitude"), context.get("longitude")
+        if latitude is None or longitude is None:
+            return
+        for result in search_results:
+            if result.get("latitude") is None or result.get("longitude") is None:
+                continue
+            result["distance_km"] = self._distance.haversine_distance(
+                latitude, longitude, result["latitude"], result["longitude"]
+            )
 
     async def _notify_ranking_update(
-        self, user_id: UUID, trigger_type: str, updated_count: int
+        self,
+        user_id: UUID,
+        trigger_type: str,
+        updated_count: int,
+        patches: Optional[List[Dict[str, Any]]] = None,
     ):
-        """랭킹 업데이트 알림"""
-        user_id_str = str(user_id)
-
-        if user_id_str in self.active_connections:
-            try:
-                websocket = self.active_connections[user_id_str]
-
-                message = {
-                    "type": "ranking_update",
-                    "trigger_type": trigger_type,
-                    "updated_searches": updated_count,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
+        """랭킹 업데이트 알림 (사용자가 연결된 워커로 전달, 짧은 구간 내 병합)"""
+        try:
+            message = {
+                "type": "ranking_update",
+                "trigger_type": trigger_type,
+                "updated_searches": updated_count,
+                "patches": patches or [],
+                "timestamp": datetime.utcnow().isoformat(),
+            }
 
-                await websocket.send_text(json.dumps(message))
+            await self.broadcaster.publish(user_id, message)
 
-            except Exception as e:
-                logger.error(f"Failed to send ranking update notification: {e}")
+        except Exception as e:
+            logger.error(f"Failed to send ranking update notification: {e}")
 
     async def _send_initial_state(self, websocket: WebSocket, user_id: str):
         """초기 상태 전송"""
         try:
+            # 연결이 끊긴 동안 놓친 변경분 대신 현재 전체 순서를 함께 전송
             initial_state = {
                 "type": "initial_state",
                 "user_id": user_id,
                 "connected_at": datetime.utcnow().isoformat(),
                 "realtime_updates_enabled": True,
+                "searches": await self._ranking_snapshot(UUID(user_id)),
             }
 
             await websocket.send_text(json.dumps(initial_state))
@@ -482,16 +621,27 @@ class RealtimeRankingService:
         except Exception as e:
             logger.error(f"Failed to send initial state: {e}")
 
-    async def _handle_websocket_message(self, user_id: str, message: Dict[str, Any]):
+    async def _handle_websocket_message(
+        self, user_id: str, message: Dict[str, Any], connection: ClientConnection
+    ):
         """WebSocket 메시지 처리"""
         try:
             message_type = message.get("type")
 
             if message_type == "ping":
-                # 연결 유지 응답
-                await self.active_connections[user_id].send_text(
-                    json.dumps({"type": "pong"})
-                )
+                # 연결 유지 응답 (해당 연결에만)
+                connection.offer(json.dumps({"type": "pong"}))
+
+            elif message_type == "resync":
+                # 변경분 유실/버전 건너뜀 시 전체 순서 재전송 (해당 연결에만)
+                snapshot = {
+                    "type": "ranking_snapshot",
+                    "searches": await self._ranking_snapshot(
+                        UUID(user_id), message.get("session_ids")
+                    ),
+                    "timestamp": datetime.utcnow().isoformat(),
+                }
+                connection.offer(json.dumps(snapshot))
 
             elif message_type == "register_search":
                 # 새 검색 세션 등록
@@ -506,6 +656,25 @@ class RealtimeRankingService:
         except Exception as e:
             logger.error(f"Failed to handle WebSocket message: {e}")
 
+    async def _ranking_snapshot(
+        self, user_id: UUID, session_ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        활성 검색 세션별 마지막으로 보낸 전체 순서와 버전
+
+        클라이언트는 이 버전 이하의 변경분은 버리고, 다음 버전부터 적용한다.
+        """
+        return [
+            {
+                "session_id": session.get("session_id"),
+                "version": session.get("ranking_version", 0),
+                "order": session.get("pushed_order")
+                or [result.get("id") for result in session.get("results", [])],
+            }
+            for session in await self._get_active_searches(user_id)
+            if session_ids is None or session.get("session_id") in session_ids
+        ]
+
     async def _register_search_session(
         self, user_id: UUID, search_data: Dict[str, Any]
     ):
@@ -519,6 +688,10 @@ class RealtimeRankingService:
                 "session_id": search_data.get("session_id"),
                 "query": search_data.get("query"),
                 "results": search_data.get("results", []),
+                "pushed_order": [
+                    result.get("id") for result in search_data.get("results", [])
+                ],
+                "ranking_version": 0,
                 "context": search_data.get("context", {}),
                 "created_at": datetime.utcnow().isoformat(),
                 "last_updated": datetime.utcnow().isoformat(),
@@ -535,64 +708,6 @@ class RealtimeRankingService:
         except Exception as e:
             logger.error(f"Failed to register search session: {e}")
 
-    async def _collect_recent_activity(self, place_id: UUID) -> Dict[str, Any]:
-        """최근 장소 활동 데이터 수집"""
-        try:
-            # 캐시에서 최근 활동 데이터 조회
-            activity_key = f"place_activity:{place_id}"
-            recent_activity = await self.cache.get(activity_key) or {
-                "views": 0,
-                "clicks": 0,
-                "bookmarks": 0,
-                "visits": 0,
-                "shares": 0,
-                "last_updated": datetime.utcnow().isoformat(),
-            }
-
-            return recent_activity
-
-        except Exception as e:
-            logger.error(f"Failed to collect recent activity: {e}")
-            return {}
-
-    def _calculate_popularity_score(self, activity_data: Dict[str, Any]) -> float:
-        """활동 데이터를 기반으로 인기도 점수 계산"""
-        if not activity_data:
-            return 0.0
-
-        # 활동별 가중치
-        weights = {
-            "views": 1.0,
-            "clicks": 2.0,
-            "bookmarks": 4.0,
-            "visits": 5.0,
-            "shares": 3.0,
-        }
-
-        total_score = 0.0
-        total_activities = 0
-
-        for activity_type, weight in weights.items():
-            count = activity_data.get(activity_type, 0)
-            total_score += count * weight
-            total_activities += count
-
-        if total_activities == 0:
-            return 0.0
-
-        # 정규화된 점수 (0-1 범위)
-        normalized_score = min(1.0, total_score / (total_activities * 10))
-
-        return normalized_score
-
-    async def _get_current_popularity(self, place_id: UUID) -> float:
-        """현재 인기도 점수 조회"""
-        try:
-            cache_key = f"popularity_score:{place_id}"
-            return await self.cache.get(cache_key) or 0.0
-        except Exception:
-            return 0.0
-
     def _should_update_popularity(self, current: float, new: float) -> bool:
         """인기도 업데이트 필요 여부 확인"""
         if current == 0.0:
@@ -601,15 +716,6 @@ class RealtimeRankingService:
         change_percent = abs(new - current) / current
         return change_percent >= self.update_thresholds["popularity_change_percent"]
 
-    async def _update_popularity_cache(self, popularity_updates: Dict[str, float]):
-        """인기도 캐시 업데이트"""
-        try:
-            for place_id, popularity in popularity_updates.items():
-                cache_key = f"popularity_score:{place_id}"
-                await self.cache.set(cache_key, popularity, ttl=3600)
-        except Exception as e:
-            logger.error(f"Failed to update popularity cache: {e}")
-
     def _calculate_trend_score(self, place_data: Dict[str, Any]) -> float:
         """트렌드 점수 계산"""
         activity_increase = place_data.get("activity_increase", 0.0)
@@ -621,35 +727,10 @@ class RealtimeRankingService:
 
         return min(1.0, max(0.0, trend_score))
 
-    def _has_ranking_changed(
-        self, old_results: List[Dict[str, Any]], new_results: List[Dict[str, Any]]
-    ) -> bool:
-        """랭킹 변경 여부 확인"""
-        if len(old_results) != len(new_results):
-            return True
-
-        # 상위 5개 결과의 순서 변경 확인
-        top_count = min(5, len(old_results))
-
-        for i in range(top_count):
-            old_id = old_results[i].get("id")
-            new_id = new_results[i].get("id")
-
-            if old_id != new_id:
-                return True
-
-        return False
-
     # 추가 도우미 메서드들 (간단한 구현)
-    async def _get_recently_active_places(self) -> List[UUID]:
-        """최근 활발한 장소 목록 조회"""
-        # 실제 구현에서는 DB에서 최근 활동이 있는 장소들을 조회
-        return []
-
-    async def _analyze_trending_activity(self, since: datetime) -> List[Dict[str, Any]]:
-        """트렌딩 활동 분석"""
-        # 실제 구현에서는 시계열 데이터 분석
-        return []
+    async def _get_recently_active_places(self) -> List[str]:
+        """최근 1시간 활동량 상위 장소 목록 조회"""
+        return await self.counters.get_active_places()
 
     async def _monitor_user_context(self, user_id: UUID):
         """사용자 컨텍스트 모니터링"""
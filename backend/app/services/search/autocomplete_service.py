@@ -9,7 +9,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
 import redis.asyncio as redis
@@ -17,8 +17,14 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db.elasticsearch import es_manager
+from app.db.session import SessionLocal
 from app.models.place import Place, PlaceStatus
-from app.utils.korean_analyzer import KoreanAnalyzer
+from app.services.search.suggestion_index import (
+    SuggestionEntry,
+    SuggestionIndexRegistry,
+    suggestion_indexes,
+)
+from app.utils.korean_analyzer import korean_analyzer
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +32,16 @@ logger = logging.getLogger(__name__)
 class AutocompleteService:
     """고도화된 자동완성 서비스"""
 
-    def __init__(self, db: Session, redis_client: Optional[redis.Redis] = None):
+    def __init__(
+        self,
+        db: Session,
+        redis_client: Optional[redis.Redis] = None,
+        suggestion_index: Optional[SuggestionIndexRegistry] = None,
+    ):
         self.db = db
         self.redis = redis_client
-        self.korean_analyzer = KoreanAnalyzer()
+        self.korean_analyzer = korean_analyzer
+        self.suggestion_index = suggestion_index or suggestion_indexes
 
         # 자동완성 설정
         self.min_query_length = 1
@@ -191,30 +203,36 @@ class AutocompleteService:
             if not self.redis:
                 return []
 
-            trending_suggestions = []
-
-            # 최근 24시간 인기 검색어
+            # 최근 24시간 인기 검색어 (주기적으로 접두사 색인에 반영)
             trending_key = f"trending_searches:{datetime.now().strftime('%Y%m%d')}"
-            trending_data = await self.redis.zrevrangebyscore(
-                trending_key, "+inf", "-inf", withscores=True, start=0, num=100
-            )
-
-            for search_term, score in trending_data:
-                if isinstance(search_term, bytes):
-                    search_term = search_term.decode()
+            if self.suggestion_index.trending_needs_refresh(trending_key):
+                trending_data = await self.redis.zrevrangebyscore(
+                    trending_key, "+inf", "-inf", withscores=True, start=0, num=100
+                )
+                self.suggestion_index.refresh_trending(
+                    trending_key,
+                    [
+                        (
+                            term.decode() if isinstance(term, bytes) else term,
+                            float(score),
+                        )
+                        for term, score in trending_data
+                    ],
+                )
 
-                if query.lower() in search_term.lower():
-                    trending_suggestions.append(
-                        {
-                            "text": search_term,
-                            "type": "trending",
-                            "score": float(score) * 1.5,  # 트렌딩 가중치
-                            "metadata": {
-                                "source": "trending",
-                                "trend_score": float(score),
-                            },
-                        }
-                    )
+            trending_suggestions = []
+            for entry in self.suggestion_index.trending.search(query, limit):
+                trending_suggestions.append(
+                    {
+                        "text": entry.text,
+                        "type": "trending",
+                        "score": entry.score * 1.5,  # 트렌딩 가중치
+                        "metadata": {
+                            "source": "trending",
+                            "trend_score": entry.score,
+                        },
+                    }
+                )
 
             return trending_suggestions[:limit]
 
@@ -227,9 +245,14 @@ class AutocompleteService:
     ) -> List[Dict[str, Any]]:
         """인기 검색어 제안"""
         try:
+            if self.suggestion_index.is_ready:
+                # 다른 워커의 변경은 백그라운드에서 반영 (기존 색인으로 응답)
+                self.suggestion_index.refresh_if_stale(SessionLocal)
+                return self._get_indexed_popular_suggestions(query, limit, categories)
+
             popular_suggestions = []
 
-            # 데이터베이스에서 인기 장소 검색
+            # 색인 준비 전에는 데이터베이스에서 인기 장소 검색
             base_query = self.db.query(
                 Place, func.count().label("search_count")
             ).filter(
@@ -269,6 +292,51 @@ class AutocompleteService:
             logger.error(f"Popular suggestions failed: {e}")
             return []
 
+    def _get_indexed_popular_suggestions(
+        self, query: str, limit: int, categories: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """접두사 색인 기반 인기 장소/태그 제안"""
+        predicate: Optional[Callable[[SuggestionEntry], bool]] = None
+        if categories:
+            category_set = set(categories)
+
+            def in_categories(entry: SuggestionEntry) -> bool:
+                return entry.payload.get("category") in category_set
+
+            predicate = in_categories
+
+        popular_suggestions = []
+        for entry in self.suggestion_index.places.search(query, limit, predicate):
+            place_count = entry.payload.get("place_count", 1)
+            popular_suggestions.append(
+                {
+                    "text": entry.text,
+                    "type": "popular_place",
+                    "score": 1.8 + place_count * 0.1,  # 인기도 점수
+                    "category": entry.payload.get("category"),
+                    "address": entry.payload.get("address"),
+                    "metadata": {
+                        "source": "popular",
+                        "search_count": place_count,
+                        "place_id": entry.payload.get("place_id"),
+                    },
+                }
+            )
+
+        if not categories:
+            for entry in self.suggestion_index.tags.search(query, limit):
+                usage_count = entry.payload.get("usage_count", 1)
+                popular_suggestions.append(
+                    {
+                        "text": entry.text,
+                        "type": "popular_tag",
+                        "score": 1.5 + usage_count * 0.05,
+                        "metadata": {"source": "tags", "usage_count": usage_count},
+                    }
+                )
+
+        return popular_suggestions
+
     async def _get_elasticsearch_suggestions(
         self,
         user_id: UUID,
@@ -343,15 +411,14 @@ class AutocompleteService:
                     unique_suggestions.append(suggestion)
 
             # 한국어 분석을 통한 관련도 점수 조정
-            analyzed_query = self.korean_analyzer.analyze_text(query)
-            query_keywords = set(analyzed_query.get("keywords", [query]))
+            query_keywords = set(self.korean_analyzer.extract_keywords(query))
+            keyword_lists = self.korean_analyzer.extract_keywords_many(
+                suggestion["text"] for suggestion in unique_suggestions
+            )
 
-            for suggestion in unique_suggestions:
+            for suggestion, keywords in zip(unique_suggestions, keyword_lists):
                 # 텍스트 유사도 계산
-                suggestion_analyzed = self.korean_analyzer.analyze_text(
-                    suggestion["text"]
-                )
-                suggestion_keywords = set(suggestion_analyzed.get("keywords", []))
+                suggestion_keywords = set(keywords)
 
                 # 키워드 겹침 정도로 관련도 점수 조정
                 overlap = len(query_keywords & suggestion_keywords)
@@ -396,7 +463,7 @@ class AutocompleteService:
                 categories["personal"].append(suggestion)
             elif suggestion_type == "trending":
                 categories["trending"].append(suggestion)
-            elif suggestion_type in ["popular_place", "popular"]:
+            elif suggestion_type in ["popular_place", "popular_tag", "popular"]:
                 categories["popular"].append(suggestion)
             elif category:
                 if "places" not in categories:
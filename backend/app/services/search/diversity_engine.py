@@ -0,0 +1,268 @@
+"""
+검색 결과 유사도 기반 다양성 엔진
+
+후보마다 TF-IDF를 다시 학습하고 n×n 유사도 행렬을 만드는 대신
+- 장소 코퍼스로 오프라인 학습해 게시한 벡터라이저를 재사용
+  (게시본이 없으면 학습이 필요 없는 해싱 벡터라이저 사용)
+- 희소 행렬 곱을 블록 단위로 계산해 행마다 상위 k개 이웃만 유지 (메모리 O(n·k))
+- NumPy 기반 탐욕적 MMR 선택 (선택된 결과와 임계값 이상 유사한 후보는 제외,
+  제외 판정은 임계값을 넘는 모든 쌍을 블록 단위로 한 번 계산한 희소 행렬로 수행)
+"""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+
+logger = logging.getLogger(__name__)
+
+PLACE_VECTORIZER_PATH = "models/place_text_vectorizer.pkl"
+HASHING_FEATURES = 2**18
+NEIGHBOR_TOP_K = 32
+SIMILARITY_BLOCK_ROWS = 256
+
+# 게시된 벡터라이저 (경로별, 파일 mtime 기준으로 재사용)
+_published_vectorizers: Dict[str, Tuple[int, TfidfVectorizer]] = {}
+
+
+def place_text(result: Dict[str, Any]) -> str:
+    """유사도 비교용 장소 텍스트 (텍스트가 없으면 영벡터가 되어 중복으로 보지 않음)"""
+    return " ".join(
+        [
+            result.get("name") or "",
+            result.get("address") or "",
+            " ".join(result.get("tags") or []),
+            result.get("description") or "",
+        ]
+    ).strip()
+
+
+def fit_place_vectorizer(
+    texts: Iterable[str], path: str = PLACE_VECTORIZER_PATH, max_features: int = 20000
+) -> TfidfVectorizer:
+    """
+    장소 코퍼스로 TF-IDF 벡터라이저를 학습해 게시
+
+    서빙 워커는 다음 인코딩 시 파일 변경을 감지해 새 벡터라이저를 사용한다.
+    """
+    vectorizer = TfidfVectorizer(
+        max_features=max_features,
+        ngram_range=(1, 2),
+        sublinear_tf=True,
+        dtype=np.float32,
+    )
+    vectorizer.fit(texts)
+
+    # 임시 파일에 쓴 뒤 교체해 읽는 쪽이 쓰는 중인 파일을 보지 않도록 함
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(f"{target.name}.tmp")
+    with open(tmp_file, "wb") as f:
+        pickle.dump(vectorizer, f)
+    os.replace(tmp_file, target)
+
+    logger.info(
+        f"Published place vectorizer ({len(vectorizer.vocabulary_)} terms) to {path}"
+    )
+    return vectorizer
+
+
+class PlaceTextEncoder:
+    """장소 텍스트를 L2 정규화된 희소 벡터로 변환 (요청마다 학습하지 않음)"""
+
+    def __init__(self, vectorizer_path: Optional[str] = PLACE_VECTORIZER_PATH):
+        self.vectorizer_path = vectorizer_path
+        self._hashing = HashingVectorizer(
+            n_features=HASHING_FEATURES,
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm="l2",
+            dtype=np.float32,
+        )
+
+    def _published_vectorizer(self) -> Optional[TfidfVectorizer]:
+        if not self.vectorizer_path:
+            return None
+        try:
+            vectorizer_file = Path(self.vectorizer_path)
+            if not vectorizer_file.exists():
+                return None
+
+            mtime_ns = vectorizer_file.stat().st_mtime_ns
+            cached = _published_vectorizers.get(self.vectorizer_path)
+            if cached is None or cached[0] != mtime_ns:
+                with open(vectorizer_file, "rb") as f:
+                    cached = (mtime_ns, pickle.load(f))
+                _published_vectorizers[self.vectorizer_path] = cached
+            return cached[1]
+        except Exception as e:
+            logger.warning(f"Failed to load place vectorizer: {e}")
+            return None
+
+    def encode(self, results: List[Dict[str, Any]]) -> sparse.csr_matrix:
+        texts = [place_text(result) for result in results]
+        vectorizer = self._published_vectorizer()
+        if vectorizer is None:
+            return self._hashing.transform(texts).tocsr()
+        return vectorizer.transform(texts).astype(np.float32).tocsr()
+
+
+def _similarity_blocks(vectors: sparse.csr_matrix, block_rows: int):
+    """행 블록별 코사인 유사도 (자기 자신 0), (시작 행, 밀집 블록) 순회"""
+    n = vectors.shape[0]
+    vectors_t = vectors.T.tocsr()  # 블록마다 형식 변환하지 않도록 미리 변환
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        block = (vectors[start:stop] @ vectors_t).toarray()
+        block[np.arange(stop - start), np.arange(start, stop)] = 0.0
+        yield start, block
+
+
+def _sparse_rows(n: int, rows, cols, values) -> sparse.csr_matrix:
+    if not rows:
+        return sparse.csr_matrix((n, n), dtype=np.float32)
+    return sparse.csr_matrix(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n, n),
+        dtype=np.float32,
+    )
+
+
+def top_k_neighbors(
+    vectors: sparse.csr_matrix,
+    k: int = NEIGHBOR_TOP_K,
+    threshold: float = 0.0,
+    block_rows: int = SIMILARITY_BLOCK_ROWS,
+) -> sparse.csr_matrix:
+    """
+    행마다 코사인 유사도 상위 k개 이웃만 담은 희소 행렬
+
+    Args:
+        vectors: L2 정규화된 행 벡터
+        k: 행당 최대 이웃 수
+        threshold: 이 값을 넘는 유사도만 유지
+        block_rows: 한 번에 계산하는 행 수 (블록 크기 × n 만큼만 밀집 메모리 사용)
+
+    Returns:
+        n×n 희소 행렬 (자기 자신 제외)
+    """
+    n = vectors.shape[0]
+    rows, cols, values = [], [], []
+
+    for start, block in _similarity_blocks(vectors, block_rows):
+        if k < n:
+            top = np.argpartition(block, -k, axis=1)[:, -k:]
+        else:
+            top = np.broadcast_to(np.arange(n), block.shape)
+        top_values = np.take_along_axis(block, top, axis=1)
+        keep = top_values > threshold
+
+        local_rows = np.nonzero(keep)[0]
+        rows.append(local_rows + start)
+        cols.append(top[keep])
+        values.append(top_values[keep])
+
+    return _sparse_rows(n, rows, cols, values)
+
+
+def similar_pairs(
+    vectors: sparse.csr_matrix,
+    threshold: float,
+    block_rows: int = SIMILARITY_BLOCK_ROWS,
+) -> sparse.csr_matrix:
+    """
+    코사인 유사도가 threshold를 넘는 모든 쌍을 담은 희소 행렬 (중복 판정용)
+
+    top_k_neighbors와 같은 블록 계산이지만 이웃 수 제한 없이 임계값만 적용하므로
+    상위 k 밖의 중복도 빠지지 않는다. 중복은 드물어 결과는 매우 희소하다.
+
+    Args:
+        vectors: L2 정규화된 행 벡터
+        threshold: 중복으로 보는 유사도
+        block_rows: 한 번에 계산하는 행 수
+
+    Returns:
+        n×n 희소 행렬 (자기 자신 제외)
+    """
+    n = vectors.shape[0]
+    rows, cols, values = [], [], []
+
+    for start, block in _similarity_blocks(vectors, block_rows):
+        local_rows, local_cols = np.nonzero(block > threshold)
+        rows.append(local_rows + start)
+        cols.append(local_cols)
+        values.append(block[local_rows, local_cols])
+
+    return _sparse_rows(n, rows, cols, values)
+
+
+def mmr_select(
+    relevance: np.ndarray,
+    vectors: sparse.csr_matrix,
+    lambda_: float = 0.7,
+    similarity_threshold: float = 1.0,
+    limit: Optional[int] = None,
+    neighbors: Optional[sparse.csr_matrix] = None,
+    duplicates: Optional[sparse.csr_matrix] = None,
+) -> List[int]:
+    """
+    탐욕적 MMR 선택
+
+    매 단계 λ·관련도 − (1−λ)·(선택된 결과와의 최대 유사도)가 가장 큰 후보를 고르고,
+    선택된 결과와 similarity_threshold를 넘게 유사한 후보는 제외한다.
+    λ=1이면 관련도 순서를 유지한 중복 제거와 같다.
+
+    제외 판정은 임계값을 넘는 모든 쌍(similar_pairs)을 한 번에 계산한 희소
+    행렬로 하므로 상위 k 이웃 밖의 중복도 빠짐없이 제거되고, 선택마다 전체
+    후보와 유사도를 다시 계산하지 않는다. neighbors는 MMR 감점(최대 유사도)
+    계산용 가속 구조다.
+
+    Args:
+        relevance: 후보별 관련도 점수
+        vectors: L2 정규화된 후보 벡터
+        lambda_: 관련도 가중치 (0.0-1.0)
+        similarity_threshold: 중복으로 보는 유사도
+        limit: 최대 선택 수
+        neighbors: MMR 감점용 상위 k 이웃 (없으면 선택마다 정확한 유사도 행 사용)
+        duplicates: 미리 계산한 similar_pairs(vectors, similarity_threshold)
+
+    Returns:
+        선택 순서대로 정렬된 후보 인덱스
+    """
+    n = len(relevance)
+    limit = n if limit is None else min(limit, n)
+    relevance = np.asarray(relevance, dtype=np.float64)
+    if duplicates is None:
+        duplicates = similar_pairs(vectors, similarity_threshold)
+    max_similarity = np.zeros(n)
+    available = np.ones(n, dtype=bool)
+    selected: List[int] = []
+
+    while len(selected) < limit and available.any():
+        scores = lambda_ * relevance - (1.0 - lambda_) * max_similarity
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        row = slice(duplicates.indptr[best], duplicates.indptr[best + 1])
+        available[duplicates.indices[row]] = False
+
+        if lambda_ >= 1.0:
+            continue  # 감점 없음: 관련도 순서 그대로
+        if neighbors is not None:
+            neighbor_row = slice(neighbors.indptr[best], neighbors.indptr[best + 1])
+            np.maximum.at(
+                max_similarity,
+                neighbors.indices[neighbor_row],
+                neighbors.data[neighbor_row],
+            )
+        else:
+            similarity = (vectors @ vectors[best].T).toarray().ravel()
+            np.maximum(max_similarity, similarity, out=max_similarity)
+
+    return selected
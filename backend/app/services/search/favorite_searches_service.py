@@ -13,7 +13,7 @@ import json
 import logging
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 import redis.asyncio as redis
@@ -21,6 +21,41 @@ from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# 서버 측 쓰기(생성, 사용 통계, 충돌 병합, 복원)의 버전 벡터 행위자
+SERVER_ACTOR = "server"
+
+# 점수 기반 보조 정렬 인덱스 (name은 사전순 인덱스를 따로 유지)
+SCORE_INDEXES = ("use_count", "last_used", "created_at")
+
+
+def compare_version_vectors(left: Dict[str, int], right: Dict[str, int]) -> str:
+    """
+    두 버전 벡터 비교
+
+    Returns:
+        "equal", "newer"(left가 right의 변경을 모두 포함), "older",
+        "concurrent"(서로 모르는 변경이 있음) 중 하나
+    """
+    actors = set(left) | set(right)
+    ahead = any(left.get(actor, 0) > right.get(actor, 0) for actor in actors)
+    behind = any(left.get(actor, 0) < right.get(actor, 0) for actor in actors)
+    if ahead and behind:
+        return "concurrent"
+    if ahead:
+        return "newer"
+    if behind:
+        return "older"
+    return "equal"
+
+
+def merge_version_vectors(*vectors: Dict[str, int]) -> Dict[str, int]:
+    """행위자별 최댓값으로 버전 벡터 병합"""
+    merged: Dict[str, int] = {}
+    for vector in vectors:
+        for actor, counter in vector.items():
+            merged[actor] = max(merged.get(actor, 0), counter)
+    return merged
+
 
 class FavoriteSearchesService:
     """즐겨찾는 검색 서비스"""
@@ -62,6 +97,18 @@ class FavoriteSearchesService:
         self.analytics_key_pattern = "favorites_analytics:{user_id}:{date}"
         self.backup_key_pattern = "favorites_backup:{user_id}:{backup_id}"
 
+        # 보조 정렬/카테고리 인덱스, 동기화용 변경 로그와 버전
+        self.index_key_pattern = "favorite_searches:{user_id}:by:{field}"
+        self.category_key_pattern = "favorite_searches:{user_id}:category:{category}"
+        self.changes_key_pattern = "favorite_searches:{user_id}:changes"
+        self.version_key_pattern = "favorite_searches:{user_id}:version"
+        self.indexed_key_pattern = "favorite_searches:{user_id}:indexed"
+
+        # 인덱스 재구축 주기: 오래 갱신되지 않은 카테고리 인덱스가 본문보다 먼저
+        # 만료되지 않도록 TTL의 절반마다 본문 해시로부터 다시 구축
+        self.index_rebuild_interval = max(self.favorites_ttl // 2, 1)
+        self.max_transaction_retries = 5
+
         # 카테고리 매핑
         self.category_mapping = {
             "restaurant": "food_and_dining",
@@ -85,33 +132,13 @@ class FavoriteSearchesService:
             if current_count >= self.max_favorites:
                 raise ValueError(f"즐겨찾는 검색은 최대 {self.max_favorites}개까지 저장 가능합니다")
 
-            # 즐겨찾는 검색 ID 생성
-            favorite_id = str(uuid.uuid4())
-
             # 즐겨찾는 검색 데이터 구성
-            favorite_data = {
-                "id": favorite_id,
-                "name": search_data.get("name", ""),
-                "query": search_data.get("query", ""),
-                "filters": search_data.get("filters", {}),
-                "location": search_data.get("location", {}),
-                "tags": search_data.get("tags", []),
-                "created_at": datetime.utcnow().isoformat(),
-                "last_used": datetime.utcnow().isoformat(),
-                "use_count": 0,
-                "category": self._determine_category(search_data),
-                "is_active": True,
-                "user_notes": search_data.get("notes", ""),
-            }
-
-            # Redis Hash에 저장
-            favorites_key = self.favorites_key_pattern.format(user_id=user_id)
-            await self.redis.hset(
-                favorites_key, favorite_id, json.dumps(favorite_data, default=str)
-            )
+            favorite_data = self._new_favorite_record(search_data)
+            favorite_data["version_vector"] = {SERVER_ACTOR: 1}
+            favorite_id = favorite_data["id"]
 
-            # TTL 설정
-            await self.redis.expire(favorites_key, self.favorites_ttl)
+            # 본문 해시, 보조 인덱스, 변경 로그를 한 트랜잭션으로 저장
+            await self._apply_changes(user_id, favorites=[favorite_data])
 
             # 분석 데이터 기록
             if self.analytics_enabled:
@@ -131,40 +158,27 @@ class FavoriteSearchesService:
         sort_by: str = "use_count",  # use_count, created_at, last_used, name
         category_filter: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """즐겨찾는 검색 목록 조회"""
-        try:
-            favorites_key = self.favorites_key_pattern.format(user_id=user_id)
-            favorites_data = await self.redis.hgetall(favorites_key)
+        """
+        즐겨찾는 검색 목록 조회
 
-            if not favorites_data:
+        보조 정렬 인덱스에서 limit개의 ID만 범위 조회하고 그 항목만 HMGET으로 읽음.
+        카테고리 필터는 카테고리 인덱스(사용 횟수순)를 사용하며, 다른 기준으로
+        정렬할 때는 해당 카테고리 항목만 읽어 정렬함
+        """
+        try:
+            if limit <= 0:
                 return []
 
-            # 데이터 파싱 및 필터링
-            favorites = []
-            for favorite_id, favorite_json in favorites_data.items():
-                try:
-                    favorite = json.loads(favorite_json)
-
-                    # 활성 상태 확인
-                    if not favorite.get("is_active", True):
-                        continue
-
-                    # 카테고리 필터 적용
-                    if category_filter and favorite.get("category") != category_filter:
-                        continue
-
-                    favorites.append(favorite)
-
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in favorite {favorite_id}")
-                    continue
+            favorite_ids = await self._ranked_favorite_ids(
+                user_id, limit, sort_by, category_filter
+            )
+            favorites = list(
+                (await self._load_favorites(self.redis, user_id, favorite_ids)).values()
+            )
+            favorites = [fav for fav in favorites if fav.get("is_active", True)]
 
-            # 정렬
-            reverse = sort_by in ["use_count", "created_at", "last_used"]
-            if sort_by == "name":
-                favorites.sort(key=lambda x: x.get("name", "").lower())
-            else:
-                favorites.sort(key=lambda x: x.get(sort_by, 0), reverse=reverse)
+            if not self._sorted_by_index(sort_by, category_filter):
+                favorites = self._sort_favorites(favorites, sort_by)
 
             return favorites[:limit]
 
@@ -512,47 +526,60 @@ class FavoriteSearchesService:
         user_id: UUID,
         device_id: str,
         local_favorites: List[Dict[str, Any]],
+        since_version: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """디바이스 간 즐겨찾는 검색 동기화"""
+        """
+        디바이스 간 즐겨찾는 검색 동기화 (버전 벡터 기반 델타 동기화)
+
+        기기는 마지막 동기화 이후 바뀐 즐겨찾기만 version_vector와 함께 보내고
+        (삭제는 deleted=True), 서버는 since_version 이후 변경 로그에 남은 항목만
+        돌려줌. 기기 쪽 변경은 하나의 MULTI/EXEC 트랜잭션으로 적용되고, 응답의
+        server_version을 다음 동기화의 since_version으로 사용함.
+        since_version이 없으면 서버의 전체 즐겨찾기를 돌려줌. version_vector가
+        없는 사본은 서버 사본과 동시에 바뀐 것으로 보고 병합함.
+
+        Args:
+            user_id: 사용자 ID
+            device_id: 버전 벡터에서 이 기기를 나타내는 행위자 ID
+            local_favorites: 마지막 동기화 이후 기기에서 바뀐 즐겨찾기
+            since_version: 기기가 마지막으로 받은 server_version
+
+        Returns:
+            동기화 결과 (server_changes/deleted_ids는 기기가 반영할 서버 변경)
+        """
         try:
             if not self.sync_enabled:
                 return {"error": "동기화 기능이 비활성화되어 있습니다"}
 
-            # 서버의 현재 즐겨찾는 검색 조회
-            server_favorites = await self.get_favorite_searches(user_id, limit=100)
-            server_favorites_dict = {fav["id"]: fav for fav in server_favorites}
-
-            synchronized_count = 0
-            conflicts_resolved = 0
-            updated_favorites = []
-
-            # 로컬 즐겨찾는 검색 처리
-            for local_fav in local_favorites:
-                local_id = local_fav.get("id")
+            local_by_id = {fav["id"]: fav for fav in local_favorites if fav.get("id")}
+            outcome: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
 
-                if local_id in server_favorites_dict:
-                    # 기존 항목 - 충돌 해결
-                    server_fav = server_favorites_dict[local_id]
-                    merged_fav = await self._resolve_sync_conflict(
-                        server_fav, local_fav
+            async def prepare(pipe, version):
+                outcome.clear()
+                server_copies = await self._load_favorites(
+                    pipe, user_id, list(local_by_id)
+                )
+                writes, deletes = [], []
+                for favorite_id, local_fav in local_by_id.items():
+                    server_fav = server_copies.get(favorite_id)
+                    action, record = await self._merge_local_favorite(
+                        device_id, local_fav, server_fav
                     )
+                    outcome[favorite_id] = (action, record)
+                    if action in ("create", "accept", "merge"):
+                        writes.append((record, server_fav))
+                    elif action == "delete":
+                        deletes.append(server_fav)
+
+                changed = await self._changed_since(
+                    pipe, user_id, since_version, version
+                )
+                return writes, deletes, changed
 
-                    if merged_fav != server_fav:
-                        await self._update_favorite(user_id, local_id, merged_fav)
-                        conflicts_resolved += 1
-                        updated_favorites.append(merged_fav)
-                else:
-                    # 새로운 항목 - 서버에 추가
-                    await self._create_favorite_from_sync(user_id, local_fav)
-                    synchronized_count += 1
-                    updated_favorites.append(local_fav)
-
-            return {
-                "synchronized_count": synchronized_count,
-                "conflicts_resolved": conflicts_resolved,
-                "updated_favorites": updated_favorites,
-                "sync_timestamp": datetime.utcnow().isoformat(),
-            }
+            server_version, changed = await self._versioned_transaction(
+                user_id, prepare
+            )
+            return self._sync_response(outcome, changed, server_version)
 
         except Exception as e:
             logger.error(f"Failed to sync favorites: {str(e)}")
@@ -620,23 +647,16 @@ class FavoriteSearchesService:
                     fav for fav in favorites_to_restore if fav["id"] not in existing_ids
                 ]
 
-            # 즐겨찾는 검색 복원
-            restored_count = 0
-            favorites_key = self.favorites_key_pattern.format(user_id=user_id)
-
+            # 즐겨찾는 검색 복원 (인덱스/변경 로그와 함께 한 트랜잭션)
+            favorites_to_restore = [
+                fav for fav in favorites_to_restore if fav.get("id")
+            ]
             for favorite in favorites_to_restore:
-                try:
-                    await self.redis.hset(
-                        favorites_key, favorite["id"], json.dumps(favorite, default=str)
-                    )
-                    restored_count += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to restore favorite {favorite.get('id')}: {str(e)}"
-                    )
-
-            # TTL 재설정
-            await self.redis.expire(favorites_key, self.favorites_ttl)
+                favorite["version_vector"] = self._bump_server_version(
+                    favorite.get("version_vector", {})
+                )
+            await self._apply_changes(user_id, favorites=favorites_to_restore)
+            restored_count = len(favorites_to_restore)
 
             return {
                 "restored_count": restored_count,
@@ -656,7 +676,9 @@ class FavoriteSearchesService:
     ) -> List[Dict[str, Any]]:
         """고급 필터링으로 즐겨찾는 검색 조회"""
         try:
-            all_favorites = await self.get_favorite_searches(user_id, limit=1000)
+            all_favorites = await self.get_favorite_searches(
+                user_id, limit=1000, category_filter=filters.get("category")
+            )
             filtered = []
 
             for favorite in all_favorites:
@@ -737,10 +759,10 @@ class FavoriteSearchesService:
             if not self.bulk_operations:
                 raise ValueError("일괄 작업 기능이 비활성화되어 있습니다")
 
-            favorites_key = self.favorites_key_pattern.format(user_id=user_id)
-
-            # Redis HDEL로 일괄 삭제
-            deleted_count = await self.redis.hdel(favorites_key, *favorite_ids)
+            # 본문 삭제, 인덱스 제거, 변경 로그(삭제 표시)를 한 트랜잭션으로 적용
+            _, deleted_count = await self._apply_changes(
+                user_id, deleted_ids=favorite_ids
+            )
 
             return {
                 "deleted_count": deleted_count,
@@ -813,6 +835,26 @@ class FavoriteSearchesService:
         except Exception:
             return 0
 
+    def _new_favorite_record(
+        self, search_data: Dict[str, Any], favorite_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """새 즐겨찾는 검색 레코드 구성"""
+        now = datetime.utcnow().isoformat()
+        return {
+            "id": favorite_id or str(uuid.uuid4()),
+            "name": search_data.get("name", ""),
+            "query": search_data.get("query", ""),
+            "filters": search_data.get("filters", {}),
+            "location": search_data.get("location", {}),
+            "tags": search_data.get("tags", []),
+            "created_at": now,
+            "last_used": now,
+            "use_count": 0,
+            "category": self._determine_category(search_data),
+            "is_active": True,
+            "user_notes": search_data.get("notes", ""),
+        }
+
     def _determine_category(self, search_data: Dict[str, Any]) -> str:
         """검색 데이터로부터 카테고리 결정"""
         filters = search_data.get("filters", {})
@@ -864,17 +906,26 @@ class FavoriteSearchesService:
         }
 
     async def _update_usage_stats(self, user_id: UUID, favorite_id: str) -> None:
-        """사용 통계 업데이트"""
+        """사용 통계 업데이트 (트랜잭션 안에서 읽고 증가시켜 동시 실행에도 누락 없음)"""
         try:
-            favorite_data = await self._get_favorite_by_id(user_id, favorite_id)
-            if favorite_data:
-                favorite_data["use_count"] = favorite_data.get("use_count", 0) + 1
-                favorite_data["last_used"] = datetime.utcnow().isoformat()
 
-                favorites_key = self.favorites_key_pattern.format(user_id=user_id)
-                await self.redis.hset(
-                    favorites_key, favorite_id, json.dumps(favorite_data, default=str)
-                )
+            async def prepare(pipe, version):
+                current = (
+                    await self._load_favorites(pipe, user_id, [favorite_id])
+                ).get(favorite_id)
+                if not current:
+                    return [], [], None
+                updated = {
+                    **current,
+                    "use_count": current.get("use_count", 0) + 1,
+                    "last_used": datetime.utcnow().isoformat(),
+                    "version_vector": self._bump_server_version(
+                        current.get("version_vector", {})
+                    ),
+                }
+                return [(updated, current)], [], None
+
+            await self._versioned_transaction(user_id, prepare)
         except Exception as e:
             logger.error(f"Failed to update usage stats: {str(e)}")
 
@@ -901,6 +952,419 @@ class FavoriteSearchesService:
         except Exception as e:
             logger.error(f"Failed to record favorite event: {str(e)}")
 
+    # Storage, index and sync helpers
+
+    def _index_key(self, user_id: UUID, field: str) -> str:
+        return self.index_key_pattern.format(user_id=user_id, field=field)
+
+    def _category_key(self, user_id: UUID, category: str) -> str:
+        return self.category_key_pattern.format(user_id=user_id, category=category)
+
+    @staticmethod
+    def _timestamp(value: Any) -> float:
+        """ISO 시각 → 정렬 점수 (없거나 잘못된 값은 0)"""
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+
+    @staticmethod
+    def _name_member(favorite: Dict[str, Any]) -> str:
+        """이름 인덱스 멤버: 같은 점수(0)에서 사전순 정렬되도록 소문자 이름 + ID"""
+        return f"{favorite.get('name', '').lower()}\x00{favorite['id']}"
+
+    @staticmethod
+    def _bump_server_version(vector: Dict[str, int]) -> Dict[str, int]:
+        return {**vector, SERVER_ACTOR: vector.get(SERVER_ACTOR, 0) + 1}
+
+    @staticmethod
+    def _sorted_by_index(sort_by: str, category_filter: Optional[str]) -> bool:
+        """인덱스 조회 순서가 곧 결과 순서인지 여부"""
+        if category_filter:
+            return sort_by == "use_count"
+        return sort_by in SCORE_INDEXES or sort_by == "name"
+
+    @staticmethod
+    def _sort_favorites(
+        favorites: List[Dict[str, Any]], sort_by: str
+    ) -> List[Dict[str, Any]]:
+        """인덱스로 처리하지 않는 정렬 (카테고리 내 정렬, 임의 필드)"""
+        if sort_by == "name":
+            return sorted(favorites, key=lambda x: x.get("name", "").lower())
+        reverse = sort_by in SCORE_INDEXES
+        return sorted(favorites, key=lambda x: x.get(sort_by, 0), reverse=reverse)
+
+    async def _ranked_favorite_ids(
+        self,
+        user_id: UUID,
+        limit: int,
+        sort_by: str,
+        category_filter: Optional[str],
+    ) -> List[str]:
+        """정렬 인덱스 범위 조회 (인덱스가 없으면 본문 해시로부터 구축 후 재조회)"""
+        indexed, members = await self._read_index(
+            user_id, limit, sort_by, category_filter
+        )
+        if not indexed:
+            await self._build_indexes(user_id)
+            _, members = await self._read_index(
+                user_id, limit, sort_by, category_filter
+            )
+
+        if sort_by == "name" and not category_filter:
+            members = [member.rsplit("\x00", 1)[-1] for member in members]
+        return list(dict.fromkeys(members))
+
+    async def _read_index(
+        self,
+        user_id: UUID,
+        limit: int,
+        sort_by: str,
+        category_filter: Optional[str],
+    ) -> Tuple[bool, List[str]]:
+        """인덱스 구축 여부와 범위 조회를 한 번의 왕복으로 수행"""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.exists(self.indexed_key_pattern.format(user_id=user_id))
+        if category_filter:
+            end = limit - 1 if sort_by == "use_count" else -1
+            pipe.zrevrange(self._category_key(user_id, category_filter), 0, end)
+        elif sort_by == "name":
+            pipe.zrange(self._index_key(user_id, "name"), 0, limit - 1)
+        elif sort_by in SCORE_INDEXES:
+            pipe.zrevrange(self._index_key(user_id, sort_by), 0, limit - 1)
+        else:
+            pipe.zrevrange(self._index_key(user_id, "use_count"), 0, -1)
+        indexed, members = await pipe.execute()
+        return bool(indexed), members
+
+    async def _build_indexes(self, user_id: UUID) -> None:
+        """
+        본문 해시로부터 보조 인덱스 구축
+
+        인덱스 도입 전 데이터의 이관과, 쓰기가 없어 TTL이 줄어든 카테고리
+        인덱스의 주기적 갱신(index_rebuild_interval)을 겸함
+        """
+        favorites_key = self.favorites_key_pattern.format(user_id=user_id)
+        favorites_data = await self.redis.hgetall(favorites_key)
+        favorites = []
+        for favorite_id, favorite_json in favorites_data.items():
+            favorite = self._decode_favorite(favorite_id, favorite_json)
+            if favorite:
+                favorites.append(favorite)
+
+        pipe = self.redis.pipeline(transaction=True)
+        for favorite in favorites:
+            self._queue_index(pipe, user_id, favorite)
+        self._queue_expire(
+            pipe, user_id, {fav.get("category", "other") for fav in favorites}
+        )
+        pipe.set(
+            self.indexed_key_pattern.format(user_id=user_id),
+            1,
+            ex=self.index_rebuild_interval,
+        )
+        await pipe.execute()
+
+    @staticmethod
+    def _decode_favorite(
+        favorite_id: str, favorite_json: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        if not favorite_json:
+            return None
+        try:
+            favorite = json.loads(favorite_json)
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid JSON in favorite {favorite_id}")
+            return None
+        favorite.setdefault("id", favorite_id)
+        return favorite
+
+    async def _load_favorites(
+        self, client: Any, user_id: UUID, favorite_ids: Sequence[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """ID 목록의 즐겨찾기를 HMGET 한 번으로 조회 (없는 항목은 제외, 순서 유지)"""
+        if not favorite_ids:
+            return {}
+        favorites_key = self.favorites_key_pattern.format(user_id=user_id)
+        values = await client.hmget(favorites_key, list(favorite_ids))
+        favorites = {}
+        for favorite_id, favorite_json in zip(favorite_ids, values):
+            favorite = self._decode_favorite(favorite_id, favorite_json)
+            if favorite:
+                favorites[favorite_id] = favorite
+        return favorites
+
+    def _queue_index(self, pipe: Any, user_id: UUID, favorite: Dict[str, Any]) -> None:
+        """활성 즐겨찾기를 정렬/카테고리 인덱스에 추가"""
+        if not favorite.get("is_active", True):
+            return
+        favorite_id = favorite["id"]
+        use_count = favorite.get("use_count", 0)
+        pipe.zadd(self._index_key(user_id, "use_count"), {favorite_id: use_count})
+        for field in ("last_used", "created_at"):
+            score = self._timestamp(favorite.get(field))
+            pipe.zadd(self._index_key(user_id, field), {favorite_id: score})
+        pipe.zadd(self._index_key(user_id, "name"), {self._name_member(favorite): 0})
+        category_key = self._category_key(user_id, favorite.get("category", "other"))
+        pipe.zadd(category_key, {favorite_id: use_count})
+
+    def _queue_unindex(
+        self, pipe: Any, user_id: UUID, favorite: Dict[str, Any]
+    ) -> None:
+        """저장되어 있던 사본 기준으로 인덱스 항목 제거"""
+        favorite_id = favorite["id"]
+        for field in SCORE_INDEXES:
+            pipe.zrem(self._index_key(user_id, field), favorite_id)
+        pipe.zrem(self._index_key(user_id, "name"), self._name_member(favorite))
+        category_key = self._category_key(user_id, favorite.get("category", "other"))
+        pipe.zrem(category_key, favorite_id)
+
+    def _queue_expire(self, pipe: Any, user_id: UUID, categories: set) -> None:
+        """본문, 인덱스, 변경 로그의 TTL을 함께 갱신"""
+        keys = [
+            self.favorites_key_pattern.format(user_id=user_id),
+            self.changes_key_pattern.format(user_id=user_id),
+            self.version_key_pattern.format(user_id=user_id),
+        ]
+        keys += [self._index_key(user_id, field) for field in SCORE_INDEXES + ("name",)]
+        keys += [self._category_key(user_id, category) for category in categories]
+        for key in keys:
+            pipe.expire(key, self.favorites_ttl)
+
+    def _queue_changes(
+        self,
+        pipe: Any,
+        user_id: UUID,
+        version: int,
+        writes: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]],
+        deletes: List[Dict[str, Any]],
+    ) -> int:
+        """
+        쓰기/삭제를 트랜잭션에 추가하고 적용 후 버전 반환
+
+        변경마다 버전을 하나씩 올려 변경 로그(ID → 마지막 변경 버전)에 기록함.
+        삭제된 항목은 본문 없이 변경 로그에만 남아 델타 동기화에서 삭제로 전달됨
+        """
+        favorites_key = self.favorites_key_pattern.format(user_id=user_id)
+        changes_key = self.changes_key_pattern.format(user_id=user_id)
+        categories = set()
+
+        for favorite, previous in writes:
+            version += 1
+            if previous:
+                self._queue_unindex(pipe, user_id, previous)
+                categories.add(previous.get("category", "other"))
+            pipe.hset(favorites_key, favorite["id"], json.dumps(favorite, default=str))
+            self._queue_index(pipe, user_id, favorite)
+            pipe.zadd(changes_key, {favorite["id"]: version})
+            categories.add(favorite.get("category", "other"))
+
+        for favorite in deletes:
+            version += 1
+            pipe.hdel(favorites_key, favorite["id"])
+            self._queue_unindex(pipe, user_id, favorite)
+            pipe.zadd(changes_key, {favorite["id"]: version})
+            categories.add(favorite.get("category", "other"))
+
+        pipe.set(self.version_key_pattern.format(user_id=user_id), version)
+        self._queue_expire(pipe, user_id, categories)
+        return version
+
+    async def _versioned_transaction(
+        self,
+        user_id: UUID,
+        prepare: Callable[[Any, int], Awaitable[Tuple[List, List, Any]]],
+    ) -> Tuple[int, Any]:
+        """
+        버전 키를 WATCH한 채 prepare로 읽기/병합하고 변경을 MULTI/EXEC로 적용
+
+        prepare(pipe, version)는 (writes, deletes, result)를 반환하며 WATCH 중인
+        파이프라인으로 즉시 읽기를 할 수 있음. 모든 쓰기가 버전 키를 올리므로
+        다른 쓰기와 겹치면 EXEC가 실패하고 prepare부터 다시 수행함.
+
+        Returns:
+            (적용 후 버전, prepare의 result)
+        """
+        version_key = self.version_key_pattern.format(user_id=user_id)
+        for _ in range(self.max_transaction_retries):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(version_key)
+                    version = int(await pipe.get(version_key) or 0)
+                    writes, deletes, result = await prepare(pipe, version)
+                    if not writes and not deletes:
+                        return version, result
+
+                    pipe.multi()
+                    version = self._queue_changes(
+                        pipe, user_id, version, writes, deletes
+                    )
+                    await pipe.execute()
+                    return version, result
+                except redis.WatchError:
+                    continue
+
+        raise RuntimeError("즐겨찾는 검색 변경이 동시 쓰기로 적용되지 않았습니다")
+
+    async def _apply_changes(
+        self,
+        user_id: UUID,
+        favorites: Sequence[Dict[str, Any]] = (),
+        deleted_ids: Sequence[str] = (),
+    ) -> Tuple[int, int]:
+        """
+        즐겨찾기 저장/삭제를 인덱스, 변경 로그와 함께 한 트랜잭션으로 적용
+
+        Returns:
+            (적용 후 버전, 실제 삭제된 개수)
+        """
+
+        async def prepare(pipe, version):
+            favorite_ids = [fav["id"] for fav in favorites] + list(deleted_ids)
+            previous = await self._load_favorites(pipe, user_id, favorite_ids)
+            writes = [(fav, previous.get(fav["id"])) for fav in favorites]
+            deletes = [
+                previous[fid] for fid in dict.fromkeys(deleted_ids) if fid in previous
+            ]
+            return writes, deletes, len(deletes)
+
+        return await self._versioned_transaction(user_id, prepare)
+
+    async def _changed_since(
+        self, pipe: Any, user_id: UUID, since_version: Optional[int], version: int
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        since_version 이후 바뀐 즐겨찾기 (None 값은 삭제됨)
+
+        since_version이 없거나 서버 버전보다 크면(만료 후 재생성) 전체를 반환
+        """
+        if not since_version or since_version > version:
+            favorites_key = self.favorites_key_pattern.format(user_id=user_id)
+            favorites_data = await pipe.hgetall(favorites_key)
+            return {
+                favorite_id: self._decode_favorite(favorite_id, favorite_json)
+                for favorite_id, favorite_json in favorites_data.items()
+            }
+
+        changes_key = self.changes_key_pattern.format(user_id=user_id)
+        changed_ids = await pipe.zrangebyscore(changes_key, f"({since_version}", "+inf")
+        current = await self._load_favorites(pipe, user_id, changed_ids)
+        return {favorite_id: current.get(favorite_id) for favorite_id in changed_ids}
+
+    async def _merge_local_favorite(
+        self,
+        device_id: str,
+        local_fav: Dict[str, Any],
+        server_fav: Optional[Dict[str, Any]],
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        기기 사본 하나를 서버 사본과 비교해 (동작, 결과 사본) 결정
+
+        create/accept/merge는 저장, delete는 삭제, stale은 서버 사본을 기기로
+        돌려주고, same/ignore는 아무것도 하지 않음
+        """
+        local_vector = local_fav.get("version_vector")
+        if server_fav is None:
+            if local_fav.get("deleted"):
+                return "ignore", None
+            record = self._new_favorite_record(local_fav, local_fav["id"])
+            record.update(local_fav)
+            record.pop("deleted", None)
+            record["version_vector"] = local_vector or {device_id: 1}
+            return "create", record
+
+        if local_vector is None:
+            order = "concurrent"
+        else:
+            order = compare_version_vectors(
+                local_vector, server_fav.get("version_vector", {})
+            )
+
+        if order == "equal":
+            return "same", server_fav
+        if order == "older" or (local_fav.get("deleted") and order != "newer"):
+            return "stale", server_fav
+        if local_fav.get("deleted"):
+            return "delete", server_fav
+        if order == "newer":
+            record = {**server_fav, **local_fav}
+            record.pop("deleted", None)
+            return "accept", record
+
+        merged = await self._resolve_sync_conflict(server_fav, local_fav)
+        if local_vector is None and self._same_content(merged, server_fav):
+            return "same", server_fav
+        return "merge", merged
+
+    @staticmethod
+    def _same_content(left: Dict[str, Any], right: Dict[str, Any]) -> bool:
+        """버전 벡터를 제외한 내용 비교"""
+        return {k: v for k, v in left.items() if k != "version_vector"} == {
+            k: v for k, v in right.items() if k != "version_vector"
+        }
+
+    async def _resolve_sync_conflict(
+        self, server_fav: Dict[str, Any], local_fav: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        동기화 충돌 해결
+
+        사용 횟수가 더 많은 쪽의 내용을 택하고(같으면 서버), 마지막 사용 시각은
+        더 최근 값을 유지함. 병합 결과의 버전 벡터는 양쪽을 모두 포함하도록
+        합친 뒤 서버 카운터를 올려 두 사본보다 최신이 되게 함
+        """
+        if server_fav.get("use_count", 0) >= local_fav.get("use_count", 0):
+            merged = {**local_fav, **server_fav}
+        else:
+            merged = {**server_fav, **local_fav}
+        merged.pop("deleted", None)
+
+        last_used = [
+            value
+            for value in (server_fav.get("last_used"), local_fav.get("last_used"))
+            if value
+        ]
+        if last_used:
+            merged["last_used"] = max(last_used)
+
+        merged["version_vector"] = self._bump_server_version(
+            merge_version_vectors(
+                server_fav.get("version_vector", {}),
+                local_fav.get("version_vector") or {},
+            )
+        )
+        return merged
+
+    @staticmethod
+    def _sync_response(
+        outcome: Dict[str, Tuple[str, Optional[Dict[str, Any]]]],
+        changed: Dict[str, Optional[Dict[str, Any]]],
+        server_version: int,
+    ) -> Dict[str, Any]:
+        """동기화 응답 구성: 기기가 이미 가진 사본은 서버 변경분에서 제외"""
+        device_view = dict(changed)
+        for favorite_id, (action, record) in outcome.items():
+            if action in ("merge", "stale"):
+                device_view[favorite_id] = record
+            else:
+                device_view.pop(favorite_id, None)
+
+        actions = [action for action, _ in outcome.values()]
+        return {
+            "synchronized_count": actions.count("create"),
+            "conflicts_resolved": actions.count("merge"),
+            "updated_favorites": [
+                record
+                for action, record in outcome.values()
+                if action in ("create", "accept", "merge")
+            ],
+            "deleted_count": actions.count("delete"),
+            "server_changes": [fav for fav in device_view.values() if fav],
+            "deleted_ids": [fid for fid, fav in device_view.items() if fav is None],
+            "server_version": server_version,
+            "sync_timestamp": datetime.utcnow().isoformat(),
+        }
+
     # Mock implementation methods
 
     async def _analyze_search_patterns(self, user_id: UUID) -> List[Dict[str, Any]]:
@@ -950,31 +1414,6 @@ class FavoriteSearchesService:
             "맛집 카테고리 검색을 즐겨찾기로 더 추가해보세요",
         ]
 
-    async def _resolve_sync_conflict(
-        self, server_fav: Dict[str, Any], local_fav: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """동기화 충돌 해결 (Mock)"""
-        # 사용 횟수가 더 많은 것을 선택
-        if server_fav.get("use_count", 0) >= local_fav.get("use_count", 0):
-            return server_fav
-        else:
-            return local_fav
-
-    async def _create_favorite_from_sync(
-        self, user_id: UUID, favorite_data: Dict[str, Any]
-    ) -> None:
-        """동기화로부터 즐겨찾는 검색 생성 (Mock)"""
-        # 실제로는 create_favorite_search 호출
-
-    async def _update_favorite(
-        self, user_id: UUID, favorite_id: str, favorite_data: Dict[str, Any]
-    ) -> None:
-        """즐겨찾는 검색 업데이트 (Mock)"""
-        favorites_key = self.favorites_key_pattern.format(user_id=user_id)
-        await self.redis.hset(
-            favorites_key, favorite_id, json.dumps(favorite_data, default=str)
-        )
-
     async def _get_cached_frequent_favorites(
         self, user_id: UUID
     ) -> Optional[List[Dict[str, Any]]]:
@@ -15,8 +15,13 @@ from collections import Counter, defaultdict
 from typing import Any, Dict, List, Optional
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from app.services.search.diversity_engine import (
+    NEIGHBOR_TOP_K,
+    PlaceTextEncoder,
+    mmr_select,
+    top_k_neighbors,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +29,7 @@ logger = logging.getLogger(__name__)
 class SearchDiversityService:
     """검색 결과 다양성 보장 서비스"""
 
-    def __init__(self):
+    def __init__(self, text_encoder: Optional[PlaceTextEncoder] = None):
         """서비스 초기화"""
         # 다양성 설정
         self.diversity_weights = {
@@ -39,10 +44,13 @@ class SearchDiversityService:
         self.diversity_threshold = 0.7  # 0-1, 높을수록 더 다양함
         self.similarity_threshold = 0.8  # 유사도 임계값
 
-        # TF-IDF 벡터화 (특성 유사도 계산용)
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=100, stop_words="english", ngram_range=(1, 2)
-        )
+        # MMR 관련도 가중치 (기본 1.0: 관련도 순서 유지, 중복만 제거.
+        # 낮추면 유사 결과를 뒤로 보내 순서가 바뀜)
+        self.mmr_lambda = 1.0
+        self.neighbor_top_k = NEIGHBOR_TOP_K
+
+        # 장소 텍스트 벡터화 (오프라인 학습 벡터라이저 재사용, 요청마다 학습하지 않음)
+        self.text_encoder = text_encoder or PlaceTextEncoder()
 
     async def ensure_diversity(
         self,
@@ -151,6 +159,9 @@ class SearchDiversityService:
         """각 결과의 다양성 점수 계산"""
         diversity_scores = []
         total_results = len(search_results)
+        tag_counter = Counter(
+            tag for result in search_results for tag in result.get("tags", [])
+        )
 
         for i, result in enumerate(search_results):
             score = 0.0
@@ -186,7 +197,7 @@ class SearchDiversityService:
 
             # 특성 다양성 (태그/키워드 기반)
             feature_diversity = self._calculate_feature_diversity(
-                result, search_results
+                result, search_results, tag_counter
             )
             score += self.diversity_weights["features"] * feature_diversity
 
@@ -235,52 +246,38 @@ class SearchDiversityService:
         return balanced_results
 
     async def _remove_similar_results(
-        self, search_results: List[Dict[str, Any]]
+        self, search_results: List[Dict[str, Any]], limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """유사한 결과 제거"""
+        """유사한 결과 제거 (임계값을 넘는 모든 쌍으로 중복 제외, MMR 재정렬은 선택)"""
         if len(search_results) <= 1:
             return search_results
 
         try:
-            # 텍스트 특성 추출
-            text_features = []
-            for result in search_results:
-                # 이름, 주소, 태그 등을 결합
-                text = " ".join(
-                    [
-                        result.get("name", ""),
-                        result.get("address", ""),
-                        " ".join(result.get("tags", [])),
-                        result.get("description", ""),
-                    ]
-                ).strip()
-                text_features.append(text if text else "unknown")
-
-            # TF-IDF 벡터화
-            if len(set(text_features)) > 1:  # 유니크한 텍스트가 있을 때만
-                tfidf_matrix = self.tfidf_vectorizer.fit_transform(text_features)
-                similarity_matrix = cosine_similarity(tfidf_matrix)
-            else:
-                similarity_matrix = np.zeros((len(search_results), len(search_results)))
-
-            # 중복 제거 로직
-            unique_results = []
-            used_indices = set()
-
-            for i, result in enumerate(search_results):
-                if i in used_indices:
-                    continue
-
-                unique_results.append(result)
-                used_indices.add(i)
-
-                # 유사한 결과들을 제외 목록에 추가
-                for j in range(i + 1, len(search_results)):
-                    if (
-                        j not in used_indices
-                        and similarity_matrix[i][j] > self.similarity_threshold
-                    ):
-                        used_indices.add(j)
+            vectors = self.text_encoder.encode(search_results)
+            # 상위 k 이웃은 MMR 감점 계산 가속용 (중복 판정에는 쓰지 않음)
+            neighbors = (
+                top_k_neighbors(vectors, k=self.neighbor_top_k)
+                if self.mmr_lambda < 1.0
+                else None
+            )
+            relevance = np.array(
+                [
+                    result.get(
+                        "balanced_score", result.get("personalization_score", 0.5)
+                    )
+                    for result in search_results
+                ]
+            )
+
+            selected = mmr_select(
+                relevance,
+                vectors,
+                lambda_=self.mmr_lambda,
+                similarity_threshold=self.similarity_threshold,
+                limit=limit,
+                neighbors=neighbors,
+            )
+            unique_results = [search_results[i] for i in selected]
 
             logger.info(
                 f"Removed {len(search_results) - len(unique_results)} similar results"
@@ -400,24 +397,24 @@ class SearchDiversityService:
             return "below_average"
 
     def _calculate_feature_diversity(
-        self, result: Dict[str, Any], all_results: List[Dict[str, Any]]
+        self,
+        result: Dict[str, Any],
+        all_results: List[Dict[str, Any]],
+        tag_counter: Optional[Counter] = None,
     ) -> float:
-        """특성 다양성 계산"""
+        """특성 다양성 계산 (tag_counter: 전체 결과 태그 빈도, 없으면 새로 집계)"""
         result_tags = set(result.get("tags", []))
         if not result_tags:
             return 0.5  # 중간값
 
         # 전체 결과에서 해당 태그들의 빈도 계산
-        all_tags = []
-        for r in all_results:
-            all_tags.extend(r.get("tags", []))
+        if tag_counter is None:
+            tag_counter = Counter(tag for r in all_results for tag in r.get("tags", []))
+        total_tags = sum(tag_counter.values())
 
-        if not all_tags:
+        if not total_tags:
             return 0.5
 
-        tag_counter = Counter(all_tags)
-        total_tags = len(all_tags)
-
         # 태그별 희소성 계산 (빈도가 낮을수록 다양성이 높음)
         diversity_score = 0.0
         for tag in result_tags:
@@ -21,6 +21,7 @@ from app.core.cache import CacheService
 from app.models.search_preference import SearchHistory, UserSearchPattern
 from app.schemas.search_ranking import FeedbackType
 from app.services.ml.ml_engine import MLEngine
+from app.services.ranking.activity_counters import ActivityCounters, activity_counters
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +30,17 @@ class SearchFeedbackService:
     """검색 피드백 학습 서비스"""
 
     def __init__(
-        self, db: AsyncSession, cache_service: CacheService, ml_engine: MLEngine
+        self,
+        db: AsyncSession,
+        cache_service: CacheService,
+        ml_engine: MLEngine,
+        counters: Optional[ActivityCounters] = None,
     ):
         """서비스 초기화"""
         self.db = db
         self.cache = cache_service
         self.ml_engine = ml_engine
+        self.counters = counters or activity_counters
 
         # 피드백 처리 설정
         self.batch_size = 50  # 배치 학습 크기
@@ -96,6 +102,9 @@ class SearchFeedbackService:
             # 비동기 배치 처리를 위한 큐에 추가
             await self._add_to_processing_queue(feedback_data)
 
+            # 인기도/트렌딩 스트리밍 카운터 갱신
+            await self.counters.record_place_event(place_id, feedback_type.value)
+
             # 검색 히스토리 업데이트
             await self._update_search_history(
                 user_id, search_session_id, place_id, feedback_type, context
@@ -12,8 +12,8 @@ import hashlib
 import json
 import logging
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 from uuid import UUID, uuid4
 
 import redis.asyncio as redis
@@ -46,11 +46,22 @@ class SearchHistoryService:
         self.privacy_mode = privacy_mode
 
         # Redis 키 패턴
-        self.history_key_pattern = "search_history:{user_id}"
+        # 히스토리: 검색 ID → 항목 해시 + 검색 시각 점수의 타임라인(정렬 집합)
+        self.timeline_key_pattern = "search_history:{user_id}:timeline"
+        self.entries_key_pattern = "search_history:{user_id}:entries"
+        self.history_key_pattern = "search_history:{user_id}"  # 이전 리스트 형식
+        self.patterns_key_pattern = "search_patterns:{user_id}"
         self.frequency_key_pattern = "search_frequency:{user_id}"
         self.interaction_key_pattern = "search_interactions:{search_id}"
         self.session_key_pattern = "search_session:{user_id}:{session_id}"
 
+        # 타임라인에서 빠진 항목 본문은 이만큼 쌓이면 한 번에 삭제
+        self.trim_batch_size = 20
+        self.pattern_cache_ttl = 3600
+        self.export_page_size = 500
+        # 딕셔너리 내보내기는 이 기간 이내만 (그 이상은 스트리밍 내보내기)
+        self.max_export_days = 31
+
     async def record_search(
         self,
         user_id: UUID,
@@ -86,26 +97,35 @@ class SearchHistoryService:
                 "clicked_places": [],  # 초기엔 빈 리스트, 후에 업데이트
             }
 
-            # Redis에 히스토리 저장
-            history_key = self.history_key_pattern.format(user_id=user_id)
-            await self.redis.lpush(history_key, json.dumps(history_item, default=str))
-
-            # 히스토리 크기 제한
-            await self.redis.ltrim(history_key, 0, self.max_history - 1)
+            # 저장, 개수/기간 제한, 빈도, 세션 기록, 패턴 캐시 무효화를 한 번에 전송
+            timeline_key = self.timeline_key_pattern.format(user_id=user_id)
+            entries_key = self.entries_key_pattern.format(user_id=user_id)
+            ttl_seconds = self.retention_days * 24 * 3600  # 개인정보 보호
 
-            # TTL 설정 (개인정보 보호)
-            ttl_seconds = self.retention_days * 24 * 3600
-            await self.redis.expire(history_key, ttl_seconds)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.hset(entries_key, search_id, json.dumps(history_item, default=str))
+            pipe.zadd(timeline_key, {search_id: self._score(timestamp)})
+            pipe.zremrangebyrank(timeline_key, 0, -(self.max_history + 1))
+            pipe.zremrangebyscore(timeline_key, "-inf", self._retention_cutoff())
+            pipe.expire(timeline_key, ttl_seconds)
+            pipe.expire(entries_key, ttl_seconds)
+            pipe.delete(self.patterns_key_pattern.format(user_id=user_id))
 
             # 검색 빈도 추적
             if self.analytics_enabled and search_data.get("query"):
-                await self._update_search_frequency(user_id, search_data["query"])
+                self._queue_search_frequency(pipe, user_id, search_data["query"])
 
             # 세션별 검색 그룹핑
             if session_id:
-                await self._record_session_search(
-                    user_id, session_id, search_id, timestamp
-                )
+                self._queue_session_search(pipe, user_id, session_id, search_id)
+
+            pipe.hlen(entries_key)
+            pipe.zcard(timeline_key)
+            *_, entry_count, timeline_count = await pipe.execute()
+
+            # 타임라인에서 밀려난 항목 본문 정리 (일정 개수마다 한 번)
+            if entry_count - timeline_count >= self.trim_batch_size:
+                await self._drop_trimmed_entries(user_id)
 
             logger.debug(f"Recorded search history for user {user_id}: {search_id}")
             return search_id
@@ -126,25 +146,15 @@ class SearchHistoryService:
             if session_id:
                 return await self.get_session_search_history(user_id, session_id)
 
-            history_key = self.history_key_pattern.format(user_id=user_id)
-            history_items = await self.redis.lrange(
-                history_key, offset, offset + limit - 1
-            )
+            if limit <= 0:
+                return []
 
-            # JSON 파싱 및 데이터 변환
-            history = []
-            for item_json in history_items:
-                try:
-                    item = json.loads(item_json)
-                    # 개인정보 보호 모드에서는 민감한 정보 마스킹
-                    if self.privacy_mode:
-                        item = self._mask_sensitive_data(item)
-                    history.append(item)
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in history: {item_json}")
-                    continue
-
-            return history
+            timeline_key = self.timeline_key_pattern.format(user_id=user_id)
+            search_ids = await self._run_on_timeline(
+                user_id,
+                lambda pipe: pipe.zrevrange(timeline_key, offset, offset + limit - 1),
+            )
+            return await self._load_entries(user_id, search_ids)
 
         except Exception as e:
             logger.error(f"Failed to get search history: {str(e)}")
@@ -272,37 +282,63 @@ class SearchHistoryService:
             if not self.pattern_analysis_enabled:
                 return {}
 
-            # 분석 기간 내 검색 히스토리 조회
-            history = await self.get_search_history(user_id, limit=200)
+            # 새 검색/삭제 전까지는 기간별 분석 결과를 캐시에서 반환
+            patterns_key = self.patterns_key_pattern.format(user_id=user_id)
+            cached = await self.redis.hget(patterns_key, str(analysis_period_days))
+            if cached:
+                return json.loads(cached)
 
-            # 시간 필터링
-            cutoff_date = datetime.utcnow() - timedelta(days=analysis_period_days)
-            filtered_history = [
-                item
-                for item in history
-                if datetime.fromisoformat(item["timestamp"]) > cutoff_date
+            # 분석 기간 내 최근 200건 (기간 필터는 타임라인 점수 범위로 처리)
+            timeline_key = self.timeline_key_pattern.format(user_id=user_id)
+            cutoff = self._score(
+                datetime.utcnow() - timedelta(days=analysis_period_days)
+            )
+            page = await self._run_on_timeline(
+                user_id,
+                lambda pipe: pipe.zrevrangebyscore(
+                    timeline_key,
+                    "+inf",
+                    f"({cutoff}",
+                    start=0,
+                    num=200,
+                    withscores=True,
+                ),
+            )
+            scores = dict(page)
+            filtered_history = await self._load_entries(user_id, list(scores))
+            timestamps = [
+                self._from_score(scores[item["search_id"]]) for item in filtered_history
             ]
 
             if not filtered_history:
-                return {"message": "분석할 데이터가 부족합니다"}
-
-            # 패턴 분석
-            patterns = {
-                "preferred_categories": self._analyze_category_preferences(
-                    filtered_history
-                ),
-                "preferred_regions": self._analyze_region_preferences(filtered_history),
-                "search_time_patterns": self._analyze_time_patterns(filtered_history),
-                "query_complexity_trends": self._analyze_query_complexity(
-                    filtered_history
-                ),
-                "filter_usage_patterns": self._analyze_filter_usage(filtered_history),
-                "search_frequency_pattern": self._analyze_search_frequency(
-                    filtered_history
-                ),
-            }
+                patterns = {"message": "분석할 데이터가 부족합니다"}
+            else:
+                patterns = {
+                    "preferred_categories": self._analyze_category_preferences(
+                        filtered_history
+                    ),
+                    "preferred_regions": self._analyze_region_preferences(
+                        filtered_history
+                    ),
+                    "search_time_patterns": self._analyze_time_patterns(timestamps),
+                    "query_complexity_trends": self._analyze_query_complexity(
+                        filtered_history
+                    ),
+                    "filter_usage_patterns": self._analyze_filter_usage(
+                        filtered_history
+                    ),
+                    "search_frequency_pattern": self._analyze_search_frequency(
+                        timestamps
+                    ),
+                }
 
-            return patterns
+            # 캐시와 같은 형태(JSON 왕복)로 반환
+            payload = json.dumps(patterns, default=str)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(patterns_key, str(analysis_period_days), payload)
+            pipe.expire(patterns_key, self.pattern_cache_ttl)
+            await pipe.execute()
+            return json.loads(payload)
 
         except Exception as e:
             logger.error(f"Pattern analysis failed: {str(e)}")
@@ -356,13 +392,8 @@ class SearchHistoryService:
 
             search_ids = await self.redis.lrange(session_key, 0, -1)
 
-            # 각 검색 ID에 해당하는 상세 정보 조회
-            history = await self.get_search_history(user_id, limit=100)
-            session_searches = [
-                item
-                for item in history
-                if item.get("search_id") in [sid.decode() for sid in search_ids]
-            ]
+            # 검색 ID로 해당 항목만 조회
+            session_searches = await self._load_entries(user_id, search_ids)
 
             return sorted(session_searches, key=lambda x: x["timestamp"], reverse=True)
 
@@ -371,43 +402,22 @@ class SearchHistoryService:
             return []
 
     async def cleanup_old_history(self, user_id: UUID) -> int:
-        """오래된 검색 히스토리 정리"""
-        try:
-            history = await self.get_search_history(user_id, limit=1000)
-            cutoff_date = datetime.utcnow() - timedelta(days=self.retention_days)
-
-            # 유효한 히스토리 필터링
-            valid_history = []
-            cleaned_count = 0
-
-            for item in history:
-                try:
-                    item_date = datetime.fromisoformat(item["timestamp"])
-                    if item_date > cutoff_date:
-                        valid_history.append(item)
-                    else:
-                        cleaned_count += 1
-                except (ValueError, KeyError):
-                    cleaned_count += 1
-
-            # 정리된 히스토리로 교체
-            if cleaned_count > 0:
-                history_key = self.history_key_pattern.format(user_id=user_id)
-
-                # 기존 리스트 삭제
-                await self.redis.delete(history_key)
-
-                # 유효한 항목들만 다시 저장
-                if valid_history:
-                    valid_items = [
-                        json.dumps(item, default=str) for item in valid_history
-                    ]
-                    await self.redis.lpush(history_key, *valid_items)
-
-                    # TTL 재설정
-                    ttl_seconds = self.retention_days * 24 * 3600
-                    await self.redis.expire(history_key, ttl_seconds)
+        """
+        오래된 검색 히스토리 정리
 
+        기록할 때마다 보관 기간이 지난 항목을 타임라인에서 빼므로, 여기서는
+        기록이 없던 사용자의 남은 항목을 점수 범위로 지우고 본문을 정리함
+        """
+        try:
+            timeline_key = self.timeline_key_pattern.format(user_id=user_id)
+            cleaned_count = await self._run_on_timeline(
+                user_id,
+                lambda pipe: pipe.zremrangebyscore(
+                    timeline_key, "-inf", self._retention_cutoff()
+                ),
+            )
+            if cleaned_count:
+                await self._drop_trimmed_entries(user_id)
             return cleaned_count
 
         except Exception as e:
@@ -421,41 +431,34 @@ class SearchHistoryService:
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
     ) -> Dict[str, Any]:
-        """검색 히스토리 데이터 내보내기"""
-        try:
-            history = await self.get_search_history(user_id, limit=1000)
-
-            # 날짜 필터링
-            if date_from or date_to:
-                filtered_history = []
-                for item in history:
-                    item_date = datetime.fromisoformat(item["timestamp"])
-
-                    if date_from and item_date < date_from:
-                        continue
-                    if date_to and item_date > date_to:
-                        continue
+        """
+        검색 히스토리 데이터 내보내기 (max_export_days 이내 기간만)
 
-                    filtered_history.append(item)
-                history = filtered_history
+        기간이 열려 있거나 더 긴 범위는 항목을 모두 메모리에 올리지 않도록
+        stream_search_history_export로 내보낸다.
+        """
+        try:
+            if (
+                date_from is None
+                or date_to is None
+                or date_to - date_from > timedelta(days=self.max_export_days)
+            ):
+                return {
+                    "error": (
+                        f"Export range must be bounded to {self.max_export_days} days; "
+                        "use stream_search_history_export for larger ranges"
+                    )
+                }
 
-            export_data = {
-                "user_id": str(user_id),
-                "export_date": datetime.utcnow().isoformat(),
-                "format": format,
-                "total_searches": len(history),
-                "date_range": {
-                    "from": date_from.isoformat() if date_from else None,
-                    "to": date_to.isoformat() if date_to else None,
-                },
-                "search_history": history,
-            }
+            history = [
+                item
+                async for item in self.iter_search_history(user_id, date_from, date_to)
+            ]
 
-            # 개인정보 보호 처리
-            if self.privacy_mode:
-                export_data["search_history"] = [
-                    self._mask_sensitive_data(item) for item in history
-                ]
+            export_data = self._export_header(user_id, format, date_from, date_to)
+            export_data["total_searches"] = len(history)
+            # 개인정보 보호 모드면 마스킹된 항목
+            export_data["search_history"] = history
 
             return export_data
 
@@ -463,25 +466,100 @@ class SearchHistoryService:
             logger.error(f"History export failed: {str(e)}")
             return {"error": str(e)}
 
-    async def delete_search_entry(self, user_id: UUID, search_id: str) -> bool:
-        """특정 검색 항목 삭제"""
-        try:
-            history = await self.get_search_history(user_id, limit=1000)
-            updated_history = [
-                item for item in history if item.get("search_id") != search_id
-            ]
+    async def stream_search_history_export(
+        self,
+        user_id: UUID,
+        format: str = "json",
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> AsyncIterator[str]:
+        """
+        검색 히스토리 내보내기를 JSON 문서 조각으로 스트리밍 (StreamingResponse 본문용)
+
+        iter_search_history로 한 페이지씩 읽어 항목별로 내보내므로 기간 크기와
+        관계없이 메모리 사용량이 일정함. 전체 개수는 마지막 조각에 포함
+        """
+        header = json.dumps(
+            self._export_header(user_id, format, date_from, date_to), default=str
+        )
+        yield header[:-1] + ', "search_history": ['
 
-            # 업데이트된 히스토리로 교체
-            history_key = self.history_key_pattern.format(user_id=user_id)
-            await self.redis.delete(history_key)
+        total = 0
+        async for item in self.iter_search_history(user_id, date_from, date_to):
+            yield ("," if total else "") + json.dumps(item, default=str)
+            total += 1
 
-            if updated_history:
-                items = [json.dumps(item, default=str) for item in updated_history]
-                await self.redis.lpush(history_key, *items)
+        yield f'], "total_searches": {total}}}'
 
-            # 관련 상호작용 데이터도 삭제
-            interaction_key = self.interaction_key_pattern.format(search_id=search_id)
-            await self.redis.delete(interaction_key)
+    def _export_header(
+        self,
+        user_id: UUID,
+        format: str,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+    ) -> Dict[str, Any]:
+        return {
+            "user_id": str(user_id),
+            "export_date": datetime.utcnow().isoformat(),
+            "format": format,
+            "date_range": {
+                "from": date_from.isoformat() if date_from else None,
+                "to": date_to.isoformat() if date_to else None,
+            },
+        }
+
+    async def iter_search_history(
+        self,
+        user_id: UUID,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        기간 내 검색 히스토리를 최신순으로 페이지 단위 순회
+
+        타임라인 점수(검색 시각) 범위를 ZREVRANGEBYSCORE LIMIT으로 나눠 읽어
+        범위 크기와 관계없이 한 페이지 분량만 메모리에 올림. 다음 페이지는
+        마지막 점수부터 이어 읽고, 같은 점수의 항목은 이미 읽은 만큼 건너뜀
+        """
+        page_size = page_size or self.export_page_size
+        timeline_key = self.timeline_key_pattern.format(user_id=user_id)
+        max_score = self._score(date_to) if date_to else "+inf"
+        min_score = self._score(date_from) if date_from else "-inf"
+        skip = 0
+
+        while True:
+            page = await self._run_on_timeline(
+                user_id,
+                lambda pipe: pipe.zrevrangebyscore(
+                    timeline_key,
+                    max_score,
+                    min_score,
+                    start=skip,
+                    num=page_size,
+                    withscores=True,
+                ),
+            )
+            for item in await self._load_entries(user_id, [sid for sid, _ in page]):
+                yield item
+            if len(page) < page_size:
+                return
+
+            last_score = page[-1][1]
+            ties = sum(1 for _, score in page if score == last_score)
+            skip = ties + (skip if last_score == max_score else 0)
+            max_score = last_score
+
+    async def delete_search_entry(self, user_id: UUID, search_id: str) -> bool:
+        """특정 검색 항목 삭제 (타임라인/본문에서 ID로 제거)"""
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.zrem(self.timeline_key_pattern.format(user_id=user_id), search_id)
+            pipe.hdel(self.entries_key_pattern.format(user_id=user_id), search_id)
+            # 관련 상호작용 데이터와 패턴 캐시도 삭제
+            pipe.delete(self.interaction_key_pattern.format(search_id=search_id))
+            pipe.delete(self.patterns_key_pattern.format(user_id=user_id))
+            await pipe.execute()
 
             return True
 
@@ -503,7 +581,10 @@ class SearchHistoryService:
 
             # 모든 관련 데이터 삭제
             patterns_to_delete = [
+                self.timeline_key_pattern.format(user_id=user_id),
+                self.entries_key_pattern.format(user_id=user_id),
                 self.history_key_pattern.format(user_id=user_id),
+                self.patterns_key_pattern.format(user_id=user_id),
                 self.frequency_key_pattern.format(user_id=user_id),
                 f"search_session:{user_id}:*",
             ]
@@ -533,50 +614,134 @@ class SearchHistoryService:
 
     # Private helper methods
 
-    async def _update_search_frequency(self, user_id: UUID, query: str) -> None:
+    @staticmethod
+    def _score(moment: datetime) -> float:
+        """검색 시각 → 타임라인 점수 (시간대 없는 값은 UTC로 간주)"""
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment.timestamp()
+
+    @staticmethod
+    def _from_score(score: float) -> datetime:
+        return datetime.fromtimestamp(score, timezone.utc).replace(tzinfo=None)
+
+    def _retention_cutoff(self) -> float:
+        return self._score(datetime.utcnow() - timedelta(days=self.retention_days))
+
+    def _queue_search_frequency(self, pipe: Any, user_id: UUID, query: str) -> None:
         """검색 빈도 업데이트"""
-        try:
-            frequency_key = self.frequency_key_pattern.format(user_id=user_id)
-            await self.redis.zincrby(frequency_key, 1, query)
-            await self.redis.expire(frequency_key, 86400 * self.retention_days)
-        except Exception as e:
-            logger.error(f"Frequency update failed: {str(e)}")
+        frequency_key = self.frequency_key_pattern.format(user_id=user_id)
+        pipe.zincrby(frequency_key, 1, query)
+        pipe.expire(frequency_key, 86400 * self.retention_days)
 
-    async def _record_session_search(
-        self, user_id: UUID, session_id: str, search_id: str, timestamp: datetime
+    def _queue_session_search(
+        self, pipe: Any, user_id: UUID, session_id: str, search_id: str
     ) -> None:
         """세션별 검색 기록"""
-        try:
-            session_key = self.session_key_pattern.format(
-                user_id=user_id, session_id=session_id
-            )
-            await self.redis.lpush(session_key, search_id)
-            await self.redis.expire(
-                session_key, int(self.session_timeout.total_seconds())
-            )
-        except Exception as e:
-            logger.error(f"Session recording failed: {str(e)}")
+        session_key = self.session_key_pattern.format(
+            user_id=user_id, session_id=session_id
+        )
+        pipe.lpush(session_key, search_id)
+        pipe.expire(session_key, int(self.session_timeout.total_seconds()))
+
+    async def _run_on_timeline(
+        self, user_id: UUID, queue_command: Callable[[Any], Any]
+    ) -> Any:
+        """
+        타임라인 명령 실행
+
+        이전 리스트 형식의 히스토리가 남아 있으면 타임라인으로 옮긴 뒤 다시 실행
+        (존재 확인은 같은 파이프라인에 실려 추가 왕복 없음)
+        """
+        history_key = self.history_key_pattern.format(user_id=user_id)
+        for attempt in range(2):
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.exists(history_key)
+            queue_command(pipe)
+            legacy_exists, result = await pipe.execute()
+            if not legacy_exists or attempt:
+                return result
+            await self._migrate_legacy_history(user_id)
+
+    async def _migrate_legacy_history(self, user_id: UUID) -> None:
+        """이전 JSON 리스트 히스토리를 타임라인/본문 해시로 이관"""
+        history_key = self.history_key_pattern.format(user_id=user_id)
+        timeline_key = self.timeline_key_pattern.format(user_id=user_id)
+        entries_key = self.entries_key_pattern.format(user_id=user_id)
+
+        pipe = self.redis.pipeline(transaction=True)
+        for item_json in await self.redis.lrange(history_key, 0, -1):
+            try:
+                item = json.loads(item_json)
+                score = self._score(datetime.fromisoformat(item["timestamp"]))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                logger.warning(f"Skipping invalid legacy history item: {item_json}")
+                continue
+            item["search_id"] = item.get("search_id") or str(uuid4())
+            pipe.hset(entries_key, item["search_id"], json.dumps(item, default=str))
+            pipe.zadd(timeline_key, {item["search_id"]: score})
+
+        ttl_seconds = self.retention_days * 24 * 3600
+        pipe.zremrangebyrank(timeline_key, 0, -(self.max_history + 1))
+        pipe.expire(timeline_key, ttl_seconds)
+        pipe.expire(entries_key, ttl_seconds)
+        pipe.delete(history_key)
+        await pipe.execute()
+
+    async def _load_entries(
+        self, user_id: UUID, search_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """검색 ID 순서대로 항목 조회 (개인정보 보호 모드면 마스킹)"""
+        if not search_ids:
+            return []
+        entries_key = self.entries_key_pattern.format(user_id=user_id)
+        history = []
+        for item_json in await self.redis.hmget(entries_key, search_ids):
+            if not item_json:
+                continue
+            try:
+                item = json.loads(item_json)
+            except json.JSONDecodeError:
+                logger.warning(f"Invalid JSON in history: {item_json}")
+                continue
+            # 개인정보 보호 모드에서는 민감한 정보 마스킹
+            if self.privacy_mode:
+                item = self._mask_sensitive_data(item)
+            history.append(item)
+        return history
+
+    async def _drop_trimmed_entries(self, user_id: UUID) -> None:
+        """개수/기간 제한으로 타임라인에서 빠진 항목의 본문을 일괄 삭제"""
+        timeline_key = self.timeline_key_pattern.format(user_id=user_id)
+        entries_key = self.entries_key_pattern.format(user_id=user_id)
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hkeys(entries_key)
+        pipe.zrange(timeline_key, 0, -1)
+        entry_ids, live_ids = await pipe.execute()
+
+        trimmed = set(entry_ids) - set(live_ids)
+        if trimmed:
+            await self.redis.hdel(entries_key, *trimmed)
 
     async def _update_clicked_places(
         self, user_id: UUID, search_id: str, place_id: str
     ) -> None:
-        """검색 히스토리의 클릭한 장소 업데이트"""
+        """검색 히스토리의 클릭한 장소 업데이트 (ID로 해당 항목만 읽고 씀)"""
         try:
-            history = await self.get_search_history(user_id, limit=100)
-
-            for i, item in enumerate(history):
-                if item.get("search_id") == search_id:
-                    clicked_places = item.get("clicked_places", [])
-                    if place_id not in clicked_places:
-                        clicked_places.append(place_id)
-                        item["clicked_places"] = clicked_places
-
-                        # Redis에 업데이트된 히스토리 저장
-                        history_key = self.history_key_pattern.format(user_id=user_id)
-                        await self.redis.lset(
-                            history_key, i, json.dumps(item, default=str)
-                        )
-                    break
+            entries_key = self.entries_key_pattern.format(user_id=user_id)
+            item_json = await self.redis.hget(entries_key, search_id)
+            if not item_json:
+                return
+
+            item = json.loads(item_json)
+            clicked_places = item.get("clicked_places", [])
+            if place_id not in clicked_places:
+                clicked_places.append(place_id)
+                item["clicked_places"] = clicked_places
+                await self.redis.hset(
+                    entries_key, search_id, json.dumps(item, default=str)
+                )
         except Exception as e:
             logger.error(f"Clicked places update failed: {str(e)}")
 
@@ -662,13 +827,12 @@ class SearchHistoryService:
             for region, count in region_counts.most_common(5)
         ]
 
-    def _analyze_time_patterns(self, history: List[Dict]) -> Dict[str, Any]:
+    def _analyze_time_patterns(self, timestamps: List[datetime]) -> Dict[str, Any]:
         """시간대별 검색 패턴 분석"""
         hours = []
         days = []
 
-        for item in history:
-            timestamp = datetime.fromisoformat(item["timestamp"])
+        for timestamp in timestamps:
             hours.append(timestamp.hour)
             days.append(timestamp.strftime("%A"))
 
@@ -702,13 +866,12 @@ class SearchHistoryService:
 
         return dict(filter_usage)
 
-    def _analyze_search_frequency(self, history: List[Dict]) -> Dict[str, Any]:
+    def _analyze_search_frequency(self, timestamps: List[datetime]) -> Dict[str, Any]:
         """검색 빈도 패턴 분석"""
-        if not history:
+        if not timestamps:
             return {}
 
-        timestamps = [datetime.fromisoformat(item["timestamp"]) for item in history]
-        timestamps.sort()
+        timestamps = sorted(timestamps)
 
         # 일별 검색 빈도 계산
         daily_counts = defaultdict(int)
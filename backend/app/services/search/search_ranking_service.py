@@ -9,7 +9,7 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
 # from app.core.config import settings
@@ -512,6 +512,75 @@ class SearchRankingService:
 
         return final_score
 
+    @staticmethod
+    def factor_contributions(result: Dict[str, Any]) -> Dict[str, float]:
+        """랭킹 결과의 요인별 기여도 추출 (캐시에서 온 dict 형태도 허용)"""
+        contributions = {}
+        for name, factor in (result.get("ranking_factors") or {}).items():
+            if isinstance(factor, dict):
+                contributions[name] = float(factor.get("contribution", 0.0))
+            else:
+                contributions[name] = factor.contribution
+        return contributions
+
+    @staticmethod
+    def score_from_contributions(contributions: Dict[str, float]) -> float:
+        """요인별 기여도로 최종 점수 계산 (_calculate_final_score와 동일한 정규화)"""
+        return max(0.0, min(1.0, sum(contributions.values())))
+
+    async def rescore_factors(
+        self,
+        user_id: UUID,
+        search_results: List[Dict[str, Any]],
+        context: Dict[str, Any],
+        factors: Set[str],
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        지정한 랭킹 요인의 기여도만 다시 계산
+
+        ML/개인화처럼 컨텍스트 변화와 무관한 요인은 건너뛰어
+        실시간 트리거마다 전체 랭킹을 다시 계산하지 않도록 한다.
+
+        Args:
+            user_id: 사용자 ID
+            search_results: 재계산 대상 결과
+            context: 갱신된 검색 컨텍스트
+            factors: 재계산할 요인 (contextual, behavior_score, real_time)
+
+        Returns:
+            장소 ID별 {요인: 기여도}
+        """
+        weights = self.default_weights
+        rescored: Dict[str, Dict[str, float]] = {
+            result.get("id"): {} for result in search_results
+        }
+
+        if "contextual" in factors:
+            adjustments = await self._apply_contextual_adjustments(
+                search_results, context
+            )
+            weight = weights["contextual"]
+            for place_id, scores in rescored.items():
+                scores["contextual"] = (adjustments.get(place_id, 1.0) - 1.0) * weight
+
+        if "behavior_score" in factors:
+            behavior_scores = await self._calculate_behavior_scores(
+                user_id, search_results
+            )
+            for place_id, scores in rescored.items():
+                scores["behavior_score"] = (
+                    behavior_scores.get(place_id, 0.0) * weights["behavior_score"]
+                )
+
+        if "real_time" in factors:
+            for place_id, scores in rescored.items():
+                adjustment = await self._get_real_time_score_adjustment(
+                    user_id, place_id
+                )
+                scores["real_time"] = adjustment * weights["real_time"]
+
+        return rescored
+
     def _calculate_confidence_score(self, factors: Dict[str, RankingFactor]) -> float:
         """랭킹 신뢰도 점수 계산"""
         # 각 요소의 기여도 분산을 통한 신뢰도 계산
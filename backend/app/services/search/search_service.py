@@ -1,17 +1,18 @@
 """Advanced search service with Korean text analysis and Elasticsearch support."""
 
 import logging
-import re
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import REAL, cast, func, or_
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from app.db.elasticsearch import es_manager
 from app.models.place import Place, PlaceStatus
 from app.services.search.search_schemas import SearchIndexSchemas
-from app.utils.korean_analyzer import KoreanAnalyzer
+from app.services.search.suggestion_index import suggestion_indexes
+from app.utils.korean_analyzer import korean_analyzer
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class SearchService:
 
     def __init__(self, db: Session):
         self.db = db
-        self.korean_analyzer = KoreanAnalyzer()
+        self.korean_analyzer = korean_analyzer
         self.schemas = SearchIndexSchemas()
 
     async def initialize_elasticsearch_indices(self) -> None:
@@ -394,9 +395,8 @@ class SearchService:
             List of (Place, relevance_score) tuples
         """
         try:
-            # Analyze Korean query
-            analyzed_query = self.korean_analyzer.analyze_text(query)
-            search_terms = analyzed_query.get("keywords", [query])
+            # Analyze Korean query (keywords only)
+            search_terms = self.korean_analyzer.extract_keywords(query) or [query]
 
             # Build base query
             base_query = self.db.query(Place).filter(
@@ -406,16 +406,6 @@ class SearchService:
             if category:
                 base_query = base_query.filter(Place.category == category)
 
-            # PostgreSQL full-text search with Korean configuration
-            search_vector = func.to_tsvector(
-                "korean",
-                func.coalesce(Place.name, "")
-                + " "
-                + func.coalesce(Place.description, "")
-                + " "
-                + func.coalesce(Place.address, ""),
-            )
-
             # Create search query for multiple terms
             ts_queries = []
             for term in search_terms:
@@ -426,11 +416,12 @@ class SearchService:
             for ts_query in ts_queries[1:]:
                 combined_query = combined_query.op("||")(ts_query)
 
-            # Execute search with ranking
+            # Match against the stored, GIN-indexed search vector
+            rank = func.ts_rank(Place.search_vector, combined_query).label("rank")
             results = (
-                base_query.filter(search_vector.op("@@")(combined_query))
-                .add_columns(func.ts_rank(search_vector, combined_query).label("rank"))
-                .order_by(func.ts_rank(search_vector, combined_query).desc())
+                base_query.filter(Place.search_vector.op("@@")(combined_query))
+                .add_columns(rank)
+                .order_by(rank.desc())
                 .limit(limit)
                 .all()
             )
@@ -467,39 +458,22 @@ class SearchService:
             List of autocomplete suggestions
         """
         try:
-            # Get places for text extraction
-            places = (
-                self.db.query(Place)
+            if not partial_query.strip():
+                return []
+
+            # Per-user prefix index, built once from the user's places
+            user_index = suggestion_indexes.user_index(
+                user_id,
+                lambda: self.db.query(Place)
                 .filter(Place.user_id == user_id, Place.status == PlaceStatus.ACTIVE)
-                .all()
+                .all(),
             )
 
-            suggestions = set()
-
-            # Extract suggestions from place names and descriptions
-            for place in places:
-                # Name suggestions
-                if place.name and partial_query.lower() in place.name.lower():
-                    suggestions.add(place.name)
-
-                # Description word suggestions
-                if place.description:
-                    words = self.korean_analyzer.extract_keywords(place.description)
-                    for word in words:
-                        if partial_query.lower() in word.lower():
-                            suggestions.add(word)
-
-            # Sort by relevance (length and frequency)
-            sorted_suggestions = sorted(
-                list(suggestions),
-                key=lambda x: (
-                    len(x),
-                    (
-                        x.lower().index(partial_query.lower())
-                        if partial_query.lower() in x.lower()
-                        else 999
-                    ),
-                ),
+            # Entries are scored by length, so shorter suggestions come first
+            sorted_suggestions = list(
+                dict.fromkeys(
+                    entry.text for entry in user_index.search(partial_query, limit)
+                )
             )
 
             logger.info(
@@ -529,21 +503,13 @@ class SearchService:
             if not text or not query:
                 return text
 
-            # Analyze query terms
-            analyzed_query = self.korean_analyzer.analyze_text(query)
-            terms = analyzed_query.get("keywords", [query])
-
-            highlighted_text = text
-
-            # Highlight each term
-            for term in terms:
-                if len(term) >= 2:  # Only highlight terms with 2+ characters
-                    pattern = re.compile(re.escape(term), re.IGNORECASE)
-                    highlighted_text = pattern.sub(
-                        f"<{highlight_tag}>\\g<0></{highlight_tag}>", highlighted_text
-                    )
+            # One alternation pattern per query; terms need 2+ characters
+            terms = self.korean_analyzer.extract_keywords(query)
+            pattern = self.korean_analyzer.build_highlight_pattern(terms)
+            if pattern is None:
+                return text
 
-            return highlighted_text
+            return pattern.sub(f"<{highlight_tag}>\\g<0></{highlight_tag}>", text)
 
         except Exception as e:
             logger.error(f"Error in search highlighting: {e}")
@@ -555,10 +521,11 @@ class SearchService:
         """
         Fallback fuzzy search when exact search returns no results.
 
-        Uses similarity matching for handling typos and variations.
+        Uses trigram similarity on name and address for handling typos and
+        variations. The ``%`` operator is served by the pg_trgm GIN indexes
+        and uses pg_trgm.similarity_threshold (0.3 by default).
         """
         try:
-            # Use PostgreSQL similarity functions
             base_query = self.db.query(Place).filter(
                 Place.user_id == user_id, Place.status == PlaceStatus.ACTIVE
             )
@@ -566,17 +533,16 @@ class SearchService:
             if category:
                 base_query = base_query.filter(Place.category == category)
 
-            # Calculate similarity scores for fuzzy matching
             similarity_expr = func.greatest(
                 func.similarity(Place.name, query),
-                func.similarity(func.coalesce(Place.description, ""), query),
                 func.similarity(func.coalesce(Place.address, ""), query),
-            )
+            ).label("similarity")
 
-            # Filter by minimum similarity threshold (0.3)
             results = (
-                base_query.filter(similarity_expr > 0.3)
-                .add_columns(similarity_expr.label("similarity"))
+                base_query.filter(
+                    or_(Place.name.op("%")(query), Place.address.op("%")(query))
+                )
+                .add_columns(similarity_expr)
                 .order_by(similarity_expr.desc())
                 .limit(limit)
                 .all()
@@ -623,28 +589,22 @@ class SearchService:
                     "address": 0.5,  # Address matches least important
                 }
 
-            # Build weighted search expression
             ts_query = func.plainto_tsquery("korean", query)
 
-            # Separate tsvectors for different fields with weights
-            name_vector = func.setweight(
-                func.to_tsvector("korean", func.coalesce(Place.name, "")), "A"
-            )
-            tag_vector = func.setweight(
-                func.to_tsvector("korean", func.array_to_string(Place.tags, " ")), "B"
-            )
-            desc_vector = func.setweight(
-                func.to_tsvector("korean", func.coalesce(Place.description, "")), "C"
-            )
-            addr_vector = func.setweight(
-                func.to_tsvector("korean", func.coalesce(Place.address, "")), "D"
+            # search_vector stores name/tags/description/address as weights
+            # A/B/C/D; ts_rank_cd takes the weight array in {D, C, B, A} order
+            max_boost = max(boost_factors.values()) or 1.0
+            weights = cast(
+                postgresql.array(
+                    [
+                        boost_factors.get(field, 0.0) / max_boost
+                        for field in ("address", "description", "tags", "name")
+                    ]
+                ),
+                postgresql.ARRAY(REAL),
             )
-
-            # Combine all vectors
-            combined_vector = (
-                name_vector.op("||")(tag_vector)
-                .op("||")(desc_vector)
-                .op("||")(addr_vector)
+            score = func.ts_rank_cd(weights, Place.search_vector, ts_query).label(
+                "score"
             )
 
             # Execute search with custom ranking
@@ -653,10 +613,10 @@ class SearchService:
                 .filter(
                     Place.user_id == user_id,
                     Place.status == PlaceStatus.ACTIVE,
-                    combined_vector.op("@@")(ts_query),
+                    Place.search_vector.op("@@")(ts_query),
                 )
-                .add_columns(func.ts_rank_cd(combined_vector, ts_query).label("score"))
-                .order_by(func.ts_rank_cd(combined_vector, ts_query).desc())
+                .add_columns(score)
+                .order_by(score.desc())
                 .limit(limit)
                 .all()
             )
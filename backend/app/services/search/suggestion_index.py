@@ -0,0 +1,822 @@
+"""
+In-memory prefix index for autocomplete suggestions.
+
+Keeps jamo-level prefix tries over place names, tags and trending queries so
+an autocomplete lookup walks len(query) trie nodes instead of scanning places
+or trending terms on every keystroke. Every node caches the best entries of
+its subtree, which keeps warm lookups well under a millisecond.
+
+The global place/tag indexes live in every worker process. Place writes
+append the place id to a capped Redis stream (from a background thread, so
+request paths never wait on Redis). Every ``version_check_seconds`` each
+worker re-reads only the places other processes changed and updates its
+indexes in place; a full rebuild happens once the indexes are older than
+``global_index_ttl_seconds`` or, debounced, when the stream was trimmed past
+the worker's cursor. Rebuilds are built aside and swapped in whole.
+
+Hangul is indexed as decomposed jamo plus a choseong (initial consonant) key,
+so partially typed syllables ("캎" -> "카페") and initial-consonant queries
+("ㅅㅌㅂㅅ" -> "스타벅스") match. Each word suffix of a text is indexed as
+well, so "맛집" finds "홍대 맛집".
+"""
+
+import heapq
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+
+from redis import Redis
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.place import Place, PlaceStatus
+from app.utils.hangul import decompose_hangul, extract_choseong
+from app.utils.korean_analyzer import korean_analyzer
+
+logger = logging.getLogger(__name__)
+
+MAX_INDEXED_WORDS = 5
+MAX_KEY_LENGTH = 64
+CHANGES_KEY = "hotly:suggestions:places:changes"
+CHANGE_LOG_MAX_LENGTH = 10000
+REDIS_RETRY_SECONDS = 30.0
+
+PLACE_COLUMNS = (
+    Place.id,
+    Place.user_id,
+    Place.name,
+    Place.category,
+    Place.address,
+    Place.tags,
+    Place.status,
+)
+_PLACE_FIELDS = (
+    "id",
+    "user_id",
+    "name",
+    "category",
+    "address",
+    "tags",
+    "status",
+    "description",
+)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query into the jamo key space used by the index."""
+    return decompose_hangul("".join(query.lower().split()))
+
+
+def build_index_keys(text: str) -> List[str]:
+    """
+    Build the trie keys for a suggestion text.
+
+    One jamo key and one choseong key per word suffix, whitespace removed.
+    """
+    words = text.lower().split()
+    jamo_words = [decompose_hangul(word) for word in words]
+    choseong_words = [extract_choseong(word) for word in words]
+
+    keys: List[str] = []
+    for start in range(min(len(words), MAX_INDEXED_WORDS)):
+        keys.append("".join(jamo_words[start:])[:MAX_KEY_LENGTH])
+        choseong = "".join(choseong_words[start:])
+        if choseong != "".join(words[start:]):
+            keys.append(choseong[:MAX_KEY_LENGTH])
+    return list(dict.fromkeys(key for key in keys if key))
+
+
+@dataclass
+class SuggestionEntry:
+    """A single suggestion stored in the index."""
+
+    entry_id: str
+    text: str
+    score: float
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+class _TrieNode:
+    """Trie node with a lazily computed top-k cache for its subtree."""
+
+    __slots__ = ("children", "entry_ids", "top")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.entry_ids: Set[str] = set()
+        self.top: Optional[List[Tuple[float, str]]] = None
+
+
+class SuggestionIndex:
+    """Prefix trie over suggestion texts with per-node top-k caches."""
+
+    def __init__(self, top_k: int = 32):
+        self.top_k = top_k
+        self._root = _TrieNode()
+        self._entries: Dict[str, SuggestionEntry] = {}
+        self._entry_keys: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entry_id: str) -> bool:
+        return entry_id in self._entries
+
+    def get(self, entry_id: str) -> Optional[SuggestionEntry]:
+        """Return an entry by id."""
+        return self._entries.get(entry_id)
+
+    def add(
+        self,
+        entry_id: str,
+        text: str,
+        score: float,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Insert or update an entry."""
+        with self._lock:
+            existing = self._entries.get(entry_id)
+            if existing is not None and existing.text == text:
+                # Same keys: only the cached rankings along its paths go stale
+                existing.score = score
+                existing.payload = payload or {}
+                for key in self._entry_keys[entry_id]:
+                    self._invalidate_path(key)
+                return
+
+            if existing is not None:
+                self._remove_locked(entry_id)
+
+            keys = build_index_keys(text)
+            if not keys:
+                return
+
+            self._entries[entry_id] = SuggestionEntry(
+                entry_id=entry_id, text=text, score=score, payload=payload or {}
+            )
+            self._entry_keys[entry_id] = keys
+
+            for key in keys:
+                node = self._root
+                node.top = None
+                for char in key:
+                    node = node.children.setdefault(char, _TrieNode())
+                    node.top = None
+                node.entry_ids.add(entry_id)
+
+    def remove(self, entry_id: str) -> bool:
+        """Remove an entry. Returns False if it was not indexed."""
+        with self._lock:
+            if entry_id not in self._entries:
+                return False
+            self._remove_locked(entry_id)
+            return True
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        predicate: Optional[Callable[[SuggestionEntry], bool]] = None,
+    ) -> List[SuggestionEntry]:
+        """
+        Return the highest scoring entries whose keys start with the query.
+
+        Args:
+            query: Raw user input
+            limit: Maximum entries
+            predicate: Optional filter applied before ranking
+
+        Returns:
+            Entries ordered by score (descending)
+        """
+        prefix = normalize_query(query)
+        if not prefix or limit <= 0:
+            return []
+
+        with self._lock:
+            node = self._root
+            for char in prefix:
+                node = node.children.get(char)
+                if node is None:
+                    return []
+
+            if predicate is None and limit <= self.top_k:
+                ranked = self._top(node)[:limit]
+            else:
+                ranked = self._collect(node, limit, predicate)
+
+            return [self._entries[entry_id] for _, entry_id in ranked]
+
+    def _top(self, node: _TrieNode) -> List[Tuple[float, str]]:
+        if node.top is None:
+            candidates: Dict[str, float] = {
+                entry_id: self._entries[entry_id].score for entry_id in node.entry_ids
+            }
+            for child in node.children.values():
+                for score, entry_id in self._top(child):
+                    candidates[entry_id] = score
+            node.top = heapq.nlargest(
+                self.top_k,
+                ((score, entry_id) for entry_id, score in candidates.items()),
+            )
+        return node.top
+
+    def _collect(
+        self,
+        node: _TrieNode,
+        limit: int,
+        predicate: Optional[Callable[[SuggestionEntry], bool]],
+    ) -> List[Tuple[float, str]]:
+        seen: Set[str] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            seen.update(current.entry_ids)
+            stack.extend(current.children.values())
+
+        candidates = (
+            (self._entries[entry_id].score, entry_id)
+            for entry_id in seen
+            if predicate is None or predicate(self._entries[entry_id])
+        )
+        return heapq.nlargest(limit, candidates)
+
+    def _invalidate_path(self, key: str) -> None:
+        node = self._root
+        node.top = None
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return
+            node.top = None
+
+    def _remove_locked(self, entry_id: str) -> None:
+        del self._entries[entry_id]
+        for key in self._entry_keys.pop(entry_id, []):
+            path = [self._root]
+            for char in key:
+                child = path[-1].children.get(char)
+                if child is None:
+                    break
+                path.append(child)
+            else:
+                path[-1].entry_ids.discard(entry_id)
+
+            for node in path:
+                node.top = None
+
+            # Prune nodes left empty by the removal
+            for depth in range(len(path) - 1, 0, -1):
+                node = path[depth]
+                if node.children or node.entry_ids:
+                    break
+                del path[depth - 1].children[key[depth - 1]]
+
+
+@dataclass
+class _PlaceRecord:
+    user_id: str
+    name_key: str
+    tags: Tuple[str, ...]
+
+
+class _GlobalIndexes:
+    """Place-name and tag indexes plus the counts behind their scores."""
+
+    def __init__(self) -> None:
+        self.places = SuggestionIndex()
+        self.tags = SuggestionIndex()
+        self.records: Dict[str, _PlaceRecord] = {}
+        self._name_counts: Dict[str, int] = {}
+        self._tag_counts: Dict[str, int] = {}
+
+    def index_place(self, place: Any) -> None:
+        if not place.name:
+            return
+
+        place_id = str(place.id)
+        name_key = " ".join(place.name.lower().split())
+        tags = tuple(dict.fromkeys(tag for tag in (place.tags or []) if tag))
+        self.records[place_id] = _PlaceRecord(
+            user_id=str(place.user_id), name_key=name_key, tags=tags
+        )
+
+        count = self._name_counts.get(name_key, 0) + 1
+        self._name_counts[name_key] = count
+        self.places.add(
+            f"name:{name_key}",
+            place.name,
+            float(count),
+            {
+                "place_id": place_id,
+                "category": place.category,
+                "address": place.address,
+                "place_count": count,
+            },
+        )
+
+        for tag in tags:
+            tag_count = self._tag_counts.get(tag, 0) + 1
+            self._tag_counts[tag] = tag_count
+            self.tags.add(
+                f"tag:{tag}", tag, float(tag_count), {"usage_count": tag_count}
+            )
+
+    def unindex_place(self, place_id: str) -> Optional[_PlaceRecord]:
+        record = self.records.pop(place_id, None)
+        if record is None:
+            return None
+
+        entry_id = f"name:{record.name_key}"
+        count = self._name_counts.get(record.name_key, 1) - 1
+        if count <= 0:
+            self._name_counts.pop(record.name_key, None)
+            self.places.remove(entry_id)
+        else:
+            self._name_counts[record.name_key] = count
+            entry = self.places.get(entry_id)
+            if entry is not None:
+                payload = dict(entry.payload, place_count=count)
+                self.places.add(entry_id, entry.text, float(count), payload)
+
+        for tag in record.tags:
+            tag_count = self._tag_counts.get(tag, 1) - 1
+            if tag_count <= 0:
+                self._tag_counts.pop(tag, None)
+                self.tags.remove(f"tag:{tag}")
+            else:
+                self._tag_counts[tag] = tag_count
+                self.tags.add(
+                    f"tag:{tag}", tag, float(tag_count), {"usage_count": tag_count}
+                )
+
+        return record
+
+
+def _place_snapshot(place: Any) -> SimpleNamespace:
+    """Detached copy of the fields the indexes read (replayed after a rebuild)."""
+    return SimpleNamespace(
+        **{name: getattr(place, name, None) for name in _PLACE_FIELDS}
+    )
+
+
+def _stream_id(entry_id: str) -> Tuple[int, int]:
+    milliseconds, _, sequence = entry_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
+class SuggestionIndexRegistry:
+    """
+    Process-wide suggestion indexes.
+
+    Holds the global place-name, tag and trending indexes plus an LRU of
+    per-user indexes. Place writes update the global indexes incrementally
+    through ``index_place``/``remove_place`` and append the place id to a
+    shared change stream, which other processes apply (see
+    ``refresh_if_stale``).
+    """
+
+    def __init__(
+        self,
+        max_user_indexes: int = 1000,
+        trending_refresh_seconds: float = 30.0,
+        user_index_ttl_seconds: float = 300.0,
+        global_index_ttl_seconds: float = 900.0,
+        version_check_seconds: float = 5.0,
+        min_rebuild_interval_seconds: float = 60.0,
+        redis_url: Optional[str] = None,
+        client: Optional[Redis] = None,
+    ):
+        self._global = _GlobalIndexes()
+        self.trending = SuggestionIndex()
+        self.is_ready = False
+
+        self.max_user_indexes = max_user_indexes
+        self.trending_refresh_seconds = trending_refresh_seconds
+        # Places written by other processes (e.g. the extraction worker) only
+        # show up once a user index is rebuilt, so bound its age
+        self.user_index_ttl_seconds = user_index_ttl_seconds
+        self.global_index_ttl_seconds = global_index_ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self.min_rebuild_interval_seconds = min_rebuild_interval_seconds
+        self.redis_url = redis_url
+
+        self._client = client
+        self._redis_retry_at = 0.0
+        self._instance_id = uuid4().hex
+        self._publisher: Optional[ThreadPoolExecutor] = None
+        # Last change stream entry the global indexes reflect
+        self._change_cursor: Optional[str] = None
+        self._built_at = 0.0
+        self._synced_at = 0.0
+        self._syncing = False
+        # Local writes made while a rebuild reads the table, replayed before
+        # the rebuilt indexes are swapped in
+        self._pending_writes: Optional[List[Tuple[str, Any]]] = None
+
+        self._user_indexes: "OrderedDict[str, SuggestionIndex]" = OrderedDict()
+        self._user_index_built_at: Dict[str, float] = {}
+        self._trending_source: Optional[str] = None
+        self._trending_refreshed_at = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def places(self) -> SuggestionIndex:
+        return self._global.places
+
+    @property
+    def tags(self) -> SuggestionIndex:
+        return self._global.tags
+
+    # Place indexes -----------------------------------------------------
+
+    def rebuild_from_db(self, db: Session, batch_size: int = 1000) -> int:
+        """
+        Rebuild the global place and tag indexes from active places.
+
+        The new indexes are built aside and swapped in at the end, so
+        lookups keep using the previous ones until then.
+
+        Returns:
+            Number of places indexed
+        """
+        # Read the cursor first so writes during the rebuild are applied again
+        cursor = self._read_latest_change()
+        rows = (
+            db.query(*PLACE_COLUMNS)
+            .filter(Place.status == PlaceStatus.ACTIVE)
+            .yield_per(batch_size)
+        )
+
+        with self._lock:
+            self._pending_writes = []
+        try:
+            indexes = _GlobalIndexes()
+            count = 0
+            for row in rows:
+                indexes.index_place(row)
+                count += 1
+        except Exception:
+            with self._lock:
+                self._pending_writes = None
+            raise
+
+        with self._lock:
+            for action, value in self._pending_writes:
+                indexes.unindex_place(value if action == "remove" else str(value.id))
+                if action == "index" and value.status == PlaceStatus.ACTIVE:
+                    indexes.index_place(value)
+            self._pending_writes = None
+
+            self._global = indexes
+            self.is_ready = True
+            self._change_cursor = cursor
+            self._built_at = self._synced_at = time.monotonic()
+
+        logger.info(f"Suggestion index rebuilt with {count} places")
+        return count
+
+    def warm(self, session_factory: Callable[[], Session]) -> int:
+        """Open a session and rebuild the global indexes."""
+        db = session_factory()
+        try:
+            return self.rebuild_from_db(db)
+        finally:
+            db.close()
+
+    def sync(self, db: Session) -> int:
+        """
+        Apply place writes from other processes to the global indexes.
+
+        Only the places named in the change stream are re-read. If entries
+        were trimmed before this process read them, the indexes are rebuilt
+        instead, at most once per ``min_rebuild_interval_seconds``.
+
+        Returns:
+            Number of places re-read (-1 after a full rebuild)
+        """
+        changes = self._read_changes()
+        if changes is None:
+            return 0
+        entries, complete = changes
+        if not complete:
+            if time.monotonic() - self._built_at < self.min_rebuild_interval_seconds:
+                return 0
+            self.rebuild_from_db(db)
+            return -1
+        if not entries:
+            return 0
+
+        place_ids = list(
+            dict.fromkeys(
+                fields["place_id"]
+                for _, fields in entries
+                if fields.get("origin") != self._instance_id
+            )
+        )
+        if place_ids:
+            rows = (
+                db.query(*PLACE_COLUMNS, Place.description)
+                .filter(Place.id.in_([UUID(place_id) for place_id in place_ids]))
+                .all()
+            )
+            found = {str(row.id): row for row in rows}
+            self._index_places(
+                [found[place_id] for place_id in place_ids if place_id in found]
+            )
+            for place_id in place_ids:
+                if place_id not in found:
+                    self._remove_place(place_id, None)
+
+        self._change_cursor = entries[-1][0]
+        return len(place_ids)
+
+    def refresh_if_stale(self, session_factory: Callable[[], Session]) -> bool:
+        """
+        Bring the global indexes up to date in a background thread.
+
+        Runs a full rebuild once the indexes are older than
+        ``global_index_ttl_seconds``; otherwise applies other processes'
+        changes every ``version_check_seconds``. Never touches Redis or the
+        database on the calling thread.
+
+        Returns:
+            Whether a background refresh was started
+        """
+        now = time.monotonic()
+        rebuild = now - self._built_at > self.global_index_ttl_seconds
+        shared = self._client is not None or self.redis_url is not None
+        due = shared and now - self._synced_at >= self.version_check_seconds
+        if not self.is_ready or self._syncing or not (rebuild or due):
+            return False
+        with self._lock:
+            if self._syncing:
+                return False
+            self._syncing = True
+            self._synced_at = now
+
+        def refresh() -> None:
+            db = session_factory()
+            try:
+                if rebuild:
+                    self.rebuild_from_db(db)
+                else:
+                    self.sync(db)
+            except Exception as e:
+                logger.warning(f"Failed to refresh suggestion index: {e}")
+            finally:
+                db.close()
+                self._syncing = False
+
+        threading.Thread(target=refresh, daemon=True).start()
+        return True
+
+    def index_place(self, place: Any) -> None:
+        """Add or update a place. Inactive places are removed."""
+        self._index_places([place])
+        self._publish(place)
+
+    def remove_place(self, place_id: Any, user_id: Any = None) -> None:
+        """Remove a place from the suggestion indexes."""
+        self._remove_place(str(place_id), user_id)
+        self._publish(SimpleNamespace(id=place_id))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Wait for queued change notifications (tests, shutdown)."""
+        if self._publisher is not None:
+            self._publisher.submit(lambda: None).result(timeout)
+
+    def _index_places(self, places: List[Any]) -> None:
+        # Keywords for owners with a loaded user index, in one batch outside the lock
+        with self._lock:
+            owned = [
+                place
+                for place in places
+                if str(getattr(place, "user_id", None)) in self._user_indexes
+            ]
+        keywords_by_place = {}
+        if owned:
+            keyword_lists = korean_analyzer.extract_keywords_many(
+                getattr(place, "description", None) or "" for place in owned
+            )
+            keywords_by_place = {
+                id(place): keywords for place, keywords in zip(owned, keyword_lists)
+            }
+        for place in places:
+            self._index_place(place, keywords_by_place.get(id(place)))
+
+    def _index_place(self, place: Any, keywords: Optional[List[str]] = None) -> None:
+        try:
+            with self._lock:
+                place_id = str(place.id)
+                is_new = place_id not in self._global.records
+                self._global.unindex_place(place_id)
+
+                user_id = str(place.user_id)
+                user_index = self._user_indexes.get(user_id)
+                if is_new and place.status == PlaceStatus.ACTIVE:
+                    if user_index is not None and keywords is not None:
+                        self._add_user_place(user_index, place, keywords)
+                    elif user_index is not None:
+                        # Loaded after keywords were extracted; reload lazily
+                        self._user_indexes.pop(user_id, None)
+                else:
+                    # Edits can drop names/keywords; reload lazily instead
+                    self._user_indexes.pop(user_id, None)
+
+                if place.status == PlaceStatus.ACTIVE:
+                    self._global.index_place(place)
+                if self._pending_writes is not None:
+                    self._pending_writes.append(("index", _place_snapshot(place)))
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to index place for suggestions: {e}")
+
+    def _remove_place(self, place_id: str, user_id: Any) -> None:
+        with self._lock:
+            record = self._global.unindex_place(place_id)
+            owner = user_id if user_id is not None else (record and record.user_id)
+            if owner is not None:
+                self._user_indexes.pop(str(owner), None)
+            if self._pending_writes is not None:
+                self._pending_writes.append(("remove", place_id))
+
+    # Shared change stream ----------------------------------------------
+
+    def _get_client(self) -> Optional[Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._client is None and self.redis_url is not None:
+            self._client = Redis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Suggestion index Redis unavailable: {error}")
+
+    def _publish(self, place: Any) -> None:
+        """Announce a local place write to the other processes (background)."""
+        if self._client is None and self.redis_url is None:
+            return
+        place_id = str(place.id)
+        with self._lock:
+            if self._publisher is None:
+                self._publisher = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="suggestion-index"
+                )
+        self._publisher.submit(self._append_change, place_id)
+
+    def _append_change(self, place_id: str) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            client.xadd(
+                CHANGES_KEY,
+                {"place_id": place_id, "origin": self._instance_id},
+                maxlen=CHANGE_LOG_MAX_LENGTH,
+                approximate=True,
+            )
+        except Exception as e:
+            self._redis_failed(e)
+
+    def _read_latest_change(self) -> Optional[str]:
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            latest = client.xrevrange(CHANGES_KEY, count=1)
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+        return latest[0][0] if latest else "0-0"
+
+    def _read_changes(self) -> Optional[Tuple[List[Tuple[str, Dict[str, str]]], bool]]:
+        """
+        Change stream entries after the cursor.
+
+        Returns:
+            (entries, complete), or None if Redis is unavailable. Not
+            complete when the cursor is unknown or older than the oldest
+            retained entry (changes were trimmed away).
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+        cursor = self._change_cursor
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.xrange(CHANGES_KEY, count=1)
+            pipe.xrange(
+                CHANGES_KEY, min=f"({cursor or '0-0'}", count=CHANGE_LOG_MAX_LENGTH
+            )
+            oldest, entries = pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+
+        trimmed = (
+            cursor not in (None, "0-0")
+            and bool(oldest)
+            and _stream_id(oldest[0][0]) > _stream_id(cursor)
+        )
+        return entries, cursor is not None and not trimmed
+
+    # Per-user indexes --------------------------------------------------
+
+    def user_index(
+        self, user_id: Any, loader: Callable[[], Iterable[Any]]
+    ) -> SuggestionIndex:
+        """
+        Get the suggestion index for a user's own places.
+
+        Built on first use from ``loader`` and kept in an LRU; rebuilt once
+        older than ``user_index_ttl_seconds``.
+        """
+        key = str(user_id)
+        with self._lock:
+            index = self._user_indexes.get(key)
+            age = time.monotonic() - self._user_index_built_at.get(key, 0.0)
+            if index is not None and age < self.user_index_ttl_seconds:
+                self._user_indexes.move_to_end(key)
+                return index
+
+        index = SuggestionIndex()
+        places = list(loader())
+        keyword_lists = korean_analyzer.extract_keywords_many(
+            place.description or "" for place in places
+        )
+        for place, keywords in zip(places, keyword_lists):
+            self._add_user_place(index, place, keywords)
+
+        with self._lock:
+            self._user_indexes[key] = index
+            self._user_indexes.move_to_end(key)
+            self._user_index_built_at[key] = time.monotonic()
+            while len(self._user_indexes) > self.max_user_indexes:
+                evicted, _ = self._user_indexes.popitem(last=False)
+                self._user_index_built_at.pop(evicted, None)
+        return index
+
+    def _add_user_place(
+        self, index: SuggestionIndex, place: Any, keywords: List[str]
+    ) -> None:
+        # Shorter suggestions rank first, matching the previous ordering
+        if place.name:
+            index.add(
+                f"place:{place.id}",
+                place.name,
+                -float(len(place.name)),
+                {"place_id": str(place.id)},
+            )
+        for word in keywords:
+            index.add(f"keyword:{word.lower()}", word, -float(len(word)))
+
+    # Trending index ----------------------------------------------------
+
+    def trending_needs_refresh(self, source_key: str) -> bool:
+        """Whether the trending index is stale for the given source key."""
+        return (
+            source_key != self._trending_source
+            or time.monotonic() - self._trending_refreshed_at
+            > self.trending_refresh_seconds
+        )
+
+    def refresh_trending(
+        self, source_key: str, terms: Iterable[Tuple[str, float]]
+    ) -> None:
+        """Replace the trending index with a fresh snapshot of scored terms."""
+        index = SuggestionIndex()
+        for term, score in terms:
+            index.add(
+                f"trending:{term}", term, float(score), {"trend_score": float(score)}
+            )
+
+        with self._lock:
+            self.trending = index
+            self._trending_source = source_key
+            self._trending_refreshed_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index sizes for monitoring."""
+        return {
+            "ready": self.is_ready,
+            "place_names": len(self.places),
+            "tags": len(self.tags),
+            "trending_terms": len(self.trending),
+            "user_indexes": len(self._user_indexes),
+            "change_cursor": self._change_cursor,
+            "age_seconds": (
+                round(time.monotonic() - self._built_at, 1) if self.is_ready else None
+            ),
+        }
+
+
+# 글로벌 인스턴스
+suggestion_indexes = SuggestionIndexRegistry(redis_url=settings.REDIS_URL)
@@ -2,7 +2,8 @@
 
 import logging
 from collections import Counter
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import and_, func
@@ -10,6 +11,11 @@ from sqlalchemy.orm import Session
 
 from app.models.place import Place, PlaceStatus
 from app.models.user_tag import UserTag
+from app.services.ranking.activity_counters import (
+    TAG_BUCKET_RETENTION_DAYS,
+    ActivityCounters,
+    activity_counters,
+)
 from app.utils.tag_normalizer import TagNormalizer
 
 logger = logging.getLogger(__name__)
@@ -271,16 +277,10 @@ class TagService:
         """
         suggestions = set()
 
-        # Extract from place name
-        name_tags = self.normalizer.extract_tags_from_text(place_name, max_tags=3)
-        suggestions.update(name_tags)
-
-        # Extract from description if provided
-        if place_description:
-            desc_tags = self.normalizer.extract_tags_from_text(
-                place_description, max_tags=3
-            )
-            suggestions.update(desc_tags)
+        # Extract from place name and description (if provided) in one batch
+        texts = [place_name, place_description] if place_description else [place_name]
+        for tags in self.normalizer.extract_tags_many(texts, max_tags=3):
+            suggestions.update(tags)
 
         # Add popular user tags if space available
         if len(suggestions) < max_suggestions:
@@ -465,8 +465,6 @@ class TagService:
         Returns:
             List of trending tags with growth metrics
         """
-        from datetime import datetime, timedelta
-
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
         # Get tags from recent places
@@ -499,12 +497,93 @@ class TagService:
             row.tag: row.total_count for row in historical_query.all()
         }
 
-        # Calculate trending score
+        return self._rank_trending_tags(
+            [(row.tag, row.recent_count) for row in recent_results],
+            historical_results,
+            limit,
+        )
+
+    async def get_streaming_trending_tags(
+        self,
+        days: int = 7,
+        limit: int = 10,
+        counters: Optional[ActivityCounters] = None,
+    ) -> List[Dict[str, any]]:
+        """
+        Get trending tags from the streaming tag counters.
+
+        Reads pre-aggregated daily tag buckets instead of scanning places.
+        Counters are seeded from the database on first use (and re-seeded
+        daily) by whichever worker claims the seed lock. If Redis is
+        unavailable or another worker is seeding, this falls back to
+        get_trending_tags without taking the seed snapshot.
+        """
+        counters = counters or activity_counters
+
+        counts = await counters.get_tag_counts(days, limit * 2)
+        if counts is None and await counters.claim_tag_seed():
+            daily_counts, totals = self.get_tag_usage_snapshot(
+                TAG_BUCKET_RETENTION_DAYS
+            )
+            await counters.seed_tag_counts(daily_counts, totals)
+            counts = await counters.get_tag_counts(days, limit * 2)
+        if counts is None:
+            return self.get_trending_tags(days=days, limit=limit)
+
+        recent_counts, total_counts = counts
+        return self._rank_trending_tags(
+            [(tag, int(count)) for tag, count in recent_counts],
+            {tag: int(total) for tag, total in total_counts.items()},
+            limit,
+        )
+
+    def get_tag_usage_snapshot(
+        self, days: int
+    ) -> Tuple[Dict[date, Dict[str, int]], Dict[str, int]]:
+        """
+        Count active-place tag usage per creation day and in total.
+
+        Used to seed the streaming tag counters.
+
+        Returns:
+            ({day: {tag: count}} for the last ``days`` days, {tag: total count})
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        tag = func.unnest(Place.tags).label("tag")
+        day = func.date(Place.created_at).label("day")
+
+        daily_counts: Dict[date, Dict[str, int]] = {}
+        daily_query = (
+            self.db.query(tag, day, func.count().label("count"))
+            .filter(
+                and_(
+                    Place.status == PlaceStatus.ACTIVE, Place.created_at >= cutoff_date
+                )
+            )
+            .group_by("tag", "day")
+        )
+        for row in daily_query.all():
+            daily_counts.setdefault(row.day, {})[row.tag] = row.count
+
+        totals_query = (
+            self.db.query(tag, func.count().label("count"))
+            .filter(Place.status == PlaceStatus.ACTIVE)
+            .group_by("tag")
+        )
+        totals = {row.tag: row.count for row in totals_query.all()}
+
+        return daily_counts, totals
+
+    def _rank_trending_tags(
+        self,
+        recent_counts: List[Tuple[str, int]],
+        total_counts: Dict[str, int],
+        limit: int,
+    ) -> List[Dict[str, any]]:
+        """Score tags by recent usage weighted by growth over older usage."""
         trending_tags = []
-        for row in recent_results:
-            tag = row.tag
-            recent_count = row.recent_count
-            total_count = historical_results.get(tag, recent_count)
+        for tag, recent_count in recent_counts:
+            total_count = total_counts.get(tag, recent_count)
 
             # Calculate growth ratio
             if total_count > recent_count:
@@ -0,0 +1,33 @@
+"""Concurrency helpers for calls to rate-limited external APIs."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+
+class ApiConcurrencyLimiter:
+    """
+    Cap in-flight calls per external API.
+
+    Each API name gets its own semaphore, created lazily on the running event
+    loop. APIs without a configured limit are not throttled.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self.limits = dict(limits or {})
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def limit(self, api: str) -> AsyncIterator[None]:
+        """Hold a slot for ``api`` for the duration of the block."""
+        max_concurrency = self.limits.get(api)
+        if not max_concurrency:
+            yield
+            return
+
+        semaphore = self._semaphores.get(api)
+        if semaphore is None:
+            semaphore = self._semaphores[api] = asyncio.Semaphore(max_concurrency)
+
+        async with semaphore:
+            yield
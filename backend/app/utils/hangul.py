@@ -0,0 +1,119 @@
+"""Hangul jamo decomposition helpers for prefix matching."""
+
+from typing import Dict
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# Compatibility jamo (what keyboards emit for a lone consonant/vowel)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = [
+    "",
+    "ㄱ",
+    "ㄲ",
+    "ㄳ",
+    "ㄴ",
+    "ㄵ",
+    "ㄶ",
+    "ㄷ",
+    "ㄹ",
+    "ㄺ",
+    "ㄻ",
+    "ㄼ",
+    "ㄽ",
+    "ㄾ",
+    "ㄿ",
+    "ㅀ",
+    "ㅁ",
+    "ㅂ",
+    "ㅄ",
+    "ㅅ",
+    "ㅆ",
+    "ㅇ",
+    "ㅈ",
+    "ㅊ",
+    "ㅋ",
+    "ㅌ",
+    "ㅍ",
+    "ㅎ",
+]
+
+# Compound jamo are typed as two keystrokes, so split them for matching
+COMPOUND_JAMO: Dict[str, str] = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+
+def _syllable_jamo(index: int) -> str:
+    cho, rest = divmod(index, 588)
+    jung, jong = divmod(rest, 28)
+    parts = [CHOSEONG[cho], JUNGSEONG[jung], JONGSEONG[jong]]
+    return "".join(COMPOUND_JAMO.get(part, part) for part in parts)
+
+
+# str.translate tables covering all 11,172 precomposed syllables
+_SYLLABLE_COUNT = HANGUL_LAST - HANGUL_BASE + 1
+_DECOMPOSE_TABLE: Dict[int, str] = {
+    HANGUL_BASE + index: _syllable_jamo(index) for index in range(_SYLLABLE_COUNT)
+}
+_DECOMPOSE_TABLE.update({ord(jamo): parts for jamo, parts in COMPOUND_JAMO.items()})
+_CHOSEONG_TABLE: Dict[int, str] = {
+    HANGUL_BASE + index: CHOSEONG[index // 588] for index in range(_SYLLABLE_COUNT)
+}
+
+
+def is_hangul_syllable(char: str) -> bool:
+    """Return True if the character is a precomposed Hangul syllable."""
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def decompose_hangul(text: str) -> str:
+    """
+    Decompose Hangul syllables into a flat compatibility-jamo string.
+
+    A partially typed syllable decomposes to a prefix of the full syllable
+    ("캎" -> "ㅋㅏㅍ" is a prefix of "카페" -> "ㅋㅏㅍㅔ"), which makes
+    keystroke-level prefix matching possible. Non-Hangul characters are
+    passed through unchanged.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Jamo sequence for the text
+    """
+    return text.translate(_DECOMPOSE_TABLE)
+
+
+def extract_choseong(text: str) -> str:
+    """
+    Extract the initial consonants (choseong) of Hangul syllables.
+
+    Used for initial-consonant search such as "ㅅㅌㅂㅅ" -> "스타벅스".
+    Non-Hangul characters are passed through unchanged.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Choseong sequence for the text
+    """
+    return text.translate(_CHOSEONG_TABLE)
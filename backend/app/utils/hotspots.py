@@ -0,0 +1,183 @@
+"""Grid-based hotspot detection over visited coordinates."""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+KM_PER_DEGREE = 111.32
+
+Cell = Tuple[int, int]
+
+NEIGHBOR_OFFSETS = [
+    (d_row, d_col)
+    for d_row in (-1, 0, 1)
+    for d_col in (-1, 0, 1)
+    if (d_row, d_col) != (0, 0)
+]
+
+
+@dataclass
+class Hotspot:
+    """A cluster of visits: weighted centroid, total weight and extent."""
+
+    latitude: float
+    longitude: float
+    weight: float
+    radius_km: float
+    cell_count: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "center": {"latitude": self.latitude, "longitude": self.longitude},
+            "visit_count": int(round(self.weight)),
+            "radius_km": round(self.radius_km, 2),
+        }
+
+
+class HotspotDetector:
+    """
+    Find visit hotspots in linear time.
+
+    Points are binned into square cells of ``cell_size_km`` (longitude is
+    scaled by the cosine of the mean latitude so cells are square on the
+    ground). Cells holding at least ``min_cell_weight``, and at least
+    ``min_cell_share`` of the total weight, are dense; dense cells that
+    touch, including diagonally, are merged into one hotspot. The share
+    keeps scattered visits from chaining a heavy user's whole city into one
+    hotspot while leaving small inputs to the absolute threshold.
+    Each hotspot reports the weighted centroid of its points and the
+    distance from it to the farthest point, floored at ``min_radius_km``.
+    Hotspots lighter than ``min_hotspot_weight`` are dropped.
+    """
+
+    def __init__(
+        self,
+        cell_size_km: float = 1.0,
+        min_cell_weight: float = 1.0,
+        min_cell_share: float = 0.0,
+        min_hotspot_weight: float = 2.0,
+        min_radius_km: float = 0.0,
+    ):
+        if cell_size_km <= 0:
+            raise ValueError("cell_size_km must be positive")
+        self.cell_size_km = cell_size_km
+        self.min_cell_weight = min_cell_weight
+        self.min_cell_share = min_cell_share
+        self.min_hotspot_weight = min_hotspot_weight
+        self.min_radius_km = min_radius_km
+
+    def detect(self, points: Iterable[Sequence[float]]) -> List[Hotspot]:
+        """
+        Detect hotspots.
+
+        Args:
+            points: ``(latitude, longitude)`` or ``(latitude, longitude,
+                weight)`` tuples; a weight stands for that many visits
+
+        Returns:
+            Hotspots, heaviest first
+        """
+        weighted = [
+            (point[0], point[1], point[2] if len(point) > 2 else 1.0)
+            for point in points
+        ]
+        if not weighted:
+            return []
+
+        total_weight = sum(weight for _, _, weight in weighted)
+        mean_lat = sum(lat * weight for lat, _, weight in weighted) / total_weight
+        lng_scale = math.cos(math.radians(mean_lat))
+
+        # Bin into cells: weight and weighted coordinate sums
+        cells: Dict[Cell, List[float]] = defaultdict(lambda: [0.0, 0.0, 0.0])
+        point_cells: List[Cell] = []
+        for lat, lng, weight in weighted:
+            cell = self._cell(lat, lng, lng_scale)
+            sums = cells[cell]
+            sums[0] += weight
+            sums[1] += weight * lat
+            sums[2] += weight * lng
+            point_cells.append(cell)
+
+        min_weight = max(self.min_cell_weight, self.min_cell_share * total_weight)
+        component_of = self._merge_dense_cells(cells, min_weight)
+
+        # Per-component totals
+        components: Dict[int, List[float]] = defaultdict(lambda: [0.0, 0.0, 0.0, 0])
+        for cell, component in component_of.items():
+            weight, lat_sum, lng_sum = cells[cell]
+            totals = components[component]
+            totals[0] += weight
+            totals[1] += lat_sum
+            totals[2] += lng_sum
+            totals[3] += 1
+
+        centroids = {
+            component: (lat_sum / weight, lng_sum / weight)
+            for component, (weight, lat_sum, lng_sum, _) in components.items()
+        }
+
+        # Extent: farthest member point from the centroid
+        radii: Dict[int, float] = defaultdict(float)
+        for (lat, lng, _), cell in zip(weighted, point_cells):
+            component = component_of.get(cell)
+            if component is None:
+                continue
+            center_lat, center_lng = centroids[component]
+            distance = self._distance_km(center_lat, center_lng, lat, lng, lng_scale)
+            if distance > radii[component]:
+                radii[component] = distance
+
+        hotspots = [
+            Hotspot(
+                latitude=centroids[component][0],
+                longitude=centroids[component][1],
+                weight=weight,
+                radius_km=max(radii[component], self.min_radius_km),
+                cell_count=int(cell_count),
+            )
+            for component, (weight, _, _, cell_count) in components.items()
+            if weight >= self.min_hotspot_weight
+        ]
+        hotspots.sort(key=lambda hotspot: -hotspot.weight)
+        return hotspots
+
+    def _cell(self, latitude: float, longitude: float, lng_scale: float) -> Cell:
+        return (
+            math.floor(latitude * KM_PER_DEGREE / self.cell_size_km),
+            math.floor(longitude * KM_PER_DEGREE * lng_scale / self.cell_size_km),
+        )
+
+    @staticmethod
+    def _merge_dense_cells(
+        cells: Dict[Cell, List[float]], min_weight: float
+    ) -> Dict[Cell, int]:
+        """Label connected groups of dense cells (8-neighbourhood)."""
+        dense = {cell for cell, sums in cells.items() if sums[0] >= min_weight}
+        component_of: Dict[Cell, int] = {}
+        components = 0
+        for start in dense:
+            if start in component_of:
+                continue
+            component = components
+            components += 1
+            component_of[start] = component
+            stack = [start]
+            while stack:
+                row, col = stack.pop()
+                for d_row, d_col in NEIGHBOR_OFFSETS:
+                    neighbor = (row + d_row, col + d_col)
+                    if neighbor in dense and neighbor not in component_of:
+                        component_of[neighbor] = component
+                        stack.append(neighbor)
+        return component_of
+
+    @staticmethod
+    def _distance_km(
+        lat1: float, lng1: float, lat2: float, lng2: float, lng_scale: float
+    ) -> float:
+        # Equirectangular approximation; accurate at hotspot scale
+        d_lat = (lat2 - lat1) * KM_PER_DEGREE
+        d_lng = (lng2 - lng1) * KM_PER_DEGREE * lng_scale
+        return math.hypot(d_lat, d_lng)
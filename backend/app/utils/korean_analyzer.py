@@ -2,15 +2,61 @@
 
 import logging
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Texts longer than this are analyzed without caching (descriptions, captions)
+MAX_CACHED_TEXT_LENGTH = 1000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r'[!@#$%^&*()_+={}\[\]|\\:";\'<>?,.`~]')
+_WORD_SPLIT_RE = re.compile(r"[\s,./]+")
+_NON_WORD_RE = re.compile(r"^[\d\W]+$")
+
+# Simple pattern matching for common entities, compiled once
+_ENTITY_NAMES = {
+    "brand": [
+        "스타벅스",
+        "투썸플레이스",
+        "이디야",
+        "맥도날드",
+        "버거킹",
+        "롯데리아",
+        "KFC",
+        "파파존스",
+        "피자헛",
+        "도미노피자",
+    ],
+    "location": [
+        "강남",
+        "홍대",
+        "명동",
+        "이태원",
+        "압구정",
+        "신사",
+        "가로수길",
+        "성수",
+        "연남",
+        "서촌",
+        "북촌",
+        "인사동",
+        "종로",
+        "을지로",
+    ],
+}
+_ENTITY_PATTERNS: List[Tuple[str, str, Pattern[str]]] = [
+    (entity_type, name, re.compile(name, re.IGNORECASE))
+    for entity_type, names in _ENTITY_NAMES.items()
+    for name in names
+]
+
 
 class KoreanAnalyzer:
     """Korean text analysis and processing utilities."""
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096):
         # Common Korean stopwords
         self.stopwords = {
             "이",
@@ -86,6 +132,13 @@ class KoreanAnalyzer:
             "스파",
         }
 
+        # Per-instance LRU caches over the pure analysis steps
+        self._analyze_cached = lru_cache(maxsize=cache_size)(self._analyze_uncached)
+        self._keywords_cached = lru_cache(maxsize=cache_size)(
+            self._extract_keywords_uncached
+        )
+        self._highlight_cached = lru_cache(maxsize=256)(self._compile_highlight_pattern)
+
     def analyze_text(self, text: str) -> Dict[str, any]:
         """
         Analyze Korean text and extract meaningful components.
@@ -100,25 +153,16 @@ class KoreanAnalyzer:
             if not text:
                 return {"keywords": [], "entities": [], "cleaned_text": ""}
 
-            # Clean and normalize text
-            cleaned_text = self._normalize_text(text)
-
-            # Extract keywords using simple heuristics
-            keywords = self._extract_keywords_heuristic(cleaned_text)
-
-            # Identify named entities (places, brands)
-            entities = self._identify_entities(cleaned_text)
-
-            # Calculate text complexity
-            complexity = self._calculate_complexity(cleaned_text)
+            if len(text) <= MAX_CACHED_TEXT_LENGTH:
+                result = self._analyze_cached(text)
+            else:
+                result = self._analyze_uncached(text)
 
+            # Cached results are shared, so hand out fresh containers
             return {
-                "keywords": keywords,
-                "entities": entities,
-                "cleaned_text": cleaned_text,
-                "complexity": complexity,
-                "word_count": len(keywords),
-                "has_place_keywords": any(kw in self.place_keywords for kw in keywords),
+                **result,
+                "keywords": list(result["keywords"]),
+                "entities": [dict(entity) for entity in result["entities"]],
             }
 
         except Exception as e:
@@ -129,6 +173,9 @@ class KoreanAnalyzer:
         """
         Extract keywords from Korean text.
 
+        Keywords-only fast path: skips entity identification and complexity
+        scoring. Prefer this over ``analyze_text`` when only keywords are used.
+
         Args:
             text: Input text
 
@@ -136,12 +183,79 @@ class KoreanAnalyzer:
             List of extracted keywords
         """
         try:
-            cleaned_text = self._normalize_text(text)
-            return self._extract_keywords_heuristic(cleaned_text)
+            if not text:
+                return []
+            if len(text) <= MAX_CACHED_TEXT_LENGTH:
+                return list(self._keywords_cached(text))
+            return list(self._extract_keywords_uncached(text))
         except Exception as e:
             logger.error(f"Error extracting keywords: {e}")
             return [text] if text else []
 
+    def extract_keywords_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """
+        Extract keywords for a batch of texts (keywords-only fast path).
+
+        Args:
+            texts: Texts to process
+
+        Returns:
+            Keyword lists in input order
+        """
+        return [self.extract_keywords(text) for text in texts]
+
+    def build_highlight_pattern(
+        self, terms: Iterable[str], min_length: int = 2
+    ) -> Optional[Pattern[str]]:
+        """
+        Build one case-insensitive alternation regex for highlighting terms.
+
+        Longer terms come first so overlapping terms highlight the longest
+        match. Patterns are cached per term set.
+
+        Args:
+            terms: Terms to highlight
+            min_length: Minimum term length to include
+
+        Returns:
+            Compiled pattern, or None if no term qualifies
+        """
+        unique_terms = {term for term in terms if term and len(term) >= min_length}
+        if not unique_terms:
+            return None
+        return self._highlight_cached(
+            tuple(sorted(unique_terms, key=lambda term: (-len(term), term)))
+        )
+
+    def _analyze_uncached(self, text: str) -> Dict[str, any]:
+        # Clean and normalize text
+        cleaned_text = self._normalize_text(text)
+
+        # Extract keywords using simple heuristics
+        keywords = tuple(self._extract_keywords_heuristic(cleaned_text))
+
+        # Identify named entities (places, brands)
+        entities = tuple(self._identify_entities(cleaned_text))
+
+        # Calculate text complexity
+        complexity = self._calculate_complexity(cleaned_text)
+
+        return {
+            "keywords": keywords,
+            "entities": entities,
+            "cleaned_text": cleaned_text,
+            "complexity": complexity,
+            "word_count": len(keywords),
+            "has_place_keywords": any(kw in self.place_keywords for kw in keywords),
+        }
+
+    def _extract_keywords_uncached(self, text: str) -> Tuple[str, ...]:
+        return tuple(self._extract_keywords_heuristic(self._normalize_text(text)))
+
+    @staticmethod
+    def _compile_highlight_pattern(terms: Tuple[str, ...]) -> Pattern[str]:
+        return re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate similarity between two Korean texts.
@@ -240,13 +354,13 @@ class KoreanAnalyzer:
             return ""
 
         # Remove extra whitespace and special characters
-        normalized = re.sub(r"\s+", " ", text.strip())
+        normalized = _WHITESPACE_RE.sub(" ", text.strip())
 
         # Remove common punctuation that doesn't help search
-        normalized = re.sub(r'[!@#$%^&*()_+={}\[\]|\\:";\'<>?,.`~]', " ", normalized)
+        normalized = _PUNCTUATION_RE.sub(" ", normalized)
 
         # Normalize spacing around Korean text
-        normalized = re.sub(r"\s+", " ", normalized)
+        normalized = _WHITESPACE_RE.sub(" ", normalized)
 
         return normalized.strip()
 
@@ -256,7 +370,7 @@ class KoreanAnalyzer:
             return []
 
         # Split by whitespace and common delimiters
-        words = re.split(r"[\s,./]+", text)
+        words = _WORD_SPLIT_RE.split(text)
 
         # Filter keywords
         keywords = []
@@ -268,7 +382,7 @@ class KoreanAnalyzer:
                 continue
 
             # Skip if all numbers or special characters
-            if re.match(r"^[\d\W]+$", word):
+            if _NON_WORD_RE.match(word):
                 continue
 
             keywords.append(word)
@@ -288,43 +402,9 @@ class KoreanAnalyzer:
         entities = []
 
         # Simple pattern matching for common entities
-        patterns = {
-            "brand": [
-                r"스타벅스",
-                r"투썸플레이스",
-                r"이디야",
-                r"맥도날드",
-                r"버거킹",
-                r"롯데리아",
-                r"KFC",
-                r"파파존스",
-                r"피자헛",
-                r"도미노피자",
-            ],
-            "location": [
-                r"강남",
-                r"홍대",
-                r"명동",
-                r"이태원",
-                r"압구정",
-                r"신사",
-                r"가로수길",
-                r"성수",
-                r"연남",
-                r"서촌",
-                r"북촌",
-                r"인사동",
-                r"종로",
-                r"을지로",
-            ],
-        }
-
-        for entity_type, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                if re.search(pattern, text, re.IGNORECASE):
-                    entities.append(
-                        {"text": pattern, "type": entity_type, "confidence": 0.8}
-                    )
+        for entity_type, name, pattern in _ENTITY_PATTERNS:
+            if pattern.search(text):
+                entities.append({"text": name, "type": entity_type, "confidence": 0.8})
 
         return entities
 
@@ -338,3 +418,7 @@ class KoreanAnalyzer:
         length_factor = min(len(text) / 50, 1.0)  # Normalize to 0-1
 
         return (char_variety + length_factor) / 2
+
+
+# Shared analyzer so caches are reused across services
+korean_analyzer = KoreanAnalyzer()
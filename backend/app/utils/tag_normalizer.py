@@ -2,7 +2,9 @@
 
 import re
 from collections import Counter
-from typing import List
+from typing import Iterable, List
+
+from app.utils.korean_analyzer import korean_analyzer
 
 
 class TagNormalizer:
@@ -167,6 +169,28 @@ class TagNormalizer:
         word_counts = Counter(candidates)
         return [word for word, count in word_counts.most_common(max_tags)]
 
+    @classmethod
+    def extract_tags_many(
+        cls, texts: Iterable[str], max_tags: int = 10
+    ) -> List[List[str]]:
+        """
+        Extract tags for a batch of texts.
+
+        Words come from the shared Korean analyzer's cached keywords-only
+        path in one batch; tags keep their first-occurrence order.
+
+        Args:
+            texts: Text contents to extract tags from
+            max_tags: Maximum number of tags per text
+
+        Returns:
+            Tag lists in input order
+        """
+        return [
+            cls.normalize_tags(keywords)[:max_tags]
+            for keywords in korean_analyzer.extract_keywords_many(texts)
+        ]
+
     @classmethod
     def suggest_similar_tags(cls, tag: str, existing_tags: List[str]) -> List[str]:
         """
@@ -0,0 +1,56 @@
+"""Place 추출 워커 진입점.
+
+API 프로세스와 분리해 실행한다::
+
+    python -m app.workers.extraction_worker
+
+SIGINT/SIGTERM을 받으면 처리 중인 작업을 마친 뒤 종료한다.
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.services.places.extraction_queue import ExtractionWorker, extraction_queue
+from app.services.places.place_extractor import PlaceExtractorService
+from app.utils.concurrency import ApiConcurrencyLimiter
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker() -> None:
+    """추출 워커를 실행한다."""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    extractor = PlaceExtractorService(
+        limiter=ApiConcurrencyLimiter({"kakao": settings.KAKAO_API_CONCURRENCY})
+    )
+    worker = ExtractionWorker(
+        extraction_queue,
+        extractor,
+        concurrency=settings.EXTRACTION_WORKER_CONCURRENCY,
+        lease_seconds=settings.EXTRACTION_LEASE_SECONDS,
+    )
+
+    logger.info(
+        f"Extraction worker started (concurrency={worker.concurrency}, "
+        f"kakao_limit={settings.KAKAO_API_CONCURRENCY})"
+    )
+    await worker.run(stop_event)
+    logger.info("Extraction worker stopped")
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Model training job.
+
+Trains the notification timing model outside the API processes and
+publishes it for serving workers::
+
+    python -m app.workers.model_training_worker [--min-samples 100]
+        [--place-vectorizer]
+
+Training rows are streamed from a server-side cursor into NumPy arrays and
+the fit runs in the training process pool. The job logs the resulting model
+version with fit time, row count and memory peak, and exits non-zero when no
+model was published.
+
+With --place-vectorizer the job also fits the TF-IDF vectorizer that search
+diversification uses for near-duplicate detection on the active place corpus.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.place import Place, PlaceStatus
+from app.services.ml.training_jobs import (
+    TRAINING_FETCH_SIZE,
+    shutdown_training_executor,
+)
+from app.services.search.diversity_engine import fit_place_vectorizer, place_text
+from app.services.notifications.ml_notification_optimizer import (
+    NotificationTimingOptimizer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def train_timing_model(min_samples: int) -> bool:
+    """Train and publish the notification timing model in its own session."""
+    db = SessionLocal()
+    try:
+        optimizer = NotificationTimingOptimizer(db)
+        published = await optimizer.train_timing_model(min_samples=min_samples)
+        report = optimizer.last_training_report
+        if report:
+            logger.info(f"Training report: {json.dumps(report.to_dict())}")
+        return published
+    finally:
+        db.close()
+        shutdown_training_executor()
+
+
+def train_place_vectorizer() -> bool:
+    """Fit and publish the place text vectorizer from active places."""
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Place.name, Place.address, Place.tags, Place.description)
+            .filter(Place.status == PlaceStatus.ACTIVE)
+            .yield_per(TRAINING_FETCH_SIZE)
+        )
+        texts = [place_text(row._asdict()) for row in rows]
+        if not texts:
+            logger.warning("No active places to fit the place vectorizer on")
+            return False
+        fit_place_vectorizer(texts)
+        return True
+    except Exception as e:
+        logger.error(f"Place vectorizer training failed: {e}")
+        return False
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-samples", type=int, default=100)
+    parser.add_argument(
+        "--place-vectorizer",
+        action="store_true",
+        help="also fit the place text vectorizer used for search diversity",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    published = asyncio.run(train_timing_model(args.min_samples))
+    if args.place_vectorizer:
+        published = train_place_vectorizer() and published
+    sys.exit(0 if published else 1)
+
+
+if __name__ == "__main__":
+    main()
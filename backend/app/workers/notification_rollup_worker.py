@@ -0,0 +1,64 @@
+"""Notification rollup refresh job.
+
+Runs alongside the API and keeps the hourly notification rollup tables
+current::
+
+    python -m app.workers.notification_rollup_worker
+
+Each cycle recomputes only the hour buckets touched since the previous run.
+SIGINT/SIGTERM stop the loop after the current refresh.
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.notifications.notification_rollup_service import (
+    NotificationRollupService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_rollups() -> dict:
+    """Run one incremental refresh in its own session."""
+    db = SessionLocal()
+    try:
+        return NotificationRollupService(db).refresh()
+    finally:
+        db.close()
+
+
+async def run_worker() -> None:
+    """Refresh rollups every NOTIFICATION_ROLLUP_INTERVAL_SECONDS."""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    interval = settings.NOTIFICATION_ROLLUP_INTERVAL_SECONDS
+    logger.info(f"Notification rollup worker started (interval={interval}s)")
+    while not stop_event.is_set():
+        try:
+            await asyncio.to_thread(refresh_rollups)
+        except Exception as e:
+            logger.error(f"Notification rollup refresh failed: {e}")
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("Notification rollup worker stopped")
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Onboarding sample pool refresh job.
+
+Runs alongside the API and keeps the popular-place pool used for onboarding
+samples current::
+
+    python -m app.workers.onboarding_pool_worker
+
+Each cycle rebuilds the pool from ``places`` in one transaction.
+SIGINT/SIGTERM stop the loop after the current refresh.
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.auth.onboarding_sample_pool import OnboardingSamplePool
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_pool() -> dict:
+    """Run one rebuild in its own session."""
+    db = SessionLocal()
+    try:
+        return OnboardingSamplePool(db).refresh()
+    finally:
+        db.close()
+
+
+async def run_worker() -> None:
+    """Rebuild the pool every ONBOARDING_POOL_REFRESH_SECONDS."""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    interval = settings.ONBOARDING_POOL_REFRESH_SECONDS
+    logger.info(f"Onboarding pool worker started (interval={interval}s)")
+    while not stop_event.is_set():
+        try:
+            await asyncio.to_thread(refresh_pool)
+        except Exception as e:
+            logger.error(f"Onboarding pool refresh failed: {e}")
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("Onboarding pool worker stopped")
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -634,6 +634,7 @@ class TestUserPreferenceService:
         """Test preference analysis with no behavior data."""
         # Given
         user_preference_service.db.query().filter().all.return_value = []
+        user_preference_service.db.execute().all.return_value = []
 
         # When
         result = user_preference_service.analyze_user_preferences(sample_user_id)
@@ -0,0 +1,104 @@
+"""
+실시간 랭킹 워커 간 브로드캐스트 통합 테스트
+
+별도 프로세스(워커 B)에 연결된 사용자에게 현재 프로세스(워커 A)에서 발행한
+랭킹 알림이 Redis pub/sub을 거쳐 병합된 1건으로 도착하는지 검증한다.
+
+settings.REDIS_URL의 Redis가 필요하며 없으면 건너뛴다.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+
+import pytest
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.services.ranking.ranking_broadcaster import RankingBroadcaster
+
+
+class QueueWebSocket:
+    """받은 메시지를 부모 프로세스 큐로 넘기는 WebSocket"""
+
+    def __init__(self, out: multiprocessing.Queue) -> None:
+        self.out = out
+
+    async def send_text(self, payload: str) -> None:
+        self.out.put(payload)
+
+    async def close(self) -> None:
+        pass
+
+
+def _run_worker(channel_prefix: str, ready, stop, out) -> None:
+    async def main() -> None:
+        broadcaster = RankingBroadcaster(
+            redis_url=settings.REDIS_URL, channel_prefix=channel_prefix
+        )
+        await broadcaster.connect("u1", QueueWebSocket(out))
+        ready.set()
+        while not stop.is_set():
+            await asyncio.sleep(0.05)
+        await broadcaster.close()
+
+    asyncio.run(main())
+
+
+@pytest.fixture
+async def redis_available():
+    client = redis.from_url(settings.REDIS_URL)
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip("Redis is not available")
+    finally:
+        await client.close()
+
+
+@pytest.mark.integration
+class TestCrossProcessBroadcast:
+    """프로세스 간 랭킹 알림 전달 테스트"""
+
+    async def test_coalesced_update_reaches_other_process(
+        self, redis_available
+    ) -> None:
+        """Given: 워커 B에 u1 연결 / When: 워커 A에서 트리거 3개 발행 / Then: 1건 병합 수신"""
+        channel_prefix = f"test:ranking:{os.getpid()}"
+        context = multiprocessing.get_context("spawn")
+        ready, stop, out = context.Event(), context.Event(), context.Queue()
+        worker = context.Process(
+            target=_run_worker, args=(channel_prefix, ready, stop, out)
+        )
+        worker.start()
+        publisher = RankingBroadcaster(
+            redis_url=settings.REDIS_URL,
+            channel_prefix=channel_prefix,
+            coalesce_window=0.1,
+        )
+        try:
+            assert await asyncio.to_thread(ready.wait, 30)
+
+            for trigger in ("location", "time", "weather"):
+                await publisher.publish(
+                    "u1",
+                    {
+                        "type": "ranking_update",
+                        "trigger_type": trigger,
+                        "updated_searches": 1,
+                    },
+                )
+            message = json.loads(await asyncio.to_thread(out.get, True, 10))
+
+            assert message["trigger_types"] == ["location", "time", "weather"]
+            assert message["coalesced"] == 3
+            with pytest.raises(queue.Empty):
+                await asyncio.to_thread(out.get, True, 0.5)
+        finally:
+            await publisher.close()
+            stop.set()
+            worker.join(10)
+            if worker.is_alive():
+                worker.terminate()
@@ -0,0 +1,149 @@
+"""
+Streaming activity counter load test.
+
+Replays a skewed view/click/save event stream into the Redis activity
+counters, then times the reads the ranking and tag services make:
+popularity for a page of places, trending places and trending tags.
+Popularity is also read the previous way (one cache GET per place) for
+comparison.
+
+Requires Redis at settings.REDIS_URL; skipped otherwise. Keys live under a
+throwaway prefix and are deleted afterwards. Set ACTIVITY_BENCH_EVENTS to
+change the replay size.
+"""
+
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.services.ranking.activity_counters import ActivityCounters
+
+EVENT_COUNT = int(os.getenv("ACTIVITY_BENCH_EVENTS", "200000"))
+REPLAY_HOURS = 24
+PLACE_COUNT = 10000
+BATCH_SIZE = 500
+READ_ROUNDS = 200
+EVENT_TYPES = ["view"] * 14 + ["click"] * 4 + ["save", "share"]
+TAGS = [f"tag{i}" for i in range(500)]
+
+
+def _event_stream(rng: random.Random):
+    """Zipf-like place popularity with a burst on a few places at the end."""
+    for i in range(EVENT_COUNT):
+        if i > EVENT_COUNT * 0.9 and rng.random() < 0.3:
+            place = f"burst-{rng.randrange(5)}"
+        else:
+            place = f"place-{int(PLACE_COUNT * rng.random() ** 3)}"
+        yield place, rng.choice(EVENT_TYPES), 1
+
+
+async def _timed(coro_fn, rounds: int = READ_ROUNDS):
+    samples = []
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        result = await coro_fn()
+        samples.append((time.perf_counter() - start_time) * 1000)
+    samples.sort()
+    return result, statistics.median(samples), samples[int(len(samples) * 0.95)]
+
+
+@pytest.mark.slow
+class TestActivityCountersLoad:
+    """Event replay throughput and O(1) read latency."""
+
+    @pytest.fixture
+    async def client(self):
+        client = redis.from_url(
+            settings.REDIS_URL, encoding="utf-8", decode_responses=True
+        )
+        try:
+            await client.ping()
+        except Exception:
+            await client.close()
+            pytest.skip("Redis is not available")
+        prefix = f"bench:activity:{os.getpid()}"
+        yield client, prefix
+        keys = [key async for key in client.scan_iter(f"{prefix}*")]
+        if keys:
+            await client.delete(*keys)
+        await client.close()
+
+    async def test_replay_then_read(self, client) -> None:
+        """Ingest the stream in pipelined batches, then read rankings."""
+        client, prefix = client
+        counters = ActivityCounters(client=client, prefix=prefix)
+        rng = random.Random(42)
+
+        # The stream spans REPLAY_HOURS simulated hours; decay runs at each
+        # hour boundary the way the popularity updater triggers it.
+        base = time.time() // 3600 * 3600
+        events_per_hour = EVENT_COUNT // REPLAY_HOURS
+        await counters.apply_decay(now=base)
+        start_time = time.perf_counter()
+        batch = []
+        for i, event in enumerate(_event_stream(rng), start=1):
+            batch.append(event)
+            if len(batch) == BATCH_SIZE or i % events_per_hour == 0:
+                assert await counters.record_place_events(batch)
+                batch = []
+            if i % events_per_hour == 0:
+                await counters.apply_decay(now=base + i // events_per_hour * 3600)
+        if batch:
+            await counters.record_place_events(batch)
+        ingest_seconds = time.perf_counter() - start_time
+
+        today = datetime.utcnow().date()
+        await counters.seed_tag_counts(
+            {
+                today
+                - timedelta(days=day): {
+                    tag: rng.randrange(1, 50) for tag in rng.sample(TAGS, 100)
+                }
+                for day in range(30)
+            },
+            {tag: rng.randrange(50, 5000) for tag in TAGS},
+        )
+
+        page = [f"place-{i}" for i in range(0, PLACE_COUNT, PLACE_COUNT // 100)]
+        popularity, pop_p50, pop_p95 = await _timed(
+            lambda: counters.get_popularity(page)
+        )
+        await client.mset({f"{prefix}:legacy:{place}": "0.5" for place in page})
+
+        async def legacy_popularity():
+            return [await client.get(f"{prefix}:legacy:{place}") for place in page]
+
+        _, legacy_p50, legacy_p95 = await _timed(legacy_popularity, rounds=20)
+        trending, trend_p50, trend_p95 = await _timed(counters.get_trending_places)
+        tags, tag_p50, tag_p95 = await _timed(lambda: counters.get_tag_counts(7, 20))
+
+        print(
+            f"\n📊 Activity counters: {EVENT_COUNT:,} events over ~{PLACE_COUNT:,} places"
+        )
+        print(
+            f"   ingest: {ingest_seconds:.2f}s "
+            f"({EVENT_COUNT / ingest_seconds:,.0f} events/s, batch {BATCH_SIZE})"
+        )
+        print(f"   popularity (100 places):  p50 {pop_p50:.2f}ms  p95 {pop_p95:.2f}ms")
+        print(
+            f"   legacy per-place GETs:    p50 {legacy_p50:.2f}ms  p95 {legacy_p95:.2f}ms"
+        )
+        print(
+            f"   trending places:          p50 {trend_p50:.2f}ms  p95 {trend_p95:.2f}ms"
+        )
+        print(f"   trending tags (7d):       p50 {tag_p50:.2f}ms  p95 {tag_p95:.2f}ms")
+
+        assert len(popularity) == 100
+        assert {item["place_id"] for item in trending[:5]} & {
+            f"burst-{i}" for i in range(5)
+        }
+        assert len(tags[0]) == 20
+        assert pop_p50 < legacy_p50
+        assert trend_p95 < 50
+        assert tag_p95 < 50
@@ -0,0 +1,104 @@
+"""
+Ranking experiment event write benchmark.
+
+Writes 2,000 events from 20 concurrent writers into an experiment that
+already holds 5,000 events. The old path reads the whole JSON event list,
+appends one event and writes it back. The new path appends to a per-variant
+Redis stream and bumps a counter hash in one transaction. Reports
+events/sec and events lost to concurrent overwrites for each path.
+
+Requires Redis at settings.REDIS_URL; skipped otherwise. Keys are deleted
+afterwards.
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as redis
+
+from app.core.cache import RedisCacheService
+from app.core.config import settings
+from app.services.ranking.experiment_event_store import RedisExperimentEventStore
+
+WRITERS = 20
+EVENTS_PER_WRITER = 100
+EXISTING_EVENTS = 5000
+
+
+def _event(i: int):
+    return {
+        "user_id": str(uuid4()),
+        "variant": "treatment",
+        "event_type": "click",
+        "event_data": {"position": i % 10, "query": "홍대 카페"},
+        "timestamp": "2025-01-01T00:00:00",
+    }
+
+
+@pytest.mark.slow
+class TestExperimentEventWrites:
+    """Read-modify-write JSON list vs append-only stream + counters."""
+
+    @pytest.fixture
+    async def client(self):
+        client = redis.from_url(
+            settings.REDIS_URL, encoding="utf-8", decode_responses=True
+        )
+        try:
+            await client.ping()
+        except Exception:
+            await client.close()
+            pytest.skip("Redis is not available")
+        experiment_id = f"bench-{uuid4().hex}"
+        yield client, experiment_id
+        keys = [key async for key in client.scan_iter(f"experiment_*{experiment_id}*")]
+        if keys:
+            await client.delete(*keys)
+        await client.close()
+
+    async def test_concurrent_event_writes(self, client) -> None:
+        client, experiment_id = client
+        total = WRITERS * EVENTS_PER_WRITER
+
+        cache = RedisCacheService(client)
+        legacy_key = f"experiment_events:{experiment_id}"
+        await cache.set(legacy_key, [_event(i) for i in range(EXISTING_EVENTS)])
+
+        async def legacy_writer():
+            for i in range(EVENTS_PER_WRITER):
+                events = await cache.get(legacy_key) or []
+                events.append(_event(i))
+                await cache.set(legacy_key, events[-10000:], ttl=86400)
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(legacy_writer() for _ in range(WRITERS)))
+        legacy_seconds = time.perf_counter() - start_time
+        legacy_stored = len(await cache.get(legacy_key)) - EXISTING_EVENTS
+
+        # Stream appends do not depend on how many events are already stored
+        store = RedisExperimentEventStore(client)
+
+        async def stream_writer():
+            for i in range(EVENTS_PER_WRITER):
+                await store.append_event(experiment_id, "treatment", _event(i))
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(stream_writer() for _ in range(WRITERS)))
+        stream_seconds = time.perf_counter() - start_time
+        aggregates = await store.get_variant_aggregates(experiment_id, ["treatment"])
+        stream_stored = aggregates["treatment"]["event_counts"]["click"]
+
+        print(f"\n📊 Experiment events, {WRITERS} writers × {EVENTS_PER_WRITER}")
+        print(
+            f"   JSON list rewrite: {total / legacy_seconds:,.0f} events/s, "
+            f"lost {total - legacy_stored:,}"
+        )
+        print(
+            f"   stream + counters: {total / stream_seconds:,.0f} events/s, "
+            f"lost {total - stream_stored:,}"
+        )
+
+        assert stream_stored == total
+        assert stream_seconds < legacy_seconds
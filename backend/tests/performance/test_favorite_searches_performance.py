@@ -0,0 +1,167 @@
+"""
+Favorite searches storage benchmark.
+
+Seeds users with 200 and 800 favorites and compares the previous storage
+(HGETALL + decode + sort in Python on every list, one HSET per synced item)
+with the indexed layout (ranged read of `limit` ids + HMGET, version-vector
+delta sync applied in one MULTI/EXEC). Reports list latency and the number
+of network round trips per list and per sync of 50 changed favorites.
+
+Requires Redis at settings.REDIS_URL; skipped otherwise. Keys are deleted
+afterwards.
+"""
+
+import json
+import statistics
+import time
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as redis
+from redis.asyncio.connection import AbstractConnection
+
+from app.core.config import settings
+from app.services.search.favorite_searches_service import FavoriteSearchesService
+
+LIMIT = 20
+CHANGED = 50
+RUNS = 20
+
+
+def _favorites(count: int):
+    return [
+        {
+            "id": f"fav_{i}",
+            "name": f"즐겨찾기 {i}",
+            "query": f"검색어 {i}",
+            "filters": {"categories": ["restaurant" if i % 3 else "cafe"]},
+            "location": {"lat": 37.5, "lng": 127.0, "name": "강남역"},
+            "tags": ["맛집", "데이트"],
+            "created_at": f"2024-01-{1 + i % 28:02d}T12:00:00",
+            "last_used": f"2024-02-{1 + i % 28:02d}T12:00:00",
+            "use_count": (i * 37) % 101,
+            "category": "restaurant" if i % 3 else "cafe",
+            "is_active": True,
+        }
+        for i in range(count)
+    ]
+
+
+async def _legacy_list(client, key: str):
+    """Previous listing: decode every favorite, then sort and slice."""
+    favorites = [json.loads(raw) for raw in (await client.hgetall(key)).values()]
+    favorites.sort(key=lambda x: x.get("use_count", 0), reverse=True)
+    return favorites[:LIMIT]
+
+
+async def _legacy_sync(client, key: str, local_favorites):
+    """Previous sync: full server read, then one HSET per changed item."""
+    server = {fav["id"]: fav for fav in await _legacy_list(client, key)}
+    for local_fav in local_favorites:
+        merged = {**server.get(local_fav["id"], {}), **local_fav}
+        await client.hset(key, local_fav["id"], json.dumps(merged, default=str))
+
+
+class RoundTrips:
+    """Counts packets sent to Redis (one per command or pipeline flush)."""
+
+    def __init__(self, monkeypatch) -> None:
+        self.count = 0
+        original = AbstractConnection.send_packed_command
+
+        async def counted(connection, *args, **kwargs):
+            self.count += 1
+            return await original(connection, *args, **kwargs)
+
+        monkeypatch.setattr(AbstractConnection, "send_packed_command", counted)
+
+    async def measure(self, operation):
+        before = self.count
+        await operation()
+        return self.count - before
+
+
+async def _median_ms(operation) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start_time = time.perf_counter()
+        await operation()
+        timings.append(time.perf_counter() - start_time)
+    return statistics.median(timings) * 1000
+
+
+@pytest.mark.slow
+class TestFavoriteSearchesStorage:
+    """HGETALL-and-sort vs sorted-set indexes with delta sync."""
+
+    @pytest.fixture
+    async def client(self):
+        client = redis.from_url(
+            settings.REDIS_URL, encoding="utf-8", decode_responses=True
+        )
+        try:
+            await client.ping()
+        except Exception:
+            await client.close()
+            pytest.skip("Redis is not available")
+        yield client
+        keys = [key async for key in client.scan_iter("favorite_searches:*")]
+        keys += [key async for key in client.scan_iter("bench:favorites:*")]
+        if keys:
+            await client.delete(*keys)
+        await client.close()
+
+    @pytest.mark.parametrize("count", [200, 800])
+    async def test_list_and_sync(self, client, monkeypatch, count: int) -> None:
+        favorites = _favorites(count)
+        user_id = uuid4()
+        legacy_key = f"bench:favorites:{user_id}"
+        await client.hset(
+            legacy_key, mapping={fav["id"]: json.dumps(fav) for fav in favorites}
+        )
+
+        service = FavoriteSearchesService(
+            redis_client=client,
+            db_session=None,
+            max_favorites_per_user=count,
+            analytics_enabled=False,
+        )
+        await service._apply_changes(user_id, favorites=favorites)
+        first = await service.sync_favorites_across_devices(user_id, "phone", [])
+        changed = [
+            {**fav, "use_count": fav["use_count"] + 1, "version_vector": {"phone": 1}}
+            for fav in first["server_changes"][:CHANGED]
+        ]
+
+        round_trips = RoundTrips(monkeypatch)
+        legacy_list_ms = await _median_ms(lambda: _legacy_list(client, legacy_key))
+        indexed_list_ms = await _median_ms(
+            lambda: service.get_favorite_searches(user_id, limit=LIMIT)
+        )
+        trips = {
+            "legacy list": await round_trips.measure(
+                lambda: _legacy_list(client, legacy_key)
+            ),
+            "indexed list": await round_trips.measure(
+                lambda: service.get_favorite_searches(user_id, limit=LIMIT)
+            ),
+            "legacy sync": await round_trips.measure(
+                lambda: _legacy_sync(client, legacy_key, changed)
+            ),
+            "delta sync": await round_trips.measure(
+                lambda: service.sync_favorites_across_devices(
+                    user_id, "phone", changed, first["server_version"]
+                )
+            ),
+        }
+
+        print(f"\n📊 Favorite searches, {count} favorites, limit {LIMIT}")
+        print(
+            f"   list: legacy {legacy_list_ms:.2f}ms, indexed {indexed_list_ms:.2f}ms"
+        )
+        for name, value in trips.items():
+            print(f"   {name:<13} {value} round trips")
+
+        assert indexed_list_ms < legacy_list_ms
+        assert trips["delta sync"] < trips["legacy sync"]
+        assert trips["delta sync"] <= 8
@@ -0,0 +1,101 @@
+"""
+Hotspot detection benchmark.
+
+Generates 1k, 10k and 100k visits around 40 neighbourhoods in Seoul (plus
+10% scattered noise) and times the grid detector (dense cells need 0.5% of
+all visits, as in preference analysis) against the previous
+greedy clustering, which compares every unclustered pair with a haversine
+call and a new DistanceCalculator per pair. The greedy pass is O(n²), so it
+only runs up to 10k points; its 100k time would be ~100x the 10k time.
+
+Runs entirely in-process; no external services are required.
+"""
+
+import random
+import time
+
+import pytest
+
+from app.utils.distance_calculator import DistanceCalculator
+from app.utils.hotspots import HotspotDetector
+
+POINT_COUNTS = [1_000, 10_000, 100_000]
+LEGACY_MAX_POINTS = 10_000
+
+
+def _visits(count, seed=0):
+    rng = random.Random(seed)
+    centers = [
+        (37.45 + rng.random() * 0.2, 126.85 + rng.random() * 0.3) for _ in range(40)
+    ]
+    points = []
+    for _ in range(count):
+        if rng.random() < 0.1:
+            points.append((37.4 + rng.random() * 0.3, 126.8 + rng.random() * 0.4))
+        else:
+            lat, lng = rng.choice(centers)
+            points.append((rng.gauss(lat, 0.003), rng.gauss(lng, 0.003)))
+    return points
+
+
+def legacy_identify_hotspots(coordinates):
+    """The previous greedy clustering, including its per-pair calculator."""
+    hotspots = []
+    used_coords = set()
+    for i, (lat1, lng1) in enumerate(coordinates):
+        if i in used_coords:
+            continue
+        cluster_coords = [(lat1, lng1)]
+        used_coords.add(i)
+        for j, (lat2, lng2) in enumerate(coordinates):
+            if j in used_coords or j <= i:
+                continue
+            calc = DistanceCalculator(None)
+            if calc.haversine_distance(lat1, lng1, lat2, lng2) <= 2.0:
+                cluster_coords.append((lat2, lng2))
+                used_coords.add(j)
+        if len(cluster_coords) >= 2:
+            hotspots.append(cluster_coords)
+    return hotspots
+
+
+def _timed(detect, points):
+    start_time = time.perf_counter()
+    hotspots = detect(points)
+    return time.perf_counter() - start_time, len(hotspots)
+
+
+@pytest.mark.slow
+class TestHotspotDetection:
+    """Greedy pairwise clustering vs grid binning."""
+
+    def test_detection_time_by_point_count(self) -> None:
+        detector = HotspotDetector(min_cell_share=0.005)
+        report = []
+        for count in POINT_COUNTS:
+            points = _visits(count)
+            grid = _timed(detector.detect, points)
+            legacy = None
+            if count <= LEGACY_MAX_POINTS:
+                legacy = _timed(legacy_identify_hotspots, points)
+            report.append((count, grid, legacy))
+
+        print("\n📊 Hotspot detection")
+        for count, (grid_s, grid_n), legacy in report:
+            legacy_text = (
+                f"greedy {legacy[0] * 1000:9.1f}ms ({legacy[1]} hotspots)"
+                if legacy
+                else "greedy skipped (O(n²))"
+            )
+            print(
+                f"   {count:>7,} points: grid {grid_s * 1000:7.1f}ms "
+                f"({grid_n} hotspots), {legacy_text}"
+            )
+
+        for count, (grid_s, grid_n), legacy in report:
+            # Noise must not chain the neighbourhoods into a few huge hotspots
+            assert grid_n >= 10
+            if legacy:
+                assert grid_s < legacy[0]
+        # Linear: 100x the points within ~300x the time (slack for timer noise)
+        assert report[-1][1][0] < max(report[0][1][0], 1e-3) * 300
@@ -0,0 +1,137 @@
+"""
+Logging call latency microbenchmark.
+
+16 threads emit a combined 10,000 logs/sec for 2 seconds with extra fields
+that need masking. The previous path builds and masks the structured entry
+on the calling thread and submits it to a 4-worker thread pool (one task
+per entry, unbounded queue). The pipeline path only appends a tuple to the
+ring buffer; the consumer thread structures, masks, indexes and sizes
+entries in batches. Reports p50/p99 per-call latency, backlog drain time,
+and pipeline drop/sample counters.
+
+Runs entirely in-process; no external services are required.
+"""
+
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.monitoring.logging_service import (
+    CentralizedLoggingService,
+    LogCollector,
+    LogLevel,
+    LogRotationManager,
+    LogSearchEngine,
+    StructuredLogger,
+)
+
+THREADS = 16
+RATE_PER_SECOND = 10_000
+DURATION_SECONDS = 2.0
+
+
+class LegacyLoggingService:
+    """The previous log(): structure and mask inline, one pool task per entry."""
+
+    def __init__(self):
+        self.structured_logger = StructuredLogger()
+        self.log_collector = LogCollector()
+        self.search_engine = LogSearchEngine()
+        self.rotation_manager = LogRotationManager()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
+    def log(self, level, message, service=None, extra_fields=None):
+        service_name = service or self.structured_logger.service_name
+        log_entry = self.structured_logger.create_structured_log(
+            level=level.value, message=message, extra_fields=extra_fields
+        )
+        if extra_fields:
+            log_entry = self.structured_logger.mask_sensitive_data(log_entry)
+        self.executor.submit(self._process_log, service_name, log_entry)
+
+    def _process_log(self, service_name, log_entry):
+        self.log_collector.collect_log(service_name, log_entry)
+        self.search_engine.add_log_entry(
+            log_entry["level"], log_entry["message"], service_name, log_entry
+        )
+        self.rotation_manager.add_log_entry(log_entry)
+
+    def flush(self):
+        self.executor.shutdown(wait=True)
+        return True
+
+
+def _run_load(service):
+    per_thread = int(RATE_PER_SECOND * DURATION_SECONDS / THREADS)
+    interval = THREADS / RATE_PER_SECOND
+    latencies = [[] for _ in range(THREADS)]
+
+    def worker(index):
+        next_call = time.perf_counter()
+        samples = latencies[index]
+        for i in range(per_thread):
+            extra = {"request_no": i, "token": "abcdef123456", "path": "/api/v1"}
+            start_time = time.perf_counter()
+            service.log(
+                LogLevel.INFO,
+                f"request {i} handled",
+                service="hotly-api",
+                extra_fields=extra,
+            )
+            samples.append(time.perf_counter() - start_time)
+            next_call += interval
+            delay = next_call - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    start_time = time.perf_counter()
+    service.flush()
+    drain_seconds = time.perf_counter() - start_time
+
+    samples = sorted(s for thread_samples in latencies for s in thread_samples)
+    p50 = statistics.median(samples) * 1e6
+    p99 = samples[int(len(samples) * 0.99)] * 1e6
+    return p50, p99, drain_seconds, len(samples)
+
+
+@pytest.mark.slow
+class TestLogPipelineLatency:
+    """Inline structuring + pool submit vs ring-buffer enqueue."""
+
+    def test_per_call_latency_under_load(self) -> None:
+        legacy = _run_load(LegacyLoggingService())
+        service = CentralizedLoggingService()
+        pipeline = _run_load(service)
+        stats = service.pipeline.get_stats()
+
+        print(
+            f"\n📊 log() latency, {THREADS} threads, "
+            f"{RATE_PER_SECOND:,} logs/s for {DURATION_SECONDS:.0f}s"
+        )
+        for label, (p50, p99, drain, calls) in (
+            ("inline + thread pool", legacy),
+            ("ring buffer pipeline", pipeline),
+        ):
+            print(
+                f"   {label}: p50 {p50:.1f}µs, p99 {p99:.1f}µs, "
+                f"{calls:,} calls, backlog drained in {drain * 1000:.0f}ms"
+            )
+        print(
+            f"   pipeline: processed {stats['processed']:,} in {stats['batches']:,} "
+            f"batches, dropped {stats['dropped']}, sampled out {stats['sampled_out']}"
+        )
+
+        assert pipeline[0] < legacy[0]
+        assert pipeline[1] < legacy[1]
+        assert (
+            stats["processed"] + stats["dropped"] + stats["sampled_out"] == pipeline[3]
+        )
@@ -0,0 +1,200 @@
+"""
+Notification analytics benchmarks at 10M log rows.
+
+Compares the previous report queries (one COUNT per metric over
+notification_logs/notification_interactions) and per-user pattern loading
+(every log and interaction row into Python) against the single-pass
+conditional aggregate and the hourly rollup tables.
+
+Requires a PostgreSQL database with the notification analytics and rollup
+tables; skipped otherwise. Seed rows are inserted inside a transaction and
+rolled back. Set NOTIFICATION_BENCH_ROWS to benchmark a smaller table.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import and_, func, text
+from sqlalchemy.exc import DBAPIError
+
+from app.models.notification_analytics import (
+    InteractionType,
+    NotificationInteraction,
+    NotificationLog,
+)
+from app.services.notifications.notification_rollup_service import (
+    NotificationRollupService,
+)
+
+SEED_ROWS = int(os.getenv("NOTIFICATION_BENCH_ROWS", "10000000"))
+SEED_DAYS = 30
+REQUIRED_TABLES = (
+    "notification_logs",
+    "notification_interactions",
+    "notification_hourly_rollups",
+    "user_notification_hourly_rollups",
+)
+
+
+def _timed(fn):
+    start_time = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start_time) * 1000
+
+
+def _legacy_report(db, start, end):
+    """The per-metric queries generate_analytics_report used to run."""
+    in_range = and_(NotificationLog.sent_at >= start, NotificationLog.sent_at <= end)
+    delivered = and_(in_range, NotificationLog.success.is_(True))
+    interactions = db.query(NotificationInteraction).join(NotificationLog)
+    return (
+        db.query(NotificationLog).filter(in_range).count(),
+        db.query(NotificationLog).filter(delivered).count(),
+        interactions.filter(
+            in_range,
+            NotificationInteraction.interaction_type == InteractionType.OPENED.value,
+        ).count(),
+        interactions.filter(
+            in_range,
+            NotificationInteraction.interaction_type == InteractionType.CLICKED.value,
+        ).count(),
+        db.query(func.avg(NotificationLog.delivery_time_seconds))
+        .filter(delivered)
+        .scalar(),
+    )
+
+
+def _legacy_user_rows(db, user_id, since):
+    """The rows analyze_user_notification_pattern used to load."""
+    logs = (
+        db.query(NotificationLog)
+        .filter(
+            NotificationLog.user_id == user_id,
+            NotificationLog.sent_at >= since,
+            NotificationLog.success.is_(True),
+        )
+        .all()
+    )
+    interactions = (
+        db.query(NotificationInteraction)
+        .filter(
+            NotificationInteraction.notification_log_id.in_([log.id for log in logs])
+        )
+        .all()
+    )
+    return logs, interactions
+
+
+@pytest.mark.slow
+class TestNotificationRollupPerformance:
+    """Report and per-user pattern reads: raw scans vs rollups."""
+
+    @pytest.fixture(autouse=True)
+    def seeded_logs(self, db, monkeypatch):
+        """Seed SEED_ROWS logs (~30% with interactions), rolled back afterwards."""
+        try:
+            missing = [
+                table
+                for table in REQUIRED_TABLES
+                if db.execute(
+                    text("SELECT to_regclass(:table)"), {"table": table}
+                ).scalar()
+                is None
+            ]
+            user_ids = db.execute(text('SELECT id FROM "user" LIMIT 100')).scalars()
+            user_ids = [str(user_id) for user_id in user_ids]
+        except DBAPIError:
+            pytest.skip("PostgreSQL is not available")
+        if missing:
+            pytest.skip(f"Missing tables: {', '.join(missing)}")
+        if not user_ids:
+            pytest.skip("At least one user row is required to seed logs")
+
+        db.execute(text("DELETE FROM notification_hourly_rollups"))
+        db.execute(text("DELETE FROM user_notification_hourly_rollups"))
+        db.execute(
+            text("""
+                INSERT INTO notification_logs (
+                    id, user_id, notification_type, priority, platform, sent_at,
+                    success, delivery_time_seconds, created_at, updated_at
+                )
+                SELECT
+                    md5(random()::text || i)::uuid,
+                    CAST((:user_ids)[1 + i % cardinality(:user_ids)] AS uuid),
+                    (ARRAY['reminder','recommendation','social','marketing'])[1 + i % 4],
+                    'normal',
+                    (ARRAY['ios','android'])[1 + i % 2],
+                    now() - make_interval(secs => i % (:days * 86400)),
+                    i % 20 <> 0,
+                    (i % 50) / 10.0,
+                    now(), now()
+                FROM generate_series(1, :rows) AS i
+                """),
+            {"user_ids": user_ids, "rows": SEED_ROWS, "days": SEED_DAYS},
+        )
+        db.execute(text("""
+                INSERT INTO notification_interactions (
+                    id, notification_log_id, user_id, interaction_type,
+                    timestamp, time_from_delivery, created_at
+                )
+                SELECT
+                    md5(random()::text || id::text)::uuid, id, user_id,
+                    (ARRAY['opened','clicked','dismissed'])[1 + abs(hashtext(id::text)) % 3],
+                    sent_at + interval '5 minutes', 300, now()
+                FROM notification_logs
+                WHERE success AND abs(hashtext(id::text)) % 10 < 3
+                """))
+        db.execute(text("ANALYZE notification_logs"))
+        db.execute(text("ANALYZE notification_interactions"))
+        # Rollup rebuilds commit; keep them inside the rolled-back transaction
+        monkeypatch.setattr(db, "commit", db.flush)
+        self.user_ids = user_ids
+        yield
+        db.rollback()
+
+    def test_report_reads_rollups_instead_of_counting_raw_rows(self, db):
+        """A 7-day report from rollups beats both raw-scan variants."""
+        end = datetime.utcnow()
+        start = end - timedelta(days=7)
+        service = NotificationRollupService(db)
+
+        legacy, legacy_ms = _timed(lambda: _legacy_report(db, start, end))
+        single_pass, single_pass_ms = _timed(
+            lambda: service.load_report_metrics(start, end)
+        )
+        _, build_ms = _timed(
+            lambda: service.rebuild(end - timedelta(days=SEED_DAYS), end)
+        )
+        rollup, rollup_ms = _timed(lambda: service.load_report_metrics(start, end))
+
+        print(f"\n📊 7-day notification report at {SEED_ROWS:,} log rows")
+        print(f"   per-metric COUNTs: {legacy_ms:.1f}ms")
+        print(f"   single pass:       {single_pass_ms:.1f}ms")
+        print(f"   rollups:           {rollup_ms:.1f}ms ({len(rollup)} rows)")
+        print(f"   30-day rollup rebuild: {build_ms:.1f}ms")
+
+        assert sum(row.counts.sent for row in rollup) == legacy[0]
+        assert sum(row.counts.sent for row in single_pass) == legacy[0]
+        assert sum(row.counts.opened for row in rollup) == legacy[2]
+        assert rollup_ms < legacy_ms
+        assert rollup_ms < single_pass_ms
+
+    def test_user_pattern_reads_rollups_instead_of_log_rows(self, db):
+        """Per-user 30-day pattern input from rollups vs loading every row."""
+        end = datetime.utcnow()
+        since = end - timedelta(days=SEED_DAYS)
+        user_id = self.user_ids[0]
+        service = NotificationRollupService(db)
+        service.rebuild(since, end)
+
+        (logs, _), legacy_ms = _timed(lambda: _legacy_user_rows(db, user_id, since))
+        rows, rollup_ms = _timed(lambda: service.load_user_metrics(user_id, since))
+
+        print(f"\n📊 30-day user pattern input at {SEED_ROWS:,} log rows")
+        print(f"   log + interaction rows: {legacy_ms:.1f}ms ({len(logs)} logs)")
+        print(f"   rollups:                {rollup_ms:.1f}ms ({len(rows)} rows)")
+
+        assert sum(row.counts.sent for row in rows) == len(logs)
+        assert rollup_ms < legacy_ms
@@ -0,0 +1,185 @@
+"""
+Onboarding sample benchmark on a synthetic place table.
+
+Seeds places (copies of shared real places saved by many users across
+Seoul) in two steps, ONBOARDING_BENCH_ROWS / 10 and then
+ONBOARDING_BENCH_ROWS, and at each size times:
+
+* the direct query: rank popular places near the user on the fly (group
+  every active place within the sample radius, count distinct savers);
+* the pool sampler: one KNN (``<->``) query over the precomputed
+  onboarding_sample_pool, after a background-style rebuild.
+
+The direct query grows with the table; the pool query should not.
+
+Requires PostgreSQL with PostGIS migrated to revision 009; skipped
+otherwise. Seed rows are inserted inside a transaction and rolled back. Set
+ONBOARDING_BENCH_ROWS to benchmark a smaller table (default 1M).
+"""
+
+import os
+import random
+import statistics
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.services.auth.onboarding_sample_pool import OnboardingSamplePool
+
+SEED_ROWS = int(os.getenv("ONBOARDING_BENCH_ROWS", "1000000"))
+COPIES_PER_PLACE = 5  # Average users saving the same real place
+BENCH_USERS = 20_000
+CATEGORIES = ["restaurant", "cafe", "bar", "shopping", "tourist_attraction"]
+SELECTED = ["restaurant", "cafe", "bar"]
+SAMPLE_COUNT = 6
+RUNS = 30
+
+SEED_SQL = """
+    INSERT INTO places (
+        id, user_id, name, category, coordinates, status, is_verified,
+        recommendation_score, created_at, updated_at
+    )
+    SELECT
+        md5(random()::text || i)::uuid,
+        md5('bench-user' || (i % :users))::uuid,
+        '벤치 장소 ' || spot,
+        (ARRAY['restaurant','cafe','bar','shopping','tourist_attraction'])[
+            1 + spot % 5
+        ],
+        ST_SetSRID(ST_MakePoint(
+            126.8 + (abs(hashtext('lng' || spot)) % 40000) / 100000.0,
+            37.4 + (abs(hashtext('lat' || spot)) % 30000) / 100000.0
+        ), 4326)::geography,
+        'active', false, 1 + spot % 10, now(), now()
+    FROM (
+        SELECT i, (abs(hashtext('spot' || i)) % :spots) AS spot
+        FROM generate_series(:first, :last) AS i
+    ) AS seeded
+"""
+
+DIRECT_POPULAR_SQL = """
+    SELECT place_id, category, distance_m
+    FROM (
+        SELECT
+            min(id::text) AS place_id,
+            category,
+            count(DISTINCT user_id) AS popularity,
+            min(ST_Distance(coordinates, origin.point)) AS distance_m,
+            row_number() OVER (
+                PARTITION BY category ORDER BY count(DISTINCT user_id) DESC
+            ) AS category_rank
+        FROM places,
+            (SELECT CAST(ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326)
+                AS geography) AS point) AS origin
+        WHERE status = 'active'
+          AND category = ANY(CAST(:categories AS text[]))
+          AND ST_DWithin(coordinates, origin.point, :radius_m)
+        GROUP BY lower(name), category
+    ) AS ranked
+    WHERE category_rank <= :limit
+"""
+
+
+def _seed(db, first: int, last: int) -> None:
+    db.execute(
+        text(SEED_SQL),
+        {
+            "first": first,
+            "last": last,
+            "users": BENCH_USERS,
+            "spots": max(SEED_ROWS // COPIES_PER_PLACE, 1),
+        },
+    )
+    db.execute(text("ANALYZE places"))
+
+
+def _origins(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        (37.45 + rng.random() * 0.2, 126.85 + rng.random() * 0.3) for _ in range(count)
+    ]
+
+
+def _latencies_ms(run, origins):
+    timings = []
+    for latitude, longitude in origins:
+        start_time = time.perf_counter()
+        run(latitude, longitude)
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return timings
+
+
+@pytest.mark.slow
+class TestOnboardingSamplePerformance:
+    """On-the-fly popularity ranking vs the precomputed KNN pool."""
+
+    @pytest.fixture(autouse=True)
+    def prepared(self, db, monkeypatch):
+        """Check PostGIS and the pool table; roll back everything afterwards."""
+        try:
+            missing = db.execute(
+                text("SELECT to_regclass('onboarding_sample_pool')")
+            ).scalar()
+        except DBAPIError:
+            pytest.skip("PostgreSQL is not available")
+        if missing is None:
+            pytest.skip("onboarding_sample_pool missing; run alembic upgrade 009")
+
+        db.execute(text("DELETE FROM onboarding_sample_pool"))
+        # Pool rebuilds commit; keep them inside the rolled-back transaction
+        monkeypatch.setattr(db, "commit", db.flush)
+        yield
+        db.rollback()
+
+    def test_sample_latency_is_flat_in_table_size(self, db):
+        pool = OnboardingSamplePool(db)
+        radius_m = settings.ONBOARDING_SAMPLE_RADIUS_KM * 1000
+        origins = _origins(RUNS)
+        report = []
+
+        seeded = 0
+        for rows in (max(SEED_ROWS // 10, 1), SEED_ROWS):
+            _seed(db, seeded + 1, rows)
+            seeded = rows
+            refresh = pool.refresh()
+
+            pool_ms = _latencies_ms(
+                lambda lat, lng: pool.nearest(lat, lng, SELECTED, SAMPLE_COUNT),
+                origins,
+            )
+            direct_ms = _latencies_ms(
+                lambda lat, lng: db.execute(
+                    text(DIRECT_POPULAR_SQL),
+                    {
+                        "latitude": lat,
+                        "longitude": lng,
+                        "categories": SELECTED,
+                        "radius_m": radius_m,
+                        "limit": SAMPLE_COUNT,
+                    },
+                ).fetchall(),
+                origins[:5],
+            )
+            samples = pool.nearest(*origins[0], SELECTED, SAMPLE_COUNT)
+            report.append((rows, refresh, pool_ms, direct_ms, samples))
+
+        print("\n📊 Onboarding samples (3 categories, 6 samples)")
+        for rows, refresh, pool_ms, direct_ms, _ in report:
+            print(
+                f"   {rows:>9,} places: pool p50 {statistics.median(pool_ms):.2f}ms "
+                f"max {max(pool_ms):.2f}ms, direct p50 "
+                f"{statistics.median(direct_ms):.1f}ms; pool of {refresh['places']:,} "
+                f"rebuilt in {refresh['duration_ms']:.0f}ms"
+            )
+
+        for rows, _, pool_ms, direct_ms, samples in report:
+            assert len(samples) == SAMPLE_COUNT
+            assert {s["category"] for s in samples[: len(SELECTED)]} == set(SELECTED)
+            assert max(pool_ms) < settings.ONBOARDING_SAMPLE_TIMEOUT_MS
+            assert statistics.median(pool_ms) < statistics.median(direct_ms)
+        # Flat: 10x the places, pool median within 3x (+1ms timer slack)
+        small, large = report[0][2], report[-1][2]
+        assert statistics.median(large) < statistics.median(small) * 3 + 1
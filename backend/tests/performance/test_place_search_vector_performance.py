@@ -0,0 +1,169 @@
+"""
+Full-text fallback search benchmarks at 100k places.
+
+Compares the stored, GIN-indexed ``search_vector`` column and the pg_trgm
+indexes against the inline ``to_tsvector``/``similarity`` expressions they
+replace, using EXPLAIN ANALYZE plans and timings.
+
+Requires a PostgreSQL database migrated to revision 008; skipped otherwise.
+Seed rows are inserted inside a transaction and rolled back.
+"""
+
+import json
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+SEED_ROWS = 100_000
+BENCH_USER_ID = "00000000-0000-0000-0000-00000000b008"
+
+INLINE_VECTOR = """
+    setweight(to_tsvector('korean', coalesce(name, '')), 'A')
+    || setweight(to_tsvector('korean', coalesce(array_to_string(tags, ' '), '')), 'B')
+    || setweight(to_tsvector('korean', coalesce(description, '')), 'C')
+    || setweight(to_tsvector('korean', coalesce(address, '')), 'D')
+"""
+
+
+def _explain(db, sql: str, params: dict) -> tuple:
+    start_time = time.perf_counter()
+    row = db.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), params).fetchone()
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    plan = row[0] if isinstance(row[0], list) else json.loads(row[0])
+    return plan[0], elapsed_ms
+
+
+def _index_names(plan_node: dict) -> set:
+    names = set()
+    if "Index Name" in plan_node:
+        names.add(plan_node["Index Name"])
+    for child in plan_node.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+@pytest.mark.slow
+class TestPlaceSearchVectorPerformance:
+    """EXPLAIN-backed benchmarks for the stored search vector."""
+
+    @pytest.fixture(autouse=True)
+    def seeded_places(self, db):
+        """Seed 100k places for one benchmark user, rolled back afterwards."""
+        try:
+            has_column = db.execute(
+                text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_name = 'places' AND column_name = 'search_vector'"
+                )
+            ).scalar()
+        except DBAPIError:
+            pytest.skip("PostgreSQL is not available")
+        if not has_column:
+            pytest.skip("places.search_vector missing; run alembic upgrade 008")
+
+        db.execute(
+            text("""
+                INSERT INTO places (
+                    id, user_id, name, description, address, category, tags,
+                    status, is_verified, created_at, updated_at
+                )
+                SELECT
+                    md5(random()::text || i)::uuid,
+                    CAST(:user_id AS uuid),
+                    (ARRAY['홍대','강남','성수','연남','망원'])[1 + i % 5]
+                        || ' ' || (ARRAY['카페','라멘','베이커리','와인바'])[1 + i % 4]
+                        || ' ' || i,
+                    '분위기 좋은 ' || (ARRAY['데이트','혼밥','작업','모임'])[1 + i % 4]
+                        || ' 장소 ' || i,
+                    '서울 ' || (ARRAY['마포구','강남구','성동구'])[1 + i % 3]
+                        || ' ' || i || '번길',
+                    'cafe',
+                    ARRAY[(ARRAY['조용한','감성','뷰맛집'])[1 + i % 3]],
+                    'active', false, now(), now()
+                FROM generate_series(1, :rows) AS i
+                """),
+            {"user_id": BENCH_USER_ID, "rows": SEED_ROWS},
+        )
+        db.execute(text("ANALYZE places"))
+        yield
+        db.rollback()
+
+    def test_stored_vector_uses_gin_index(self, db):
+        """Full-text search on search_vector is served by the GIN index."""
+        params = {"user_id": BENCH_USER_ID, "q": "와인바"}
+
+        stored_plan, stored_ms = _explain(
+            db,
+            """
+            SELECT id, ts_rank(search_vector, plainto_tsquery('korean', :q)) AS rank
+            FROM places
+            WHERE user_id = CAST(:user_id AS uuid) AND status = 'active'
+              AND search_vector @@ plainto_tsquery('korean', :q)
+            ORDER BY rank DESC LIMIT 20
+            """,
+            params,
+        )
+        inline_plan, inline_ms = _explain(
+            db,
+            f"""
+            SELECT id, ts_rank({INLINE_VECTOR}, plainto_tsquery('korean', :q)) AS rank
+            FROM places
+            WHERE user_id = CAST(:user_id AS uuid) AND status = 'active'
+              AND ({INLINE_VECTOR}) @@ plainto_tsquery('korean', :q)
+            ORDER BY rank DESC LIMIT 20
+            """,
+            params,
+        )
+
+        print("\n📊 Full-text search at 100k places")
+        print(
+            f"   stored vector: {stored_ms:.1f}ms {_index_names(stored_plan['Plan'])}"
+        )
+        print(f"   inline vector: {inline_ms:.1f}ms")
+
+        assert "idx_places_search_vector" in _index_names(stored_plan["Plan"])
+        assert stored_plan["Execution Time"] < inline_plan["Execution Time"]
+
+    def test_trigram_fallback_uses_gin_index(self, db):
+        """Fuzzy fallback with the % operator is served by trigram indexes."""
+        params = {"user_id": BENCH_USER_ID, "q": "성수 베이커리 4217"}
+
+        indexed_plan, indexed_ms = _explain(
+            db,
+            """
+            SELECT id, greatest(similarity(name, :q),
+                                similarity(coalesce(address, ''), :q)) AS sim
+            FROM places
+            WHERE user_id = CAST(:user_id AS uuid) AND status = 'active'
+              AND (name % :q OR address % :q)
+            ORDER BY sim DESC LIMIT 20
+            """,
+            params,
+        )
+        scan_plan, scan_ms = _explain(
+            db,
+            """
+            SELECT id, greatest(similarity(name, :q),
+                                similarity(coalesce(description, ''), :q),
+                                similarity(coalesce(address, ''), :q)) AS sim
+            FROM places
+            WHERE user_id = CAST(:user_id AS uuid) AND status = 'active'
+              AND greatest(similarity(name, :q),
+                           similarity(coalesce(description, ''), :q),
+                           similarity(coalesce(address, ''), :q)) > 0.3
+            ORDER BY sim DESC LIMIT 20
+            """,
+            params,
+        )
+
+        print("\n📊 Fuzzy fallback at 100k places")
+        print(f"   trigram index: {indexed_ms:.1f}ms")
+        print(f"   similarity scan: {scan_ms:.1f}ms")
+
+        assert _index_names(indexed_plan["Plan"]) & {
+            "idx_places_name_trgm",
+            "idx_places_address_trgm",
+        }
+        assert indexed_plan["Execution Time"] < scan_plan["Execution Time"]
@@ -0,0 +1,129 @@
+"""
+Preference profile read benchmark.
+
+Builds behavior histories of 1k, 10k and 100k rows spread over 90 days and
+times one preference read two ways: the previous per-row pass (weighting and
+averaging every behavior in Python) and summarizing the window aggregates
+that the cache holds for the same history. The aggregate read depends on
+the number of distinct categories, tags and cells, not on the number of
+behaviors.
+
+Runs entirely in-process; no external services are required.
+"""
+
+import random
+import statistics
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.auth.preference_aggregates import (
+    ACTION_WEIGHTS,
+    behavior_aggregates,
+    summarize_preferences,
+)
+
+HISTORY_SIZES = [1_000, 10_000, 100_000]
+RUNS = 5
+
+CATEGORIES = ["restaurant", "cafe", "bar", "bakery", "dessert", "pub"]
+PRICES = ["budget", "moderate", "expensive"]
+ACTIONS = ["visit", "save", "share", "view"]
+TAGS = ["조용한", "분위기 좋은", "활기찬", "넓음", "주차"]
+
+
+def _distance(lat1, lng1, lat2, lng2):
+    return abs(lat1 - lat2) * 111 + abs(lng1 - lng2) * 88
+
+
+def _history(size, now, seed=0):
+    rng = random.Random(seed)
+    places = [
+        SimpleNamespace(
+            category=rng.choice(CATEGORIES),
+            price_range=rng.choice(PRICES),
+            latitude=37.45 + rng.random() * 0.2,
+            longitude=126.85 + rng.random() * 0.3,
+        )
+        for _ in range(500)
+    ]
+    for _ in range(size):
+        behavior = SimpleNamespace(
+            action=rng.choice(ACTIONS),
+            rating=rng.choice([None, 3.0, 4.0, 4.5, 5.0]),
+            tags_added=rng.sample(TAGS, 2),
+            time_of_day=rng.choice(["morning", "afternoon", "evening"]),
+            day_of_week="friday",
+            created_at=now - timedelta(minutes=rng.randrange(90 * 24 * 60)),
+        )
+        yield behavior, rng.choice(places)
+
+
+def _per_row_read(history, now):
+    """The previous analysis: one Python pass over every behavior."""
+    category_scores = defaultdict(list)
+    time_patterns = defaultdict(list)
+    coordinates = []
+    for behavior, place in history:
+        score = (behavior.rating or 3.0) * ACTION_WEIGHTS.get(behavior.action, 1.0)
+        category_scores[place.category].append(score)
+        if behavior.rating:
+            time_patterns[behavior.time_of_day].append(behavior.rating)
+        coordinates.append((place.latitude, place.longitude))
+    recent = [b for b, _ in history if (now - b.created_at).days <= 30]
+    ratings = [b.rating for b, _ in history if b.rating]
+    return (
+        {c: min(sum(s) / len(s) / 5, 1) for c, s in category_scores.items()},
+        {t: min(sum(r) / len(r) / 5, 1) for t, r in time_patterns.items()},
+        len(recent),
+        statistics.variance(ratings),
+        len(coordinates),
+    )
+
+
+def _timed(read):
+    timings = []
+    for _ in range(RUNS):
+        start_time = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - start_time)
+    return statistics.median(timings) * 1000
+
+
+@pytest.mark.slow
+class TestPreferenceReadCost:
+    """Per-row recompute vs cached window aggregates."""
+
+    def test_read_cost_by_history_size(self) -> None:
+        now = datetime.utcnow()
+        report = []
+        for size in HISTORY_SIZES:
+            history = list(_history(size, now))
+            aggregates = defaultdict(float)
+            recent_since = now - timedelta(days=30)
+            for behavior, place in history:
+                recent = behavior.created_at >= recent_since
+                for field, value in behavior_aggregates(
+                    behavior, place, recent
+                ).items():
+                    aggregates[field] += value
+
+            per_row_ms = _timed(lambda: _per_row_read(history, now))
+            read_ms = _timed(lambda: summarize_preferences(aggregates, _distance))
+            report.append((size, len(aggregates), per_row_ms, read_ms))
+
+        print("\n📊 Preference read, 90-day history")
+        for size, fields, per_row_ms, read_ms in report:
+            print(
+                f"   {size:>7,} behaviors: per-row {per_row_ms:8.2f}ms, "
+                f"aggregate read {read_ms:6.2f}ms ({fields:,} fields)"
+            )
+
+        smallest, largest = report[0], report[-1]
+        assert largest[3] < largest[2]
+        # Aggregate size is bounded by distinct keys, not history length
+        assert largest[1] < smallest[1] * 2
+        assert largest[3] < smallest[3] * 5
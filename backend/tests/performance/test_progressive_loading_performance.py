@@ -0,0 +1,128 @@
+"""
+Progressive loading storage benchmark.
+
+Pages through 1k and 10k result sessions in batches of 10, once with the
+previous layout (the whole remainder in one JSON value, read and rewritten
+on every batch) and once with the chunked layout, in full-document and
+ids-only modes. Reports wall time per session and bytes moved through Redis.
+
+Requires Redis at settings.REDIS_URL; skipped otherwise. Keys are deleted
+afterwards.
+"""
+
+import json
+import time
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.services.content.progressive_loading_service import (
+    ProgressiveLoadingService,
+)
+
+BATCH_SIZE = 10
+
+
+def _results(count: int):
+    return [
+        {
+            "id": f"place-{i}",
+            "name": f"장소 {i}",
+            "category": "restaurant",
+            "address": f"서울시 마포구 테스트로 {i}",
+            "tags": ["맛집", "데이트", "분위기"],
+            "rating": 4.0 + (i % 10) / 10,
+            "description": "한 줄 소개 " * 10,
+        }
+        for i in range(count)
+    ]
+
+
+async def _legacy_session(client, key: str, results) -> int:
+    """Previous layout: one JSON value, full rewrite after each batch."""
+    payload = json.dumps({"results": results[BATCH_SIZE:]}, default=str)
+    await client.setex(key, 300, payload)
+    moved = len(payload)
+    while True:
+        raw = await client.get(key)
+        moved += len(raw)
+        remaining = json.loads(raw)["results"][BATCH_SIZE:]
+        if not remaining:
+            await client.delete(key)
+            return moved
+        payload = json.dumps({"results": remaining}, default=str)
+        await client.setex(key, 300, payload)
+        moved += len(payload)
+
+
+async def _chunked_session(service, user_id, results) -> int:
+    initial = await service.load_initial_results(user_id, {}, results)
+    token = initial["loading_metadata"]["next_batch_token"]
+    loaded = len(initial["results"])
+    while token:
+        response = await service.load_next_batch(user_id, token, BATCH_SIZE)
+        loaded += len(response["results"])
+        token = response["loading_metadata"]["next_batch_token"]
+    return loaded
+
+
+@pytest.mark.slow
+class TestProgressiveLoadingStorage:
+    """Legacy single-value storage vs chunked storage."""
+
+    @pytest.fixture
+    async def client(self):
+        client = redis.from_url(
+            settings.REDIS_URL, encoding="utf-8", decode_responses=True
+        )
+        try:
+            await client.ping()
+        except Exception:
+            await client.close()
+            pytest.skip("Redis is not available")
+        yield client
+        keys = [key async for key in client.scan_iter("progressive_loading:*")]
+        keys += [key async for key in client.scan_iter("bench:progressive:*")]
+        if keys:
+            await client.delete(*keys)
+        await client.close()
+
+    @pytest.mark.parametrize("count", [1000, 10000])
+    async def test_page_through_session(self, client, count: int) -> None:
+        results = _results(count)
+        user_id = uuid4()
+
+        start_time = time.perf_counter()
+        legacy_bytes = await _legacy_session(
+            client, f"bench:progressive:{user_id}", results
+        )
+        legacy_seconds = time.perf_counter() - start_time
+
+        timings = {}
+        for mode, ids_only in (("chunked", False), ("ids-only", True)):
+            service = ProgressiveLoadingService(
+                redis_client=client,
+                db_session=None,
+                initial_batch_size=BATCH_SIZE,
+                batch_size=BATCH_SIZE,
+                adaptive_batch_sizing=False,
+                enable_preloading=False,
+                analytics_enabled=False,
+                store_ids_only=ids_only,
+            )
+            start_time = time.perf_counter()
+            loaded = await _chunked_session(service, user_id, results)
+            timings[mode] = time.perf_counter() - start_time
+            assert loaded == count
+
+        print(f"\n📊 Progressive loading, {count:,} results, batch {BATCH_SIZE}")
+        print(
+            f"   legacy single value: {legacy_seconds:.2f}s "
+            f"({legacy_bytes / 1e6:,.1f} MB moved)"
+        )
+        for mode, seconds in timings.items():
+            print(f"   {mode:<19} {seconds:.2f}s")
+
+        assert timings["chunked"] < legacy_seconds
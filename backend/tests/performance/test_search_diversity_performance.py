@@ -0,0 +1,106 @@
+"""
+Search diversity dedupe benchmark.
+
+Times near-duplicate removal over 100/500/2000 candidates the previous way
+(TfidfVectorizer refit per call, dense n×n cosine matrix, Python double
+loop) and through the diversity engine (shared encoder, blocked sparse
+top-k neighbours, NumPy MMR). Runs in-process, no external services.
+"""
+
+import random
+import statistics
+import time
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from app.services.search.diversity_engine import PlaceTextEncoder, place_text
+from app.services.search.search_diversity_service import SearchDiversityService
+
+ROUNDS = 5
+DISTRICTS = ["마포구", "강남구", "종로구", "성동구", "용산구"]
+WORDS = ["카페", "맛집", "데이트", "브런치", "루프탑", "분위기", "디저트", "와인"]
+
+
+def _candidates(count: int, rng: random.Random):
+    candidates = []
+    for i in range(count):
+        # 약 10%는 앞선 후보의 체인점/중복 등록
+        source = (
+            candidates[rng.randrange(len(candidates))]
+            if i and rng.random() < 0.1
+            else None
+        )
+        if source:
+            candidates.append(
+                {**source, "id": f"place-{i}", "balanced_score": 1.0 - i / count}
+            )
+            continue
+        candidates.append(
+            {
+                "id": f"place-{i}",
+                "name": f"장소 {i}",
+                "address": f"서울 {rng.choice(DISTRICTS)} 테스트로 {rng.randrange(200)}",
+                "tags": rng.sample(WORDS, 3),
+                "description": " ".join(rng.choices(WORDS, k=12)),
+                "balanced_score": 1.0 - i / count,
+            }
+        )
+    return candidates
+
+
+def _legacy_dedupe(results, threshold: float = 0.8):
+    vectorizer = TfidfVectorizer(max_features=100, ngram_range=(1, 2))
+    similarity = cosine_similarity(
+        vectorizer.fit_transform([place_text(r) or "unknown" for r in results])
+    )
+    unique, used = [], set()
+    for i, result in enumerate(results):
+        if i in used:
+            continue
+        unique.append(result)
+        used.add(i)
+        for j in range(i + 1, len(results)):
+            if j not in used and similarity[i][j] > threshold:
+                used.add(j)
+    return unique
+
+
+def _median_ms(fn, rounds: int = ROUNDS) -> float:
+    samples = []
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(samples)
+
+
+@pytest.mark.slow
+class TestSearchDiversityPerformance:
+    """Legacy refit + dense matrix vs shared encoder + sparse top-k."""
+
+    @pytest.mark.parametrize("count", [100, 500, 2000])
+    async def test_dedupe_latency(self, count: int) -> None:
+        candidates = _candidates(count, random.Random(count))
+        service = SearchDiversityService(PlaceTextEncoder(vectorizer_path=None))
+
+        legacy_ms = _median_ms(lambda: _legacy_dedupe(candidates))
+        samples = []
+        for _ in range(ROUNDS):
+            start_time = time.perf_counter()
+            unique = await service._remove_similar_results(candidates)
+            samples.append((time.perf_counter() - start_time) * 1000)
+        engine_ms = statistics.median(samples)
+
+        legacy_matrix_mb = count * count * np.dtype(np.float64).itemsize / 1e6
+        print(
+            f"\n📊 Diversity dedupe, {count} candidates: "
+            f"legacy {legacy_ms:.1f}ms ({legacy_matrix_mb:.1f} MB dense matrix), "
+            f"engine {engine_ms:.1f}ms, kept {len(unique)}"
+        )
+
+        assert len(unique) < count
+        if count >= 2000:
+            assert engine_ms < legacy_ms
@@ -0,0 +1,210 @@
+"""
+Search history storage benchmark.
+
+Seeds one user with 1,000 searches and compares the previous list storage
+(LPUSH/LTRIM/EXPIRE plus separate frequency and session writes per search,
+full-list rewrite to delete one entry, LRANGE + parse + filter for a date
+range) with the time-scored timeline (one pipelined write per search,
+ZREM/HDEL delete, ZREVRANGEBYSCORE paging). Reports latency and network
+round trips per operation.
+
+Requires Redis at settings.REDIS_URL; skipped otherwise. Keys are deleted
+afterwards.
+"""
+
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as redis
+from redis.asyncio.connection import AbstractConnection
+
+from app.core.config import settings
+from app.services.search.search_history_service import SearchHistoryService
+
+HISTORY_SIZE = 1_000
+RUNS = 20
+
+
+def _searches(count: int):
+    now = datetime.utcnow()
+    return [
+        {
+            "search_id": f"search_{i}",
+            "query": f"검색어 {i % 50}",
+            "filters": {"categories": ["restaurant" if i % 3 else "cafe"]},
+            "location": {"lat": 37.5, "lng": 127.0},
+            "result_count": i % 30,
+            "timestamp": (now - timedelta(minutes=10 * i)).isoformat(),
+            "session_id": None,
+            "clicked_places": [],
+        }
+        for i in range(count)
+    ]
+
+
+async def _legacy_record(client, user_id, item):
+    """Previous record_search: five separate commands per search."""
+    history_key = f"bench:search_history:{user_id}"
+    await client.lpush(history_key, json.dumps(item))
+    await client.ltrim(history_key, 0, HISTORY_SIZE - 1)
+    await client.expire(history_key, 90 * 86400)
+    await client.zincrby(f"bench:search_frequency:{user_id}", 1, item["query"])
+    await client.expire(f"bench:search_frequency:{user_id}", 90 * 86400)
+
+
+async def _legacy_range(client, user_id, date_from, date_to):
+    """Previous export: read the whole list, parse and filter every item."""
+    items = await client.lrange(f"bench:search_history:{user_id}", 0, -1)
+    history = [json.loads(raw) for raw in items]
+    return [
+        item
+        for item in history
+        if date_from <= datetime.fromisoformat(item["timestamp"]) <= date_to
+    ]
+
+
+async def _legacy_delete(client, user_id, search_id):
+    """Previous delete_search_entry: rewrite the list without the entry."""
+    history_key = f"bench:search_history:{user_id}"
+    items = [json.loads(raw) for raw in await client.lrange(history_key, 0, -1)]
+    kept = [item for item in items if item["search_id"] != search_id]
+    await client.delete(history_key)
+    if kept:
+        await client.rpush(history_key, *[json.dumps(item) for item in kept])
+
+
+class RoundTrips:
+    """Counts packets sent to Redis (one per command or pipeline flush)."""
+
+    def __init__(self, monkeypatch) -> None:
+        self.count = 0
+        original = AbstractConnection.send_packed_command
+
+        async def counted(connection, *args, **kwargs):
+            self.count += 1
+            return await original(connection, *args, **kwargs)
+
+        monkeypatch.setattr(AbstractConnection, "send_packed_command", counted)
+
+    async def measure(self, operation):
+        before = self.count
+        await operation()
+        return self.count - before
+
+
+async def _median_ms(operation) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start_time = time.perf_counter()
+        await operation()
+        timings.append(time.perf_counter() - start_time)
+    return statistics.median(timings) * 1000
+
+
+@pytest.mark.slow
+class TestSearchHistoryStorage:
+    """JSON list vs time-scored timeline with entries addressable by id."""
+
+    @pytest.fixture
+    async def client(self):
+        client = redis.from_url(
+            settings.REDIS_URL, encoding="utf-8", decode_responses=True
+        )
+        try:
+            await client.ping()
+        except Exception:
+            await client.close()
+            pytest.skip("Redis is not available")
+        yield client
+        keys = []
+        for pattern in ("search_history:*", "search_frequency:*", "bench:search_*"):
+            keys += [key async for key in client.scan_iter(pattern)]
+        if keys:
+            await client.delete(*keys)
+        await client.close()
+
+    async def test_record_range_and_delete(self, client, monkeypatch) -> None:
+        searches = _searches(HISTORY_SIZE)
+        user_id = uuid4()
+        await client.rpush(
+            f"bench:search_history:{user_id}", *[json.dumps(s) for s in searches]
+        )
+
+        service = SearchHistoryService(
+            redis_client=client, db_session=None, max_history_items=HISTORY_SIZE
+        )
+        pipe = client.pipeline(transaction=False)
+        for item in searches:
+            pipe.hset(
+                f"search_history:{user_id}:entries", item["search_id"], json.dumps(item)
+            )
+            pipe.zadd(
+                f"search_history:{user_id}:timeline",
+                {
+                    item["search_id"]: service._score(
+                        datetime.fromisoformat(item["timestamp"])
+                    )
+                },
+            )
+        await pipe.execute()
+
+        # One day out of roughly a week of history
+        date_to = datetime.utcnow() - timedelta(days=2)
+        date_from = date_to - timedelta(days=1)
+
+        async def timeline_range():
+            return [
+                item
+                async for item in service.iter_search_history(
+                    user_id, date_from, date_to
+                )
+            ]
+
+        legacy_items = await _legacy_range(client, user_id, date_from, date_to)
+        assert [item["search_id"] for item in await timeline_range()] == [
+            item["search_id"] for item in legacy_items
+        ]
+
+        round_trips = RoundTrips(monkeypatch)
+        legacy_range_ms = await _median_ms(
+            lambda: _legacy_range(client, user_id, date_from, date_to)
+        )
+        timeline_range_ms = await _median_ms(timeline_range)
+        trips = {
+            "legacy record": await round_trips.measure(
+                lambda: _legacy_record(client, user_id, searches[0])
+            ),
+            "record": await round_trips.measure(
+                lambda: service.record_search(user_id, {"query": "강남 맛집"})
+            ),
+            "legacy delete": await round_trips.measure(
+                lambda: _legacy_delete(client, user_id, "search_500")
+            ),
+            "delete": await round_trips.measure(
+                lambda: service.delete_search_entry(user_id, "search_500")
+            ),
+        }
+        legacy_delete_ms = await _median_ms(
+            lambda: _legacy_delete(client, user_id, "search_missing")
+        )
+        delete_ms = await _median_ms(
+            lambda: service.delete_search_entry(user_id, "search_missing")
+        )
+
+        print(f"\n📊 Search history, {HISTORY_SIZE} entries")
+        print(
+            f"   1-day range: legacy {legacy_range_ms:.2f}ms, "
+            f"timeline {timeline_range_ms:.2f}ms ({len(legacy_items)} items)"
+        )
+        print(f"   delete: legacy {legacy_delete_ms:.2f}ms, timeline {delete_ms:.2f}ms")
+        for name, value in trips.items():
+            print(f"   {name:<14} {value} round trips")
+
+        assert timeline_range_ms < legacy_range_ms
+        assert delete_ms < legacy_delete_ms
+        assert trips["record"] == 1
+        assert trips["delete"] == 1
@@ -0,0 +1,199 @@
+"""
+Sequential experiment statistics simulation benchmark.
+
+Latency: streams 20,000 participants into a two-variant experiment and
+refreshes the result every 500 participants. The previous path keeps the
+raw event list and rebuilds per-user outcomes on every refresh; the
+streaming path updates constant-size sufficient statistics per event and
+runs mSPRT on them.
+
+Sample size: simulates 200 experiments (conversion 0.30 -> 0.33) peeked
+every 100 users per variant and compares the fixed-horizon sample size
+(two-sided z test, 80% power) with the sample at which mSPRT stops, with
+and without a CUPED covariate. A/A runs report the false positive rate of
+naive z-test peeking against mSPRT.
+
+Runs entirely in-process; no Redis or database is required.
+"""
+
+import math
+import time
+from collections import Counter
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from app.services.experiments.sequential_statistics import (
+    SufficientStatistics,
+    msprt_test,
+    z_test,
+)
+
+PARTICIPANTS = 20000
+REFRESH_EVERY = 500
+SIMULATIONS = 200
+PEEK_EVERY = 100
+BASE_RATE = 0.30
+LIFT = 0.03
+ALPHA = 0.05
+
+
+def _prefix_stats(y, x, end):
+    """Statistics of the first `end` units from cumulative sums."""
+    return SufficientStatistics(
+        n=end,
+        sum_y=float(y[0][end - 1]),
+        sum_y2=float(y[1][end - 1]),
+        sum_x=float(x[0][end - 1]),
+        sum_x2=float(x[1][end - 1]),
+        sum_xy=float(x[2][end - 1]),
+    )
+
+
+def _cumulative(outcomes, covariates):
+    return (
+        (np.cumsum(outcomes), np.cumsum(outcomes**2)),
+        (
+            np.cumsum(covariates),
+            np.cumsum(covariates**2),
+            np.cumsum(covariates * outcomes),
+        ),
+    )
+
+
+def _simulate_arm(rng, rate, size):
+    """Bernoulli outcome with a correlated pre-experiment covariate."""
+    latent = rng.normal(size=size)
+    outcomes = (latent + 0.6 * rng.normal(size=size) < stats.norm.ppf(rate)).astype(
+        float
+    )
+    covariates = -latent
+    return outcomes, covariates
+
+
+def _stopping_sample(rng, treatment_rate, max_n, use_cuped, naive=False):
+    control = _cumulative(*_simulate_arm(rng, BASE_RATE, max_n))
+    treatment = _cumulative(*_simulate_arm(rng, treatment_rate, max_n))
+    for end in range(PEEK_EVERY, max_n + 1, PEEK_EVERY):
+        control_stats = _prefix_stats(*control, end)
+        treatment_stats = _prefix_stats(*treatment, end)
+        if naive:
+            decided = z_test(control_stats, treatment_stats)["p_value"] < ALPHA
+        else:
+            decided = msprt_test(
+                control_stats, treatment_stats, tau=LIFT, use_cuped=use_cuped
+            )["decided"]
+        if decided:
+            return end
+    return None
+
+
+@pytest.mark.slow
+class TestSequentialStatistics:
+    """Raw event recomputation vs streaming sufficient statistics."""
+
+    def test_result_refresh_latency(self) -> None:
+        rng = np.random.default_rng(0)
+        variants = rng.integers(0, 2, PARTICIPANTS)
+        clicks = rng.poisson(np.where(variants == 1, 0.33, 0.30))
+
+        # Previous path: raw event list, per-user outcomes rebuilt per refresh
+        events = []
+        legacy_seconds = 0.0
+        for user, (variant, count) in enumerate(zip(variants, clicks)):
+            events.append({"user_id": user, "variant": variant, "type": "assign"})
+            events.extend(
+                {"user_id": user, "variant": variant, "type": "click"}
+                for _ in range(count)
+            )
+            if (user + 1) % REFRESH_EVERY:
+                continue
+            start_time = time.perf_counter()
+            members = {0: set(), 1: set()}
+            per_user = Counter()
+            for event in events:
+                members[event["variant"]].add(event["user_id"])
+                if event["type"] == "click":
+                    per_user[event["user_id"]] += 1
+            samples = [
+                np.array([per_user[u] for u in members[v]], dtype=float) for v in (0, 1)
+            ]
+            stats.ttest_ind(samples[1], samples[0], equal_var=False)
+            legacy_seconds += time.perf_counter() - start_time
+
+        # Streaming path: O(1) update per event, O(1) refresh
+        arms = [SufficientStatistics(), SufficientStatistics()]
+        per_user_clicks = Counter()
+        streaming_seconds = 0.0
+        for user, (variant, count) in enumerate(zip(variants, clicks)):
+            start_time = time.perf_counter()
+            arm = arms[variant]
+            arm.n += 1
+            for _ in range(count):
+                per_user_clicks[user] += 1
+                arm.sum_y += 1
+                arm.sum_y2 += 2 * per_user_clicks[user] - 1
+            if (user + 1) % REFRESH_EVERY == 0:
+                msprt_test(arms[0], arms[1], tau=LIFT)
+            streaming_seconds += time.perf_counter() - start_time
+
+        refreshes = PARTICIPANTS // REFRESH_EVERY
+        print(f"\n📊 Result refresh, {PARTICIPANTS:,} users, {refreshes} refreshes")
+        print(
+            f"   raw event recompute: {legacy_seconds * 1000 / refreshes:.2f}ms/refresh"
+        )
+        print(
+            "   sufficient stats:    "
+            f"{streaming_seconds * 1000 / refreshes:.3f}ms/refresh (incl. updates)"
+        )
+
+        assert arms[0].n + arms[1].n == PARTICIPANTS
+        assert streaming_seconds < legacy_seconds
+
+    def test_sample_size_to_decision(self) -> None:
+        rng = np.random.default_rng(1)
+        treatment_rate = BASE_RATE + LIFT
+
+        # Fixed-horizon sample size per variant (two-sided, 80% power)
+        pooled_variance = BASE_RATE * (1 - BASE_RATE) + treatment_rate * (
+            1 - treatment_rate
+        )
+        fixed_n = math.ceil(
+            (stats.norm.ppf(1 - ALPHA / 2) + stats.norm.ppf(0.8)) ** 2
+            * pooled_variance
+            / LIFT**2
+        )
+        max_n = 3 * fixed_n
+
+        report = {}
+        for label, use_cuped in (("mSPRT", False), ("mSPRT + CUPED", True)):
+            stops = [
+                _stopping_sample(rng, treatment_rate, max_n, use_cuped)
+                for _ in range(SIMULATIONS)
+            ]
+            decided = [n for n in stops if n is not None]
+            report[label] = (len(decided) / SIMULATIONS, np.median(decided))
+
+        false_positives = {
+            label: sum(
+                _stopping_sample(rng, BASE_RATE, fixed_n, False, naive=naive)
+                is not None
+                for _ in range(SIMULATIONS)
+            )
+            / SIMULATIONS
+            for label, naive in (("naive z peeking", True), ("mSPRT", False))
+        }
+
+        print(
+            f"\n📊 Users per variant to decide {BASE_RATE:.2f} -> {treatment_rate:.2f}"
+        )
+        print(f"   fixed horizon (80% power): {fixed_n:,}")
+        for label, (power, median_n) in report.items():
+            print(f"   {label}: median {median_n:,.0f}, decided {power:.0%}")
+        for label, rate in false_positives.items():
+            print(f"   A/A false positives, {label}: {rate:.1%}")
+
+        assert report["mSPRT + CUPED"][1] < fixed_n
+        assert false_positives["mSPRT"] <= ALPHA
+        assert false_positives["naive z peeking"] > false_positives["mSPRT"]
@@ -0,0 +1,160 @@
+"""
+Viewport tile cache benchmark.
+
+Replays a 300-step pan/zoom sequence over 50k synthetic places around Seoul.
+The previous path runs one bounding-box query per viewport; the tiled path
+reads cached tiles from Redis and queries only tiles scrolled into view.
+The database is simulated in-process (bounding-box scan over NumPy
+arrays), so the report counts queries and rows read next to wall time.
+
+Requires Redis at settings.REDIS_URL; skipped otherwise. Keys are deleted
+afterwards.
+"""
+
+import random
+import time
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from redis import Redis
+
+from app.core.config import settings
+from app.services.maps.viewport_tile_cache import (
+    POINTS,
+    ViewportTileCache,
+    choose_tile_zoom,
+    in_bounds,
+    lat_lng_to_tile,
+    tile_bounds,
+    tiles_covering,
+)
+
+PLACE_COUNT = 50_000
+STEPS = 300
+
+
+class SimulatedPlaceTable:
+    """Bounding-box scans over synthetic places, counting queries and rows."""
+
+    def __init__(self, count: int, rng: np.random.Generator):
+        self.latitudes = rng.normal(37.56, 0.05, count)
+        self.longitudes = rng.normal(126.98, 0.07, count)
+        self.queries = 0
+        self.rows = 0
+
+    def scan(self, bounds):
+        south, west, north, east = bounds
+        self.queries += 1
+        mask = (
+            (self.latitudes >= south)
+            & (self.latitudes <= north)
+            & (self.longitudes >= west)
+            & (self.longitudes <= east)
+        )
+        indices = np.nonzero(mask)[0]
+        self.rows += len(indices)
+        return [
+            {
+                "place_id": f"place-{i}",
+                "latitude": float(self.latitudes[i]),
+                "longitude": float(self.longitudes[i]),
+                "name": f"장소 {i}",
+                "category": "restaurant",
+            }
+            for i in indices
+        ]
+
+    def load_tiles(self, zoom, tiles):
+        bounds = [tile_bounds(zoom, x, y) for x, y in tiles]
+        union = (
+            min(b[0] for b in bounds),
+            min(b[1] for b in bounds),
+            max(b[2] for b in bounds),
+            max(b[3] for b in bounds),
+        )
+        loaded = {tile: {"places": [], "truncated": False} for tile in tiles}
+        for place in self.scan(union):
+            tile = lat_lng_to_tile(place["latitude"], place["longitude"], zoom)
+            if tile in loaded:
+                loaded[tile]["places"].append(place)
+        return loaded
+
+
+def _pan_sequence(rng: random.Random):
+    """Viewports (bounds, zoom) for a user panning and occasionally zooming."""
+    latitude, longitude, zoom = 37.56, 126.98, 15
+    for _ in range(STEPS):
+        if rng.random() < 0.1:
+            zoom = max(14, min(16, zoom + rng.choice((-1, 1))))
+        height = 0.6 / (1 << (zoom - 8))
+        width = height * 1.6
+        latitude += rng.uniform(-0.25, 0.25) * height
+        longitude += rng.uniform(-0.25, 0.25) * width
+        yield (
+            latitude - height / 2,
+            longitude - width / 2,
+            latitude + height / 2,
+            longitude + width / 2,
+        ), zoom
+
+
+@pytest.mark.slow
+class TestViewportTileCachePerformance:
+    """Per-viewport bounding-box queries vs tile cache."""
+
+    @pytest.fixture
+    def client(self):
+        client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        try:
+            client.ping()
+        except Exception:
+            client.close()
+            pytest.skip("Redis is not available")
+        prefix = f"bench:viewport:{uuid4().hex}"
+        yield client, prefix
+        keys = list(client.scan_iter(f"{prefix}:*"))
+        if keys:
+            client.delete(*keys)
+        client.close()
+
+    def test_pan_sequence(self, client) -> None:
+        client, prefix = client
+        viewports = list(_pan_sequence(random.Random(7)))
+
+        legacy_table = SimulatedPlaceTable(PLACE_COUNT, np.random.default_rng(7))
+        start_time = time.perf_counter()
+        legacy_counts = [len(legacy_table.scan(bounds)) for bounds, _ in viewports]
+        legacy_seconds = time.perf_counter() - start_time
+
+        table = SimulatedPlaceTable(PLACE_COUNT, np.random.default_rng(7))
+        cache = ViewportTileCache(client=client, prefix=prefix)
+        tiled_counts = []
+        start_time = time.perf_counter()
+        for bounds, zoom in viewports:
+            tile_zoom = choose_tile_zoom(bounds, zoom)
+            tiles = tiles_covering(bounds, tile_zoom)
+            data = cache.get_tiles("all", POINTS, tile_zoom, tiles, table.load_tiles)
+            tiled_counts.append(
+                sum(
+                    in_bounds(p["latitude"], p["longitude"], bounds)
+                    for tile in tiles
+                    for p in data[tile]["places"]
+                )
+            )
+        tiled_seconds = time.perf_counter() - start_time
+        stats = cache.get_stats()
+
+        print(f"\n📊 Viewport pan sequence, {STEPS} steps, {PLACE_COUNT:,} places")
+        print(
+            f"   bbox per viewport: {legacy_table.queries} queries, "
+            f"{legacy_table.rows:,} rows, {legacy_seconds:.2f}s (simulated DB)"
+        )
+        print(
+            f"   tile cache:        {table.queries} queries, {table.rows:,} rows, "
+            f"{tiled_seconds:.2f}s, tile hit rate {stats['hit_rate']:.1%}"
+        )
+
+        assert tiled_counts == legacy_counts
+        assert table.queries < legacy_table.queries
+        assert table.rows < legacy_table.rows
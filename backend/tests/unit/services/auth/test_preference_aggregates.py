@@ -0,0 +1,262 @@
+"""
+사용자 선호도 집계 테스트
+
+일자별 집계로 계산한 선호도가 행 단위 계산과 같은지, 기록 시 캐시 증분 갱신,
+분석 기간/보존 기간 처리, 단일 그룹 SQL 구성 검증
+"""
+
+import uuid
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.preference import UserBehaviorCreate
+from app.services.auth import user_preference_service as service_module
+from app.services.auth.preference_aggregates import (
+    PreferenceAggregateCache,
+    behavior_aggregates,
+    build_aggregate_query,
+    summarize_preferences,
+    window_start,
+)
+from app.services.auth.user_preference_service import UserPreferenceService
+
+# 서비스는 실제 현재 시각 기준으로 기간을 자르므로 오늘 정오로 고정
+NOW = datetime.combine(datetime.utcnow().date(), time(12))
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self.redis, name)
+        return lambda *args, **kwargs: self.commands.append((method, args, kwargs))
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hgetall(self, key):
+        return {field: str(value) for field, value in self.hashes.get(key, {}).items()}
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hexists(self, key, field):
+        return field in self.hashes.get(key, {})
+
+    def hincrbyfloat(self, key, field, value):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = float(fields.get(field, 0.0)) + value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+
+    def expire(self, key, seconds):
+        pass
+
+
+def _place(category, price_range=None, latitude=None, longitude=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        category=category,
+        price_range=price_range,
+        latitude=latitude,
+        longitude=longitude,
+    )
+
+
+def _behavior(place, action, rating, days_ago=0, tags=None, time_of_day=None):
+    return SimpleNamespace(
+        place_id=place.id if place else None,
+        action=action,
+        rating=rating,
+        tags_added=tags,
+        time_of_day=time_of_day,
+        day_of_week="friday",
+        created_at=NOW - timedelta(days=days_ago, hours=2),
+    )
+
+
+def _rebuild(history, since, recent_since):
+    """DB 그룹 쿼리 대역: 기간 내 행동의 행 단위 증분을 합산"""
+    aggregates = defaultdict(float)
+    for behavior, place in history:
+        if behavior.created_at < since:
+            continue
+        recent = behavior.created_at >= recent_since
+        for field, value in behavior_aggregates(behavior, place, recent).items():
+            aggregates[field] += value
+    return dict(aggregates)
+
+
+def _window(history, days):
+    return _rebuild(history, window_start(NOW, days), window_start(NOW, 30))
+
+
+def _distance(lat1, lng1, lat2, lng2):
+    return abs(lat1 - lat2) * 111 + abs(lng1 - lng2) * 88
+
+
+GANGNAM = _place("restaurant", "moderate", 37.4979, 127.0276)
+GANGNAM_CAFE = _place("cafe", "budget", 37.4985, 127.0281)
+HONGDAE = _place("cafe", "budget", 37.5563, 126.9236)
+
+HISTORY = [
+    (_behavior(GANGNAM, "visit", 4.0, tags=["조용한"], time_of_day="evening"), GANGNAM),
+    (_behavior(GANGNAM, "save", None, days_ago=10), GANGNAM),
+    (
+        _behavior(GANGNAM_CAFE, "share", 5.0, days_ago=40, tags=["활기찬", "넓음"]),
+        GANGNAM_CAFE,
+    ),
+    (_behavior(HONGDAE, "view", 2.0, days_ago=60, time_of_day="evening"), HONGDAE),
+    (_behavior(None, "search", 3.0, days_ago=5), None),
+]
+
+
+class TestPreferenceAggregates:
+    """선호도 집계 테스트"""
+
+    def test_summary_matches_per_row_weighting(self) -> None:
+        """Given: 행동 5건 / When: 일자별 집계를 90일 기간으로 요약 / Then: 행 단위 가중 평균과 동일"""
+        summary = summarize_preferences(_window(HISTORY, 90), _distance)
+
+        assert summary["data_points_count"] == 5
+        # restaurant: (4.0*1.5 + 3.0*1.2) / 2, cafe: (5.0*1.3 + 2.0*1.0) / 2
+        assert summary["cuisine_preferences"] == pytest.approx(
+            {"restaurant": 0.96, "cafe": 0.85}
+        )
+        assert summary["price_preferences"] == pytest.approx(
+            {"moderate": 0.96, "budget": 0.85}
+        )
+        assert summary["ambiance_preferences"] == {"조용한": 0.8, "활기찬": 1.0}
+        assert summary["time_preferences"]["evening"] == pytest.approx(0.6)
+        assert summary["time_preferences"]["friday"] == pytest.approx(0.7)
+        assert summary["time_preferences"]["hour_10"] == pytest.approx(0.7)
+
+        location = summary["location_preferences"]
+        (hotspot,) = location["activity_hotspots"]
+        assert hotspot["visit_count"] == 3
+        assert location["preferred_center"]["latitude"] == pytest.approx(
+            (37.4979 * 2 + 37.4985 + 37.5563) / 4
+        )
+
+        # 평점 [4, 5, 2, 3]: 분산 5/3, 최근 30일 3/5, 데이터 5/50
+        expected = round((0.1 + 0.6 + (1 - (5 / 3) / 4)) / 3, 3)
+        assert summary["confidence_score"] == expected
+        legacy = UserPreferenceService(MagicMock())._calculate_confidence_score(
+            [behavior for behavior, _ in HISTORY]
+        )
+        assert legacy == expected
+
+    def test_window_excludes_older_days(self) -> None:
+        """Given: 60일 전까지의 행동 / When: 30일 기간 요약 / Then: 30일 이내 행동만 반영"""
+        summary = summarize_preferences(_window(HISTORY, 30), _distance)
+
+        assert summary["data_points_count"] == 3
+        assert summary["cuisine_preferences"] == pytest.approx({"restaurant": 0.96})
+        assert summarize_preferences({}, _distance) is None
+
+    def test_recorded_behavior_updates_built_cache(self, monkeypatch) -> None:
+        """Given: 캐시가 구축된 사용자 / When: 행동 기록 / Then: 재구축 없이 증분 반영, 전체 재계산과 동일"""
+        user_id = uuid.uuid4()
+        history = list(HISTORY)
+        builds = []
+
+        def query(db, uid, since, recent_since):
+            builds.append(since)
+            return _rebuild(history, since, recent_since)
+
+        monkeypatch.setattr(service_module, "query_aggregates", query)
+        cache = PreferenceAggregateCache(client=FakeRedis())
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = HONGDAE
+        service = UserPreferenceService(db, aggregate_cache=cache)
+
+        before = service.analyze_user_preferences(user_id)
+        assert before.data_points_count == 5
+        assert service.analyze_user_preferences(user_id, 30).data_points_count == 3
+
+        behavior = service.record_user_behavior(
+            user_id,
+            UserBehaviorCreate(
+                action="visit",
+                place_id=HONGDAE.id,
+                rating=5.0,
+                tags_added=["분위기 좋은"],
+                time_of_day="evening",
+                day_of_week="saturday",
+            ),
+        )
+        history.append((behavior, HONGDAE))
+        after = service.analyze_user_preferences(user_id)
+
+        assert len(builds) == 2
+        assert cache.get_stats()["increments"] == 1
+        assert after.data_points_count == 6
+        assert service.analyze_user_preferences(user_id, 30).data_points_count == 4
+        assert after.ambiance_preferences["분위기 좋은"] == 1.0
+
+        cache.invalidate(user_id)
+        rebuilt = service.analyze_user_preferences(user_id)
+        assert len(builds) == 3
+        for name in ("cuisine_preferences", "ambiance_preferences", "time_preferences"):
+            assert getattr(after, name) == pytest.approx(getattr(rebuilt, name))
+        location, expected = after.location_preferences, rebuilt.location_preferences
+        assert location["preferred_center"] == pytest.approx(
+            expected["preferred_center"]
+        )
+        assert [h["visit_count"] for h in location["activity_hotspots"]] == [3, 2]
+        assert after.confidence_score == rebuilt.confidence_score
+
+    def test_uncached_paths_query_database(self, monkeypatch) -> None:
+        """Given: 미구축 캐시/캐시 대상이 아닌 기간 / When: 기록 및 분석 / Then: 증분 생략, 직접 조회"""
+        builds = []
+        monkeypatch.setattr(
+            service_module,
+            "query_aggregates",
+            lambda db, uid, since, recent_since: builds.append(since) or {},
+        )
+        cache = PreferenceAggregateCache(client=FakeRedis())
+        db = MagicMock()
+        service = UserPreferenceService(db, aggregate_cache=cache)
+        user_id = uuid.uuid4()
+
+        service.record_user_behavior(
+            user_id,
+            UserBehaviorCreate(action="visit", place_id=uuid.uuid4(), rating=4.0),
+        )
+        db.query.assert_not_called()
+
+        result = service.analyze_user_preferences(user_id, analysis_window_days=365)
+        assert result.data_points_count == 0
+        assert cache.get_stats().get("builds", 0) == 0
+        assert datetime.utcnow() - builds[0] > timedelta(days=365)
+
+    def test_aggregate_query_is_one_grouped_statement(self) -> None:
+        """Given: 사용자/기간 / When: 집계 쿼리 생성 / Then: 장소 조인 CTE 위 그룹 집계의 UNION ALL"""
+        sql = str(
+            build_aggregate_query(uuid.uuid4(), NOW, NOW).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert sql.count("LEFT OUTER JOIN places") == 1
+        assert sql.count("UNION ALL") == 9
+        assert sql.count("GROUP BY") == 7
+        assert "CASE WHEN" in sql
+        assert "unnest" in sql
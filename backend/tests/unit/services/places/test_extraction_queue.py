@@ -0,0 +1,204 @@
+"""Place 추출 작업 큐 단위 테스트 (인메모리 브로커)."""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.services.places.extraction_queue import (
+    ExtractionJob,
+    ExtractionJobQueue,
+    ExtractionWorker,
+    InMemoryJobBroker,
+)
+from app.utils.concurrency import ApiConcurrencyLimiter
+
+
+def _snapshot(url: str = "https://instagram.com/p/abc", **overrides) -> dict:
+    snapshot = {
+        "content_type": "place",
+        "title": "성수 베이커리",
+        "url": url,
+        "platform": "instagram",
+        "keywords_main": ["베이커리"],
+        "named_entities": ["성수 베이커리"],
+        "type_specific_data": {"address": "서울 성동구"},
+    }
+    snapshot.update(overrides)
+    return snapshot
+
+
+class FakeExtractor:
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.calls = []
+
+    async def extract(self, *, user_id, **payload):
+        self.calls.append((user_id, payload["url"]))
+        if self.failures:
+            raise self.failures.pop(0)
+
+
+@pytest.fixture
+def queue():
+    return ExtractionJobQueue(InMemoryJobBroker(), max_attempts=3, backoff_base=0)
+
+
+class TestEnqueue:
+    async def test_dedupes_on_source_hash(self, queue):
+        user_id = uuid4()
+
+        first = await queue.enqueue(user_id, _snapshot())
+        second = await queue.enqueue(user_id, _snapshot())
+        other_user = await queue.enqueue(uuid4(), _snapshot())
+
+        assert first and other_user
+        assert second is None
+        metrics = await queue.get_metrics()
+        assert metrics["depth"]["ready"] == 2
+        assert metrics["counters"]["duplicates"] == 1
+
+    async def test_skips_non_place_and_nameless_content(self, queue):
+        assert await queue.enqueue(uuid4(), _snapshot(content_type="tips")) is None
+        assert (
+            await queue.enqueue(uuid4(), _snapshot(title=None, named_entities=None))
+            is None
+        )
+        assert (await queue.get_metrics())["depth"]["ready"] == 0
+
+
+class TestWorker:
+    async def test_processes_job_and_records_metrics(self, queue):
+        user_id = uuid4()
+        extractor = FakeExtractor()
+        worker = ExtractionWorker(queue, extractor, poll_timeout=0.01)
+        await queue.enqueue(user_id, _snapshot())
+
+        assert await worker.process_next()
+        assert not await worker.process_next()
+
+        assert extractor.calls == [(user_id, "https://instagram.com/p/abc")]
+        assert isinstance(extractor.calls[0][0], UUID)
+        metrics = await queue.get_metrics()
+        assert metrics["counters"]["succeeded"] == 1
+        assert metrics["depth"] == {
+            "ready": 0,
+            "processing": 0,
+            "delayed": 0,
+            "dead": 0,
+        }
+
+    async def test_transient_failure_is_retried_with_backoff(self, queue):
+        extractor = FakeExtractor(failures=[ConnectionError("db down")])
+        worker = ExtractionWorker(queue, extractor, poll_timeout=0.01)
+        await queue.enqueue(uuid4(), _snapshot())
+
+        await worker.process_next()
+        assert (await queue.get_metrics())["depth"]["delayed"] == 1
+
+        await queue.broker.promote_due(float("inf"))
+        await worker.process_next()
+
+        metrics = await queue.get_metrics()
+        assert len(extractor.calls) == 2
+        assert metrics["counters"]["retried"] == 1
+        assert metrics["counters"]["succeeded"] == 1
+
+    async def test_permanent_failure_is_dead_lettered(self, queue):
+        user_id = uuid4()
+        extractor = FakeExtractor(failures=[ValueError("bad payload")])
+        worker = ExtractionWorker(queue, extractor, poll_timeout=0.01)
+        await queue.enqueue(user_id, _snapshot())
+
+        await worker.process_next()
+
+        dead = ExtractionJob.from_json(queue.broker.dead[0])
+        assert dead.attempts == 1
+        assert dead.last_error == "ValueError: bad payload"
+        # 중복 방지 키가 해제되어 재적재 가능
+        assert await queue.enqueue(user_id, _snapshot())
+
+    async def test_recovers_expired_in_flight_jobs_and_stops(self, queue):
+        await queue.enqueue(uuid4(), _snapshot("https://a"))
+        await queue.enqueue(uuid4(), _snapshot("https://b"))
+        await queue.broker.pop(0.01)  # 처리 중 종료된 작업 흉내 (리스 연장 없음)
+
+        extractor = FakeExtractor()
+        worker = ExtractionWorker(
+            queue,
+            extractor,
+            concurrency=2,
+            poll_timeout=0.01,
+            promote_interval=0.01,
+            lease_seconds=0.05,
+        )
+        stop_event = asyncio.Event()
+        run_task = asyncio.create_task(worker.run(stop_event))
+        for _ in range(100):
+            if len(extractor.calls) == 2:
+                break
+            await asyncio.sleep(0.01)
+        stop_event.set()
+        await asyncio.wait_for(run_task, 1)
+
+        assert sorted(url for _, url in extractor.calls) == ["https://a", "https://b"]
+        assert (await queue.get_metrics())["depth"]["processing"] == 0
+
+    async def test_live_worker_jobs_are_not_recovered(self, queue):
+        await queue.enqueue(uuid4(), _snapshot())
+        release = asyncio.Event()
+
+        class SlowExtractor(FakeExtractor):
+            async def extract(self, *, user_id, **payload):
+                await super().extract(user_id=user_id, **payload)
+                await release.wait()
+
+        extractor = SlowExtractor()
+        busy = ExtractionWorker(
+            queue,
+            extractor,
+            poll_timeout=0.01,
+            promote_interval=0.01,
+            lease_seconds=0.06,
+        )
+        stop_event = asyncio.Event()
+        busy_task = asyncio.create_task(busy.run(stop_event))
+        # 새로 시작한 워커가 리스 점검을 여러 번 돌아도 하트비트 중인 작업은 그대로
+        restarted = ExtractionWorker(
+            queue,
+            FakeExtractor(),
+            poll_timeout=0.01,
+            promote_interval=0.01,
+            lease_seconds=0.06,
+        )
+        restarted_task = asyncio.create_task(restarted.run(stop_event))
+        await asyncio.sleep(0.3)
+
+        assert len(extractor.calls) == 1
+        assert (await queue.get_metrics())["depth"]["processing"] == 1
+
+        release.set()
+        await asyncio.sleep(0.05)
+        stop_event.set()
+        await asyncio.wait_for(asyncio.gather(busy_task, restarted_task), 1)
+        assert (await queue.get_metrics())["depth"]["processing"] == 0
+
+
+class TestApiConcurrencyLimiter:
+    async def test_caps_in_flight_calls_per_api(self):
+        limiter = ApiConcurrencyLimiter({"kakao": 2})
+        in_flight = peak = 0
+
+        async def call(api):
+            nonlocal in_flight, peak
+            async with limiter.limit(api):
+                if api == "kakao":
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                if api == "kakao":
+                    in_flight -= 1
+
+        await asyncio.gather(*(call("kakao") for _ in range(6)), call("other"))
+
+        assert peak == 2
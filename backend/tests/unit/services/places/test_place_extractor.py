@@ -146,7 +146,7 @@ class TestGetCoordinatesIntegration:
         called_queries: list[str] = []
 
         class FakeKakao:
-            def __init__(self):
+            def __init__(self, **kwargs):
                 pass
 
             async def _address_to_coordinate_async(self, address):
@@ -183,7 +183,7 @@ class TestGetCoordinatesIntegration:
         from app.services.places import place_extractor as pe
 
         class FakeKakao:
-            def __init__(self):
+            def __init__(self, **kwargs):
                 pass
 
             async def _address_to_coordinate_async(self, address):
@@ -202,3 +202,29 @@ class TestGetCoordinatesIntegration:
             keywords_main=[],
         )
         assert (lat, lng) == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_transient_kakao_error_propagates(self, monkeypatch):
+        """타임아웃 같은 일시 오류는 삼키지 않고 전파해 큐가 재시도하게 한다."""
+        from app.services.places import place_extractor as pe
+
+        class FakeKakao:
+            def __init__(self, **kwargs):
+                pass
+
+            async def _address_to_coordinate_async(self, address):
+                raise ValueError("not found")
+
+            async def _search_places_async(self, keyword, *args, **kwargs):
+                raise TimeoutError("Kakao API timeout")
+
+        monkeypatch.setattr(pe, "KakaoMapService", FakeKakao)
+
+        svc = PlaceExtractorService()
+        with pytest.raises(TimeoutError):
+            await svc._get_coordinates(
+                name="성수 베이커리",
+                address="서울 성동구",
+                named_entities=["성수 베이커리"],
+                keywords_main=[],
+            )
@@ -0,0 +1,292 @@
+"""
+스트리밍 활동 카운터 테스트
+
+이벤트 가중 집계, 시간 단위 감쇠, 트렌딩 장소, 태그 일 버킷/시드, 서비스 연동 검증
+"""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+from app.services.ranking.activity_counters import (
+    ActivityCounters,
+    popularity_from_score,
+)
+from app.services.ranking.realtime_ranking_service import RealtimeRankingService
+from app.services.utils.tag_service import TagService
+
+
+class FakePipeline:
+    """호출을 모았다가 execute에서 순서대로 실행"""
+
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [
+            await getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.calls
+        ]
+
+
+class FakeRedis:
+    """정렬 집합/문자열 명령만 흉내내는 Redis"""
+
+    def __init__(self) -> None:
+        self.zsets = {}
+        self.strings = {}
+        self.ttls = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def zincrby(self, key, amount, member):
+        zset = self.zsets.setdefault(key, {})
+        zset[member] = zset.get(member, 0.0) + amount
+        return zset[member]
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zmscore(self, key, members):
+        zset = self.zsets.get(key, {})
+        return [zset.get(member) for member in members]
+
+    async def zrevrange(self, key, start, end, withscores=False):
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda i: -i[1])
+        stop = None if end == -1 else end + 1
+        items = items[start:stop]
+        return items if withscores else [member for member, _ in items]
+
+    async def zrevrangebyscore(
+        self, key, max, min, start=0, num=None, withscores=False
+    ):
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda i: -i[1])
+        items = [item for item in items if item[1] >= float(min)]
+        stop = start + num if num else None
+        items = items[start:stop]
+        return items if withscores else [member for member, _ in items]
+
+    async def zunionstore(self, dest, keys):
+        weights = keys if isinstance(keys, dict) else {key: 1.0 for key in keys}
+        result = {}
+        for key, weight in weights.items():
+            for member, score in self.zsets.get(key, {}).items():
+                result[member] = result.get(member, 0.0) + score * weight
+        self.zsets[dest] = result
+
+    async def zremrangebyscore(self, key, min, max):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= float(max)]:
+            del zset[member]
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = str(value)
+        return True
+
+    async def exists(self, key):
+        return int(key in self.strings or bool(self.zsets.get(key)))
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.zsets.pop(key, None)
+            self.strings.pop(key, None)
+
+
+def _counters() -> ActivityCounters:
+    return ActivityCounters(client=FakeRedis(), prefix="test")
+
+
+class TestPlaceCounters:
+    """장소 활동 카운터 테스트"""
+
+    async def test_events_are_weighted_into_every_series(self) -> None:
+        """Given: 조회 2 + 저장 1 / When: 기록 / Then: 모든 시리즈에 가중합 6"""
+        counters = _counters()
+
+        await counters.record_place_events(
+            [("p1", "view", 2), ("p1", "save", 1), ("p1", "unknown", 5)]
+        )
+
+        for series in ("popularity", "short", "long"):
+            assert counters._client.zsets[f"test:place:{series}"]["p1"] == 6.0
+        popularity = await counters.get_popularity(["p1", "p2"])
+        assert popularity == {"p1": popularity_from_score(6.0), "p2": 0.0}
+
+    async def test_decay_runs_once_per_hour_with_half_lives(self) -> None:
+        """Given: 점수 8 / When: 2시간 경과 후 두 번 호출 / Then: 반감기대로 1회 감쇠"""
+        counters = _counters()
+        await counters.apply_decay(now=10 * 3600)
+        await counters.record_place_event("p1", "view", 8)
+
+        assert await counters.apply_decay(now=12 * 3600 + 5) == 2
+        assert await counters.apply_decay(now=12 * 3600 + 50) == 0
+
+        zsets = counters._client.zsets
+        assert zsets["test:place:short"]["p1"] == 2.0  # 1시간 반감기 × 2
+        assert zsets["test:place:popularity"]["p1"] == 8.0 * 0.5 ** (2 / 6)
+
+    async def test_decay_drops_negligible_scores(self) -> None:
+        """Given: 오래된 활동 / When: 하루 경과 감쇠 / Then: short 시리즈에서 제거"""
+        counters = _counters()
+        await counters.apply_decay(now=0)
+        await counters.record_place_event("p1", "view")
+
+        await counters.apply_decay(now=24 * 3600)
+
+        assert "p1" not in counters._client.zsets["test:place:short"]
+        assert "p1" in counters._client.zsets["test:place:long"]
+
+    async def test_trending_compares_short_and_long_rates(self) -> None:
+        """Given: 꾸준한 장소 + 급증 장소 / When: 트렌딩 조회 / Then: 급증 장소가 상위"""
+        counters = _counters()
+        client = counters._client
+        await client.zadd("test:place:short", {"steady": 15.0, "burst": 30.0})
+        await client.zadd("test:place:long", {"steady": 360.0, "burst": 40.0})
+        await client.zadd("test:place:short", {"quiet": 2.0})
+
+        trending = await counters.get_trending_places(limit=5)
+
+        assert [item["place_id"] for item in trending] == ["burst", "steady"]
+        assert trending[0]["activity_increase"] > 1.0
+        assert trending[1]["activity_increase"] < 0.1
+
+    async def test_redis_failure_returns_defaults(self) -> None:
+        """Given: Redis 장애 / When: 기록·조회 / Then: 예외 없이 기본값, 재시도 대기"""
+        client = Mock()
+        client.zmscore = AsyncMock(side_effect=ConnectionError("down"))
+        counters = ActivityCounters(client=client, prefix="test")
+
+        assert await counters.get_popularity(["p1"]) == {}
+        assert await counters.record_place_event("p1", "view") is False
+        client.pipeline.assert_not_called()
+
+
+class TestTagCounters:
+    """태그 일 버킷 카운터 테스트"""
+
+    async def test_window_sums_day_buckets_until_unseeded(self) -> None:
+        """Given: 시드 전 / When: 조회 / Then: None, 시드 후 기간 합계 + 전체 누적"""
+        counters = _counters()
+        today = datetime.utcnow().date()
+        assert await counters.get_tag_counts(7, 10) is None
+
+        await counters.seed_tag_counts(
+            {
+                today: {"카페": 3, "맛집": 1},
+                today - timedelta(days=3): {"카페": 2},
+                today - timedelta(days=10): {"맛집": 9},
+            },
+            {"카페": 20, "맛집": 12},
+        )
+        await counters.record_tag_usage(added=["맛집"], removed=["카페"])
+
+        recent, totals = await counters.get_tag_counts(7, 10)
+
+        assert recent == [("카페", 4.0), ("맛집", 2.0)]
+        assert totals == {"카페": 19.0, "맛집": 13.0}
+
+    async def test_old_places_only_change_totals(self) -> None:
+        """Given: 보관 기간 밖 장소 / When: 태그 제거 / Then: 일 버킷 없이 누적만 감소"""
+        counters = _counters()
+        await counters.seed_tag_counts({}, {"카페": 1})
+
+        await counters.record_tag_usage(
+            removed=["카페"], created_at=datetime.utcnow() - timedelta(days=90)
+        )
+
+        zsets = counters._client.zsets
+        assert zsets["test:tag:total"] == {}
+        assert not any(key.startswith("test:tag:day:") for key in zsets)
+
+
+class TestServiceIntegration:
+    """랭킹/태그 서비스 연동 테스트"""
+
+    async def test_trending_tags_seed_once_then_read_counters(self) -> None:
+        """Given: 빈 카운터 / When: 트렌딩 태그 두 번 조회 / Then: DB 스냅샷 1회"""
+        counters = _counters()
+        service = TagService(Mock())
+        service.get_tag_usage_snapshot = Mock(
+            return_value=({datetime.utcnow().date(): {"카페": 4}}, {"카페": 6})
+        )
+
+        first = await service.get_streaming_trending_tags(7, 5, counters=counters)
+        second = await service.get_streaming_trending_tags(7, 5, counters=counters)
+
+        assert first == second
+        assert first[0]["tag"] == "카페"
+        assert first[0]["recent_count"] == 4
+        assert first[0]["growth_ratio"] == 2.0
+        service.get_tag_usage_snapshot.assert_called_once()
+
+    async def test_trending_tags_skip_snapshot_when_redis_down(self) -> None:
+        """Given: Redis 장애 / When: 트렌딩 태그 조회 / Then: DB 스냅샷 없이 기존 경로"""
+        client = Mock()
+        client.exists = AsyncMock(side_effect=ConnectionError("down"))
+        counters = ActivityCounters(client=client, prefix="test")
+        service = TagService(Mock())
+        service.get_tag_usage_snapshot = Mock()
+        service.get_trending_tags = Mock(return_value=[{"tag": "카페"}])
+
+        result = await service.get_streaming_trending_tags(7, 5, counters=counters)
+
+        assert result == [{"tag": "카페"}]
+        service.get_tag_usage_snapshot.assert_not_called()
+        client.set.assert_not_called()
+
+    async def test_trending_tags_fall_back_while_another_worker_seeds(self) -> None:
+        """Given: 다른 워커가 시드 잠금 보유 / When: 조회 / Then: 스냅샷 없이 기존 경로"""
+        counters = _counters()
+        assert await counters.claim_tag_seed() is True
+        service = TagService(Mock())
+        service.get_tag_usage_snapshot = Mock()
+        service.get_trending_tags = Mock(return_value=[])
+
+        await service.get_streaming_trending_tags(7, 5, counters=counters)
+
+        service.get_tag_usage_snapshot.assert_not_called()
+        service.get_trending_tags.assert_called_once_with(days=7, limit=5)
+
+    async def test_popularity_update_notifies_only_changed_places(self) -> None:
+        """Given: 카운터 점수 / When: 두 번 갱신 / Then: 처음만 변경 알림"""
+        counters = _counters()
+        await counters.record_place_events([("p1", "visit", 4), ("p2", "view", 1)])
+        service = RealtimeRankingService(Mock(), Mock(), Mock(), counters=counters)
+        service._notify_popularity_changes = AsyncMock()
+
+        assert await service.update_popularity_scores(["p1", "p2"]) is True
+        assert await service.update_popularity_scores(["p1", "p2"]) is False
+
+        notified = service._notify_popularity_changes.await_args.args[0]
+        assert set(notified) == {"p1", "p2"}
+        assert await service._get_recently_active_places() == ["p1", "p2"]
+
+    def test_seed_snapshot_buckets_by_day(self) -> None:
+        """Given: 태그/일자별 집계 행 / When: 스냅샷 / Then: 일자별 딕셔너리"""
+        db = Mock()
+        day = date(2026, 1, 2)
+        db.query.return_value.filter.return_value.group_by.return_value.all.side_effect = [
+            [Mock(tag="카페", day=day, count=2), Mock(tag="맛집", day=day, count=1)],
+            [Mock(tag="카페", count=5), Mock(tag="맛집", count=1)],
+        ]
+
+        daily, totals = TagService(db).get_tag_usage_snapshot(31)
+
+        assert daily == {day: {"카페": 2, "맛집": 1}}
+        assert totals == {"카페": 5, "맛집": 1}
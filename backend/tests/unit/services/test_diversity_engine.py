@@ -0,0 +1,156 @@
+"""
+검색 다양성 엔진 테스트
+
+상위 k 이웃 계산, MMR 선택, 게시 벡터라이저 재사용, 서비스 중복 제거 검증
+"""
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from app.services.search.diversity_engine import (
+    PlaceTextEncoder,
+    fit_place_vectorizer,
+    mmr_select,
+    similar_pairs,
+    top_k_neighbors,
+)
+from app.services.search.search_diversity_service import SearchDiversityService
+
+
+def _places(count: int):
+    rng = np.random.default_rng(3)
+    words = [f"단어{i}" for i in range(60)]
+    return [
+        {
+            "name": f"장소{i % (count // 3 or 1)}",
+            "address": "서울 마포구",
+            "tags": list(rng.choice(words, 4)),
+            "balanced_score": float(1 - i / count),
+        }
+        for i in range(count)
+    ]
+
+
+class TestTopKNeighbors:
+    """희소 상위 k 이웃 테스트"""
+
+    def test_matches_dense_cosine_top_k(self) -> None:
+        """Given: 후보 300개 / When: 블록 단위 상위 k / Then: 밀집 코사인 상위 k와 동일"""
+        vectors = PlaceTextEncoder(vectorizer_path=None).encode(_places(300))
+        dense = cosine_similarity(vectors)
+        np.fill_diagonal(dense, 0.0)
+
+        neighbors = top_k_neighbors(vectors, k=5, block_rows=64)
+
+        for i in (0, 150, 299):
+            row = neighbors.getrow(i)
+            expected = np.sort(dense[i])[-5:]
+            np.testing.assert_allclose(np.sort(row.data), expected, rtol=1e-5)
+            assert i not in row.indices
+
+
+    def test_similar_pairs_keeps_every_pair_above_threshold(self) -> None:
+        """Given: 중복이 많은 후보 / When: 블록 단위 임계값 쌍 / Then: 밀집 코사인 결과와 동일"""
+        vectors = PlaceTextEncoder(vectorizer_path=None).encode(_places(300))
+        dense = cosine_similarity(vectors)
+        np.fill_diagonal(dense, 0.0)
+
+        pairs = similar_pairs(vectors, threshold=0.4, block_rows=64)
+
+        expected = np.argwhere(dense > 0.4)
+        assert sorted(zip(*pairs.nonzero())) == sorted(map(tuple, expected))
+        # 상위 k 제한이 없으므로 이웃이 k개를 넘는 행도 그대로 유지
+        assert np.diff(pairs.indptr).max() > 5
+
+
+class TestMMRSelect:
+    """MMR 선택 테스트"""
+
+    def test_lambda_one_equals_greedy_dedupe(self) -> None:
+        """Given: 관련도 내림차순 후보 / When: λ=1 / Then: 기존 탐욕 중복 제거와 같은 결과"""
+        places = _places(120)
+        vectors = PlaceTextEncoder(vectorizer_path=None).encode(places)
+        similarity = cosine_similarity(vectors)
+        expected, removed = [], set()
+        for i in range(len(places)):
+            if i in removed:
+                continue
+            expected.append(i)
+            removed.update(
+                j for j in range(i + 1, len(places)) if similarity[i][j] > 0.8
+            )
+
+        selected = mmr_select(
+            np.array([p["balanced_score"] for p in places]),
+            vectors,
+            lambda_=1.0,
+            similarity_threshold=0.8,
+        )
+
+        assert selected == expected
+
+    def test_near_duplicate_is_pushed_back(self) -> None:
+        """Given: 1위와 거의 같은 2위 / When: λ=0.5 / Then: 다른 후보가 먼저 선택"""
+        places = [
+            {"name": "연남동 카페 A", "tags": ["커피", "디저트"]},
+            {"name": "연남동 카페 A", "tags": ["커피", "디저트", "빵"]},
+            {"name": "성수 갈비집", "tags": ["고기"]},
+        ]
+        vectors = PlaceTextEncoder(vectorizer_path=None).encode(places)
+
+        selected = mmr_select(np.array([1.0, 0.95, 0.8]), vectors, lambda_=0.5)
+
+        assert selected == [0, 2, 1]
+
+
+class TestPlaceTextEncoder:
+    """장소 텍스트 인코더 테스트"""
+
+    def test_published_vectorizer_is_used(self, tmp_path) -> None:
+        """Given: 게시된 벡터라이저 / When: 인코딩 / Then: 학습 어휘 차원으로 변환"""
+        path = str(tmp_path / "vectorizer.pkl")
+        vectorizer = fit_place_vectorizer(["홍대 카페", "강남 맛집", "홍대 맛집"], path)
+
+        vectors = PlaceTextEncoder(path).encode([{"name": "홍대 카페"}])
+
+        assert vectors.shape[1] == len(vectorizer.vocabulary_)
+        assert np.isclose(vectors.multiply(vectors).sum(), 1.0)
+
+    async def test_results_without_text_are_kept(self) -> None:
+        """Given: 텍스트 없는 결과들 + 중복 쌍 / When: 중복 제거 / Then: 중복만 제거"""
+        service = SearchDiversityService(PlaceTextEncoder(vectorizer_path=None))
+        service.mmr_lambda = 1.0
+        results = [
+            {"id": "a", "name": "홍대 카페", "balanced_score": 0.9},
+            {"id": "b", "name": "홍대 카페", "balanced_score": 0.8},
+            {"id": "c", "balanced_score": 0.7},
+            {"id": "d", "balanced_score": 0.6},
+        ]
+
+        unique = await service._remove_similar_results(results)
+
+        assert [r["id"] for r in unique] == ["a", "c", "d"]
+
+    async def test_duplicates_beyond_top_k_are_removed(self) -> None:
+        """Given: 같은 지점 100건 + 서로 다른 5건 / When: 기본 설정 중복 제거 / Then: 상위 k 밖 중복도 제거, 관련도 순서 유지"""
+        service = SearchDiversityService(PlaceTextEncoder(vectorizer_path=None))
+        duplicates = [
+            {"id": f"dup{i}", "name": "스타벅스 강남점", "balanced_score": 1 - i / 1000}
+            for i in range(100)
+        ]
+        distinct = [
+            {"id": f"other{i}", "name": name, "balanced_score": 0.5 - i / 100}
+            for i, name in enumerate(
+                [
+                    "성수 갈비집",
+                    "연남동 파스타",
+                    "망원 와인바",
+                    "이태원 타코",
+                    "합정 서점",
+                ]
+            )
+        ]
+
+        unique = await service._remove_similar_results(duplicates + distinct)
+
+        assert [r["id"] for r in unique] == ["dup0"] + [r["id"] for r in distinct]
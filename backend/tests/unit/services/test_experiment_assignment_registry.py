@@ -0,0 +1,166 @@
+"""
+랭킹 실험 배정 레지스트리 테스트
+
+결정적 버킷팅, 참가자 집합 기반 집계, 활성 실험 일괄 조회 검증
+"""
+
+from uuid import uuid4
+
+from app.core.cache import MemoryCacheService
+from app.services.ranking.experiment_assignment_registry import (
+    RedisExperimentAssignmentRegistry,
+    bucket_variant,
+)
+from app.services.ranking.ranking_experiment_service import RankingExperimentService
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [getattr(self.redis, f"_{name}")(*args) for name, args in self.commands]
+
+
+class FakeRedis:
+    """해시/집합 명령만 지원하는 Redis 대역 (왕복 횟수 기록)"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.sets = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hget(self, key, field):
+        self.round_trips += 1
+        return self._hget(key, field)
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.sets.pop(key, None)
+
+    def _hsetnx(self, key, field, value):
+        values = self.hashes.setdefault(key, {})
+        if field in values:
+            return 0
+        values[field] = value
+        return 1
+
+    def _hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def _sadd(self, key, member):
+        members = self.sets.setdefault(key, set())
+        added = member not in members
+        members.add(member)
+        return int(added)
+
+    def _scard(self, key):
+        return len(self.sets.get(key, ()))
+
+    def _expire(self, key, seconds):
+        return 1
+
+
+VARIANTS = [
+    {"name": "control", "type": "control"},
+    {"name": "treatment", "type": "treatment"},
+]
+
+
+async def _start_experiments(service, count):
+    experiment_ids = []
+    for i in range(count):
+        experiment_id = await service.create_experiment(
+            name=f"실험 {i}",
+            description="테스트",
+            variants=VARIANTS,
+            target_metrics=["click_through_rate"],
+        )
+        assert await service.start_experiment(experiment_id)
+        experiment_ids.append(experiment_id)
+    return experiment_ids
+
+
+class TestBucketVariant:
+    """결정적 버킷팅 테스트"""
+
+    def test_same_user_always_gets_same_variant(self) -> None:
+        """Given: 같은 실험/사용자 / When: 반복 배정 / Then: 항상 같은 변형"""
+        allocation = {"control": 0.5, "treatment": 0.5}
+        user_id = uuid4()
+
+        variants = {bucket_variant("exp", user_id, allocation) for _ in range(10)}
+
+        assert len(variants) == 1
+
+    def test_allocation_ratio_is_respected(self) -> None:
+        """Given: 20/80 할당 / When: 사용자 5000명 배정 / Then: 비율이 할당과 근사"""
+        allocation = {"control": 0.2, "treatment": 0.8}
+
+        control = sum(
+            bucket_variant("exp", uuid4(), allocation) == "control" for _ in range(5000)
+        )
+
+        assert 0.17 < control / 5000 < 0.23
+
+
+class TestAssignmentRegistry:
+    """배정 레지스트리 테스트"""
+
+    async def test_reassignment_does_not_double_count(self) -> None:
+        """Given: 이미 배정된 사용자 / When: 다시 배정 / Then: 같은 변형, 참가자 수 그대로"""
+        service = RankingExperimentService(db=None, cache_service=MemoryCacheService())
+        (experiment_id,) = await _start_experiments(service, 1)
+        users = [uuid4() for _ in range(30)]
+
+        first = [await service.assign_user_to_variant(experiment_id, u) for u in users]
+        second = [await service.assign_user_to_variant(experiment_id, u) for u in users]
+        results = await service.get_experiment_results(experiment_id)
+
+        assert first == second
+        assert results["total_participants"] == 30
+        assert {
+            name: result["participant_count"]
+            for name, result in results["variant_results"].items()
+        } == {v: first.count(v) for v in ("control", "treatment")}
+
+    async def test_user_config_resolved_in_one_round_trip(self) -> None:
+        """Given: 활성 실험 20개 중 일부 배정 / When: 사용자 설정 조회 / Then: 한 번의 왕복으로 배정만 반환"""
+        redis = FakeRedis()
+        service = RankingExperimentService(
+            db=None,
+            cache_service=MemoryCacheService(),
+            assignment_registry=RedisExperimentAssignmentRegistry(redis),
+        )
+        experiment_ids = await _start_experiments(service, 20)
+        user_id = uuid4()
+        expected = {}
+        for experiment_id in experiment_ids[::3]:
+            expected[experiment_id] = await service.assign_user_to_variant(
+                experiment_id, user_id
+            )
+
+        redis.round_trips = 0
+        config = await service.get_user_experiment_config(user_id)
+
+        assert config == expected
+        assert redis.round_trips == 1
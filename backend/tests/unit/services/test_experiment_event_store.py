@@ -0,0 +1,233 @@
+"""
+랭킹 실험 이벤트 저장소 테스트
+
+동시 작성자 이벤트 유실 없음, 집계 카운터 기반 결과, Redis 스트림/카운터 기록 검증
+"""
+
+import asyncio
+from uuid import uuid4
+
+from app.core.cache import MemoryCacheService
+from app.services.ranking.experiment_assignment_registry import (
+    MemoryExperimentAssignmentRegistry,
+)
+from app.services.ranking.experiment_event_store import (
+    MemoryExperimentEventStore,
+    RedisExperimentEventStore,
+)
+from app.services.ranking.ranking_experiment_service import RankingExperimentService
+
+
+class YieldingAssignmentRegistry(MemoryExperimentAssignmentRegistry):
+    """조회마다 이벤트 루프에 양보해 작성자들이 서로 끼어들게 하는 레지스트리"""
+
+    async def get_variant(self, experiment_id, user_id):
+        await asyncio.sleep(0)
+        return await super().get_variant(experiment_id, user_id)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):
+        results = []
+        for name, args, kwargs in self.commands:
+            results.append(await getattr(self.redis, name)(*args, **kwargs))
+        return results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.streams = {}
+        self.hashes = {}
+        self.ttls = {}
+        self.xadd_kwargs = []
+        self.transactions = 0
+
+    def pipeline(self, transaction=True):
+        self.transactions += transaction
+        return FakePipeline(self)
+
+    async def xadd(self, key, fields, **kwargs):
+        self.xadd_kwargs.append(kwargs)
+        stream = self.streams.setdefault(key, [])
+        stream.append((f"{len(stream)}-0", fields))
+        return stream[-1][0]
+
+    async def xrevrange(self, key, count=None):
+        return list(reversed(self.streams.get(key, [])))[:count]
+
+    async def hincrby(self, key, field, amount):
+        values = self.hashes.setdefault(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+        return int(values[field])
+
+    async def hincrbyfloat(self, key, field, amount):
+        values = self.hashes.setdefault(key, {})
+        values[field] = str(float(values.get(field, 0)) + amount)
+        return float(values[field])
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value)
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def eval(self, script, numkeys, users_key, counters_key, *args):
+        """USER_STATISTICS_SCRIPT 동작 재현"""
+        user_field, covariate_field, sum_sq_field, sum_xy_field, ttl = args
+        count = await self.hincrby(users_key, user_field, 1)
+        covariate = float(await self.hget(users_key, covariate_field) or 0)
+        await self.hincrby(counters_key, sum_sq_field, 2 * count - 1)
+        if covariate:
+            await self.hincrbyfloat(counters_key, sum_xy_field, covariate)
+        await self.expire(users_key, ttl)
+        return count
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.streams.pop(key, None)
+            self.hashes.pop(key, None)
+
+
+async def _active_experiment(service):
+    experiment_id = await service.create_experiment(
+        name="랭킹 가중치 실험",
+        description="테스트",
+        variants=[
+            {"name": "control", "type": "control"},
+            {"name": "treatment", "type": "treatment"},
+        ],
+        target_metrics=["click_through_rate"],
+    )
+    assert await service.start_experiment(experiment_id)
+    return experiment_id
+
+
+class TestExperimentEventStore:
+    """실험 이벤트 저장소 테스트"""
+
+    async def test_parallel_writers_lose_no_events(self) -> None:
+        """Given: 서로 끼어드는 동시 작성자 50명 / When: 각 20개 이벤트 기록 / Then: 1000개 모두 집계"""
+        store = MemoryExperimentEventStore()
+        service = RankingExperimentService(
+            db=None,
+            cache_service=MemoryCacheService(),
+            event_store=store,
+            assignment_registry=YieldingAssignmentRegistry(),
+        )
+        experiment_id = await _active_experiment(service)
+        users = [uuid4() for _ in range(50)]
+        variants = {}
+        for user_id in users:
+            variants[user_id] = await service.assign_user_to_variant(
+                experiment_id, user_id
+            )
+
+        async def writer(user_id):
+            for _ in range(20):
+                assert await service.record_experiment_event(
+                    experiment_id, user_id, "click", {"position": 1}
+                )
+
+        await asyncio.gather(*(writer(user_id) for user_id in users))
+
+        aggregates = await store.get_variant_aggregates(
+            experiment_id, ["control", "treatment"]
+        )
+        for variant in ("control", "treatment"):
+            expected = 20 * sum(1 for v in variants.values() if v == variant)
+            assert aggregates[variant]["event_counts"].get("click", 0) == expected
+        participants = await service.assignments.count_participants(
+            experiment_id, ["control", "treatment"]
+        )
+        assert sum(participants.values()) == 50
+
+    async def test_results_read_from_aggregates(self) -> None:
+        """Given: 참가자와 클릭 기록 / When: 결과 조회 / Then: 카운터 기반 클릭률"""
+        service = RankingExperimentService(
+            db=None,
+            cache_service=MemoryCacheService(),
+            event_store=MemoryExperimentEventStore(max_events=5),
+        )
+        experiment_id = await _active_experiment(service)
+        user_id = uuid4()
+        variant = await service.assign_user_to_variant(experiment_id, user_id)
+        for _ in range(8):
+            await service.record_experiment_event(experiment_id, user_id, "click", {})
+
+        results = await service.get_experiment_results(experiment_id)
+
+        variant_result = results["variant_results"][variant]
+        assert results["total_participants"] == 1
+        assert variant_result["event_counts"] == {"click": 8}
+        assert variant_result["conversion_metrics"]["click_through_rate"] == 8.0
+        # 로그는 최대 길이만 보관하지만 카운터는 전체를 집계
+        recent = await service.event_store.get_recent_events(experiment_id, variant)
+        assert len(recent) == 5
+
+    async def test_redis_store_appends_to_variant_stream(self) -> None:
+        """Given: Redis 저장소 / When: 이벤트 기록 / Then: 변형 스트림 추가 + 카운터 증가"""
+        redis = FakeRedis()
+        store = RedisExperimentEventStore(redis, max_events=100)
+
+        for i in range(3):
+            await store.append_event(
+                "exp", "control", {"event_type": "click", "event_data": {"i": i}}
+            )
+        await store.append_event("exp", "control", {"event_type": "conversion"})
+
+        aggregates = await store.get_variant_aggregates("exp", ["control", "treatment"])
+        recent = await store.get_recent_events("exp", "control", limit=2)
+
+        assert aggregates["control"]["event_counts"] == {"click": 3, "conversion": 1}
+        assert aggregates["treatment"]["event_counts"] == {}
+        assert [e["event_type"] for e in recent] == ["click", "conversion"]
+        assert redis.xadd_kwargs[0] == {"maxlen": 100, "approximate": True}
+        assert "experiment_events:exp:control" in redis.ttls
+
+    async def test_redis_store_tracks_sufficient_statistics(self) -> None:
+        """Given: 공변량이 있는 사용자들의 이벤트 / When: 집계 조회 / Then: Σy², Σxy, Σx, Σx²가 정확"""
+        redis = FakeRedis()
+        store = RedisExperimentEventStore(redis)
+        clicks = {"u1": 3, "u2": 1, "u3": 0}
+        covariates = {"u1": 2.0, "u2": 0.5, "u3": 1.0}
+
+        for user_id, value in covariates.items():
+            await store.record_covariate("exp", "control", user_id, value)
+        redis.transactions = 0
+        for user_id, count in clicks.items():
+            for _ in range(count):
+                await store.append_event(
+                    "exp", "control", {"user_id": user_id, "event_type": "click"}
+                )
+
+        aggregate = (await store.get_variant_aggregates("exp", ["control"]))["control"]
+
+        assert aggregate["event_counts"] == {"click": 4}
+        # 카운터와 충분통계량은 이벤트당 한 트랜잭션으로 갱신
+        assert redis.transactions == 4
+        assert aggregate["sum_squares"] == {"click": 3**2 + 1**2}
+        assert aggregate["cross_sums"] == {"click": 3 * 2.0 + 1 * 0.5}
+        assert aggregate["covariate_sum"] == 3.5
+        assert aggregate["covariate_sum_sq"] == 4.0 + 0.25 + 1.0
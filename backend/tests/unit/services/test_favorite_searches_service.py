@@ -5,11 +5,140 @@ TDD Red Phase: 사용자 즐겨찾는 검색 저장 및 관리 시스템 테스
 """
 
 import json
+import random
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
-from app.services.search.favorite_searches_service import FavoriteSearchesService
+from redis.exceptions import WatchError
+
+from app.services.search.favorite_searches_service import (
+    FavoriteSearchesService,
+    compare_version_vectors,
+)
+
+
+class FakePipeline:
+    """WATCH 후 즉시 실행, MULTI 후 모았다가 execute에서 순서대로 실행"""
+
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.calls = []
+        self.immediate = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.calls = []
+        self.immediate = False
+
+    async def watch(self, *keys):
+        self.immediate = True
+
+    def multi(self):
+        self.immediate = False
+
+    def __getattr__(self, name):
+        command = getattr(self.client, name)
+
+        def call(*args, **kwargs):
+            if self.immediate:
+                return command(*args, **kwargs)
+            self.calls.append((command, args, kwargs))
+            return self
+
+        return call
+
+    async def execute(self):
+        calls, self.calls = self.calls, []
+        if self.client.conflicts:
+            self.client.conflicts -= 1
+            raise WatchError("watched key modified")
+        self.client.executes += 1
+        return [await command(*args, **kwargs) for command, args, kwargs in calls]
+
+
+class FakeRedis:
+    """해시/정렬 집합/문자열 명령만 흉내내는 Redis"""
+
+    def __init__(self) -> None:
+        self.hashes = {}
+        self.zsets = {}
+        self.strings = {}
+        self.ttls = {}
+        self.hmget_sizes = []
+        self.executes = 0
+        self.conflicts = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def hmget(self, key, fields):
+        self.hmget_sizes.append(len(fields))
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hdel(self, key, *fields):
+        hash_ = self.hashes.get(key, {})
+        return sum(1 for field in fields if hash_.pop(field, None) is not None)
+
+    async def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    def _ordered(self, key):
+        return sorted(self.zsets.get(key, {}).items(), key=lambda i: (i[1], i[0]))
+
+    async def zrange(self, key, start, end):
+        items = self._ordered(key)
+        return [member for member, _ in items[start : None if end == -1 else end + 1]]
+
+    async def zrevrange(self, key, start, end):
+        items = self._ordered(key)[::-1]
+        return [member for member, _ in items[start : None if end == -1 else end + 1]]
+
+    async def zrangebyscore(self, key, min, max):
+        low = float(min.lstrip("("))
+        return [
+            member
+            for member, score in self._ordered(key)
+            if score > low or (score == low and not min.startswith("("))
+        ]
+
+    async def exists(self, key):
+        return int(key in self.strings)
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.strings[key] = str(value)
+        if ex:
+            self.ttls[key] = ex
+
+    async def setex(self, key, ttl, value):
+        await self.set(key, value, ex=ttl)
+
+    async def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+    async def lpush(self, key, value):
+        pass
 
 
 class TestFavoriteSearchesService:
@@ -54,8 +183,9 @@ class TestFavoriteSearchesService:
         Then: 올바른 형태로 즐겨찾는 검색이 생성됨
         """
         # Given: 즐겨찾는 검색 서비스 초기화
+        fake_redis = FakeRedis()
         favorite_service = FavoriteSearchesService(
-            redis_client=self.mock_redis, db_session=self.mock_db
+            redis_client=fake_redis, db_session=self.mock_db
         )
 
         search_data = {
@@ -75,13 +205,14 @@ class TestFavoriteSearchesService:
         assert favorite_id is not None
         assert len(favorite_id) > 0
 
-        # Redis 저장 확인
-        self.mock_redis.hset.assert_called()
-        call_args = self.mock_redis.hset.call_args
-        assert f"favorite_searches:{self.test_user_id}" in call_args[0][0]
+        # Redis 저장 확인: 본문 해시와 정렬 인덱스, 변경 로그
+        favorites_key = f"favorite_searches:{self.test_user_id}"
+        assert favorite_id in fake_redis.hashes[favorites_key]
+        assert favorite_id in fake_redis.zsets[f"{favorites_key}:by:use_count"]
+        assert fake_redis.zsets[f"{favorites_key}:changes"][favorite_id] == 1
 
         # 저장된 데이터 구조 확인
-        stored_data = json.loads(call_args[0][2])
+        stored_data = json.loads(fake_redis.hashes[favorites_key][favorite_id])
         assert stored_data["name"] == search_data["name"]
         assert stored_data["query"] == search_data["query"]
         assert stored_data["filters"] == search_data["filters"]
@@ -94,17 +225,15 @@ class TestFavoriteSearchesService:
         When: 사용자의 즐겨찾는 검색 목록을 조회함
         Then: 사용 빈도순으로 정렬된 목록을 반환함
         """
-        # Given: 즐겨찾는 검색 서비스와 저장된 데이터
+        # Given: 즐겨찾는 검색 서비스와 저장된 데이터 (인덱스 도입 전 해시만 존재)
+        fake_redis = FakeRedis()
         favorite_service = FavoriteSearchesService(
-            redis_client=self.mock_redis, db_session=self.mock_db
+            redis_client=fake_redis, db_session=self.mock_db
         )
-
-        # Mock Redis Hash 데이터
-        mock_favorites = {
-            "fav_1": json.dumps(self.sample_favorite_searches[0]),
+        fake_redis.hashes[f"favorite_searches:{self.test_user_id}"] = {
             "fav_2": json.dumps(self.sample_favorite_searches[1]),
+            "fav_1": json.dumps(self.sample_favorite_searches[0]),
         }
-        self.mock_redis.hgetall.return_value = mock_favorites
 
         # When: 즐겨찾는 검색 목록 조회
         favorites = await favorite_service.get_favorite_searches(
@@ -126,13 +255,15 @@ class TestFavoriteSearchesService:
         Then: 저장된 조건으로 검색을 수행하고 사용 횟수를 증가시킴
         """
         # Given: 즐겨찾는 검색 실행 서비스
+        fake_redis = FakeRedis()
         favorite_service = FavoriteSearchesService(
-            redis_client=self.mock_redis, db_session=self.mock_db
+            redis_client=fake_redis, db_session=self.mock_db
         )
 
-        # Mock 저장된 즐겨찾는 검색
+        # 저장된 즐겨찾는 검색
+        favorites_key = f"favorite_searches:{self.test_user_id}"
         favorite_data = self.sample_favorite_searches[0].copy()
-        self.mock_redis.hget.return_value = json.dumps(favorite_data)
+        fake_redis.hashes[favorites_key] = {"fav_1": json.dumps(favorite_data)}
 
         # Mock 검색 서비스
         mock_search_results = [
@@ -153,8 +284,10 @@ class TestFavoriteSearchesService:
             assert search_result["favorite_info"]["name"] == "홍대 맛집 탐방"
             assert len(search_result["results"]) == 2
 
-            # 사용 횟수 증가 확인
-            self.mock_redis.hset.assert_called()  # 업데이트된 데이터 저장
+            # 사용 횟수 증가 확인: 저장된 데이터와 사용 횟수 인덱스 모두 갱신
+            stored = json.loads(fake_redis.hashes[favorites_key]["fav_1"])
+            assert stored["use_count"] == 16
+            assert fake_redis.zsets[f"{favorites_key}:by:use_count"]["fav_1"] == 16
 
     async def test_favorite_search_categorization(self) -> None:
         """
@@ -338,10 +471,15 @@ class TestFavoriteSearchesService:
         When: 디바이스 간 동기화를 수행함
         Then: 모든 디바이스에서 일관된 즐겨찾는 검색 상태 유지
         """
-        # Given: 동기화 기능이 있는 서비스
+        # Given: 동기화 기능이 있는 서비스와 서버의 기존 즐겨찾기
+        fake_redis = FakeRedis()
         favorite_service = FavoriteSearchesService(
-            redis_client=self.mock_redis, db_session=self.mock_db, sync_enabled=True
+            redis_client=fake_redis, db_session=self.mock_db, sync_enabled=True
         )
+        favorites_key = f"favorite_searches:{self.test_user_id}"
+        fake_redis.hashes[favorites_key] = {
+            "fav_1": json.dumps(self.sample_favorite_searches[0])
+        }
 
         # When: 디바이스 동기화 요청
         sync_result = await favorite_service.sync_favorites_across_devices(
@@ -349,7 +487,11 @@ class TestFavoriteSearchesService:
             device_id="device_123",
             local_favorites=[
                 {"id": "local_1", "name": "새로운 즐겨찾기", "query": "새 검색"},
-                {"id": "fav_1", "name": "홍대 맛집 탐방", "use_count": 18},  # 업데이트된 데이터
+                {
+                    "id": "fav_1",
+                    "name": "홍대 맛집 탐방",
+                    "use_count": 18,
+                },  # 업데이트된 데이터
             ],
         )
 
@@ -358,8 +500,12 @@ class TestFavoriteSearchesService:
         assert "conflicts_resolved" in sync_result
         assert "updated_favorites" in sync_result
 
-        # 동기화된 데이터 저장 확인
-        self.mock_redis.hset.assert_called()
+        # 동기화된 데이터 저장 확인 (한 번의 트랜잭션)
+        assert sync_result["synchronized_count"] == 1
+        assert sync_result["conflicts_resolved"] == 1
+        assert "local_1" in fake_redis.hashes[favorites_key]
+        assert json.loads(fake_redis.hashes[favorites_key]["fav_1"])["use_count"] == 18
+        assert fake_redis.executes == 1
 
     async def test_favorite_search_backup_restore(self) -> None:
         """
@@ -510,3 +656,170 @@ class TestFavoriteSearchesService:
         assert "response_time_ms" in metrics
         assert "cache_hit_rate" in metrics
         assert "memory_usage_mb" in metrics
+
+
+class TestFavoriteIndexesAndDeltaSync:
+    """보조 정렬 인덱스와 버전 벡터 델타 동기화 테스트"""
+
+    def setup_method(self) -> None:
+        self.user_id = uuid4()
+        self.redis = FakeRedis()
+        self.service = FavoriteSearchesService(
+            redis_client=self.redis, db_session=Mock(), max_favorites_per_user=1000
+        )
+
+    async def _create(self, count: int, seed: int = 48):
+        rng = random.Random(seed)
+        created = []
+        for i in range(count):
+            favorite_id = await self.service.create_favorite_search(
+                self.user_id,
+                {
+                    "name": f"검색 {rng.randrange(1000):03d}",
+                    "query": f"쿼리 {i}",
+                    "filters": {"categories": [rng.choice(["restaurant", "cafe"])]},
+                },
+            )
+            created.append(favorite_id)
+        # 사용 횟수/마지막 사용 시각을 무작위로 갱신
+        for favorite_id in rng.sample(created, count // 2):
+            for _ in range(rng.randint(1, 5)):
+                await self.service._update_usage_stats(self.user_id, favorite_id)
+        return created
+
+    async def test_listing_matches_full_sort_and_reads_only_limit(self) -> None:
+        """Given: 무작위 즐겨찾기 120개 / When: 기준별 목록 조회 / Then: 전체 정렬과 같은 순서, limit개만 읽음"""
+        await self._create(120)
+        everything = [
+            json.loads(raw)
+            for raw in self.redis.hashes[f"favorite_searches:{self.user_id}"].values()
+        ]
+
+        for sort_by in ("use_count", "last_used", "created_at", "name"):
+            for category in (None, "cafe"):
+                self.redis.hmget_sizes.clear()
+                listed = await self.service.get_favorite_searches(
+                    self.user_id, limit=10, sort_by=sort_by, category_filter=category
+                )
+
+                expected = [
+                    fav for fav in everything if category in (None, fav["category"])
+                ]
+                if sort_by == "name":
+                    expected.sort(key=lambda x: x["name"].lower())
+                    assert [fav["name"] for fav in listed] == [
+                        fav["name"] for fav in expected[:10]
+                    ]
+                else:
+                    expected.sort(key=lambda x: x[sort_by], reverse=True)
+                    assert [fav[sort_by] for fav in listed] == [
+                        fav[sort_by] for fav in expected[:10]
+                    ]
+                if category is None or sort_by == "use_count":
+                    assert self.redis.hmget_sizes == [10]
+
+    async def test_delta_sync_between_devices(self) -> None:
+        """Given: 두 기기 / When: 편집·삭제 후 델타 동기화 / Then: 바뀐 항목만 교환, 동시 편집은 병합"""
+        phone = await self.service.sync_favorites_across_devices(
+            self.user_id,
+            "phone",
+            [{"id": "a", "name": "홍대 맛집", "query": "홍대 맛집"}],
+        )
+        assert phone["synchronized_count"] == 1
+        tablet = await self.service.sync_favorites_across_devices(
+            self.user_id, "tablet", [], since_version=None
+        )
+        (copy,) = tablet["server_changes"]
+        assert copy["version_vector"] == {"phone": 1}
+        tablet_version = tablet["server_version"]
+
+        # 태블릿이 이름 변경(자기 카운터 증가) → 서버 반영, 휴대폰은 델타로 받음
+        renamed = {
+            **copy,
+            "name": "홍대 맛집 2",
+            "version_vector": {"phone": 1, "tablet": 1},
+        }
+        result = await self.service.sync_favorites_across_devices(
+            self.user_id, "tablet", [renamed], since_version=tablet_version
+        )
+        assert result["server_changes"] == []
+        phone_delta = await self.service.sync_favorites_across_devices(
+            self.user_id, "phone", [], since_version=phone["server_version"]
+        )
+        assert [fav["name"] for fav in phone_delta["server_changes"]] == ["홍대 맛집 2"]
+
+        # 오래된 사본(휴대폰의 이전 벡터)은 무시되고 서버 사본을 돌려받음
+        stale = {**copy, "name": "옛 이름", "version_vector": {"phone": 1}}
+        result = await self.service.sync_favorites_across_devices(
+            self.user_id, "phone", [stale], since_version=phone_delta["server_version"]
+        )
+        assert result["server_changes"][0]["name"] == "홍대 맛집 2"
+
+        # 동시 편집: 사용 횟수가 많은 쪽 내용, 벡터는 양쪽을 포함
+        concurrent = {**copy, "name": "휴대폰 이름", "use_count": 7}
+        concurrent["version_vector"] = {"phone": 2}
+        result = await self.service.sync_favorites_across_devices(
+            self.user_id, "phone", [concurrent], since_version=result["server_version"]
+        )
+        assert result["conflicts_resolved"] == 1
+        (merged,) = result["server_changes"]
+        assert merged["name"] == "휴대폰 이름"
+        for vector in ({"phone": 2}, {"phone": 1, "tablet": 1}):
+            assert compare_version_vectors(merged["version_vector"], vector) == "newer"
+
+        # 삭제는 변경 로그에 남아 다른 기기에 deleted_ids로 전달
+        deleted = {
+            "id": "a",
+            "deleted": True,
+            "version_vector": merged["version_vector"],
+        }
+        deleted["version_vector"] = {**deleted["version_vector"], "phone": 3}
+        result = await self.service.sync_favorites_across_devices(
+            self.user_id, "phone", [deleted], since_version=result["server_version"]
+        )
+        assert result["deleted_count"] == 1
+        tablet_delta = await self.service.sync_favorites_across_devices(
+            self.user_id, "tablet", [], since_version=tablet_version
+        )
+        assert tablet_delta["deleted_ids"] == ["a"]
+        assert await self.service.get_favorite_searches(self.user_id) == []
+
+    async def test_sync_applies_changes_in_one_transaction_and_retries(self) -> None:
+        """Given: 즐겨찾기 여러 개 / When: 동기화 중 동시 쓰기 발생 / Then: 재시도 후 한 번의 EXEC로 모두 적용"""
+        local = [{"id": f"fav_{i}", "name": f"검색 {i}"} for i in range(50)]
+        self.redis.conflicts = 1
+
+        result = await self.service.sync_favorites_across_devices(
+            self.user_id, "phone", local
+        )
+
+        assert result["synchronized_count"] == 50
+        assert self.redis.executes == 1
+        assert result["server_version"] == 50
+
+    async def test_bulk_delete_unindexes_and_logs_tombstones(self) -> None:
+        """Given: 즐겨찾기 3개 / When: 2개 일괄 삭제 / Then: 목록·인덱스에서 제거, 변경 로그에 남음"""
+        created = await self._create(3)
+
+        result = await self.service.bulk_delete_favorites(
+            self.user_id, created[:2] + ["missing"]
+        )
+
+        assert result["deleted_count"] == 2
+        listed = await self.service.get_favorite_searches(self.user_id)
+        assert [fav["id"] for fav in listed] == [created[2]]
+        changes = self.redis.zsets[f"favorite_searches:{self.user_id}:changes"]
+        assert set(changes) == set(created)
+        for key, members in self.redis.zsets.items():
+            if ":by:" in key or ":category:" in key:
+                assert not any(
+                    fid in member for member in members for fid in created[:2]
+                )
+
+    def test_compare_version_vectors(self) -> None:
+        """Given: 버전 벡터 쌍 / When: 비교 / Then: 포함 관계에 따른 순서"""
+        assert compare_version_vectors({"a": 1}, {"a": 1}) == "equal"
+        assert compare_version_vectors({"a": 2}, {"a": 1}) == "newer"
+        assert compare_version_vectors({"a": 1}, {"a": 1, "b": 1}) == "older"
+        assert compare_version_vectors({"a": 2}, {"a": 1, "b": 1}) == "concurrent"
+        assert compare_version_vectors({}, {}) == "equal"
@@ -0,0 +1,171 @@
+"""
+FCM 일괄 발송 엔진 테스트
+
+가짜 메시징 전송 계층으로 청크 분할, 동시 발송, 재시도, 무효 토큰 정리 검증
+"""
+
+import threading
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from firebase_admin import exceptions as firebase_exceptions
+from firebase_admin import messaging
+
+from app.schemas.notification import PushNotificationRequest
+from app.services.notifications.fcm_delivery import FCMDeliveryEngine
+from app.services.notifications.fcm_service import FCMService
+
+
+class FakeMessagingTransport:
+    """FCM 응답을 흉내내는 전송 계층"""
+
+    def __init__(self, invalid=(), flaky=(), fail_calls: int = 0, errors=None) -> None:
+        self.invalid = set(invalid)
+        self.errors = errors or {}
+        self.flaky = Counter({token: 1 for token in flaky})
+        self.fail_calls = fail_calls
+        self.calls = []
+        self.thread_ids = set()
+        self._lock = threading.Lock()
+
+    def send_multicast(self, message):
+        with self._lock:
+            self.calls.append(list(message.tokens))
+            self.thread_ids.add(threading.get_ident())
+            if self.fail_calls:
+                self.fail_calls -= 1
+                raise firebase_exceptions.UnavailableError("service unavailable")
+
+            responses = []
+            for token in message.tokens:
+                if token in self.invalid:
+                    exception = messaging.UnregisteredError("unregistered")
+                elif token in self.errors:
+                    exception = self.errors[token]
+                elif self.flaky[token] > 0:
+                    self.flaky[token] -= 1
+                    exception = firebase_exceptions.InternalError("internal")
+                else:
+                    exception = None
+                responses.append(
+                    SimpleNamespace(success=exception is None, exception=exception)
+                )
+            return SimpleNamespace(responses=responses)
+
+
+def _message(tokens):
+    return messaging.MulticastMessage(tokens=tokens, data={"k": "v"})
+
+
+class TestFCMDeliveryEngine:
+    """일괄 발송 엔진 테스트"""
+
+    async def test_chunks_to_fcm_limit_and_sends_off_event_loop(self) -> None:
+        """Given: 1,203개 토큰 / When: 발송 / Then: 500개 단위 청크, 워커 스레드 사용"""
+        transport = FakeMessagingTransport()
+        engine = FCMDeliveryEngine(transport=transport)
+        tokens = [f"token-{i}" for i in range(1203)]
+
+        report = await engine.deliver(tokens + tokens[:10], _message)
+
+        assert sorted(len(call) for call in transport.calls) == [203, 500, 500]
+        assert threading.get_ident() not in transport.thread_ids
+        assert report.success_count == 1203
+        assert report.failure_count == 0
+        assert len(report.batches) == 3
+        assert all(batch.tokens_per_second > 0 for batch in report.batches)
+
+    async def test_retries_only_transient_tokens_and_reports_invalid(self) -> None:
+        """Given: 무효/일시 오류 토큰 / When: 발송 / Then: 일시 오류만 재시도"""
+        transport = FakeMessagingTransport(invalid={"t1"}, flaky={"t2"})
+        engine = FCMDeliveryEngine(transport=transport, backoff_base=0)
+
+        report = await engine.deliver(["t0", "t1", "t2"], _message)
+
+        assert transport.calls == [["t0", "t1", "t2"], ["t2"]]
+        assert report.success_count == 2
+        assert report.invalid_tokens == ["t1"]
+        assert report.failed_tokens == ["t1"]
+        assert report.batches[0].attempts == 2
+
+    async def test_only_token_specific_invalid_argument_marks_token_invalid(
+        self,
+    ) -> None:
+        """Given: 잘못된 토큰/잘못된 페이로드 INVALID_ARGUMENT / When: 발송 / Then: 토큰 오류만 무효 처리"""
+        transport = FakeMessagingTransport(
+            errors={
+                "t0": firebase_exceptions.InvalidArgumentError(
+                    "The registration token is not a valid FCM registration token"
+                ),
+                "t1": firebase_exceptions.InvalidArgumentError(
+                    "Invalid value at 'message.data[0].value' (TYPE_STRING)"
+                ),
+            }
+        )
+        engine = FCMDeliveryEngine(transport=transport, backoff_base=0)
+
+        report = await engine.deliver(["t0", "t1"], _message)
+
+        assert report.failed_tokens == ["t0", "t1"]
+        assert report.invalid_tokens == ["t0"]
+
+    async def test_whole_call_failure_is_retried_then_given_up(self) -> None:
+        """Given: 전송 계층 장애 / When: 재시도 한도 초과 / Then: 전체 실패 처리"""
+        transport = FakeMessagingTransport(fail_calls=10)
+        engine = FCMDeliveryEngine(transport=transport, max_retries=2, backoff_base=0)
+
+        report = await engine.deliver(["t0", "t1"], _message)
+
+        assert len(transport.calls) == 3
+        assert report.failure_count == 2
+        assert report.invalid_tokens == []
+        assert report.batches[0].error == "service unavailable"
+
+
+class TestFCMServiceDelivery:
+    """FCM 서비스 일괄 발송 테스트"""
+
+    async def test_resolves_tokens_once_and_prunes_invalid_in_bulk(self) -> None:
+        """Given: 여러 사용자 / When: 발송 / Then: 토큰 조회 1회, 무효 토큰 일괄 정리"""
+        transport = FakeMessagingTransport(invalid={"bad"})
+        db = Mock()
+        db.query.return_value.filter.return_value.all.return_value = [
+            SimpleNamespace(fcm_token="good"),
+            SimpleNamespace(fcm_token="bad"),
+        ]
+        with patch.object(FCMService, "_initialize_firebase"):
+            service = FCMService(
+                db, delivery_engine=FCMDeliveryEngine(transport=transport)
+            )
+        service._record_notification = Mock()
+        service._handle_invalid_tokens = Mock()
+
+        response = await service.send_push_notification_async(
+            PushNotificationRequest(title="t", body="b", user_ids=["u1", "u2", "u3"])
+        )
+
+        assert db.query.call_count == 1
+        assert response.success_count == 1
+        assert response.failed_tokens == ["bad"]
+        service._handle_invalid_tokens.assert_called_once_with(["bad"])
+        service._record_notification.assert_called_once()
+
+    async def test_send_to_users_reports_success_per_user(self) -> None:
+        """Given: 사용자별 미리 조회한 토큰 / When: 한 번에 발송 / Then: 사용자별 성공 여부"""
+        transport = FakeMessagingTransport(invalid={"bad"})
+        with patch.object(FCMService, "_initialize_firebase"):
+            service = FCMService(
+                Mock(), delivery_engine=FCMDeliveryEngine(transport=transport)
+            )
+        service._record_notification = Mock()
+        service._handle_invalid_tokens = Mock()
+
+        delivered = await service.send_to_users_async(
+            PushNotificationRequest(title="t", body="b", user_ids=["u1", "u2", "u3"]),
+            {"u1": ["good", "bad"], "u2": ["bad"], "u3": []},
+        )
+
+        assert delivered == {"u1": True, "u2": False, "u3": False}
+        assert transport.calls == [["good", "bad"]]
+        service._handle_invalid_tokens.assert_called_once_with(["bad"])
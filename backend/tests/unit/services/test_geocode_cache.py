@@ -0,0 +1,173 @@
+"""
+지오코딩/키워드 검색 공유 캐시 테스트
+
+정규화 키, 로컬 LRU + Redis 2단 캐시, 부정 결과 TTL, 동시 요청 병합, 적중률 지표 검증
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.maps.geocode_cache import GeocodeCache, normalize_query
+from app.services.maps.kakao_map_service import KakaoMapService
+
+
+class FakeRedis:
+    """get/set(ex=)만 흉내내는 Redis"""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.data = {}
+        self.ttls = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+        self.ttls[key] = ex
+
+
+def _cache(client=None, **kwargs) -> GeocodeCache:
+    return GeocodeCache(
+        client=client, ttl_seconds=1000, negative_ttl_seconds=10, **kwargs
+    )
+
+
+class TestGeocodeCache:
+    """2단 캐시 동작 테스트"""
+
+    async def test_normalized_queries_share_one_entry(self) -> None:
+        """Given: 공백/대소문자만 다른 주소 / When: 조회 / Then: API 1회, 로컬 적중"""
+        cache = _cache()
+        fetch = AsyncMock(return_value={"latitude": 37.5, "longitude": 127.0})
+
+        first = await cache.get_or_fetch("address", " 서울 강남구  Teheran-ro ", fetch)
+        second = await cache.get_or_fetch("address", "서울 강남구 teheran-ro", fetch)
+
+        assert first == second == {"latitude": 37.5, "longitude": 127.0}
+        assert normalize_query("Ａ  b ") == "a b"
+        fetch.assert_awaited_once()
+        stats = cache.get_stats()["namespaces"]["address"]
+        assert stats["local_hits"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    async def test_not_found_uses_short_ttl_and_is_served_from_cache(self) -> None:
+        """Given: 결과 없음 / When: 재조회 / Then: 짧은 TTL로 저장, 부정 적중"""
+        redis_client = FakeRedis()
+        cache = _cache(redis_client)
+        fetch = AsyncMock(return_value=[])
+
+        assert await cache.get_or_fetch("keyword", "없는 가게", fetch) == []
+        assert await cache.get_or_fetch("keyword", "없는 가게", fetch) == []
+
+        fetch.assert_awaited_once()
+        assert list(redis_client.ttls.values()) == [10]
+        assert cache.get_stats()["overall"]["negative_hits"] == 1
+
+    async def test_redis_entry_is_shared_across_processes(self) -> None:
+        """Given: 다른 워커가 저장한 결과 / When: 새 프로세스 조회 / Then: Redis 적중"""
+        redis_client = FakeRedis()
+        await _cache(redis_client).get_or_fetch(
+            "address", "성수동", AsyncMock(return_value={"latitude": 1.0})
+        )
+        other_worker = _cache(redis_client)
+        fetch = AsyncMock()
+
+        result = await other_worker.get_or_fetch("address", "성수동", fetch)
+
+        assert result == {"latitude": 1.0}
+        fetch.assert_not_awaited()
+        assert list(redis_client.ttls.values()) == [1000]
+        assert other_worker.get_stats()["overall"]["redis_hits"] == 1
+
+    async def test_concurrent_misses_are_coalesced(self) -> None:
+        """Given: 같은 키 동시 요청 10개 / When: 조회 / Then: API 1회"""
+        cache = _cache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"latitude": 1.0}
+
+        results = await asyncio.gather(
+            *(cache.get_or_fetch("address", "강남역", fetch) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert all(result == {"latitude": 1.0} for result in results)
+        assert cache.get_stats()["overall"]["coalesced"] == 9
+
+    async def test_redis_failure_falls_back_to_local_cache(self) -> None:
+        """Given: Redis 장애 / When: 조회 / Then: 로컬 캐시로 동작, 오류는 전파 안 함"""
+        cache = _cache(FakeRedis(fail=True))
+        fetch = AsyncMock(return_value={"latitude": 1.0})
+
+        await cache.get_or_fetch("address", "홍대", fetch)
+        await cache.get_or_fetch("address", "홍대", fetch)
+
+        fetch.assert_awaited_once()
+        stats = cache.get_stats()
+        assert stats["overall"]["redis_errors"] == 1
+        assert stats["redis_available"] is False
+
+    async def test_fetch_errors_are_not_cached(self) -> None:
+        """Given: API 오류 / When: 재조회 / Then: 다시 호출"""
+        cache = _cache()
+        fetch = AsyncMock(side_effect=[TimeoutError("slow"), {"latitude": 1.0}])
+
+        with pytest.raises(TimeoutError):
+            await cache.get_or_fetch("address", "이태원", fetch)
+        assert await cache.get_or_fetch("address", "이태원", fetch) == {"latitude": 1.0}
+
+    async def test_local_lru_evicts_oldest(self) -> None:
+        """Given: 로컬 2개 한도 / When: 3개 저장 / Then: 가장 오래된 항목 제거"""
+        cache = _cache(local_size=2)
+        for query in ("a", "b", "c"):
+            await cache.get_or_fetch("address", query, AsyncMock(return_value=[1]))
+
+        assert cache.get_stats()["local_entries"] == 2
+        fetch = AsyncMock(return_value=[1])
+        await cache.get_or_fetch("address", "a", fetch)
+        fetch.assert_awaited_once()
+
+
+class TestKakaoMapServiceCache:
+    """KakaoMapService 공유 캐시 연동 테스트"""
+
+    async def test_address_not_found_is_cached_and_still_raises(self) -> None:
+        """Given: 없는 주소 / When: 두 번 조회 / Then: 둘 다 ValueError, API 1회"""
+        service = KakaoMapService(api_key="test_key", cache=_cache())
+        service._make_request = AsyncMock(return_value={"documents": []})
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await service._address_to_coordinate_async("없는 주소")
+
+        service._make_request.assert_awaited_once()
+
+    async def test_keyword_search_shares_cache_across_instances(self) -> None:
+        """Given: 같은 캐시의 두 인스턴스 / When: 같은 키워드 / Then: API 1회"""
+        cache = _cache()
+        documents = [
+            {"place_name": "카페", "address_name": "서울", "y": "37.5", "x": "127"}
+        ]
+        first = KakaoMapService(api_key="test_key", cache=cache)
+        first._make_request = AsyncMock(return_value={"documents": documents})
+        second = KakaoMapService(api_key="test_key", cache=cache)
+        second._make_request = AsyncMock()
+
+        await first._search_places_async("강남 카페", 37.49801, 127.02761, 1.0, 5)
+        results = await second._search_places_async(
+            "강남  카페", 37.498012, 127.027608, 1.0, 5
+        )
+
+        assert results[0]["place_name"] == "카페"
+        second._make_request.assert_not_awaited()
@@ -0,0 +1,142 @@
+"""
+큐 기반 로그 파이프라인 테스트
+
+요청 경로 비차단 처리, 포화 정책(폐기/샘플링) 카운터, 배치 크기 계산 검증
+"""
+
+import json
+import logging
+import threading
+
+from app.services.monitoring import logging_service
+from app.services.monitoring.logging_service import (
+    CentralizedLoggingService,
+    LogLevel,
+    LogOverflowPolicy,
+    LogPipeline,
+    LogRotationManager,
+)
+
+
+class BlockedHandler:
+    """해제될 때까지 첫 배치에서 멈추는 처리기 (큐를 채우기 위함)"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.records = []
+
+    def __call__(self, batch):
+        self.started.set()
+        self.release.wait(5)
+        self.records.extend(batch)
+
+
+def _blocked_pipeline(**kwargs):
+    handler = BlockedHandler()
+    pipeline = LogPipeline(handler, batch_size=1, **kwargs)
+    pipeline.submit("first")
+    assert handler.started.wait(5)
+    return pipeline, handler
+
+
+class TestLogPipeline:
+    """로그 파이프라인 테스트"""
+
+    def test_logged_entries_are_processed_after_flush(self) -> None:
+        """Given: 로깅 서비스 / When: 로그 기록 후 flush / Then: 수집/검색/마스킹 반영"""
+        service = CentralizedLoggingService()
+        extra = {"password": "secret-value", "order_id": 7}
+
+        service.log(
+            LogLevel.ERROR, "payment failed", service="hotly-pay", extra_fields=extra
+        )
+        extra["order_id"] = 8  # 기록 후 변경은 반영되지 않음
+        assert service.flush()
+
+        (entry,) = service.search_logs(message_contains="payment")
+        assert entry["password"] == "se***ue"
+        assert entry["order_id"] == 7
+        assert service.get_service_stats("hotly-pay")["error_count"] == 1
+        assert service.get_system_stats()["pipeline"]["processed"] == 1
+
+    def test_drop_policy_counts_overflow(self) -> None:
+        """Given: 처리기가 멈춘 용량 10 큐 / When: 15개 추가 / Then: 5개 폐기 후 나머지 처리"""
+        pipeline, handler = _blocked_pipeline(
+            capacity=10, overflow_policy=LogOverflowPolicy.DROP
+        )
+
+        accepted = [pipeline.submit(i) for i in range(15)]
+        handler.release.set()
+        assert pipeline.flush()
+
+        assert accepted == [True] * 10 + [False] * 5
+        assert handler.records == ["first"] + list(range(10))
+        assert pipeline.get_stats()["dropped"] == 5
+        pipeline.stop()
+
+    def test_sample_policy_keeps_high_priority_logs(self) -> None:
+        """Given: 임계치 50% 샘플링 큐 / When: 저중요도/고중요도 추가 / Then: 저중요도만 1/N 샘플링"""
+        pipeline, handler = _blocked_pipeline(
+            capacity=100,
+            overflow_policy=LogOverflowPolicy.SAMPLE,
+            sample_watermark=0.5,
+            sample_rate=10,
+        )
+
+        for i in range(50):
+            assert pipeline.submit(("info", i), low_priority=True)
+        sampled = [pipeline.submit(("info", i), low_priority=True) for i in range(100)]
+        errors = [pipeline.submit(("error", i)) for i in range(20)]
+        handler.release.set()
+        assert pipeline.flush()
+
+        stats = pipeline.get_stats()
+        assert sum(sampled) == 10
+        assert all(errors)
+        assert stats["sampled_out"] == 90
+        assert stats["dropped"] == 0
+        pipeline.stop()
+
+    def test_handler_failure_is_logged_and_counted(self, caplog) -> None:
+        """Given: 실패하는 처리기 / When: 레코드 처리 / Then: 표준 로거로 보고 + 오류 카운트"""
+
+        def failing_handler(batch):
+            raise RuntimeError("sink down")
+
+        pipeline = LogPipeline(failing_handler)
+        with caplog.at_level(logging.ERROR, logger=logging_service.__name__):
+            pipeline.submit("record")
+            assert pipeline.flush()
+
+        assert pipeline.get_stats()["handler_errors"] == 1
+        assert "sink down" in caplog.text
+        pipeline.stop()
+
+    def test_stop_unregisters_exit_hook(self, monkeypatch) -> None:
+        """Given: 시작된 파이프라인 / When: stop / Then: atexit 등록 해제"""
+        registered = []
+        monkeypatch.setattr(logging_service.atexit, "register", registered.append)
+        monkeypatch.setattr(logging_service.atexit, "unregister", registered.remove)
+
+        pipeline = LogPipeline(lambda batch: None)
+        pipeline.submit("record")
+        assert registered == [pipeline.stop]
+
+        pipeline.stop()
+        assert registered == []
+
+    def test_batch_size_accounting_matches_per_entry_serialization(self) -> None:
+        """Given: 로그 배치 / When: 일괄 추가 / Then: 항목별 직렬화 크기 합과 동일"""
+        manager = LogRotationManager(max_log_size=10**6)
+        entries = [
+            {"level": "INFO", "message": f"요청 {i}", "extra": {"n": i}}
+            for i in range(50)
+        ]
+
+        manager.add_log_entries(entries[:20])
+        manager.add_log_entries(entries[20:])
+
+        stats = manager.get_log_statistics()
+        assert stats["current_size"] == sum(len(json.dumps(e)) for e in entries)
+        assert stats["current_logs_count"] == 50
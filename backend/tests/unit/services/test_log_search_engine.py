@@ -0,0 +1,134 @@
+"""
+로그 검색 엔진 테스트
+
+세그먼트/역색인 검색 결과가 전체 스캔과 같은지, 시간 범위 이진 탐색,
+세그먼트 단위 보존 한도, 추가 중 검색 검증
+"""
+
+import random
+import threading
+from datetime import datetime, timedelta
+
+from app.services.monitoring import logging_service
+from app.services.monitoring.logging_service import LogSearchEngine
+
+LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+SERVICES = ["hotly-api", "hotly-ai", "hotly-worker"]
+WORDS = ["user", "login", "failed", "cache", "miss", "place", "created", "timeout"]
+
+
+class SteppingClock:
+    """호출마다 1초씩 증가하는 datetime 대역"""
+
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now(self) -> datetime:
+        self.current += timedelta(seconds=1)
+        return self.current
+
+
+def _fill(engine, count, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        engine.add_log_entry(
+            rng.choice(LEVELS),
+            f"{' '.join(rng.sample(WORDS, 3))} #{i}",
+            rng.choice(SERVICES),
+            {"request_no": i},
+        )
+
+
+def _scan(entries, level=None, service=None, message_contains=None, limit=100):
+    results = []
+    for entry in entries:
+        if level and entry["level"] != level:
+            continue
+        if service and entry["service"] != service:
+            continue
+        if message_contains and message_contains.lower() not in (
+            entry["message"].lower()
+        ):
+            continue
+        results.append(entry)
+    return results[:limit]
+
+
+class TestLogSearchEngine:
+    """로그 검색 엔진 테스트"""
+
+    def test_indexed_search_matches_full_scan(self) -> None:
+        """Given: 여러 세그먼트의 로그 / When: 레벨/서비스/부분 문자열 검색 / Then: 전체 스캔과 동일"""
+        engine = LogSearchEngine(segment_size=64)
+        entries = []
+        original_add = engine.add_log_entry
+        engine.add_log_entry = lambda *args: entries.append(original_add(*args))
+        _fill(engine, 1000)
+
+        queries = [
+            {"level": "ERROR"},
+            {"service": "hotly-ai", "level": "WARNING"},
+            {"message_contains": "USER"},
+            {"message_contains": "ogin fail"},
+            {"message_contains": "#99"},
+            {"message_contains": "cache", "service": "hotly-api", "limit": 500},
+            {"message_contains": "not-a-word"},
+            {"limit": 7},
+        ]
+        for query in queries:
+            assert engine.search_logs(**query) == _scan(entries, **query), query
+
+    def test_time_range_uses_segment_bounds(self, monkeypatch) -> None:
+        """Given: 1초 간격 로그 300개 / When: 시간 범위 검색 / Then: 경계 포함 구간만 반환"""
+        clock = SteppingClock(datetime(2025, 1, 1))
+        monkeypatch.setattr(logging_service, "datetime", clock)
+        engine = LogSearchEngine(segment_size=32)
+        _fill(engine, 300)
+
+        time_from = datetime(2025, 1, 1) + timedelta(seconds=100)
+        time_to = datetime(2025, 1, 1) + timedelta(seconds=150)
+        results = engine.search_logs(time_from=time_from, time_to=time_to, limit=1000)
+
+        assert [entry["request_no"] for entry in results] == list(range(99, 150))
+
+    def test_retention_drops_whole_segments(self, monkeypatch) -> None:
+        """Given: 항목 수/기간 한도 / When: 한도 초과 추가 / Then: 오래된 세그먼트 단위 삭제"""
+        clock = SteppingClock(datetime(2025, 1, 1))
+        monkeypatch.setattr(logging_service, "datetime", clock)
+        engine = LogSearchEngine(
+            segment_size=100, max_entries=250, max_age=timedelta(hours=1)
+        )
+        _fill(engine, 1000)
+
+        ids = [entry["id"] for entry in engine.search_logs(limit=10000)]
+        assert ids == list(range(701, 1001))
+
+        # 한 시간 넘게 지난 뒤의 추가는 오래된 세그먼트를 모두 밀어냄
+        clock.current += timedelta(hours=2)
+        engine.add_log_entry("INFO", "after idle", "hotly-api")
+        assert [e["message"] for e in engine.search_logs()] == ["after idle"]
+
+    def test_search_runs_while_writers_append(self) -> None:
+        """Given: 로그를 계속 추가하는 작성자 / When: 동시에 검색 / Then: 오류 없이 일관된 결과"""
+        engine = LogSearchEngine(segment_size=50, max_entries=2000)
+        done = threading.Event()
+        errors = []
+
+        def writer():
+            _fill(engine, 5000, seed=1)
+            done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        while not done.is_set():
+            try:
+                for entry in engine.search_logs(level="ERROR", message_contains="user"):
+                    assert entry["level"] == "ERROR"
+                    assert "user" in entry["message"]
+            except Exception as e:  # pragma: no cover - 실패 시 원인 보고
+                errors.append(e)
+                break
+        thread.join()
+
+        assert errors == []
+        assert len(engine.search_logs(limit=10000)) <= 2000 + 50
@@ -20,6 +20,10 @@ from app.schemas.notification_analytics import (
     NotificationLogCreate,
     PersonalizationInsights,
 )
+from app.services.notifications.notification_rollup_service import (
+    MetricCounts,
+    MetricRow,
+)
 
 
 class TestNotificationAnalyticsService:
@@ -143,7 +147,7 @@ class TestNotificationAnalyticsService:
         service = get_notification_analytics_service(mock_db)
 
         # Mock empty query results for new user
-        mock_db.query.return_value.filter.return_value.all.return_value = []
+        service.rollups.load_user_metrics = Mock(return_value=[])
         mock_db.query.return_value.filter.return_value.first.return_value = None
 
         # When
@@ -169,29 +173,17 @@ class TestNotificationAnalyticsService:
 
         service = get_notification_analytics_service(mock_db)
 
-        # Mock notification logs
-        mock_logs = [
-            Mock(
-                sent_at=datetime.now() - timedelta(hours=i),
-                notification_type="preparation_reminder",
-                success=True,
-            )
-            for i in range(5)
-        ]
-
-        # Mock interactions (2 out of 5 opened)
-        mock_interactions = [
-            Mock(
-                notification_log_id=mock_logs[i].id,
-                interaction_type="opened",
-                timestamp=datetime.now() - timedelta(hours=i, minutes=10),
-            )
-            for i in range(2)
-        ]
-
-        mock_db.query.return_value.filter.return_value.all.return_value = mock_logs
-        mock_db.query.return_value.filter.return_value.join.return_value.all.return_value = (
-            mock_interactions
+        # Mock hourly rollups: 5 delivered, 2 opened
+        now = datetime.now().replace(minute=0, second=0, microsecond=0)
+        service.rollups.load_user_metrics = Mock(
+            return_value=[
+                MetricRow(
+                    bucket_start=now - timedelta(hours=i),
+                    notification_type="preparation_reminder",
+                    counts=MetricCounts(sent=1, delivered=1, opened=int(i < 2)),
+                )
+                for i in range(5)
+            ]
         )
 
         # Mock existing pattern
@@ -334,11 +326,23 @@ class TestNotificationAnalyticsService:
         end_date = datetime.now()
 
         # Mock aggregated data
-        mock_db.query.return_value.filter.return_value.count.return_value = 100
-        mock_db.execute.return_value.fetchall.return_value = [
-            ("preparation_reminder", 50, 30, 15),
-            ("departure_reminder", 50, 35, 20),
-        ]
+        service.rollups.load_report_metrics = Mock(
+            return_value=[
+                MetricRow(
+                    bucket_start=start_date,
+                    notification_type=notification_type,
+                    platform="ios",
+                    counts=MetricCounts(
+                        sent=50, delivered=50, opened=opened, clicked=clicked
+                    ),
+                )
+                for notification_type, opened, clicked in [
+                    ("preparation_reminder", 30, 15),
+                    ("departure_reminder", 35, 20),
+                ]
+            ]
+        )
+        service._calculate_personalization_lift = AsyncMock(return_value=None)
 
         # When
         report = await service.generate_analytics_report(start_date, end_date)
@@ -0,0 +1,140 @@
+"""
+알림 시간별 롤업 테스트
+
+롤업/원본 구간 분할, 증분 갱신 범위, 집계 합산 검증
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from app.services.notifications.notification_rollup_service import (
+    LATE_DATA_MARGIN,
+    MetricCounts,
+    MetricRow,
+    NotificationRollupService,
+    summarize,
+)
+
+
+def _metric_row(bucket_start: datetime) -> SimpleNamespace:
+    return SimpleNamespace(
+        bucket_start=bucket_start,
+        notification_type="reminder",
+        platform="ios",
+        sent=10,
+        delivered=9,
+        opened=4,
+        clicked=1,
+        dismissed=0,
+        delivery_time_sum=9.0,
+        delivery_time_count=9,
+    )
+
+
+def _service(last_refreshed_at=None) -> NotificationRollupService:
+    service = NotificationRollupService(db=Mock())
+    service.last_refreshed_at = Mock(return_value=last_refreshed_at)
+    return service
+
+
+class TestRangePlanning:
+    """롤업 구간과 원본 구간 분할 테스트"""
+
+    def test_complete_hours_come_from_rollups(self) -> None:
+        """Given: 10시 갱신 / When: 01:30~12:15 조회 / Then: 02~10시 롤업, 양끝 원본"""
+        service = _service(last_refreshed_at=datetime(2026, 1, 1, 10, 5))
+
+        rollup_range, raw_ranges = service._plan(
+            datetime(2026, 1, 1, 1, 30), datetime(2026, 1, 1, 12, 15)
+        )
+
+        assert rollup_range == (datetime(2026, 1, 1, 2), datetime(2026, 1, 1, 10))
+        assert raw_ranges == [
+            (datetime(2026, 1, 1, 1, 30), datetime(2026, 1, 1, 2), False),
+            (datetime(2026, 1, 1, 10), datetime(2026, 1, 1, 12, 15), True),
+        ]
+
+    def test_without_rollups_reads_raw_range(self) -> None:
+        """Given: 롤업 없음 / When: 조회 / Then: 전체 구간 원본 집계"""
+        service = _service(last_refreshed_at=None)
+        start, end = datetime(2026, 1, 1), datetime(2026, 1, 2)
+
+        assert service._plan(start, end) == (None, [(start, end, True)])
+
+    def test_report_merges_rollup_and_raw_rows(self) -> None:
+        """Given: 롤업 행 + 원본 꼬리 / When: 리포트 지표 조회 / Then: 둘 다 반환"""
+        service = _service(last_refreshed_at=datetime(2026, 1, 1, 6))
+        rollup = _metric_row(datetime(2026, 1, 1, 3))
+        raw = _metric_row(datetime(2026, 1, 1, 6))
+        service.db.query.return_value.filter.return_value.all.return_value = [rollup]
+        service.db.execute.return_value = [raw]
+
+        rows = service.load_report_metrics(
+            datetime(2026, 1, 1), datetime(2026, 1, 1, 6, 30)
+        )
+
+        assert [row.bucket_start.hour for row in rows] == [3, 6]
+        assert service.db.execute.call_count == 1
+
+
+class TestIncrementalRefresh:
+    """증분 갱신 테스트"""
+
+    def test_refresh_rescans_from_previous_watermark(self) -> None:
+        """Given: 이전 갱신 시각 / When: 변경 없음 / Then: 여유 구간부터 조회, 쓰기 없음"""
+        last = datetime(2026, 1, 1, 10)
+        service = _service(last_refreshed_at=last)
+        service._changed_buckets = Mock(return_value=[])
+        service._rebuild_buckets = Mock()
+
+        result = service.refresh(now=datetime(2026, 1, 1, 10, 1))
+
+        service._changed_buckets.assert_called_once_with(last - LATE_DATA_MARGIN)
+        service._rebuild_buckets.assert_not_called()
+        assert result["buckets"] == 0
+
+    def test_changed_buckets_replace_both_rollup_tables(self) -> None:
+        """Given: 변경된 2개 구간 / When: 갱신 / Then: 두 테이블 삭제+재적재, 1회 커밋"""
+        now = datetime(2026, 1, 1, 12)
+        service = _service(last_refreshed_at=None)
+        service._changed_buckets = Mock(
+            return_value=[datetime(2026, 1, 1, 9), datetime(2026, 1, 1, 11)]
+        )
+
+        service.refresh(now=now)
+
+        service._changed_buckets.assert_called_once_with(now - timedelta(days=30))
+        statements = [str(call.args[0]) for call in service.db.execute.call_args_list]
+        assert [statement.split()[0] for statement in statements] == [
+            "DELETE",
+            "INSERT",
+            "DELETE",
+            "INSERT",
+        ]
+        assert "notification_hourly_rollups" in statements[1]
+        assert "user_notification_hourly_rollups" in statements[3]
+        service.db.commit.assert_called_once()
+
+
+class TestMetricCounts:
+    """집계 합산 테스트"""
+
+    def test_summarize_adds_counts_and_keeps_fastest_response(self) -> None:
+        """Given: 시간대별 행 / When: 시간대 기준 합산 / Then: 누적 및 최솟값 유지"""
+        rows = [
+            MetricRow(
+                bucket_start=datetime(2026, 1, day, 18),
+                notification_type="reminder",
+                counts=MetricCounts(
+                    sent=2, opened=1, clicked=1, fastest_response_seconds=speed
+                ),
+            )
+            for day, speed in [(1, 30.0), (2, None), (3, 12.0)]
+        ]
+
+        totals = summarize(rows, lambda row: row.bucket_start.hour)[18]
+
+        assert totals.sent == 6
+        assert totals.engaged == 6
+        assert totals.fastest_response_seconds == 12.0
@@ -0,0 +1,146 @@
+"""Tests for onboarding sample pool interleaving and sample generation."""
+
+import random
+from unittest.mock import Mock, patch
+
+from app.services.auth.onboarding_sample_pool import (
+    OnboardingSamplePool,
+    interleave_by_category,
+)
+from app.services.auth.onboarding_service import OnboardingSampleService
+
+
+def _place(place_id, category, distance_m=100.0, popularity=3):
+    return {
+        "place_id": place_id,
+        "name": f"장소 {place_id}",
+        "address": "서울 마포구",
+        "category": category,
+        "latitude": 37.55,
+        "longitude": 126.92,
+        "distance_m": distance_m,
+        "popularity": popularity,
+        "recommendation_score": 8.25,
+    }
+
+
+class TestInterleaveByCategory:
+    """Test round-robin selection across categories."""
+
+    def test_every_category_before_repeats(self):
+        """
+        Given: Nearest-first places for three categories
+        When: Four samples are interleaved
+        Then: Each category appears once before any category repeats
+        """
+        places = [
+            _place("r1", "restaurant"),
+            _place("r2", "restaurant"),
+            _place("c1", "cafe"),
+            _place("b1", "bar"),
+            _place("b2", "bar"),
+        ]
+
+        picked = interleave_by_category(places, ["cafe", "restaurant", "bar"], 4)
+
+        assert [p["place_id"] for p in picked] == ["c1", "r1", "b1", "r2"]
+
+    def test_other_categories_fill_missing_ones(self):
+        """
+        Given: A selected category with no nearby places
+        When: Samples are interleaved
+        Then: Remaining slots are filled from the other categories
+        """
+        places = [_place("r1", "restaurant"), _place("r2", "restaurant")]
+
+        picked = interleave_by_category(places, ["cafe", "restaurant"], 3)
+
+        assert [p["place_id"] for p in picked] == ["r1", "r2"]
+
+    def test_matches_reference_round_robin(self):
+        """
+        Given: Random candidate lists, including places shared by categories
+        When: Interleaved with random limits
+        Then: Result matches a straightforward round-robin without duplicates
+        """
+        rng = random.Random(50)
+        categories = ["restaurant", "cafe", "bar", "shopping"]
+
+        for _ in range(300):
+            selected = rng.sample(categories, rng.randint(1, 4))
+            places = [
+                _place(f"p{rng.randint(0, 15)}", rng.choice(categories))
+                for _ in range(rng.randint(0, 20))
+            ]
+            limit = rng.randint(1, 8)
+
+            queues = {c: [p for p in places if p["category"] == c] for c in selected}
+            expected, seen = [], set()
+            for depth in range(len(places)):
+                for category in selected:
+                    queue = queues[category]
+                    if depth < len(queue) and queue[depth]["place_id"] not in seen:
+                        seen.add(queue[depth]["place_id"])
+                        expected.append(queue[depth])
+
+            assert interleave_by_category(places, selected, limit) == expected[:limit]
+
+
+class TestOnboardingSampleGeneration:
+    """Test onboarding samples built from the popular-place pool."""
+
+    def setup_method(self) -> None:
+        """Set up test environment."""
+        self.db_mock = Mock()
+        self.service = OnboardingSampleService(self.db_mock)
+        self.location = {"latitude": 37.55, "longitude": 126.92}
+
+    def test_samples_come_from_pool(self):
+        """
+        Given: Nearby pool places for the selected categories
+        When: Sample places are generated
+        Then: Real places are returned with distance, rating and sample type
+        """
+        nearby = [
+            _place("r1", "restaurant", 420.0),
+            _place("c1", "cafe", 150.0),
+            _place("r2", "restaurant", 900.0, popularity=7),
+        ]
+
+        with patch.object(
+            OnboardingSamplePool, "nearest", return_value=nearby
+        ) as nearest:
+            result = self.service.generate_sample_places(
+                "user_1", self.location, ["restaurant", "cafe"], 3
+            )
+
+        nearest.assert_called_once_with(37.55, 126.92, ["restaurant", "cafe"], 3)
+        samples = result["sample_places"]
+        assert result["sample_source"] == "popular_pool"
+        assert [s["place_id"] for s in samples] == ["r1", "c1", "r2"]
+        assert samples[0]["distance_km"] == 0.42
+        assert samples[0]["rating"] == 8.2
+        assert [s["sample_type"] for s in samples] == [
+            "category_matched",
+            "category_matched",
+            "popular_local",
+        ]
+        assert set(result["categories_represented"]) == {"restaurant", "cafe"}
+
+    def test_falls_back_to_placeholders_when_pool_fails(self):
+        """
+        Given: The pool query fails (e.g. statement timeout)
+        When: Sample places are generated
+        Then: The session is rolled back and placeholder samples are returned
+        """
+        with patch.object(
+            OnboardingSamplePool, "nearest", side_effect=RuntimeError("timeout")
+        ):
+            result = self.service.generate_sample_places(
+                "user_1", self.location, ["cafe"], 2
+            )
+
+        self.db_mock.rollback.assert_called_once()
+        assert result["sample_source"] == "placeholder"
+        assert result["sample_count"] == 2
+        assert result["sample_places"][0]["sample_id"] == "sample_cafe_0"
@@ -0,0 +1,152 @@
+"""
+개인화 알림 일괄 발송 테스트
+
+권한 일괄 확인, 배치 단위 타이밍 최적화, 처리량 보고 검증
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from app.schemas.notification import PushNotificationRequest
+from app.services.notifications.notification_settings_service import (
+    NotificationSettingsService,
+)
+from app.services.notifications.personalized_notification_service import (
+    PersonalizedNotificationService,
+)
+
+
+def _requests(count: int, notification_type: str = "general"):
+    return [
+        {
+            "user_id": f"user-{i}",
+            "notification_request": PushNotificationRequest(
+                title="t", body="b", user_ids=[], notification_type=notification_type
+            ),
+        }
+        for i in range(count)
+    ]
+
+
+class TestBulkPersonalizedNotifications:
+    """대량 개인화 발송 테스트"""
+
+    def setup_method(self) -> None:
+        self.settings_service = Mock()
+        self.personalization_engine = Mock()
+        self.fcm_service = Mock()
+        self.fcm_service.get_device_tokens_by_user.side_effect = lambda user_ids: {
+            user_id: [f"token-{user_id}"] for user_id in user_ids
+        }
+        self.fcm_service.send_to_users_async = AsyncMock(
+            side_effect=lambda request, tokens_by_user: {
+                user_id: True for user_id in tokens_by_user
+            }
+        )
+        self.service = PersonalizedNotificationService(
+            db=Mock(),
+            settings_service=self.settings_service,
+            personalization_engine=self.personalization_engine,
+            fcm_service=self.fcm_service,
+        )
+
+    async def test_permissions_checked_once_and_timing_batched(self) -> None:
+        """Given: 25명 중 1명 차단 / When: 배치 10 / Then: 권한 1회, 타이밍 3배치"""
+        requests = _requests(25)
+        self.settings_service.bulk_check_notification_permissions = AsyncMock(
+            return_value={("user-3", "general"): False}
+        )
+        later = datetime.utcnow() + timedelta(hours=3)
+        self.personalization_engine.optimize_batch_timing = AsyncMock(
+            side_effect=lambda batch: [
+                SimpleNamespace(
+                    predicted_time=later, confidence_score=0.7, improvement_score=0.1
+                )
+                for _ in batch
+            ]
+        )
+
+        results = await self.service.send_bulk_personalized_notifications(
+            requests, batch_size=10
+        )
+
+        self.settings_service.bulk_check_notification_permissions.assert_awaited_once()
+        self.settings_service.is_notification_allowed_for_user.assert_not_called()
+        batch_sizes = [
+            len(call.args[0])
+            for call in self.personalization_engine.optimize_batch_timing.call_args_list
+        ]
+        assert batch_sizes == [10, 10, 4]
+        assert results["blocked_sends"] == [
+            {"user_id": "user-3", "reason": "blocked_by_user_settings"}
+        ]
+        assert len(results["scheduled_sends"]) == 24
+        assert results["performance"]["batch_count"] == 3
+        assert results["performance"]["users_per_second"] > 0
+
+    async def test_permission_errors_fall_back_to_allow(self) -> None:
+        """Given: 권한 확인 실패 / When: 발송 / Then: 허용 후 즉시 발송"""
+        self.settings_service.bulk_check_notification_permissions = AsyncMock(
+            side_effect=Exception("db down")
+        )
+        self.personalization_engine.optimize_batch_timing = AsyncMock(return_value=[])
+
+        results = await self.service.send_bulk_personalized_notifications(_requests(2))
+
+        assert results["blocked_sends"] == []
+        assert len(results["immediate_sends"]) == 2
+        assert results["optimization_stats"]["fallback_count"] == 2
+
+    async def test_due_sends_share_token_query_and_delivery(self) -> None:
+        """Given: 즉시 발송 대상 6명, 페이로드 2종 / When: 발송 / Then: 토큰 조회 1회, 페이로드별 1회 발송"""
+        requests = _requests(4) + [
+            {**request, "user_id": f"reminder-{i}"}
+            for i, request in enumerate(_requests(2, notification_type="reminder"))
+        ]
+        self.settings_service.bulk_check_notification_permissions = AsyncMock(
+            return_value={}
+        )
+        self.personalization_engine.optimize_batch_timing = AsyncMock(return_value=[])
+        self.fcm_service.send_to_users_async.side_effect = (
+            lambda request, tokens_by_user: {
+                user_id: user_id != "user-2" for user_id in tokens_by_user
+            }
+        )
+
+        results = await self.service.send_bulk_personalized_notifications(requests)
+
+        self.fcm_service.get_device_tokens_by_user.assert_called_once()
+        sent = [
+            (call.args[0].notification_type, sorted(call.args[1]))
+            for call in self.fcm_service.send_to_users_async.await_args_list
+        ]
+        assert sorted(sent) == [
+            ("general", ["user-0", "user-1", "user-2", "user-3"]),
+            ("reminder", ["reminder-0", "reminder-1"]),
+        ]
+        assert [
+            send["user_id"]
+            for send in results["immediate_sends"]
+            if not send["success"]
+        ] == ["user-2"]
+        self.fcm_service.send_push_notification_async.assert_not_called()
+
+
+class TestBulkSettingsLoading:
+    """설정 일괄 조회 테스트"""
+
+    async def test_settings_loaded_in_chunks(self) -> None:
+        """Given: 2,500명 / When: 권한 일괄 확인 / Then: 1,000명 단위 3회 조회"""
+        db = Mock()
+        disabled = Mock(user_id="user-7")
+        disabled.is_notification_allowed.return_value = False
+        db.query.return_value.filter.return_value.all.side_effect = [[disabled], [], []]
+        service = NotificationSettingsService(db)
+        pairs = [(f"user-{i}", "general") for i in range(2500)]
+
+        results = await service.bulk_check_notification_permissions(pairs)
+
+        assert db.query.call_count == 3
+        assert results[("user-7", "general")] is False
+        assert results[("user-8", "general")] is True
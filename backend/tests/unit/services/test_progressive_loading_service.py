@@ -447,3 +447,222 @@ class TestProgressiveLoadingService:
                 personalized_response["personalization_applied"]["strategy"]
                 == "high_patience"
             )
+
+
+class FakeBatchRedis:
+    """청크 저장에 쓰는 명령만 흉내내고 주고받은 바이트 수를 기록"""
+
+    def __init__(self) -> None:
+        self.strings = {}
+        self.hashes = {}
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.expired = set()
+
+    def pipeline(self, transaction: bool = True) -> "FakeBatchPipeline":
+        return FakeBatchPipeline(self)
+
+    async def setex(self, key, ttl, value):
+        self.bytes_written += len(value)
+        self.strings[key] = value
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(
+            {field: str(value) for field, value in mapping.items()}
+        )
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+    async def eval(self, script, numkeys, key, expected, cursor):
+        # ADVANCE_CURSOR_SCRIPT: 커서가 expected일 때만 cursor로 이동
+        fields = self.hashes.get(key, {})
+        if fields.get("cursor") != expected:
+            return 0
+        fields["cursor"] = cursor
+        return 1
+
+    async def expire(self, key, ttl):
+        self.expired.add(key)
+        return key in self.strings or key in self.hashes
+
+    async def mget(self, keys):
+        values = [self.strings.get(key) for key in keys]
+        self.bytes_read += sum(len(value) for value in values if value)
+        return values
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.strings.pop(key, None)
+            self.hashes.pop(key, None)
+
+
+class FakeBatchPipeline:
+    def __init__(self, client: FakeBatchRedis) -> None:
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [
+            await getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.calls
+        ]
+
+
+def _chunked_service(redis_client, **kwargs) -> ProgressiveLoadingService:
+    return ProgressiveLoadingService(
+        redis_client=redis_client,
+        db_session=Mock(),
+        initial_batch_size=10,
+        batch_size=10,
+        adaptive_batch_sizing=False,
+        enable_preloading=False,
+        analytics_enabled=False,
+        **kwargs,
+    )
+
+
+async def _page_through(service, user_id, results, batch_size=10):
+    initial = await service.load_initial_results(user_id, {"query": "맛집"}, results)
+    loaded = list(initial["results"])
+    token = initial["loading_metadata"]["next_batch_token"]
+    while token:
+        response = await service.load_next_batch(user_id, token, batch_size)
+        loaded.extend(response["results"])
+        token = response["loading_metadata"]["next_batch_token"]
+    return loaded, response
+
+
+class TestChunkedBatchStorage:
+    """청크 단위 배치 저장 테스트"""
+
+    def setup_method(self) -> None:
+        self.user_id = uuid4()
+        self.results = [
+            {"id": f"place_{i}", "name": f"장소 {i}", "description": "설명" * 20}
+            for i in range(500)
+        ]
+
+    async def test_paging_reads_each_chunk_once(self) -> None:
+        """Given: 500개 결과 / When: 끝까지 페이지 이동 / Then: 순서 보존, 읽은 바이트 ≈ 저장 바이트"""
+        redis_client = FakeBatchRedis()
+        service = _chunked_service(redis_client, storage_chunk_size=50)
+
+        loaded, last = await _page_through(service, self.user_id, self.results)
+
+        assert loaded == self.results
+        assert last["loading_metadata"]["loaded_count"] == 500
+        assert last["loading_metadata"]["progress_percentage"] == 100
+        # 배치 10개가 청크 하나를 공유하므로 청크당 5번 읽힘, 전체 재기록 없음
+        assert redis_client.bytes_read <= redis_client.bytes_written * 5
+        assert redis_client.strings == {} and redis_client.hashes == {}
+
+    async def test_large_sets_are_compressed(self) -> None:
+        """Given: 압축 기준 초과 / When: 저장 / Then: 청크가 원본 JSON보다 작음"""
+        redis_client = FakeBatchRedis()
+        service = _chunked_service(redis_client, storage_chunk_size=100)
+
+        await service.load_initial_results(self.user_id, {}, self.results)
+
+        assert redis_client.bytes_written < len(json.dumps(self.results[10:])) / 3
+
+    async def test_ids_only_hydrates_from_place_cache_and_loader(self) -> None:
+        """Given: ID만 저장, 일부 장소 캐시 만료 / When: 다음 배치 / Then: 로더로 보충"""
+        redis_client = FakeBatchRedis()
+        loader = AsyncMock(
+            return_value={"place_12": {"id": "place_12", "name": "복구"}}
+        )
+        service = _chunked_service(
+            redis_client, store_ids_only=True, place_loader=loader
+        )
+        initial = await service.load_initial_results(
+            self.user_id, {}, self.results[:30]
+        )
+        del redis_client.strings["progressive_loading:place:place_12"]
+
+        response = await service.load_next_batch(
+            self.user_id, initial["loading_metadata"]["next_batch_token"], 10
+        )
+
+        assert [r["id"] for r in response["results"]] == [
+            f"place_{i}" for i in range(10, 20)
+        ]
+        assert response["results"][2]["name"] == "복구"
+        loader.assert_awaited_once_with(["place_12"])
+
+    async def test_ids_only_touch_refreshes_only_next_window(self) -> None:
+        """Given: ID만 저장, 로더 없음 / When: 다음 배치 / Then: 다음 요청이 읽을 범위만 TTL 연장"""
+        redis_client = FakeBatchRedis()
+        service = _chunked_service(
+            redis_client, store_ids_only=True, storage_chunk_size=10
+        )
+        initial = await service.load_initial_results(
+            self.user_id, {}, self.results[:200]
+        )
+        token = initial["loading_metadata"]["next_batch_token"]
+        redis_client.bytes_read = 0
+
+        await service.load_next_batch(self.user_id, token, 10)
+
+        touched_places = {
+            key.rsplit(":", 1)[1]
+            for key in redis_client.expired
+            if key.startswith("progressive_loading:place:")
+        }
+        touched_chunks = {
+            int(key.rsplit(":", 1)[1])
+            for key in redis_client.expired
+            if key.startswith(f"progressive_loading:batch:{self.user_id}:{token}:")
+        }
+        # 최대 배치 크기(50)만큼: 나머지 인덱스 10..59 -> place_20..place_69
+        assert touched_places == {f"place_{i}" for i in range(20, 70)}
+        assert touched_chunks == set(range(1, 6))
+        assert redis_client.bytes_read < redis_client.bytes_written / 2
+
+    async def test_failed_read_does_not_advance_cursor(self) -> None:
+        """Given: 청크 읽기 중 장애 / When: 같은 토큰으로 다시 요청 / Then: 같은 범위를 다시 받음"""
+        redis_client = FakeBatchRedis()
+        service = _chunked_service(redis_client, retry_enabled=False)
+        initial = await service.load_initial_results(
+            self.user_id, {}, self.results[:40]
+        )
+        token = initial["loading_metadata"]["next_batch_token"]
+
+        with patch.object(
+            redis_client, "mget", AsyncMock(side_effect=ConnectionError("down"))
+        ):
+            failed = await service.load_next_batch(self.user_id, token, 10)
+        response = await service.load_next_batch(self.user_id, token, 10)
+
+        assert failed["error"]["type"] == "loading_error"
+        assert [r["id"] for r in response["results"]] == [
+            f"place_{i}" for i in range(10, 20)
+        ]
+
+    async def test_concurrent_batches_do_not_overlap(self) -> None:
+        """Given: 같은 토큰 동시 요청 / When: 3개 동시 로드 / Then: 겹치지 않는 범위"""
+        redis_client = FakeBatchRedis()
+        service = _chunked_service(redis_client)
+        initial = await service.load_initial_results(
+            self.user_id, {}, self.results[:40]
+        )
+        token = initial["loading_metadata"]["next_batch_token"]
+
+        responses = await asyncio.gather(
+            *(service.load_next_batch(self.user_id, token, 10) for _ in range(3))
+        )
+
+        ids = [r["id"] for response in responses for r in response["results"]]
+        assert sorted(ids) == sorted(f"place_{i}" for i in range(10, 40))
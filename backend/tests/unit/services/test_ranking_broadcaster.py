@@ -0,0 +1,302 @@
+"""
+실시간 랭킹 브로드캐스트 테스트
+
+사용자 채널 구독, 메시지 병합, 송신 큐 백프레셔, 느린 클라이언트 종료, Redis 장애 대체,
+유실 후 재동기화 검증
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+from app.services.ranking.ranking_broadcaster import (
+    RankingBroadcaster,
+    coalesce_messages,
+)
+from app.services.ranking.realtime_ranking_service import RealtimeRankingService
+
+
+class FakePubSub:
+    """subscribe/unsubscribe/get_message만 흉내내는 pub/sub"""
+
+    def __init__(self, broker: "FakeRedis") -> None:
+        self.broker = broker
+        self.channels = set()
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        pass
+
+
+class FakeRedis:
+    """같은 이벤트 루프 안의 여러 브로드캐스터가 공유하는 브로커"""
+
+    def __init__(self) -> None:
+        self.pubsubs = []
+        self.published = []
+
+    def pubsub(self, ignore_subscribe_messages=True):
+        pubsub = FakePubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel, payload):
+        self.published.append((channel, payload))
+        for pubsub in self.pubsubs:
+            if channel in pubsub.channels:
+                pubsub.messages.put_nowait(
+                    {"type": "message", "channel": channel, "data": payload}
+                )
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.sent = []
+        self.delay = delay
+        self.closed = False
+
+    async def send_text(self, payload):
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(payload))
+
+    async def close(self):
+        self.closed = True
+
+
+def _broadcaster(client, **kwargs) -> RankingBroadcaster:
+    kwargs.setdefault("coalesce_window", 0.01)
+    return RankingBroadcaster(client=client, channel_prefix="test", **kwargs)
+
+
+async def _settle(seconds: float = 0.05) -> None:
+    await asyncio.sleep(seconds)
+
+
+class TestCrossWorkerDelivery:
+    """워커 간 전달 테스트"""
+
+    async def test_update_reaches_user_on_other_worker(self) -> None:
+        """Given: 사용자가 워커 B에 연결 / When: 워커 A에서 발행 / Then: B 연결로 전달"""
+        broker = FakeRedis()
+        worker_a, worker_b = _broadcaster(broker), _broadcaster(broker)
+        websocket = FakeWebSocket()
+        await worker_b.connect("u1", websocket)
+
+        await worker_a.publish("u1", {"type": "ranking_update", "trigger_type": "x"})
+        await _settle()
+
+        assert [m["trigger_type"] for m in websocket.sent] == ["x"]
+        assert broker.published[0][0] == "test:u1"
+        await worker_a.close()
+        await worker_b.close()
+
+    async def test_last_connection_unsubscribes_channel(self) -> None:
+        """Given: 같은 사용자 2개 연결 / When: 하나씩 해제 / Then: 마지막 해제 때만 구독 해제"""
+        broker = FakeRedis()
+        broadcaster = _broadcaster(broker)
+        first = await broadcaster.connect("u1", FakeWebSocket())
+        second = await broadcaster.connect("u1", FakeWebSocket())
+
+        await broadcaster.disconnect(first)
+        assert broker.pubsubs[0].channels == {"test:u1"}
+        await broadcaster.disconnect(second)
+
+        assert broker.pubsubs[0].channels == set()
+        assert broadcaster.local_user_ids() == []
+        await broadcaster.close()
+
+
+class TestCoalescing:
+    """메시지 병합 테스트"""
+
+    async def test_triggers_within_window_are_published_once(self) -> None:
+        """Given: 병합 구간 내 트리거 3개 / When: 발행 / Then: 1회 발행, 트리거 타입 합침"""
+        broker = FakeRedis()
+        broadcaster = _broadcaster(broker, coalesce_window=0.05)
+
+        for trigger, count in [("location", 1), ("time", 3), ("location", 2)]:
+            await broadcaster.publish(
+                "u1",
+                {
+                    "type": "ranking_update",
+                    "trigger_type": trigger,
+                    "updated_searches": count,
+                },
+            )
+        await _settle(0.1)
+
+        assert len(broker.published) == 1
+        message = json.loads(broker.published[0][1])
+        assert message["trigger_types"] == ["location", "time"]
+        assert message["updated_searches"] == 3
+        assert message["coalesced"] == 3
+        assert broadcaster.get_stats()["coalesced"] == 2
+
+    def test_other_message_types_keep_latest(self) -> None:
+        """Given: 랭킹 외 타입 / When: 병합 / Then: 최신 메시지로 교체"""
+        merged = coalesce_messages(
+            {"type": "trending", "n": 1}, {"type": "trending", "n": 2}
+        )
+
+        assert merged == {"type": "trending", "n": 2}
+
+
+class TestBackpressure:
+    """느린 클라이언트 처리 테스트"""
+
+    async def test_full_queue_drops_oldest(self) -> None:
+        """Given: 큐 크기 2, 멈춘 클라이언트 / When: 5개 전달 / Then: 최근 2개만 남음"""
+        broadcaster = _broadcaster(None, queue_size=2, max_consecutive_drops=100)
+        connection = await broadcaster.connect("u1", FakeWebSocket(delay=10))
+        await _settle(0.01)  # 송신 루프가 첫 메시지를 잡고 멈추게 함
+        connection.offer(json.dumps({"n": 0}))
+        await _settle(0.01)
+
+        for n in range(1, 5):
+            broadcaster._deliver_local("u1", json.dumps({"n": n}))
+
+        assert [json.loads(p)["n"] for p in list(connection.queue._queue)] == [3, 4]
+        assert connection.dropped == 2
+        assert broadcaster.get_stats()["dropped"] == 2
+        await broadcaster.close()
+
+    async def test_drop_requests_resync_before_next_message(self) -> None:
+        """Given: 큐 크기 1, 드롭 발생 / When: 송신 재개 / Then: resync_required 먼저 전송"""
+        broadcaster = _broadcaster(None, queue_size=1, max_consecutive_drops=100)
+        websocket = FakeWebSocket(delay=0.02)
+        await broadcaster.connect("u1", websocket)
+        await _settle(0.01)
+        broadcaster._deliver_local("u1", json.dumps({"n": 0}))
+        await _settle(0.01)  # 송신 루프가 첫 메시지를 전송 중
+
+        for n in range(1, 3):
+            broadcaster._deliver_local("u1", json.dumps({"n": n}))
+        await _settle(0.1)
+
+        assert websocket.sent == [{"n": 0}, {"type": "resync_required"}, {"n": 2}]
+        assert broadcaster.get_stats()["resync_requested"] == 1
+        await broadcaster.close()
+
+    async def test_slow_client_is_closed_after_drop_limit(self) -> None:
+        """Given: 연속 드롭 한도 3 / When: 계속 밀림 / Then: 연결 종료 및 해제"""
+        broadcaster = _broadcaster(None, queue_size=1, max_consecutive_drops=3)
+        websocket = FakeWebSocket(delay=10)
+        await broadcaster.connect("u1", websocket)
+        await _settle(0.01)
+
+        for n in range(6):
+            broadcaster._deliver_local("u1", json.dumps({"n": n}))
+        await _settle()
+
+        assert websocket.closed is True
+        assert broadcaster.local_user_ids() == []
+        assert broadcaster.get_stats()["slow_clients"] == 1
+
+    async def test_send_timeout_closes_connection(self) -> None:
+        """Given: 전송 시간 초과 / When: 메시지 전달 / Then: 연결 종료"""
+        broadcaster = _broadcaster(None, send_timeout=0.01)
+        websocket = FakeWebSocket(delay=1)
+        await broadcaster.connect("u1", websocket)
+
+        broadcaster._deliver_local("u1", json.dumps({"n": 1}))
+        await _settle()
+
+        assert websocket.closed is True
+        assert broadcaster.get_stats()["send_failures"] == 1
+
+
+class TestRedisFallback:
+    """Redis 장애 대체 테스트"""
+
+    async def test_publish_failure_delivers_locally(self) -> None:
+        """Given: Redis 발행 실패 / When: 알림 / Then: 이 워커 연결로 직접 전달"""
+        client = Mock()
+        client.pubsub.return_value = FakePubSub(None)
+        client.publish = AsyncMock(side_effect=ConnectionError("down"))
+        broadcaster = _broadcaster(client, coalesce_window=0)
+        websocket = FakeWebSocket()
+        await broadcaster.connect("u1", websocket)
+
+        await broadcaster.publish("u1", {"type": "ranking_update", "trigger_type": "x"})
+        await _settle()
+
+        assert len(websocket.sent) == 1
+        stats = broadcaster.get_stats()
+        assert stats["redis_errors"] == 1
+        assert stats["published_local"] == 1
+        await broadcaster.close()
+
+    async def test_recovered_redis_requests_resync_for_missed_users(self) -> None:
+        """Given: 장애 중 로컬로만 전달 / When: Redis 복구 후 발행 / Then: 해당 사용자에 재동기화 요청"""
+        broker = FakeRedis()
+        publish = broker.publish
+        broker.publish = AsyncMock(side_effect=ConnectionError("down"))
+        broadcaster = _broadcaster(broker, coalesce_window=0)
+
+        await broadcaster.publish("u1", {"type": "ranking_update", "trigger_type": "x"})
+        broker.publish = publish
+        broadcaster._redis_retry_at = 0.0
+        await broadcaster.publish("u2", {"type": "ranking_update", "trigger_type": "y"})
+
+        assert broker.published[-1] == (
+            "test:u1",
+            json.dumps({"type": "resync_required"}),
+        )
+        assert broadcaster.get_stats()["resync_pending_users"] == 0
+        await broadcaster.close()
+
+
+class TestRealtimeRankingService:
+    """랭킹 서비스 연동 테스트"""
+
+    async def test_ranking_update_goes_through_broadcaster(self) -> None:
+        """Given: 브로드캐스터 / When: 랭킹 업데이트 알림 / Then: 사용자 채널로 발행"""
+        broadcaster = Mock()
+        broadcaster.publish = AsyncMock()
+        service = RealtimeRankingService(
+            Mock(), Mock(), Mock(), counters=Mock(), broadcaster=broadcaster
+        )
+
+        await service._notify_ranking_update("u1", "location", 2)
+
+        user_id, message = broadcaster.publish.await_args.args
+        assert user_id == "u1"
+        assert message["type"] == "ranking_update"
+        assert message["updated_searches"] == 2
+
+    async def test_resync_sends_full_order_snapshot(self) -> None:
+        """Given: 버전 3까지 보낸 세션 / When: 클라이언트 resync 요청 / Then: 전체 순서와 버전 전송"""
+        service = RealtimeRankingService(
+            Mock(), Mock(), Mock(), counters=Mock(), broadcaster=Mock()
+        )
+        service._get_active_searches = AsyncMock(
+            return_value=[
+                {"session_id": "s1", "pushed_order": ["b", "a"], "ranking_version": 3},
+                {"session_id": "s2", "results": [{"id": "c"}]},
+            ]
+        )
+        connection = Mock()
+
+        await service._handle_websocket_message(
+            "00000000-0000-0000-0000-000000000001",
+            {"type": "resync", "session_ids": ["s1"]},
+            connection,
+        )
+
+        snapshot = json.loads(connection.offer.call_args.args[0])
+        assert snapshot["type"] == "ranking_snapshot"
+        assert snapshot["searches"] == [
+            {"session_id": "s1", "version": 3, "order": ["b", "a"]}
+        ]
@@ -0,0 +1,182 @@
+"""
+실시간 랭킹 변경분 전송 테스트
+
+최소 이동/삽입/삭제 diff, 트리거별 부분 재계산, 세션 변경분 버전 관리 검증
+"""
+
+import random
+from unittest.mock import AsyncMock, Mock
+
+from app.services.ranking.ranking_broadcaster import coalesce_messages
+from app.services.ranking.ranking_diff import (
+    apply_ranking_diff,
+    compute_ranking_diff,
+    is_empty_diff,
+)
+from app.services.ranking.realtime_ranking_service import RealtimeRankingService
+from app.services.search.search_ranking_service import SearchRankingService
+
+
+class TestComputeRankingDiff:
+    """순서 변경분 계산 테스트"""
+
+    def test_single_move_is_one_operation(self) -> None:
+        """Given: 마지막 항목이 맨 앞으로 / When: diff / Then: 이동 1건"""
+        diff = compute_ranking_diff(["a", "b", "c", "d"], ["d", "a", "b", "c"])
+
+        assert diff == {"remove": [], "move": [{"id": "d", "to": 0}], "insert": []}
+
+    def test_insert_and_remove(self) -> None:
+        """Given: 항목 교체 / When: diff / Then: 삭제 1건, 삽입 1건"""
+        diff = compute_ranking_diff(["a", "b", "c"], ["a", "x", "c"])
+
+        assert diff == {
+            "remove": ["b"],
+            "move": [],
+            "insert": [{"id": "x", "to": 1}],
+        }
+
+    def test_same_order_is_empty(self) -> None:
+        """Given: 같은 순서 / When: diff / Then: 빈 변경분"""
+        assert is_empty_diff(compute_ranking_diff(["a", "b"], ["a", "b"]))
+
+    def test_random_orders_round_trip_with_minimal_moves(self) -> None:
+        """Given: 무작위 순서 쌍 / When: diff 적용 / Then: 새 순서 복원, 이동 수 최소"""
+        rng = random.Random(7)
+        for _ in range(200):
+            old = [f"p{i}" for i in rng.sample(range(30), rng.randrange(0, 20))]
+            new = [f"p{i}" for i in rng.sample(range(30), rng.randrange(0, 20))]
+
+            diff = compute_ranking_diff(old, new)
+
+            assert apply_ranking_diff(old, diff) == new
+            common = [place_id for place_id in new if place_id in old]
+            assert len(diff["move"]) == len(common) - _lis_length(
+                [old.index(place_id) for place_id in common]
+            )
+
+
+def _lis_length(values) -> int:
+    best = [1] * len(values)
+    for i in range(len(values)):
+        for j in range(i):
+            if values[j] < values[i]:
+                best[i] = max(best[i], best[j] + 1)
+    return max(best, default=0)
+
+
+def _session():
+    results = [
+        {"id": "near", "latitude": 37.5, "longitude": 127.0, "distance_km": 0.5},
+        {"id": "mid", "latitude": 37.52, "longitude": 127.02, "distance_km": 3.0},
+        {"id": "far", "latitude": 37.6, "longitude": 127.1, "distance_km": 12.0},
+    ]
+    # 거리 외 요인은 동일, contextual 기여도만 차이
+    factor_scores = {
+        result["id"]: {"base_relevance": 0.5, "contextual": contextual}
+        for result, contextual in zip(results, [0.015, 0.0, -0.015])
+    }
+    return {
+        "session_id": "s1",
+        "results": results,
+        "context": {"diversity_enabled": False},
+        "factor_scores": factor_scores,
+        "pushed_order": ["near", "mid", "far"],
+        "ranking_version": 0,
+    }
+
+
+def _service(session):
+    cache = Mock()
+    cache.get = AsyncMock(return_value=[session])
+    cache.set = AsyncMock(return_value=True)
+    ranking_service = SearchRankingService(Mock(), Mock(), None)
+    ranking_service.rank_search_results = AsyncMock()
+    broadcaster = Mock()
+    broadcaster.publish = AsyncMock()
+    service = RealtimeRankingService(
+        cache, Mock(), ranking_service, counters=Mock(), broadcaster=broadcaster
+    )
+    service._get_active_searches = AsyncMock(return_value=[session])
+    return service, ranking_service, broadcaster, cache
+
+
+class TestIncrementalRanking:
+    """트리거별 부분 재계산 테스트"""
+
+    async def test_location_trigger_rescores_distance_only(self) -> None:
+        """Given: 먼 장소 근처로 이동 / When: 위치 트리거 / Then: 부분 재계산 후 이동 변경분만 전송"""
+        session = _session()
+        service, ranking_service, broadcaster, cache = _service(session)
+
+        updated = await service.trigger_ranking_update(
+            "u1", "location", {"latitude": 37.6, "longitude": 127.1}, force=True
+        )
+
+        assert updated is True
+        ranking_service.rank_search_results.assert_not_called()
+        _, message = broadcaster.publish.await_args.args
+        assert message["patches"] == [
+            {
+                "session_id": "s1",
+                "version": 1,
+                "remove": [],
+                "move": [{"id": "far", "to": 0}],
+                "insert": [],
+            }
+        ]
+        assert session["pushed_order"] == ["far", "near", "mid"]
+        assert session["factor_scores"]["far"]["base_relevance"] == 0.5
+        cache.set.assert_awaited_once()
+
+    async def test_unchanged_order_sends_nothing(self) -> None:
+        """Given: 같은 위치 / When: 위치 트리거 / Then: 변경분 없음, 알림 없음, 새 컨텍스트는 저장"""
+        session = _session()
+        service, _, broadcaster, cache = _service(session)
+
+        updated = await service.trigger_ranking_update(
+            "u1", "location", {"latitude": 37.5, "longitude": 127.0}, force=True
+        )
+
+        assert updated is False
+        broadcaster.publish.assert_not_called()
+        cache.set.assert_awaited_once()
+        assert cache.set.await_args.args[1][0]["context"]["latitude"] == 37.5
+
+    async def test_unchanged_state_is_not_saved_again(self) -> None:
+        """Given: 같은 위치 트리거 반복 / When: 두 번째 업데이트 / Then: 요인·컨텍스트 그대로라 저장 생략"""
+        session = _session()
+        service, _, _, cache = _service(session)
+        context = {"latitude": 37.5, "longitude": 127.0}
+        await service.trigger_ranking_update("u1", "location", context, force=True)
+        cache.set.reset_mock()
+
+        await service.trigger_ranking_update("u1", "location", context, force=True)
+
+        cache.set.assert_not_called()
+
+    async def test_unknown_trigger_falls_back_to_full_rank(self) -> None:
+        """Given: 요인 매핑 없는 트리거 / When: 업데이트 / Then: 전체 재랭킹 후 기여도 저장"""
+        session = _session()
+        service, ranking_service, broadcaster, _ = _service(session)
+        factor = Mock(contribution=0.3)
+        ranking_service.rank_search_results.return_value = [
+            {"id": "mid", "ranking_factors": {"personalization": factor}},
+            {"id": "near", "ranking_factors": {"personalization": factor}},
+            {"id": "far", "ranking_factors": {"personalization": factor}},
+        ]
+
+        await service.trigger_ranking_update("u1", "manual", force=True)
+
+        ranking_service.rank_search_results.assert_awaited_once()
+        assert "ranking_factors" not in session["results"][0]
+        assert session["factor_scores"]["mid"] == {"personalization": 0.3}
+        _, message = broadcaster.publish.await_args.args
+        assert message["patches"][0]["move"] == [{"id": "mid", "to": 0}]
+
+    def test_coalesced_updates_keep_every_patch(self) -> None:
+        """Given: 병합 구간 내 변경분 2건 / When: 병합 / Then: 순서대로 이어 붙임"""
+        first = {"type": "ranking_update", "trigger_type": "time", "patches": [1]}
+        second = {"type": "ranking_update", "trigger_type": "location", "patches": [2]}
+
+        assert coalesce_messages(first, second)["patches"] == [1, 2]
@@ -4,21 +4,205 @@
 TDD Red Phase: 사용자 검색 히스토리 관리 및 개인화 시스템 테스트
 """
 
+import hashlib
 import json
+import random
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 from uuid import uuid4
 
 from app.services.search.search_history_service import SearchHistoryService
 
 
+def _score_bound(bound):
+    """Redis 점수 범위 인자 → (값, 배타 여부)"""
+    if isinstance(bound, str):
+        if bound.startswith("("):
+            return float(bound[1:]), True
+        return float(bound), False
+    return float(bound), False
+
+
+def _in_range(score, low, high):
+    (low_value, low_open), (high_value, high_open) = low, high
+    above = score > low_value if low_open else score >= low_value
+    below = score < high_value if high_open else score <= high_value
+    return above and below
+
+
+class FakePipeline:
+    """명령을 모았다가 execute에서 한 번의 왕복으로 실행"""
+
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        command = getattr(self.client, f"_{name}")
+
+        def call(*args, **kwargs):
+            self.calls.append((command, args, kwargs))
+            return self
+
+        return call
+
+    async def execute(self):
+        calls, self.calls = self.calls, []
+        self.client.round_trips += 1
+        return [command(*args, **kwargs) for command, args, kwargs in calls]
+
+
+class FakeRedis:
+    """해시/정렬 집합/리스트 명령만 흉내내는 Redis (명령당 왕복 수 집계)"""
+
+    def __init__(self) -> None:
+        self.hashes = {}
+        self.zsets = {}
+        self.lists = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def __getattr__(self, name):
+        command = getattr(self, f"_{name}")
+
+        async def call(*args, **kwargs):
+            self.round_trips += 1
+            return command(*args, **kwargs)
+
+        return call
+
+    def keys_for(self, user_id):
+        stores = (self.hashes, self.zsets, self.lists)
+        return [key for store in stores for key in store if str(user_id) in key]
+
+    # 해시
+    def _hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def _hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def _hmget(self, key, fields):
+        values = self.hashes.get(key, {})
+        return [values.get(field) for field in fields]
+
+    def _hdel(self, key, *fields):
+        values = self.hashes.get(key, {})
+        return sum(1 for field in fields if values.pop(field, None) is not None)
+
+    def _hkeys(self, key):
+        return list(self.hashes.get(key, {}))
+
+    def _hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    # 정렬 집합
+    def _ordered(self, key):
+        members = self.zsets.get(key, {})
+        return sorted(members, key=lambda member: (members[member], member))
+
+    def _zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def _zincrby(self, key, amount, member):
+        members = self.zsets.setdefault(key, {})
+        members[member] = members.get(member, 0) + amount
+        return members[member]
+
+    def _zrem(self, key, *members):
+        values = self.zsets.get(key, {})
+        return sum(1 for member in members if values.pop(member, None) is not None)
+
+    def _zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def _zrange(self, key, start, end):
+        ordered = self._ordered(key)
+        return ordered[start : (end + 1) or None]
+
+    def _zrevrange(self, key, start, end):
+        ordered = self._ordered(key)[::-1]
+        return ordered[start : (end + 1) or None]
+
+    def _zrevrangebyscore(self, key, max, min, start=None, num=None, withscores=False):
+        members = self.zsets.get(key, {})
+        low, high = _score_bound(min), _score_bound(max)
+        matched = [
+            (member, members[member])
+            for member in self._ordered(key)[::-1]
+            if _in_range(members[member], low, high)
+        ]
+        if start is not None:
+            matched = matched[start : start + num]
+        return matched if withscores else [member for member, _ in matched]
+
+    def _zremrangebyrank(self, key, start, end):
+        doomed = self._zrange(key, start, end)
+        return self._zrem(key, *doomed)
+
+    def _zremrangebyscore(self, key, min, max):
+        members = self.zsets.get(key, {})
+        low, high = _score_bound(min), _score_bound(max)
+        doomed = [m for m, score in members.items() if _in_range(score, low, high)]
+        return self._zrem(key, *doomed)
+
+    # 리스트
+    def _lpush(self, key, *values):
+        self.lists.setdefault(key, [])[:0] = list(reversed(values))
+
+    def _lrange(self, key, start, end):
+        return self.lists.get(key, [])[start : (end + 1) or None]
+
+    # 공통
+    def _expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def _exists(self, key):
+        return int(any(key in store for store in (self.hashes, self.zsets, self.lists)))
+
+    def _delete(self, *keys):
+        removed = 0
+        for key in keys:
+            for store in (self.hashes, self.zsets, self.lists):
+                removed += store.pop(key, None) is not None
+        return removed
+
+    def _scan(self, cursor=0, match="*", count=100):
+        prefix = match.rstrip("*")
+        stores = (self.hashes, self.zsets, self.lists)
+        return 0, [key for store in stores for key in store if key.startswith(prefix)]
+
+
+def _seed(fake_redis, user_id, items):
+    """타임라인/본문 해시에 직접 히스토리 저장 (timestamp 없으면 1분 간격으로 부여)"""
+    now = datetime.utcnow()
+    for index, item in enumerate(items):
+        item = dict(item)
+        item.setdefault("search_id", f"seed_{index}")
+        item.setdefault("timestamp", (now - timedelta(minutes=index)).isoformat())
+        fake_redis._hset(
+            f"search_history:{user_id}:entries", item["search_id"], json.dumps(item)
+        )
+        fake_redis._zadd(
+            f"search_history:{user_id}:timeline",
+            {
+                item["search_id"]: SearchHistoryService._score(
+                    datetime.fromisoformat(item["timestamp"])
+                )
+            },
+        )
+
+
 class TestSearchHistoryService:
     """검색 히스토리 서비스 테스트"""
 
     def setup_method(self) -> None:
         """테스트 설정"""
         self.test_user_id = uuid4()
-        self.mock_redis = AsyncMock()
+        self.mock_redis = FakeRedis()
         self.mock_db = Mock()
 
         # 테스트 검색 히스토리 데이터
@@ -64,16 +248,16 @@ class TestSearchHistoryService:
             session_id="session_abc123",
         )
 
-        # Then: Redis에 히스토리 저장 확인
-        self.mock_redis.lpush.assert_called_once()
-        self.mock_redis.ltrim.assert_called_once()  # 히스토리 크기 제한
+        # Then: 한 번의 왕복으로 본문 해시와 타임라인에 저장
+        assert self.mock_redis.round_trips == 1
 
         # 저장된 데이터 구조 확인
-        call_args = self.mock_redis.lpush.call_args
-        history_key = call_args[0][0]
-        stored_data = json.loads(call_args[0][1])
+        entries_key = f"search_history:{self.test_user_id}:entries"
+        ((search_id, stored_json),) = self.mock_redis.hashes[entries_key].items()
+        stored_data = json.loads(stored_json)
+        timeline = self.mock_redis.zsets[f"search_history:{self.test_user_id}:timeline"]
 
-        assert f"search_history:{self.test_user_id}" in history_key
+        assert list(timeline) == [search_id]
         assert stored_data["query"] == "이태원 바"
         assert stored_data["filters"] == search_data["filters"]
         assert "timestamp" in stored_data
@@ -90,11 +274,7 @@ class TestSearchHistoryService:
             redis_client=self.mock_redis, db_session=self.mock_db
         )
 
-        # Mock Redis 데이터 (JSON 문자열 리스트)
-        mock_history_data = [
-            json.dumps(history) for history in self.sample_search_history
-        ]
-        self.mock_redis.lrange.return_value = mock_history_data
+        _seed(self.mock_redis, self.test_user_id, self.sample_search_history)
 
         # When: 검색 히스토리 조회
         history = await history_service.get_search_history(
@@ -158,10 +338,7 @@ class TestSearchHistoryService:
             redis_client=self.mock_redis, db_session=self.mock_db
         )
 
-        # Mock user patterns
-        self.mock_redis.lrange.return_value = [
-            json.dumps(history) for history in self.sample_search_history
-        ]
+        _seed(self.mock_redis, self.test_user_id, self.sample_search_history)
 
         # When: 개인화된 제안 생성
         suggestions = await history_service.get_personalized_suggestions(
@@ -196,13 +373,10 @@ class TestSearchHistoryService:
                 session_id=f"session_{i}",
             )
 
-        # Then: 빈도 카운터 업데이트 확인
-        frequency_calls = self.mock_redis.zincrby.call_args_list
-        assert len(frequency_calls) == 3
-
-        # 각 호출이 동일한 쿼리에 대한 증가인지 확인
-        for call in frequency_calls:
-            assert search_query in str(call)
+        # Then: 빈도 카운터 업데이트 확인 (기록당 한 번의 왕복)
+        frequency_key = f"search_frequency:{self.test_user_id}"
+        assert self.mock_redis.zsets[frequency_key] == {search_query: 3}
+        assert self.mock_redis.round_trips == 3
 
     async def test_search_history_cleanup(self) -> None:
         """
@@ -232,7 +406,7 @@ class TestSearchHistoryService:
         ]
 
         all_history = old_history + recent_history
-        self.mock_redis.lrange.return_value = [json.dumps(h) for h in all_history]
+        _seed(self.mock_redis, self.test_user_id, all_history)
 
         # When: 히스토리 정리 수행
         cleaned_count = await history_service.cleanup_old_history(
@@ -242,9 +416,11 @@ class TestSearchHistoryService:
         # Then: 오래된 데이터만 정리됨
         assert cleaned_count == 1
 
-        # 새로운 히스토리 리스트 저장 확인 (최근 데이터만)
-        self.mock_redis.delete.assert_called()  # 기존 리스트 삭제
-        self.mock_redis.lpush.assert_called()  # 새 리스트 생성
+        # 타임라인과 본문 모두 최근 데이터만 남음
+        history = await history_service.get_search_history(self.test_user_id)
+        assert [item["query"] for item in history] == ["최근 검색"]
+        entries_key = f"search_history:{self.test_user_id}:entries"
+        assert list(self.mock_redis.hashes[entries_key]) == ["seed_1"]
 
     async def test_search_interaction_tracking(self) -> None:
         """
@@ -258,6 +434,11 @@ class TestSearchHistoryService:
         )
 
         search_id = "search_12345"
+        _seed(
+            self.mock_redis,
+            self.test_user_id,
+            [{"search_id": search_id, "query": "홍대 맛집", "clicked_places": []}],
+        )
 
         # When: 검색 후 상호작용 기록
         interactions = [
@@ -274,12 +455,12 @@ class TestSearchHistoryService:
             )
 
         # Then: 상호작용 데이터 저장 확인
-        assert self.mock_redis.hset.call_count == 3
+        interactions_key = f"search_interactions:{search_id}"
+        assert len(self.mock_redis.hashes[interactions_key]) == 3
 
-        # 각 상호작용이 올바른 키로 저장되었는지 확인
-        for call in self.mock_redis.hset.call_args_list:
-            args = call[0]
-            assert f"search_interactions:{search_id}" in args[0]
+        # 클릭한 장소는 해당 검색 항목에만 한 번 기록됨
+        (entry,) = await history_service.get_search_history(self.test_user_id)
+        assert entry["clicked_places"] == ["place_1"]
 
     async def test_search_pattern_analysis(self) -> None:
         """
@@ -302,7 +483,7 @@ class TestSearchHistoryService:
             {"query": "강남 맛집", "filters": {"categories": ["restaurant"]}},
         ]
 
-        self.mock_redis.lrange.return_value = [json.dumps(h) for h in pattern_history]
+        _seed(self.mock_redis, self.test_user_id, pattern_history)
 
         # When: 검색 패턴 분석
         patterns = await history_service.analyze_search_patterns(
@@ -320,6 +501,23 @@ class TestSearchHistoryService:
         assert preferred_categories[0]["category"] == "restaurant"
         assert preferred_categories[0]["frequency"] == 2
 
+        # 새 검색 전까지는 캐시에서 한 번의 조회로 반환
+        round_trips = self.mock_redis.round_trips
+        cached = await history_service.analyze_search_patterns(
+            user_id=self.test_user_id, analysis_period_days=30
+        )
+        assert cached == patterns
+        assert self.mock_redis.round_trips == round_trips + 1
+
+        await history_service.record_search(
+            self.test_user_id, {"query": "연남동 맛집", "filters": {}}
+        )
+        refreshed = await history_service.analyze_search_patterns(
+            user_id=self.test_user_id, analysis_period_days=30
+        )
+        assert refreshed["preferred_categories"][0]["frequency"] == 2
+        assert refreshed["search_frequency_pattern"] != {}
+
     async def test_recent_search_autocomplete(self) -> None:
         """
         Given: 사용자의 최근 검색 히스토리
@@ -331,12 +529,12 @@ class TestSearchHistoryService:
             redis_client=self.mock_redis, db_session=self.mock_db
         )
 
-        # Mock recent searches
-        self.mock_redis.lrange.return_value = [
-            json.dumps({"query": "홍대 맛집", "timestamp": datetime.utcnow().isoformat()}),
-            json.dumps({"query": "홍대 카페", "timestamp": datetime.utcnow().isoformat()}),
-            json.dumps({"query": "강남 맛집", "timestamp": datetime.utcnow().isoformat()}),
-        ]
+        # 최근 검색 저장
+        _seed(
+            self.mock_redis,
+            self.test_user_id,
+            [{"query": "홍대 맛집"}, {"query": "홍대 카페"}, {"query": "강남 맛집"}],
+        )
 
         # When: 자동완성 요청
         suggestions = await history_service.get_autocomplete_suggestions(
@@ -368,8 +566,14 @@ class TestSearchHistoryService:
         # When: 동일 세션에서 연속 검색
         searches_in_session = [
             {"query": "홍대", "timestamp": datetime.utcnow()},
-            {"query": "홍대 맛집", "timestamp": datetime.utcnow() + timedelta(minutes=2)},
-            {"query": "홍대 카페", "timestamp": datetime.utcnow() + timedelta(minutes=5)},
+            {
+                "query": "홍대 맛집",
+                "timestamp": datetime.utcnow() + timedelta(minutes=2),
+            },
+            {
+                "query": "홍대 카페",
+                "timestamp": datetime.utcnow() + timedelta(minutes=5),
+            },
         ]
 
         for search in searches_in_session:
@@ -397,10 +601,7 @@ class TestSearchHistoryService:
             redis_client=self.mock_redis, db_session=self.mock_db
         )
 
-        # Mock complete history data
-        self.mock_redis.lrange.return_value = [
-            json.dumps(history) for history in self.sample_search_history
-        ]
+        _seed(self.mock_redis, self.test_user_id, self.sample_search_history)
 
         # When: 히스토리 데이터 내보내기
         exported_data = await history_service.export_search_history(
@@ -430,24 +631,203 @@ class TestSearchHistoryService:
             redis_client=self.mock_redis, db_session=self.mock_db, privacy_mode=True
         )
 
+        search_id = await history_service.record_search(
+            self.test_user_id, {"query": "삭제할 검색"}, session_id="session_1"
+        )
+        await history_service.record_search(self.test_user_id, {"query": "남길 검색"})
+
         # When: 특정 검색 삭제
         await history_service.delete_search_entry(
-            user_id=self.test_user_id, search_id="search_to_delete"
+            user_id=self.test_user_id, search_id=search_id
         )
 
+        # Then: 해당 항목만 삭제됨
+        history = await history_service.get_search_history(self.test_user_id)
+        assert [item["query"] for item in history] == ["남길 검색"]
+
         # When: 모든 히스토리 삭제
-        await history_service.clear_all_history(
-            user_id=self.test_user_id, confirmation_token="confirm_delete_123"
+        confirmation_token = hashlib.sha256(
+            f"delete_all_{self.test_user_id}".encode()
+        ).hexdigest()[:16]
+        cleared = await history_service.clear_all_history(
+            user_id=self.test_user_id, confirmation_token=confirmation_token
+        )
+
+        # Then: 히스토리, 빈도, 세션 등 관련 데이터가 모두 삭제됨
+        assert cleared is True
+        assert self.mock_redis.keys_for(self.test_user_id) == []
+
+
+class TestSearchHistoryTimeline:
+    """시각 점수 타임라인 저장 구조 테스트"""
+
+    def setup_method(self) -> None:
+        """테스트 설정"""
+        self.test_user_id = uuid4()
+        self.fake_redis = FakeRedis()
+        self.service = SearchHistoryService(
+            redis_client=self.fake_redis, db_session=Mock(), max_history_items=30
+        )
+        self.entries_key = f"search_history:{self.test_user_id}:entries"
+
+    async def test_history_cap_trims_timeline_and_batches_body_cleanup(self) -> None:
+        """
+        Given: 보관 한도 30건
+        When: 60건을 기록함
+        Then: 최신 30건만 조회되고, 밀려난 본문은 일괄 정리되어 한도+배치 이하로 유지됨
+        """
+        for index in range(60):
+            await self.service.record_search(
+                self.test_user_id, {"query": f"검색 {index}"}
+            )
+
+        history = await self.service.get_search_history(self.test_user_id, limit=100)
+
+        assert len(history) == 30
+        timeline = self.fake_redis.zsets[f"search_history:{self.test_user_id}:timeline"]
+        assert len(timeline) == 30
+        entry_count = len(self.fake_redis.hashes[self.entries_key])
+        assert entry_count < 30 + self.service.trim_batch_size
+        assert set(timeline) <= set(self.fake_redis.hashes[self.entries_key])
+
+    async def test_date_range_pages_match_full_scan(self) -> None:
+        """
+        Given: 같은 시각이 많이 겹치는 무작위 히스토리
+        When: 다양한 기간/페이지 크기로 순회함
+        Then: 전체를 읽어 거른 결과와 순서까지 일치함 (페이지 경계의 동점 포함)
+        """
+        rng = random.Random(49)
+        base = datetime(2024, 3, 1)
+
+        for _ in range(40):
+            fake_redis = FakeRedis()
+            service = SearchHistoryService(redis_client=fake_redis, db_session=Mock())
+            items = [
+                {
+                    "search_id": f"s{index:03d}",
+                    "query": f"검색 {index}",
+                    "timestamp": (
+                        base + timedelta(hours=rng.randint(0, 12))
+                    ).isoformat(),
+                }
+                for index in range(rng.randint(0, 40))
+            ]
+            _seed(fake_redis, self.test_user_id, items)
+            date_from = base + timedelta(hours=rng.randint(0, 6))
+            date_to = date_from + timedelta(hours=rng.randint(0, 8))
+
+            streamed = [
+                item["search_id"]
+                async for item in service.iter_search_history(
+                    self.test_user_id, date_from, date_to, page_size=rng.randint(1, 6)
+                )
+            ]
+
+            expected = sorted(
+                (
+                    item
+                    for item in items
+                    if date_from <= datetime.fromisoformat(item["timestamp"]) <= date_to
+                ),
+                key=lambda item: (item["timestamp"], item["search_id"]),
+                reverse=True,
+            )
+            assert streamed == [item["search_id"] for item in expected]
+
+    async def test_streaming_export_is_valid_json_per_page(self) -> None:
+        """
+        Given: 기간 제한 없는 히스토리 25건
+        When: 스트리밍 내보내기를 페이지 크기 10으로 읽음
+        Then: 조각을 이으면 전체 항목과 개수를 담은 JSON 문서가 됨
+        """
+        _seed(
+            self.fake_redis,
+            self.test_user_id,
+            [{"query": f"검색 {i}"} for i in range(25)],
         )
+        self.service.export_page_size = 10
 
-        # Then: 삭제 작업 수행 확인
-        self.mock_redis.delete.assert_called()  # 히스토리 삭제
+        chunks = [
+            chunk
+            async for chunk in self.service.stream_search_history_export(
+                self.test_user_id
+            )
+        ]
+        exported = json.loads("".join(chunks))
+
+        assert len(chunks) == 27  # 머리 + 항목 25개 + 꼬리
+        assert exported["user_id"] == str(self.test_user_id)
+        assert exported["total_searches"] == 25
+        assert [item["search_id"] for item in exported["search_history"]] == [
+            f"seed_{i}" for i in range(25)
+        ]
 
-        # 관련 데이터도 함께 삭제되는지 확인
-        delete_calls = [str(call) for call in self.mock_redis.delete.call_args_list]
-        assert any(
-            f"search_history:{self.test_user_id}" in call for call in delete_calls
+    async def test_dict_export_requires_bounded_range(self) -> None:
+        """
+        Given: 히스토리
+        When: 기간 없이 / 최대 기간보다 길게 딕셔너리 내보내기를 요청함
+        Then: 항목을 읽지 않고 스트리밍 내보내기를 안내함
+        """
+        _seed(self.fake_redis, self.test_user_id, [{"query": "검색"}])
+        now = datetime.utcnow()
+
+        unbounded = await self.service.export_search_history(self.test_user_id)
+        too_long = await self.service.export_search_history(
+            self.test_user_id, date_from=now - timedelta(days=90), date_to=now
+        )
+
+        assert "stream_search_history_export" in unbounded["error"]
+        assert "stream_search_history_export" in too_long["error"]
+
+    async def test_delete_is_single_round_trip(self) -> None:
+        """
+        Given: 여러 건의 히스토리
+        When: 한 항목을 삭제함
+        Then: 한 번의 왕복으로 타임라인/본문/상호작용에서 제거됨
+        """
+        _seed(
+            self.fake_redis,
+            self.test_user_id,
+            [{"query": f"검색 {i}"} for i in range(5)],
         )
-        assert any(
-            f"search_frequency:{self.test_user_id}" in call for call in delete_calls
+        self.fake_redis._hset("search_interactions:seed_2", "click_p1", "{}")
+        round_trips = self.fake_redis.round_trips
+
+        assert await self.service.delete_search_entry(self.test_user_id, "seed_2")
+
+        assert self.fake_redis.round_trips == round_trips + 1
+        assert "seed_2" not in self.fake_redis.hashes[self.entries_key]
+        assert "search_interactions:seed_2" not in self.fake_redis.hashes
+        history = await self.service.get_search_history(self.test_user_id)
+        assert [item["search_id"] for item in history] == [
+            "seed_0",
+            "seed_1",
+            "seed_3",
+            "seed_4",
+        ]
+
+    async def test_legacy_list_history_is_migrated_on_first_read(self) -> None:
+        """
+        Given: 이전 리스트 형식으로 저장된 히스토리
+        When: 히스토리를 조회함
+        Then: 타임라인으로 이관되어 최신순으로 반환되고 이전 키는 삭제됨
+        """
+        now = datetime.utcnow()
+        legacy_key = f"search_history:{self.test_user_id}"
+        self.fake_redis._lpush(
+            legacy_key,
+            json.dumps(
+                {"query": "오래된", "timestamp": (now - timedelta(hours=1)).isoformat()}
+            ),
+            "not json",
+            json.dumps(
+                {"search_id": "s2", "query": "최근", "timestamp": now.isoformat()}
+            ),
         )
+
+        history = await self.service.get_search_history(self.test_user_id)
+
+        assert [item["query"] for item in history] == ["최근", "오래된"]
+        assert history[0]["search_id"] == "s2"
+        assert history[1]["search_id"]
+        assert legacy_key not in self.fake_redis.lists
@@ -0,0 +1,126 @@
+"""
+순차 검정 통계 엔진 테스트
+
+스트리밍 충분통계량, mSPRT 상시 유효성, CUPED 분산 감소, 실험 조기 종료 검증
+"""
+
+from uuid import uuid4
+
+import numpy as np
+
+from app.core.cache import MemoryCacheService
+from app.services.experiments.sequential_statistics import (
+    SufficientStatistics,
+    msprt_test,
+)
+from app.services.ranking.ranking_experiment_service import RankingExperimentService
+
+
+def _stats(y, x=None):
+    stats = SufficientStatistics()
+    for i, value in enumerate(y):
+        stats.add(float(value), float(x[i]) if x is not None else 0.0)
+    return stats
+
+
+class TestSufficientStatistics:
+    """충분통계량 테스트"""
+
+    def test_streaming_matches_batch_moments(self) -> None:
+        """Given: 두 샤드로 나눠 쌓은 통계 / When: 병합 / Then: 전체 배열의 평균/분산/공분산과 일치"""
+        rng = np.random.default_rng(0)
+        x = rng.normal(5, 2, 1000)
+        y = 0.5 * x + rng.normal(0, 1, 1000)
+
+        merged = _stats(y[:400], x[:400]).merge(_stats(y[400:], x[400:]))
+
+        assert merged.n == 1000
+        assert np.isclose(merged.mean, y.mean())
+        assert np.isclose(merged.variance, y.var(ddof=1))
+        assert np.isclose(merged.variance_x, x.var(ddof=1))
+        assert np.isclose(merged.covariance, np.cov(x, y)[0, 1])
+        assert SufficientStatistics.from_dict(merged.to_dict()) == merged
+
+
+class TestMSPRT:
+    """mSPRT 순차 검정 테스트"""
+
+    def test_continuous_peeking_keeps_false_positive_rate(self) -> None:
+        """Given: 효과 없는 A/A 실험 200개 / When: 50명마다 조회 / Then: 한 번이라도 기각한 비율이 alpha 이하"""
+        rng = np.random.default_rng(1)
+        false_positives = 0
+
+        for _ in range(200):
+            control, treatment = SufficientStatistics(), SufficientStatistics()
+            outcomes = rng.binomial(1, 0.3, size=(2, 2000))
+            for i in range(2000):
+                control.add(outcomes[0, i])
+                treatment.add(outcomes[1, i])
+                if i % 50 == 49 and msprt_test(control, treatment, tau=0.05)["decided"]:
+                    false_positives += 1
+                    break
+
+        assert false_positives / 200 <= 0.05
+
+    def test_real_effect_is_decided(self) -> None:
+        """Given: 0.30 → 0.40 전환율 / When: 검정 / Then: 결정되고 신뢰 수열이 실제 효과 포함"""
+        rng = np.random.default_rng(2)
+        control = _stats(rng.binomial(1, 0.3, 3000))
+        treatment = _stats(rng.binomial(1, 0.4, 3000))
+
+        result = msprt_test(control, treatment, tau=0.05)
+
+        assert result["decided"] is True
+        assert result["p_value"] < 0.05
+        lower, upper = result["confidence_interval"]
+        assert lower < 0.1 < upper
+
+    def test_cuped_reduces_variance(self) -> None:
+        """Given: 결과와 상관된 실험 전 공변량 / When: CUPED 보정 / Then: 분산 감소, 우도비 증가"""
+        rng = np.random.default_rng(3)
+        x = rng.normal(10, 3, size=(2, 1000))
+        y = x + rng.normal(0, 1, size=(2, 1000))
+        y[1] += 0.15
+        control, treatment = _stats(y[0], x[0]), _stats(y[1], x[1])
+
+        adjusted = msprt_test(control, treatment, tau=0.1)
+        raw = msprt_test(control, treatment, tau=0.1, use_cuped=False)
+
+        assert adjusted["variance_reduction"] > 0.8
+        assert adjusted["likelihood_ratio"] > raw["likelihood_ratio"]
+        assert abs(adjusted["effect_size"] - 0.15) < abs(raw["effect_size"] - 0.15)
+
+
+class TestExperimentEarlyStopping:
+    """실험 조기 종료 테스트"""
+
+    async def test_decided_experiment_completes_before_minimum_runtime(self) -> None:
+        """Given: 시작 직후 명확한 차이 / When: 완료 조건 확인 / Then: 최소 기간 전에 종료"""
+        service = RankingExperimentService(db=None, cache_service=MemoryCacheService())
+        experiment_id = await service.create_experiment(
+            name="랭킹 가중치 실험",
+            description="테스트",
+            variants=[
+                {"name": "control", "type": "control"},
+                {"name": "treatment", "type": "treatment"},
+            ],
+            target_metrics=["click_through_rate"],
+        )
+        assert await service.start_experiment(experiment_id)
+        assert not await service.check_experiment_completion(experiment_id)
+
+        for i in range(400):
+            user_id = uuid4()
+            variant = await service.assign_user_to_variant(experiment_id, user_id)
+            clicks = (i % 10 < 3) if variant == "control" else (i % 10 < 6)
+            if clicks:
+                await service.record_experiment_event(
+                    experiment_id, user_id, "click", {}
+                )
+
+        results = await service.get_experiment_results(experiment_id)
+        test = results["statistical_tests"]["control_vs_treatment"]
+
+        assert test["test_type"] == "msprt"
+        assert test["statistically_significant"] is True
+        assert await service.check_experiment_completion(experiment_id)
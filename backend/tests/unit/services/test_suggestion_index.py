@@ -0,0 +1,329 @@
+"""
+자동완성 접두사 색인 테스트
+
+자모 분해/초성 매칭, 증분 갱신, 트렌딩 스냅샷 교체, 워커 간 색인 갱신 동작 검증
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+from uuid import uuid4
+
+from app.models.place import PlaceStatus
+from app.services.search import suggestion_index as suggestion_index_module
+from app.services.search.suggestion_index import (
+    SuggestionIndex,
+    SuggestionIndexRegistry,
+)
+from app.utils.hangul import decompose_hangul, extract_choseong
+
+
+def _place(name: str, **kwargs) -> SimpleNamespace:
+    defaults = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "name": name,
+        "description": None,
+        "category": "cafe",
+        "address": None,
+        "tags": [],
+        "status": PlaceStatus.ACTIVE,
+    }
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
+class TestHangulDecomposition:
+    """한글 자모 분해 테스트"""
+
+    def test_partial_syllable_is_prefix_of_full_word(self) -> None:
+        assert decompose_hangul("카페").startswith(decompose_hangul("캎"))
+        assert decompose_hangul("카페").startswith(decompose_hangul("ㅋ"))
+
+    def test_compound_vowel_is_split(self) -> None:
+        assert decompose_hangul("과") == "ㄱㅗㅏ"
+
+    def test_choseong_extraction(self) -> None:
+        assert extract_choseong("스타벅스 강남") == "ㅅㅌㅂㅅ ㄱㄴ"
+        assert extract_choseong("CGV") == "CGV"
+
+
+class TestSuggestionIndex:
+    """접두사 색인 테스트"""
+
+    def setup_method(self) -> None:
+        self.index = SuggestionIndex(top_k=4)
+        self.index.add("1", "홍대 맛집 카페", 3.0)
+        self.index.add("2", "홍대 술집", 5.0)
+        self.index.add("3", "스타벅스 강남점", 4.0)
+
+    def test_search_ranks_by_score(self) -> None:
+        results = self.index.search("홍대", 10)
+        assert [entry.entry_id for entry in results] == ["2", "1"]
+
+    def test_search_matches_partial_syllable_and_word_suffix(self) -> None:
+        assert [e.entry_id for e in self.index.search("맛ㅈ")] == ["1"]
+        assert [e.entry_id for e in self.index.search("카")] == ["1"]
+
+    def test_search_matches_choseong(self) -> None:
+        assert [e.entry_id for e in self.index.search("ㅅㅌㅂㅅ")] == ["3"]
+
+    def test_update_and_remove_invalidate_cached_rankings(self) -> None:
+        assert self.index.search("홍대", 1)[0].entry_id == "2"
+
+        self.index.add("1", "홍대 맛집 카페", 10.0)
+        assert self.index.search("홍대", 1)[0].entry_id == "1"
+
+        assert self.index.remove("1")
+        assert [e.entry_id for e in self.index.search("홍대")] == ["2"]
+        assert self.index.search("맛집") == []
+        assert not self.index.remove("1")
+
+    def test_predicate_and_large_limit_walk_subtree(self) -> None:
+        for i in range(10):
+            self.index.add(f"extra-{i}", f"홍대 라멘 {i}", float(i))
+
+        results = self.index.search("홍대", 20)
+        assert len(results) == 12
+
+        filtered = self.index.search(
+            "홍대", 5, predicate=lambda entry: entry.entry_id.startswith("extra")
+        )
+        assert [e.entry_id for e in filtered] == [f"extra-{i}" for i in range(9, 4, -1)]
+
+
+class FakeStreamPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [getattr(self.redis, n)(*a, **kw) for n, a, kw in self.commands]
+
+
+class FakeStreamRedis:
+    """XADD/XRANGE/XREVRANGE만 흉내내는 공유 Redis (maxlen은 정확히 트리밍)"""
+
+    def __init__(self) -> None:
+        self.entries = []
+        self.sequence = 0
+        self.threads = []
+
+    def pipeline(self, transaction=True):
+        return FakeStreamPipeline(self)
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        self.threads.append(threading.current_thread())
+        self.sequence += 1
+        self.entries.append((f"{self.sequence}-0", dict(fields)))
+        if maxlen is not None:
+            self.entries = self.entries[-maxlen:]
+        return self.entries[-1][0]
+
+    def xrange(self, key, min="-", max="+", count=None):
+        entries = self.entries
+        if min.startswith("("):
+            after = int(min[1:].split("-")[0])
+            entries = [e for e in entries if int(e[0].split("-")[0]) > after]
+        return entries[:count]
+
+    def xrevrange(self, key, max="+", min="-", count=None):
+        return list(reversed(self.entries))[:count]
+
+
+def _db(*places, changed=()) -> Mock:
+    db = Mock()
+    db.query.return_value.filter.return_value.yield_per.return_value = list(places)
+    db.query.return_value.filter.return_value.all.return_value = list(changed)
+    return db
+
+
+class TestSuggestionIndexRegistry:
+    """전역 색인 레지스트리 테스트"""
+
+    def test_index_place_counts_shared_names_and_tags(self) -> None:
+        registry = SuggestionIndexRegistry()
+        first = _place("성수 베이커리", tags=["빵", "디저트"])
+        second = _place("성수 베이커리", tags=["빵"])
+
+        registry.index_place(first)
+        registry.index_place(second)
+
+        entry = registry.places.search("성수")[0]
+        assert entry.payload["place_count"] == 2
+        assert registry.tags.search("빵")[0].score == 2.0
+
+        registry.remove_place(first.id)
+        assert registry.places.search("성수")[0].payload["place_count"] == 1
+        assert registry.tags.search("디저트") == []
+
+    def test_inactive_place_is_removed(self) -> None:
+        registry = SuggestionIndexRegistry()
+        place = _place("연남 파스타")
+        registry.index_place(place)
+
+        place.status = PlaceStatus.INACTIVE
+        registry.index_place(place)
+
+        assert registry.places.search("연남") == []
+
+    def test_user_index_is_loaded_once_and_updated_on_create(self) -> None:
+        registry = SuggestionIndexRegistry()
+        user_id = uuid4()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return [
+                _place("망원 커피", user_id=user_id, description="조용한 작업 공간")
+            ]
+
+        index = registry.user_index(user_id, loader)
+        assert registry.user_index(user_id, loader) is index
+        assert len(calls) == 1
+        assert [e.text for e in index.search("작업")] == ["작업"]
+
+        registry.index_place(_place("망원 떡볶이", user_id=user_id))
+        assert {e.text for e in index.search("망원")} == {"망원 커피", "망원 떡볶이"}
+
+    def test_new_place_keywords_use_batch_extraction(self, monkeypatch) -> None:
+        registry = SuggestionIndexRegistry()
+        user_id = uuid4()
+        index = registry.user_index(user_id, lambda: [])
+        analyzer = Mock(wraps=suggestion_index_module.korean_analyzer)
+        monkeypatch.setattr(suggestion_index_module, "korean_analyzer", analyzer)
+
+        registry.index_place(
+            _place("연남 파스타", user_id=user_id, description="생면 파스타 전문")
+        )
+        registry.index_place(_place("다른 사용자 카페", description="루프탑"))
+
+        assert [e.text for e in index.search("생면")] == ["생면"]
+        analyzer.extract_keywords.assert_not_called()
+        analyzer.extract_keywords_many.assert_called_once()
+
+    def test_user_index_is_rebuilt_after_ttl(self) -> None:
+        registry = SuggestionIndexRegistry(user_index_ttl_seconds=0)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return []
+
+        registry.user_index("user-1", loader)
+        registry.user_index("user-1", loader)
+        assert len(calls) == 2
+
+    def test_refresh_trending_replaces_snapshot(self) -> None:
+        registry = SuggestionIndexRegistry(trending_refresh_seconds=60)
+        assert registry.trending_needs_refresh("trending_searches:20240101")
+
+        registry.refresh_trending("trending_searches:20240101", [("홍대 맛집", 3.0)])
+        assert not registry.trending_needs_refresh("trending_searches:20240101")
+        assert registry.trending_needs_refresh("trending_searches:20240102")
+
+        registry.refresh_trending("trending_searches:20240102", [("강남 카페", 1.0)])
+        assert registry.trending.search("홍대") == []
+        assert registry.trending.search("강남")[0].text == "강남 카페"
+
+
+class TestCrossProcessRefresh:
+    """다른 프로세스의 장소 변경 반영 테스트"""
+
+    def test_other_process_write_is_applied_incrementally(self) -> None:
+        """Given: 같은 Redis를 쓰는 두 워커 / When: A에서 장소 생성 / Then: B는 그 장소만 다시 읽어 반영"""
+        client = FakeStreamRedis()
+        worker_a = SuggestionIndexRegistry(client=client)
+        worker_b = SuggestionIndexRegistry(client=client)
+        worker_a.rebuild_from_db(_db())
+        worker_b.rebuild_from_db(_db())
+        place = _place("합정 라멘")
+
+        worker_a.index_place(place)
+        worker_a.flush()
+        db = _db(changed=[place])
+
+        assert worker_a.sync(_db()) == 0  # 자기 쓰기는 이미 반영됨
+        assert worker_b.sync(db) == 1
+        assert [e.text for e in worker_b.places.search("합정")] == ["합정 라멘"]
+        assert not db.query.return_value.filter.return_value.yield_per.called
+        # 변경 알림은 요청 스레드가 아닌 백그라운드 스레드에서 전송
+        assert client.threads[0] is not threading.current_thread()
+
+    def test_removed_place_is_unindexed_on_other_worker(self) -> None:
+        """Given: 두 워커에 색인된 장소 / When: A에서 삭제 / Then: B에서도 제거"""
+        client = FakeStreamRedis()
+        place = _place("을지로 노가리")
+        worker_a = SuggestionIndexRegistry(client=client)
+        worker_b = SuggestionIndexRegistry(client=client)
+        worker_a.rebuild_from_db(_db(place))
+        worker_b.rebuild_from_db(_db(place))
+
+        worker_a.remove_place(place.id)
+        worker_a.flush()
+
+        assert worker_b.sync(_db(changed=[])) == 1
+        assert worker_b.places.search("을지로") == []
+
+    def test_trimmed_changes_trigger_debounced_rebuild(self, monkeypatch) -> None:
+        """Given: 커서 이후 변경이 트리밍됨 / When: 동기화 / Then: 재구축 간격 안에서는 보류, 이후 재구축"""
+        monkeypatch.setattr(suggestion_index_module, "CHANGE_LOG_MAX_LENGTH", 2)
+        client = FakeStreamRedis()
+        writer = SuggestionIndexRegistry(client=client)
+        reader = SuggestionIndexRegistry(client=client, min_rebuild_interval_seconds=60)
+        reader.rebuild_from_db(_db())
+        writer.index_place(_place("망원 커피"))
+        writer.flush()
+        reader.sync(_db(changed=[]))
+
+        for name in ("연남 파스타", "성수 베이커리", "합정 라멘"):
+            writer.index_place(_place(name))
+        writer.flush()
+
+        assert reader.sync(_db()) == 0
+        reader.min_rebuild_interval_seconds = 0
+        assert reader.sync(_db(_place("성수 베이커리"))) == -1
+        assert [e.text for e in reader.places.search("성수")] == ["성수 베이커리"]
+
+    def test_rebuild_swaps_indexes_and_keeps_concurrent_writes(self) -> None:
+        """Given: 재구축 중 조회/쓰기 / When: 재구축 완료 / Then: 도중엔 기존 색인, 이후 쓰기 포함 교체"""
+        registry = SuggestionIndexRegistry()
+        registry.rebuild_from_db(_db(_place("기존 카페")))
+        seen_during_rebuild = []
+
+        def rows():
+            yield _place("새 카페")
+            seen_during_rebuild.append([e.text for e in registry.places.search("카페")])
+            registry.index_place(_place("도중 카페"))
+
+        db = Mock()
+        db.query.return_value.filter.return_value.yield_per.return_value = rows()
+        registry.rebuild_from_db(db)
+
+        assert seen_during_rebuild == [["기존 카페"]]
+        assert {e.text for e in registry.places.search("카페")} == {
+            "새 카페",
+            "도중 카페",
+        }
+
+    def test_stale_index_is_rebuilt_in_background(self) -> None:
+        """Given: TTL 지난 색인 / When: 갱신 확인 / Then: 백그라운드 재구축 후 새 장소 검색"""
+        registry = SuggestionIndexRegistry(global_index_ttl_seconds=0)
+        registry.rebuild_from_db(_db())
+        db = _db(_place("을지로 노가리"))
+
+        assert registry.refresh_if_stale(lambda: db)
+        for _ in range(100):
+            if not registry._syncing:
+                break
+            time.sleep(0.01)
+
+        assert [e.text for e in registry.places.search("을지로")] == ["을지로 노가리"]
+        db.close.assert_called_once()
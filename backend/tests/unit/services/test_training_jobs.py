@@ -0,0 +1,135 @@
+"""
+모델 학습 잡 러너 테스트
+
+NumPy 배열 적재, 프로세스 풀 학습/리포트, 모델 버전 배포 및 서빙 측 재로드 검증
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from app.services.ml import training_jobs
+from app.services.ml.ml_engine import MODEL_VERSION_KEY, MLEngine
+from app.services.ml.training_jobs import (
+    TrainingMatrixBuilder,
+    fit_timing_model,
+    run_training_job,
+)
+from app.services.notifications import ml_notification_optimizer
+from app.services.notifications.ml_notification_optimizer import (
+    TIMING_FEATURE_COUNT,
+    NotificationTimingOptimizer,
+)
+
+
+def _separable_rows(rows: int = 400):
+    """시간대(첫 특성)로 참여 여부가 갈리는 학습 데이터"""
+    rng = np.random.default_rng(7)
+    X = rng.random((rows, TIMING_FEATURE_COUNT))
+    X[:, 0] = rng.integers(0, 24, rows)
+    y = (X[:, 0] >= 12).astype(np.int8)
+    return X, y
+
+
+@pytest.fixture(autouse=True)
+def training_pool():
+    yield
+    training_jobs.shutdown_training_executor()
+    ml_notification_optimizer._published_models.clear()
+
+
+class TestTrainingMatrixBuilder:
+    """학습 배열 빌더 테스트"""
+
+    def test_grows_and_keeps_rows_in_order(self) -> None:
+        """Given: 초기 용량 2 / When: 5행 추가 / Then: 확장 후 순서대로 보존"""
+        builder = TrainingMatrixBuilder(n_features=3, initial_capacity=2)
+
+        builder.extend(([i, i + 0.5, -i], i % 2) for i in range(5))
+        X, y = builder.arrays()
+
+        assert X.shape == (5, 3)
+        assert X[:, 0].tolist() == [0, 1, 2, 3, 4]
+        assert X[4].tolist() == [4, 4.5, -4]
+        assert y.tolist() == [0, 1, 0, 1, 0]
+
+
+class TestRunTrainingJob:
+    """프로세스 풀 학습 테스트"""
+
+    async def test_fit_runs_off_event_loop_and_reports(self) -> None:
+        """Given: 학습 데이터 / When: 학습 잡 실행 / Then: 루프는 계속 동작, 리포트 생성"""
+        X, y = _separable_rows()
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        result, report = await run_training_job("timing", fit_timing_model, X, y)
+        done.set()
+        await ticker_task
+
+        assert ticks > 1
+        assert result["model"].predict(result["scaler"].transform(X[:1])).shape == (1,)
+        assert report.rows == 400
+        assert report.fit_seconds > 0
+        assert report.peak_memory_mb > 0
+        assert report.max_rss_mb > 0
+        assert report.metrics["accuracy"] > 0.9
+        assert report.model_version
+
+
+class TestTimingModelPublishing:
+    """알림 타이밍 모델 배포 테스트"""
+
+    async def test_trained_model_is_published_and_shared(self, tmp_path) -> None:
+        """Given: 학습 가능한 데이터 / When: 학습 / Then: 버전 배포, 새 인스턴스가 공유 로드"""
+        model_path = str(tmp_path / "timing.pkl")
+        trainer = NotificationTimingOptimizer(Mock(), model_path=model_path)
+        trainer._prepare_training_data = AsyncMock(return_value=_separable_rows())
+
+        assert await trainer.train_timing_model(min_samples=100) is True
+
+        first = NotificationTimingOptimizer(Mock(), model_path=model_path)
+        second = NotificationTimingOptimizer(Mock(), model_path=model_path)
+        assert first.is_trained is True
+        assert first.model_version == trainer.last_training_report.model_version
+        assert first.model is second.model
+        assert not (tmp_path / "timing.pkl.tmp").exists()
+
+
+class TestRelevanceModelRefresh:
+    """검색 관련도 모델 버전 감지 테스트"""
+
+    def _engine(self, published_version):
+        cache = Mock()
+        cache.get = AsyncMock(return_value=published_version)
+        engine = MLEngine(cache)
+        engine._load_model = AsyncMock(return_value=True)
+        return engine
+
+    async def test_reloads_when_published_version_changes(self) -> None:
+        """Given: 다른 버전 배포됨 / When: 갱신 확인 / Then: 모델 재로드"""
+        engine = self._engine("20260101000000000000")
+
+        assert await engine.refresh_published_model() is True
+
+        engine.cache.get.assert_awaited_once_with(MODEL_VERSION_KEY)
+        engine._load_model.assert_awaited_once()
+
+    async def test_same_version_and_recent_check_skip_reload(self) -> None:
+        """Given: 같은 버전 / When: 연속 확인 / Then: 재로드 없음, 캐시 조회 1회"""
+        engine = self._engine("1.0.0")
+
+        assert await engine.refresh_published_model() is False
+        assert await engine.refresh_published_model() is False
+
+        engine.cache.get.assert_awaited_once()
+        engine._load_model.assert_not_awaited()
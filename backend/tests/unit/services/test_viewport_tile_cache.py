@@ -0,0 +1,240 @@
+"""
+뷰포트 타일 캐시 테스트
+
+타일 좌표 변환, 타일 단위 캐시 적중/로드, 장소 쓰기 시 무효화, Redis 장애 시 동작,
+MapService 뷰포트 조립 검증
+"""
+
+import threading
+
+from app.services.maps import map_service as map_service_module
+from app.services.maps.map_service import MapService
+from app.services.maps.viewport_tile_cache import (
+    CLUSTERS,
+    MAX_TILE_ZOOM,
+    MAX_VIEWPORT_TILES,
+    POINTS,
+    ViewportTileCache,
+    choose_tile_zoom,
+    lat_lng_to_tile,
+    tile_bounds,
+    tile_count,
+    tiles_covering,
+)
+
+
+class FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value))
+
+    def execute(self):
+        self.store.update(self.commands)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.fail = False
+
+    def mget(self, keys):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.store)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+def _point_loader(places, calls):
+    """타일별 장소 요약을 메모리에서 반환하는 로더 (호출 기록)"""
+
+    def load(zoom, tiles):
+        calls.append(list(tiles))
+        loaded = {tile: {"places": [], "truncated": False} for tile in tiles}
+        for place in places:
+            tile = lat_lng_to_tile(place["latitude"], place["longitude"], zoom)
+            if tile in loaded:
+                loaded[tile]["places"].append(place)
+        return loaded
+
+    return load
+
+
+PLACES = [
+    {
+        "place_id": f"p{i}",
+        "latitude": 37.55 + i * 0.002,
+        "longitude": 126.92 + i * 0.002,
+        "name": f"장소 {i}",
+        "category": "cafe",
+    }
+    for i in range(20)
+]
+
+
+class TestTileMath:
+    """타일 좌표 변환 테스트"""
+
+    def test_point_lies_inside_its_tile(self) -> None:
+        """Given: 서울 좌표 / When: 타일 변환 / Then: 타일 경계 안에 포함"""
+        for zoom in (5, 11, 16):
+            x, y = lat_lng_to_tile(37.5665, 126.978, zoom)
+            south, west, north, east = tile_bounds(zoom, x, y)
+
+            assert south <= 37.5665 <= north
+            assert west <= 126.978 <= east
+
+    def test_tiles_covering_spans_bounds(self) -> None:
+        """Given: 뷰포트 경계 / When: 덮는 타일 계산 / Then: 모서리 타일을 모두 포함"""
+        bounds = (37.50, 126.90, 37.60, 127.10)
+
+        tiles = tiles_covering(bounds, 14)
+
+        assert lat_lng_to_tile(37.60, 126.90, 14) in tiles
+        assert lat_lng_to_tile(37.50, 127.10, 14) in tiles
+        assert len(tiles) == len(set(tiles))
+        assert tile_count(bounds, 14) == len(tiles)
+
+    def test_world_sized_box_picks_zoom_without_enumerating(self) -> None:
+        """Given: 전 세계 경계 / When: 타일 줌 선택 / Then: 타일 목록 없이 예산 안의 줌 선택"""
+        world = (-85.0, -180.0, 85.0, 180.0)
+
+        assert tile_count(world, MAX_TILE_ZOOM) > 10**9
+        zoom = choose_tile_zoom(world, MAX_TILE_ZOOM)
+
+        assert tile_count(world, zoom + 1) > MAX_VIEWPORT_TILES
+        assert len(tiles_covering(world, zoom)) == tile_count(world, zoom)
+        assert tile_count(world, zoom) <= MAX_VIEWPORT_TILES
+
+
+class TestViewportTileCache:
+    """타일 캐시 테스트"""
+
+    def test_overlapping_viewport_loads_only_new_tiles(self) -> None:
+        """Given: 캐시된 뷰포트 / When: 일부 겹치게 이동 / Then: 새 타일만 로드"""
+        cache = ViewportTileCache(client=FakeRedis())
+        calls = []
+        load = _point_loader(PLACES, calls)
+        first = tiles_covering((37.55, 126.92, 37.57, 126.95), 15)
+        second = tiles_covering((37.55, 126.93, 37.57, 126.96), 15)
+
+        cache.get_tiles("all", POINTS, 15, first, load)
+        cache.get_tiles("all", POINTS, 15, second, load)
+
+        assert calls[0] == first
+        assert set(calls[1]) == set(second) - set(first)
+        assert cache.get_stats()["tile_hits"] == len(set(first) & set(second))
+
+    def test_place_write_invalidates_containing_tiles(self) -> None:
+        """Given: 캐시된 타일 / When: 장소 쓰기 무효화 / Then: 해당 타일만 다시 로드"""
+        client = FakeRedis()
+        cache = ViewportTileCache(client=client)
+        calls = []
+        load = _point_loader(PLACES, calls)
+        tiles = tiles_covering((37.55, 126.92, 37.57, 126.95), 15)
+        cache.get_tiles("user:u1", POINTS, 15, tiles, load)
+        cache.get_tiles("all", CLUSTERS, 10, [lat_lng_to_tile(37.56, 126.93, 10)], load)
+
+        cache.invalidate_place("u1", [(37.56, 126.93), (None, None)])
+        cache.flush()
+        cache.get_tiles("user:u1", POINTS, 15, tiles, load)
+
+        assert calls[-1] == [lat_lng_to_tile(37.56, 126.93, 15)]
+        assert not any(":c:10:" in key for key in client.store)
+
+    def test_invalidation_runs_off_the_calling_thread(self) -> None:
+        """Given: 캐시된 타일 / When: 무효화 / Then: Redis 삭제는 백그라운드 스레드에서 실행"""
+        client = FakeRedis()
+        delete_threads = []
+        delete = client.delete
+        client.delete = lambda *keys: (
+            delete_threads.append(threading.current_thread()),
+            delete(*keys),
+        )
+        cache = ViewportTileCache(client=client)
+
+        cache.invalidate_point(["all"], 37.56, 126.93).result(5)
+
+        assert delete_threads and delete_threads[0] is not threading.current_thread()
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_redis_failure_falls_back_to_loader(self) -> None:
+        """Given: Redis 장애 / When: 타일 조회 / Then: DB 로더 결과 반환, 예외 없음"""
+        client = FakeRedis()
+        client.fail = True
+        cache = ViewportTileCache(client=client)
+        calls = []
+        tiles = tiles_covering((37.55, 126.92, 37.57, 126.95), 15)
+
+        result = cache.get_tiles("all", POINTS, 15, tiles, _point_loader(PLACES, calls))
+
+        assert set(result) == set(tiles)
+        assert cache.get_stats()["redis_errors"] == 1
+        assert cache.get_stats()["redis_available"] is False
+
+
+class TestMapServiceViewport:
+    """MapService 뷰포트 조립 테스트"""
+
+    @staticmethod
+    def _viewport(south, west, north, east):
+        return {
+            "southwest": {"latitude": south, "longitude": west},
+            "northeast": {"latitude": north, "longitude": east},
+        }
+
+    def test_places_trimmed_to_viewport(self, monkeypatch) -> None:
+        """Given: 타일에 뷰포트 밖 장소 포함 / When: 뷰포트 로드 / Then: 경계 안 장소만 반환"""
+        calls = []
+        loader = _point_loader(PLACES, calls)
+        monkeypatch.setattr(
+            map_service_module,
+            "query_point_tiles",
+            lambda db, filters, zoom, tiles: loader(zoom, tiles),
+        )
+        service = MapService(db=None, tile_cache=ViewportTileCache(client=FakeRedis()))
+
+        data = service.load_viewport_places(
+            self._viewport(37.55, 126.92, 37.56, 126.93), zoom_level=16
+        )
+
+        assert data["clustered"] is False
+        assert {p["place_id"] for p in data["places"]} == {
+            p["place_id"]
+            for p in PLACES
+            if 37.55 <= p["latitude"] <= 37.56 and 126.92 <= p["longitude"] <= 126.93
+        }
+        assert all(p["in_viewport"] for p in data["places"])
+
+    def test_low_zoom_returns_clusters(self, monkeypatch) -> None:
+        """Given: 낮은 줌 / When: 뷰포트 로드 / Then: 개별 장소 대신 클러스터 반환"""
+        cluster = {
+            "cluster_id": "13/0/0",
+            "center": {"latitude": 37.56, "longitude": 126.97},
+            "place_count": 12,
+        }
+        monkeypatch.setattr(
+            map_service_module,
+            "query_cluster_tiles",
+            lambda db, filters, zoom, tiles: {
+                tile: {"clusters": [cluster], "place_count": 12} for tile in tiles
+            },
+        )
+        service = MapService(db=None, tile_cache=ViewportTileCache(client=FakeRedis()))
+
+        data = service.load_viewport_places(
+            self._viewport(37.40, 126.80, 37.70, 127.20), zoom_level=10
+        )
+
+        assert data["clustered"] is True
+        assert data["places"] == []
+        assert data["clusters"]
+        assert data["clustered_places_count"] == 12 * len(data["clusters"])
@@ -0,0 +1,147 @@
+"""
+격자 기반 핫스팟 탐지 테스트
+
+기존 탐욕적 군집화와의 결과 일치(무작위 소규모 입력), 인접 밀집 셀 병합,
+가중 중심/반경 계산, 임계값 설정 검증
+"""
+
+import math
+import random
+
+import pytest
+
+from app.utils.distance_calculator import DistanceCalculator
+from app.utils.hotspots import HotspotDetector
+
+
+def legacy_identify_hotspots(coordinates):
+    """기존 UserPreferenceService._identify_hotspots (O(n²) 탐욕적 군집화)"""
+    calc = DistanceCalculator(None)
+    hotspots = []
+    used_coords = set()
+    for i, (lat1, lng1) in enumerate(coordinates):
+        if i in used_coords:
+            continue
+        cluster_coords = [(lat1, lng1)]
+        used_coords.add(i)
+        for j, (lat2, lng2) in enumerate(coordinates):
+            if j in used_coords or j <= i:
+                continue
+            if calc.haversine_distance(lat1, lng1, lat2, lng2) <= 2.0:
+                cluster_coords.append((lat2, lng2))
+                used_coords.add(j)
+        if len(cluster_coords) >= 2:
+            hotspots.append(
+                {
+                    "center": {
+                        "latitude": sum(lat for lat, _ in cluster_coords)
+                        / len(cluster_coords),
+                        "longitude": sum(lng for _, lng in cluster_coords)
+                        / len(cluster_coords),
+                    },
+                    "visit_count": len(cluster_coords),
+                }
+            )
+    return hotspots
+
+
+def _summary(hotspots):
+    return sorted(
+        (
+            h["visit_count"],
+            round(h["center"]["latitude"], 6),
+            round(h["center"]["longitude"], 6),
+        )
+        for h in hotspots
+    )
+
+
+def _separated_clusters(rng):
+    """10km 이상 떨어진 군집(각 1~6개 방문, 반경 250m 이내)"""
+    coordinates = []
+    sites = rng.sample([(row, col) for row in range(6) for col in range(6)], 5)
+    for row, col in sites[: rng.randint(1, 5)]:
+        center_lat = 37.3 + row * 0.1 + rng.uniform(-0.005, 0.005)
+        center_lng = 126.8 + col * 0.12 + rng.uniform(-0.005, 0.005)
+        for _ in range(rng.randint(1, 6)):
+            coordinates.append(
+                (
+                    center_lat + rng.uniform(-0.0015, 0.0015),
+                    center_lng + rng.uniform(-0.0015, 0.0015),
+                )
+            )
+    rng.shuffle(coordinates)
+    return coordinates
+
+
+class TestHotspotDetector:
+    """핫스팟 탐지기 테스트"""
+
+    def test_agrees_with_legacy_clustering_on_small_inputs(self) -> None:
+        """Given: 무작위 분리 군집 300세트 / When: 격자/기존 탐지 / Then: 방문 수와 중심 일치"""
+        detector = HotspotDetector()
+        rng = random.Random(47)
+
+        for _ in range(300):
+            coordinates = _separated_clusters(rng)
+            grid = [hotspot.to_dict() for hotspot in detector.detect(coordinates)]
+            assert _summary(grid) == _summary(legacy_identify_hotspots(coordinates))
+
+    def test_neighbouring_dense_cells_merge(self) -> None:
+        """Given: 인접 셀에 걸친 방문과 떨어진 단일 방문 / When: 탐지 / Then: 인접 셀만 한 핫스팟"""
+        detector = HotspotDetector(cell_size_km=0.5)
+        # 위도 방향 약 0.4km 간격으로 6개 방문: 연속된 셀들
+        line = [(37.50 + i * 0.0036, 127.00) for i in range(6)]
+        far = [(37.60, 127.20)]
+
+        (hotspot,) = detector.detect(line + far)
+
+        assert hotspot.weight == 6
+        assert hotspot.cell_count >= 4
+        assert hotspot.latitude == pytest.approx(37.50 + 2.5 * 0.0036)
+
+    def test_weighted_centroid_and_radius(self) -> None:
+        """Given: 가중치가 있는 두 지점 / When: 탐지 / Then: 가중 중심, 최원점 거리 반경"""
+        detector = HotspotDetector(cell_size_km=2.0, min_radius_km=0.0)
+        points = [(37.500, 127.000, 3.0), (37.504, 127.000, 1.0)]
+
+        (hotspot,) = detector.detect(points)
+
+        assert hotspot.weight == 4.0
+        assert hotspot.latitude == pytest.approx(37.501)
+        assert hotspot.radius_km == pytest.approx(0.003 * 111.32, rel=1e-6)
+        assert hotspot.to_dict()["visit_count"] == 4
+
+        floored = HotspotDetector(cell_size_km=2.0, min_radius_km=1.0)
+        assert floored.detect(points)[0].radius_km == 1.0
+
+    def test_thresholds_are_configurable(self) -> None:
+        """Given: 밀집도가 다른 두 지역 / When: 셀/핫스팟 최소 가중치 변경 / Then: 결과 필터링"""
+        busy = [(37.5000 + i * 0.0001, 127.0000) for i in range(5)]
+        quiet = [(37.5500, 127.1000), (37.5501, 127.1000)]
+        points = busy + quiet
+
+        assert [h.weight for h in HotspotDetector().detect(points)] == [5, 2]
+        assert [
+            h.weight for h in HotspotDetector(min_hotspot_weight=3).detect(points)
+        ] == [5]
+        assert [
+            h.weight for h in HotspotDetector(min_cell_weight=3).detect(points)
+        ] == [5]
+        # 전체의 30% 이상인 셀만 밀집: 조용한 지역(2/7)은 제외
+        assert [
+            h.weight for h in HotspotDetector(min_cell_share=0.3).detect(points)
+        ] == [5]
+        assert HotspotDetector().detect([]) == []
+        with pytest.raises(ValueError):
+            HotspotDetector(cell_size_km=0)
+
+    def test_longitude_cells_are_square_on_the_ground(self) -> None:
+        """Given: 고위도 동서 방향 방문 / When: 탐지 / Then: 위도 보정된 거리로 반경 계산"""
+        latitude = 60.0
+        step = 0.3 / (111.32 * math.cos(math.radians(latitude)))  # 동쪽으로 0.3km
+        points = [(latitude, 10.0 + i * step) for i in range(3)]
+
+        (hotspot,) = HotspotDetector(cell_size_km=1.0).detect(points)
+
+        assert hotspot.radius_km == pytest.approx(0.3, rel=1e-3)
@@ -0,0 +1,71 @@
+"""Test cached Korean text analysis and highlighting helpers."""
+
+from app.services.search.search_service import SearchService
+from app.utils.korean_analyzer import KoreanAnalyzer, korean_analyzer
+from app.utils.tag_normalizer import TagNormalizer
+
+
+def test_analyze_text_is_cached_and_returns_fresh_containers() -> None:
+    """Repeated analysis hits the cache without sharing mutable results."""
+    analyzer = KoreanAnalyzer(cache_size=16)
+
+    first = analyzer.analyze_text("강남 스타벅스 카페")
+    first["keywords"].append("변경")
+    first["entities"][0]["text"] = "변경"
+    second = analyzer.analyze_text("강남 스타벅스 카페")
+
+    assert second["keywords"] == ["강남", "스타벅스", "카페"]
+    assert {e["text"] for e in second["entities"]} == {"스타벅스", "강남"}
+    assert second["has_place_keywords"] is True
+    assert analyzer._analyze_cached.cache_info().hits == 1
+
+
+def test_extract_keywords_fast_path_matches_full_analysis() -> None:
+    """Keywords-only path agrees with analyze_text and skips entity work."""
+    analyzer = KoreanAnalyzer()
+    text = "홍대 맛집, 정말 분위기 좋은 카페!"
+
+    assert analyzer.extract_keywords(text) == analyzer.analyze_text(text)["keywords"]
+    assert analyzer.extract_keywords("") == []
+
+
+def test_extract_keywords_many_preserves_order() -> None:
+    """Batch keyword extraction returns one result per input, in order."""
+    analyzer = KoreanAnalyzer()
+    texts = ["성수 베이커리", "연남 파스타", "성수 베이커리"]
+
+    assert analyzer.extract_keywords_many(texts) == [
+        ["성수", "베이커리"],
+        ["연남", "파스타"],
+        ["성수", "베이커리"],
+    ]
+
+
+def test_extract_tags_many_normalizes_analyzer_keywords() -> None:
+    """Batch tag extraction normalizes synonyms and caps tags per text."""
+    texts = ["강남 스타벅스 카페", "분위기 좋은 cafe, 커피 맛집!"]
+
+    assert TagNormalizer.extract_tags_many(texts, max_tags=3) == [
+        ["강남", "스타벅스", "커피"],
+        ["분위기", "커피", "맛집"],
+    ]
+
+
+def test_build_highlight_pattern_prefers_longer_terms() -> None:
+    """One alternation pattern; longer overlapping terms win, short terms skipped."""
+    analyzer = KoreanAnalyzer()
+
+    pattern = analyzer.build_highlight_pattern(["카페", "카페거리", "a"])
+    assert pattern.pattern == "카페거리|카페"
+    assert analyzer.build_highlight_pattern(["카페거리", "카페"]) is pattern
+    assert analyzer.build_highlight_pattern(["a"]) is None
+
+
+def test_highlight_search_terms_single_pass() -> None:
+    """Highlighting wraps each match once, case-insensitively."""
+    service = SearchService(db=None)
+
+    highlighted = service.highlight_search_terms("Cafe 카페거리 카페", "cafe 카페")
+
+    assert highlighted == "<mark>Cafe</mark> <mark>카페</mark>거리 <mark>카페</mark>"
+    assert service.korean_analyzer is korean_analyzer